@@ -6,42 +6,85 @@ TrendRadar MCP Server - FastMCP 2.0 实现
 """
 
 import asyncio
+import importlib
+import inspect
 import json
-from typing import List, Optional, Dict, Union
+import threading
+from datetime import datetime
+from typing import Any, List, Optional, Dict, Union
 
 from fastmcp import FastMCP
 
-from .tools.data_query import DataQueryTools
-from .tools.analytics import AnalyticsTools
-from .tools.search_tools import SearchTools
-from .tools.config_mgmt import ConfigManagementTools
-from .tools.system import SystemManagementTools
-from .tools.storage_sync import StorageSyncTools
-from .tools.article_reader import ArticleReaderTools
+from .services.cache_service import get_cache
+from .services.scheduler_service import get_scheduler
 from .utils.date_parser import DateParser
-from .utils.errors import MCPError
+from .utils.errors import DataNotFoundError, InvalidParameterError, MCPError, ServerBusyError
 
 
 # 创建 FastMCP 2.0 应用
 mcp = FastMCP('trendradar-news')
 
-# 全局工具实例（在第一次请求时初始化）
-_tools_instances = {}
+# 工具实例名 -> (模块, 类名)
+_TOOL_CLASSES = {
+    'data': ('.tools.data_query', 'DataQueryTools'),
+    'analytics': ('.tools.analytics', 'AnalyticsTools'),
+    'search': ('.tools.search_tools', 'SearchTools'),
+    'config': ('.tools.config_mgmt', 'ConfigManagementTools'),
+    'system': ('.tools.system', 'SystemManagementTools'),
+    'storage': ('.tools.storage_sync', 'StorageSyncTools'),
+    'article': ('.tools.article_reader', 'ArticleReaderTools'),
+}
+
+
+class _LazyTools(dict):
+    """工具实例字典：首次访问某个工具时才导入对应模块并创建实例，缩短服务启动时间"""
+
+    def __init__(self):
+        super().__init__()
+        self.project_root: Optional[str] = None
+        self.configured = False
+        self._lock = threading.Lock()
+
+    def __missing__(self, key: str):
+        module_name, class_name = _TOOL_CLASSES[key]
+        # 批量查询的子查询可能在多个工作线程中同时首次访问
+        with self._lock:
+            if not dict.__contains__(self, key):
+                module = importlib.import_module(module_name, __package__)
+                self[key] = getattr(module, class_name)(self.project_root)
+            return dict.__getitem__(self, key)
+
+
+# 全局工具实例（各工具在第一次使用时创建）
+_tools_instances = _LazyTools()
 
 
 def _get_tools(project_root: Optional[str] = None):
-    """获取或创建工具实例（单例模式）"""
-    if not _tools_instances:
-        _tools_instances['data'] = DataQueryTools(project_root)
-        _tools_instances['analytics'] = AnalyticsTools(project_root)
-        _tools_instances['search'] = SearchTools(project_root)
-        _tools_instances['config'] = ConfigManagementTools(project_root)
-        _tools_instances['system'] = SystemManagementTools(project_root)
-        _tools_instances['storage'] = StorageSyncTools(project_root)
-        _tools_instances['article'] = ArticleReaderTools(project_root)
+    """获取工具实例（单例模式，首次调用确定项目根目录）"""
+    if not _tools_instances.configured:
+        _tools_instances.project_root = project_root
+        _tools_instances.configured = True
+        # 进程池的工作进程按同一项目根目录创建工具实例
+        get_scheduler().project_root = project_root
     return _tools_instances
 
 
+async def _run_tool(tool_name: str, func, *args, **kwargs):
+    """
+    按工具成本类别调度执行同步调用（替代 asyncio.to_thread）
+
+    轻量查询、重查询和外部网络调用使用各自的线程池，互不抢占；
+    排队已满时返回 SERVER_BUSY 错误结果而不是无限排队。
+    """
+    try:
+        return await get_scheduler().run(tool_name, func, *args, **kwargs)
+    except ServerBusyError as e:
+        return {
+            "success": False,
+            "error": e.to_dict()
+        }
+
+
 # ==================== MCP Resources ====================
 
 @mcp.resource("config://platforms")
@@ -52,8 +95,8 @@ async def get_platforms_resource() -> str:
     返回 config.yaml 中配置的所有平台信息，包括 ID 和名称。
     """
     tools = _get_tools()
-    config = await asyncio.to_thread(
-        tools['config'].get_current_config, section="crawler"
+    config = await _run_tool(
+        "get_platforms_resource", tools['config'].get_current_config, section="crawler"
     )
     return json.dumps({
         "platforms": config.get("platforms", []),
@@ -69,7 +112,7 @@ async def get_rss_feeds_resource() -> str:
     返回当前配置的所有 RSS 源信息。
     """
     tools = _get_tools()
-    status = await asyncio.to_thread(tools['data'].get_rss_feeds_status)
+    status = await _run_tool("get_rss_feeds_resource", tools['data'].get_rss_feeds_status)
     return json.dumps({
         "feeds": status.get("today_feeds", {}),
         "description": "TrendRadar 支持的 RSS 订阅源列表"
@@ -84,8 +127,8 @@ async def get_available_dates_resource() -> str:
     返回本地存储中可查询的日期列表。
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['storage'].list_available_dates, source="local"
+    result = await _run_tool(
+        "get_available_dates_resource", tools['storage'].list_available_dates, source="local"
     )
     return json.dumps({
         "dates": result.get("data", {}).get("local", {}).get("dates", []),
@@ -101,8 +144,8 @@ async def get_keywords_resource() -> str:
     返回 frequency_words.txt 中配置的关注词分组。
     """
     tools = _get_tools()
-    config = await asyncio.to_thread(
-        tools['config'].get_current_config, section="keywords"
+    config = await _run_tool(
+        "get_keywords_resource", tools['config'].get_current_config, section="keywords"
     )
     return json.dumps({
         "word_groups": config.get("word_groups", []),
@@ -165,7 +208,7 @@ async def resolve_date_range(
         2. search_news(query="特斯拉", date_range={"start": "2025-11-20", "end": "2025-11-26"})
     """
     try:
-        result = await asyncio.to_thread(DateParser.resolve_date_range_expression, expression)
+        result = await _run_tool("resolve_date_range", DateParser.resolve_date_range_expression, expression)
         return json.dumps(result, ensure_ascii=False, indent=2)
     except MCPError as e:
         return json.dumps({
@@ -207,8 +250,8 @@ async def get_latest_news(
     - 用户问"为什么只显示部分"说明需要完整数据
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['data'].get_latest_news,
+    result = await _run_tool(
+        "get_latest_news", tools['data'].get_latest_news,
         platforms=platforms, limit=limit, include_url=include_url
     )
     return json.dumps(result, ensure_ascii=False, indent=2)
@@ -240,8 +283,8 @@ async def get_trending_topics(
         - 自动提取热点: get_trending_topics(extract_mode="auto_extract", top_n=20)
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['data'].get_trending_topics,
+    result = await _run_tool(
+        "get_trending_topics", tools['data'].get_trending_topics,
         top_n=top_n, mode=mode, extract_mode=extract_mode
     )
     return json.dumps(result, ensure_ascii=False, indent=2)
@@ -275,8 +318,8 @@ async def get_latest_rss(
         - get_latest_rss(days=7, feeds=['hacker-news'])
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['data'].get_latest_rss,
+    result = await _run_tool(
+        "get_latest_rss", tools['data'].get_latest_rss,
         feeds=feeds, days=days, limit=limit, include_summary=include_summary
     )
     return json.dumps(result, ensure_ascii=False, indent=2)
@@ -311,8 +354,8 @@ async def search_rss(
         - search_rss(keyword="machine learning", feeds=['hacker-news'], days=14)
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['data'].search_rss,
+    result = await _run_tool(
+        "search_rss", tools['data'].search_rss,
         keyword=keyword,
         feeds=feeds,
         days=days,
@@ -341,7 +384,7 @@ async def get_rss_feeds_status() -> str:
         - get_rss_feeds_status()  # 查看所有 RSS 源状态
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(tools['data'].get_rss_feeds_status)
+    result = await _run_tool("get_rss_feeds_status", tools['data'].get_rss_feeds_status)
     return json.dumps(result, ensure_ascii=False, indent=2)
 
 
@@ -369,8 +412,8 @@ async def get_news_by_date(
         JSON格式的新闻列表，包含标题、平台、排名等信息
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['data'].get_news_by_date,
+    result = await _run_tool(
+        "get_news_by_date", tools['data'].get_news_by_date,
         date_range=date_range,
         platforms=platforms,
         limit=limit,
@@ -420,8 +463,8 @@ async def analyze_topic_trend(
         - analyze_topic_trend(topic="特斯拉", analysis_type="lifecycle")
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['analytics'].analyze_topic_trend_unified,
+    result = await _run_tool(
+        "analyze_topic_trend", tools['analytics'].analyze_topic_trend_unified,
         topic=topic,
         analysis_type=analysis_type,
         date_range=date_range,
@@ -467,8 +510,8 @@ async def analyze_data_insights(
         - analyze_data_insights(insight_type="keyword_cooccur", min_frequency=5, top_n=15)
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['analytics'].analyze_data_insights_unified,
+    result = await _run_tool(
+        "analyze_data_insights", tools['analytics'].analyze_data_insights_unified,
         insight_type=insight_type,
         topic=topic,
         date_range=date_range,
@@ -507,8 +550,8 @@ async def analyze_sentiment(
         - analyze_sentiment(topic="AI", date_range={"start": "2025-01-01", "end": "2025-01-07"})
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['analytics'].analyze_sentiment,
+    result = await _run_tool(
+        "analyze_sentiment", tools['analytics'].analyze_sentiment,
         topic=topic,
         platforms=platforms,
         date_range=date_range,
@@ -548,8 +591,8 @@ async def find_related_news(
         - find_related_news(reference_title="AI突破", date_range="last_week")
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['search'].find_related_news_unified,
+    result = await _run_tool(
+        "find_related_news", tools['search'].find_related_news_unified,
         reference_title=reference_title,
         date_range=date_range,
         threshold=threshold,
@@ -578,8 +621,8 @@ async def generate_summary_report(
         JSON格式的摘要报告，包含Markdown格式内容
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['analytics'].generate_summary_report,
+    result = await _run_tool(
+        "generate_summary_report", tools['analytics'].generate_summary_report,
         report_type=report_type,
         date_range=date_range
     )
@@ -614,8 +657,8 @@ async def aggregate_news(
         - aggregate_news(similarity_threshold=0.8)
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['analytics'].aggregate_news,
+    result = await _run_tool(
+        "aggregate_news", tools['analytics'].aggregate_news,
         date_range=date_range,
         platforms=platforms,
         similarity_threshold=similarity_threshold,
@@ -673,8 +716,8 @@ async def compare_periods(
           )
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['analytics'].compare_periods,
+    result = await _run_tool(
+        "compare_periods", tools['analytics'].compare_periods,
         period1=period1,
         period2=period2,
         topic=topic,
@@ -729,8 +772,8 @@ async def search_news(
         - search_news(query="特斯拉", date_range={"start": "2025-01-01", "end": "2025-01-07"})
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['search'].search_news_unified,
+    result = await _run_tool(
+        "search_news", tools['search'].search_news_unified,
         query=query,
         search_mode=search_mode,
         date_range=date_range,
@@ -745,6 +788,181 @@ async def search_news(
     return json.dumps(result, ensure_ascii=False, indent=2)
 
 
+# ==================== 批量查询工具 ====================
+
+# 单次批量查询最多执行的子查询数
+BATCH_MAX_QUERIES = 10
+
+# 子查询的最大并发数
+BATCH_MAX_CONCURRENCY = 4
+
+# 可批量执行的只读查询工具：工具名 -> (工具实例, 方法名, {工具参数名: 方法参数名})
+_BATCH_QUERY_TOOLS = {
+    "get_latest_news": ("data", "get_latest_news", {}),
+    "get_news_by_date": ("data", "get_news_by_date", {}),
+    "get_trending_topics": ("data", "get_trending_topics", {}),
+    "get_latest_rss": ("data", "get_latest_rss", {}),
+    "search_rss": ("data", "search_rss", {}),
+    "get_rss_feeds_status": ("data", "get_rss_feeds_status", {}),
+    "search_news": ("search", "search_news_unified", {}),
+    "find_related_news": ("search", "find_related_news_unified", {}),
+    "analyze_topic_trend": (
+        "analytics", "analyze_topic_trend_unified", {"spike_threshold": "threshold"}
+    ),
+    "analyze_data_insights": ("analytics", "analyze_data_insights_unified", {}),
+    "analyze_sentiment": ("analytics", "analyze_sentiment", {}),
+    "aggregate_news": ("analytics", "aggregate_news", {}),
+    "compare_periods": ("analytics", "compare_periods", {}),
+    "generate_summary_report": ("analytics", "generate_summary_report", {}),
+}
+
+
+def _prime_batch_snapshot() -> Optional[str]:
+    """加载今天的热榜数据并固定到当前快照，返回最新抓取时间（无数据时为 None）"""
+    parser = _get_tools()['data'].data_service.parser
+    try:
+        _, _, timestamps = parser.read_all_titles_for_date()
+    except DataNotFoundError:
+        return None
+    crawl_times = [name.rsplit(".", 1)[0] for name in timestamps]
+    return max(crawl_times) if crawl_times else None
+
+
+def _run_batch_sub_query(tool: Any, params: Any) -> Dict:
+    """执行单个子查询（在工作线程中调用），参数或工具名无效时返回错误结果"""
+    spec = _BATCH_QUERY_TOOLS.get(tool)
+    if spec is None:
+        return {
+            "success": False,
+            "error": InvalidParameterError(
+                f"不支持批量执行的工具: {tool}",
+                suggestion=f"支持的工具: {', '.join(_BATCH_QUERY_TOOLS)}"
+            ).to_dict()
+        }
+    if params is None:
+        params = {}
+    if not isinstance(params, dict):
+        return {
+            "success": False,
+            "error": InvalidParameterError("params 必须是对象（参数名 -> 参数值）").to_dict()
+        }
+
+    tools_key, method_name, aliases = spec
+    method = getattr(_get_tools()[tools_key], method_name)
+    kwargs = {aliases.get(name, name): value for name, value in params.items()}
+    try:
+        inspect.signature(method).bind(**kwargs)
+    except TypeError as e:
+        return {
+            "success": False,
+            "error": InvalidParameterError(f"{tool} 参数错误: {e}").to_dict()
+        }
+
+    try:
+        return method(**kwargs)
+    except MCPError as e:
+        return {"success": False, "error": e.to_dict()}
+    except Exception as e:
+        return {
+            "success": False,
+            "error": {"code": "INTERNAL_ERROR", "message": str(e)}
+        }
+
+
+@mcp.tool
+async def batch_query(
+    queries: List[Dict[str, Any]]
+) -> str:
+    """
+    批量查询 - 一次调用执行多个只读查询，共享同一份数据快照
+
+    适合连续调用多个查询工具的场景（如先看最新新闻、再看热点话题、再搜索）：
+    所有子查询基于同一份数据快照（今天的数据只加载一次，期间新的抓取不影响结果），
+    互相独立的子查询并发执行，结果按输入顺序合并返回，只需一次往返。
+
+    Args:
+        queries: 子查询列表（最多 10 个），每项格式：
+                 {"tool": "工具名", "params": {参数}, "id": "可选的标识"}
+                 - **tool**: 支持 get_latest_news / get_news_by_date / get_trending_topics /
+                   get_latest_rss / search_rss / get_rss_feeds_status / search_news /
+                   find_related_news / analyze_topic_trend / analyze_data_insights /
+                   analyze_sentiment / aggregate_news / compare_periods / generate_summary_report
+                 - **params**: 与对应工具的参数相同，未指定的参数使用默认值
+
+    Returns:
+        JSON格式的批量结果，results 中每项包含 id、tool 和该工具的原始结果
+
+    Examples:
+        - batch_query(queries=[
+              {"tool": "get_latest_news", "params": {"limit": 20}},
+              {"tool": "get_trending_topics", "params": {"top_n": 10}},
+              {"tool": "search_news", "params": {"query": "AI"}}
+          ])
+
+    Note:
+        - 单个子查询失败不影响其他子查询，失败信息在对应结果的 error 字段中
+        - 超出上限的子查询会被跳过
+        - 抓取、同步、读取文章等有副作用或访问外部网络的工具不支持批量执行
+    """
+    if not isinstance(queries, list) or not queries:
+        return json.dumps({
+            "success": False,
+            "error": InvalidParameterError(
+                "queries 必须是非空列表",
+                suggestion='示例: [{"tool": "get_latest_news", "params": {"limit": 20}}]'
+            ).to_dict()
+        }, ensure_ascii=False, indent=2)
+
+    accepted = queries[:BATCH_MAX_QUERIES]
+    semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENCY)
+
+    async def run(query: Any) -> Dict:
+        if not isinstance(query, dict):
+            return {
+                "success": False,
+                "error": InvalidParameterError(
+                    '子查询必须是对象: {"tool": "...", "params": {...}}'
+                ).to_dict()
+            }
+        async with semaphore:
+            return await _run_tool(
+                str(query.get("tool")), _run_batch_sub_query,
+                query.get("tool"), query.get("params")
+            )
+
+    with get_cache().snapshot():
+        snapshot_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        latest_crawl_time = await _run_tool("batch_query", _prime_batch_snapshot)
+        results = await asyncio.gather(*(run(query) for query in accepted))
+
+    combined = []
+    for index, (query, result) in enumerate(zip(accepted, results)):
+        query = query if isinstance(query, dict) else {}
+        combined.append({
+            "id": query.get("id", index),
+            "tool": query.get("tool"),
+            "success": bool(result.get("success", True)) if isinstance(result, dict) else True,
+            "result": result
+        })
+
+    succeeded = sum(1 for item in combined if item["success"])
+    response = {
+        "success": True,
+        "summary": {
+            "description": "批量查询结果",
+            "total": len(combined),
+            "succeeded": succeeded,
+            "failed": len(combined) - succeeded,
+            "snapshot_time": snapshot_time,
+            "latest_crawl_time": latest_crawl_time
+        },
+        "results": combined
+    }
+    if len(queries) > BATCH_MAX_QUERIES:
+        response["note"] = f"超出上限的 {len(queries) - BATCH_MAX_QUERIES} 个子查询已跳过（单次最多 {BATCH_MAX_QUERIES} 个）"
+    return json.dumps(response, ensure_ascii=False, indent=2)
+
+
 # ==================== 配置与系统管理工具 ====================
 
 @mcp.tool
@@ -766,7 +984,7 @@ async def get_current_config(
         JSON格式的配置信息
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(tools['config'].get_current_config, section=section)
+    result = await _run_tool("get_current_config", tools['config'].get_current_config, section=section)
     return json.dumps(result, ensure_ascii=False, indent=2)
 
 
@@ -775,13 +993,15 @@ async def get_system_status() -> str:
     """
     获取系统运行状态和健康检查信息
 
-    返回系统版本、数据统计、缓存状态等信息
+    返回系统版本、数据统计、缓存状态、查询调度状态等信息
 
     Returns:
         JSON格式的系统状态信息
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(tools['system'].get_system_status)
+    result = await _run_tool("get_system_status", tools['system'].get_system_status)
+    if isinstance(result, dict) and result.get("success"):
+        result["scheduler"] = get_scheduler().get_stats()
     return json.dumps(result, ensure_ascii=False, indent=2)
 
 
@@ -805,7 +1025,7 @@ async def check_version(
         - check_version(proxy_url="http://127.0.0.1:7890")
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(tools['system'].check_version, proxy_url=proxy_url)
+    result = await _run_tool("check_version", tools['system'].check_version, proxy_url=proxy_url)
     return json.dumps(result, ensure_ascii=False, indent=2)
 
 
@@ -831,8 +1051,8 @@ async def trigger_crawl(
         - trigger_crawl(save_to_local=True)
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['system'].trigger_crawl,
+    result = await _run_tool(
+        "trigger_crawl", tools['system'].trigger_crawl,
         platforms=platforms, save_to_local=save_to_local, include_url=include_url
     )
     return json.dumps(result, ensure_ascii=False, indent=2)
@@ -877,7 +1097,7 @@ async def sync_from_remote(
         - S3_SECRET_ACCESS_KEY: 访问密钥
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(tools['storage'].sync_from_remote, days=days)
+    result = await _run_tool("sync_from_remote", tools['storage'].sync_from_remote, days=days)
     return json.dumps(result, ensure_ascii=False, indent=2)
 
 
@@ -892,7 +1112,7 @@ async def get_storage_status() -> str:
         JSON格式的存储状态信息，包含本地/远程存储状态和拉取配置
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(tools['storage'].get_storage_status)
+    result = await _run_tool("get_storage_status", tools['storage'].get_storage_status)
     return json.dumps(result, ensure_ascii=False, indent=2)
 
 
@@ -919,7 +1139,7 @@ async def list_available_dates(
         - list_available_dates(source="local")
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(tools['storage'].list_available_dates, source=source)
+    result = await _run_tool("list_available_dates", tools['storage'].list_available_dates, source=source)
     return json.dumps(result, ensure_ascii=False, indent=2)
 
 
@@ -953,13 +1173,13 @@ async def read_article(
 
     Note:
         - 使用 Jina AI Reader 免费服务（100 RPM 限制）
-        - 每次请求间隔 5 秒（内置速率控制）
+        - 内置令牌桶限速，同一 URL 的内容默认缓存 1 小时
         - 部分付费墙/登录墙页面可能无法完整获取
     """
     tools = _get_tools()
     timeout = min(max(timeout, 10), 60)
-    result = await asyncio.to_thread(
-        tools['article'].read_article,
+    result = await _run_tool(
+        "read_article", tools['article'].read_article,
         url=url, timeout=timeout
     )
     return json.dumps(result, ensure_ascii=False, indent=2)
@@ -971,9 +1191,9 @@ async def read_articles_batch(
     timeout: int = 30
 ) -> str:
     """
-    批量读取多篇文章内容（最多 5 篇，间隔 5 秒）
+    批量并发读取多篇文章内容（最多 5 篇，自建 Reader 服务最多 20 篇）
 
-    逐篇请求文章内容，每篇之间自动间隔 5 秒以遵守速率限制。
+    以有限并发同时请求多篇文章，共享令牌桶限速以遵守速率限制，结果按输入顺序返回。
 
     **典型使用流程：**
     1. 先用 search_news(include_url=True) 搜索新闻获取多个链接
@@ -981,7 +1201,7 @@ async def read_articles_batch(
     3. AI 对多篇文章进行对比分析、综合报告
 
     Args:
-        urls: 文章链接列表（必需），最多处理 5 篇
+        urls: 文章链接列表（必需），最多处理 5 篇（自建 Reader 服务 20 篇）
         timeout: 每篇的请求超时时间（秒），默认 30
 
     Returns:
@@ -992,13 +1212,14 @@ async def read_articles_batch(
 
     Note:
         - 单次最多读取 5 篇，超出部分会被跳过
-        - 5 篇约需 25-30 秒（每篇间隔 5 秒）
+        - 默认 2 并发、100 RPM，可通过 JINA_MAX_CONCURRENCY / JINA_RATE_LIMIT_RPM 调整
+        - 已读取过的 URL 直接返回缓存内容
         - 单篇失败不影响其他篇的读取
     """
     tools = _get_tools()
     timeout = min(max(timeout, 10), 60)
-    result = await asyncio.to_thread(
-        tools['article'].read_articles_batch,
+    result = await _run_tool(
+        "read_articles_batch", tools['article'].read_articles_batch,
         urls=urls, timeout=timeout
     )
     return json.dumps(result, ensure_ascii=False, indent=2)
@@ -1021,7 +1242,7 @@ def run_server(
         host: HTTP模式的监听地址，默认 0.0.0.0
         port: HTTP模式的监听端口，默认 3333
     """
-    # 初始化工具实例
+    # 设置项目根目录（工具实例在首次调用时创建）
     _get_tools(project_root)
 
     # 打印启动信息
@@ -1084,6 +1305,9 @@ def run_server(
     print("    === 文章内容读取 ===")
     print("    22. read_article            - 读取单篇文章内容（Markdown格式）")
     print("    23. read_articles_batch     - 批量读取多篇文章（自动限速）")
+    print()
+    print("    === 批量查询 ===")
+    print("    24. batch_query             - 一次执行多个查询（共享数据快照）")
     print("=" * 60)
     print()
 
@@ -0,0 +1,251 @@
+"""
+流式聚合服务
+
+把多日分析拆成"逐天计算部分聚合 → 按日期合并"的 map-reduce 流程。
+每天的部分聚合只保存计数器和 TOP-K 候选（关键词计数缓存前裁剪为每天 TOP-K），
+合并满足结合律，峰值内存与天数 × TOP-K 成正比，而不是与区间内的全部标题数或词表大小
+成正比。已结束日期（非今天）的部分聚合不会再变化，可长期缓存，缓存条目数有上限。
+"""
+
+import heapq
+import threading
+from collections import Counter, OrderedDict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from .cache_service import get_cache, make_cache_key
+from .parser_service import ParserService
+
+
+# 部分聚合缓存时间（秒）：今天的数据仍在更新，已结束日期长期有效
+OPEN_DAY_TTL = 900
+CLOSED_DAY_TTL = 86400
+
+# 每天保留的关键词候选数（不小于工具参数 top_n 的上限 100）
+KEYWORD_TOP_K = 200
+
+# 缓存的单日部分聚合条数上限，超出时淘汰最久未使用的
+MAX_CACHED_PARTIALS = 400
+
+# 已缓存的部分聚合 key（按最近使用排序），用于限制缓存条目数
+_partial_keys: "OrderedDict[str, None]" = OrderedDict()
+_partial_lock = threading.Lock()
+
+
+class PeriodAggregate:
+    """
+    时期部分聚合结果
+
+    可以表示单日，也可以表示多日合并后的结果：
+    - news_count: 新闻条数
+    - keywords: 关键词计数（单日裁剪为 TOP-K 候选后，合并结果是各天候选计数之和）
+    - platform_stats: 各平台新闻条数
+    - daily_counts / daily_keywords: 按日期的条数与 TOP-K 关键词计数（用于关键词日序列）
+    - top_news: 按权重保留的 TOP-K 新闻（小顶堆）
+
+    TOP-K 堆元素为 (weight, -日期序号, -日内序号, news_item)，权重相同时
+    日期早、出现早的新闻优先，与对完整列表做稳定降序排序的结果一致。
+    """
+
+    def __init__(self, top_k: int = 0):
+        """
+        Args:
+            top_k: 保留的 TOP 新闻数量，0 表示不保留新闻
+        """
+        self.top_k = top_k
+        self.news_count = 0
+        self.keywords = Counter()
+        self.platform_stats = Counter()
+        self.daily_counts: Dict[str, int] = {}
+        self.daily_keywords: Dict[str, Counter] = {}
+        self._heap: List[tuple] = []
+        self._seq = 0
+
+    def add(
+        self,
+        date: datetime,
+        news_item: Dict,
+        platform_name: str,
+        keywords: List[str],
+        weight: float = 0.0
+    ) -> None:
+        """
+        累加单条新闻
+
+        Args:
+            date: 新闻所属日期
+            news_item: 新闻数据（仅在进入 TOP-K 时保留）
+            platform_name: 平台名称
+            keywords: 标题关键词
+            weight: 新闻权重（top_k 为 0 时忽略）
+        """
+        date_str = date.strftime("%Y-%m-%d")
+        self.news_count += 1
+        self.platform_stats[platform_name] += 1
+        self.keywords.update(keywords)
+        self.daily_counts[date_str] = self.daily_counts.get(date_str, 0) + 1
+
+        if self.top_k <= 0:
+            return
+
+        self._seq += 1
+        entry = (weight, -date.toordinal(), -self._seq, news_item)
+        if len(self._heap) < self.top_k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:3] > self._heap[0][:3]:
+            heapq.heapreplace(self._heap, entry)
+
+    def trim_keywords(self, limit: int) -> "PeriodAggregate":
+        """
+        把单日的关键词计数裁剪为出现次数最多的 limit 个（原地修改并返回自身）
+
+        裁剪后的计数同时作为当天的关键词日序列。某个关键词在某天未进入候选时
+        按 0 计，合并结果中的计数是各天候选计数之和。
+        """
+        if len(self.keywords) > limit:
+            self.keywords = Counter(dict(self.keywords.most_common(limit)))
+        for date_str in self.daily_counts:
+            self.daily_keywords[date_str] = self.keywords
+        return self
+
+    def merge(self, other: "PeriodAggregate") -> "PeriodAggregate":
+        """
+        合并另一个部分聚合（原地修改并返回自身）
+
+        计数器直接相加；日序列按日期合并（引用对方的计数器，不复制）；
+        TOP-K 取两者并集中权重最高的 K 条。合并顺序不影响结果。
+        """
+        self.news_count += other.news_count
+        self.keywords.update(other.keywords)
+        self.platform_stats.update(other.platform_stats)
+
+        for date_str, count in other.daily_counts.items():
+            self.daily_counts[date_str] = self.daily_counts.get(date_str, 0) + count
+        for date_str, counter in other.daily_keywords.items():
+            if date_str in self.daily_keywords:
+                self.daily_keywords[date_str] = self.daily_keywords[date_str] + counter
+            else:
+                self.daily_keywords[date_str] = counter
+
+        if self.top_k > 0 and other._heap:
+            combined = heapq.nlargest(
+                self.top_k, self._heap + other._heap, key=lambda e: e[:3]
+            )
+            heapq.heapify(combined)
+            self._heap = combined
+
+        return self
+
+    def top_news(self, n: Optional[int] = None) -> List[Dict]:
+        """
+        按权重降序返回 TOP 新闻
+
+        Args:
+            n: 返回数量，默认返回全部保留的新闻
+        """
+        ordered = sorted(self._heap, key=lambda e: e[:3], reverse=True)
+        return [entry[3] for entry in ordered[:n]]
+
+    def keyword_series(self, keyword: str, dates: List[str]) -> List[int]:
+        """
+        获取关键词的日序列
+
+        Args:
+            keyword: 关键词
+            dates: 日期字符串列表（YYYY-MM-DD）
+
+        Returns:
+            与 dates 对应的每日出现次数
+        """
+        return [self.daily_keywords.get(d, {}).get(keyword, 0) for d in dates]
+
+
+class AggregateService:
+    """按天 map、按日期 reduce 的聚合服务"""
+
+    def __init__(self, parser: ParserService):
+        """
+        Args:
+            parser: 解析服务（用于并行读取每日数据）
+        """
+        self.parser = parser
+        self.cache = get_cache()
+
+    def collect(
+        self,
+        dates: List[datetime],
+        build_day: Callable[[datetime, Dict, Dict], PeriodAggregate],
+        cache_namespace: str,
+        platform_ids: Optional[List[str]] = None,
+        top_k: int = 0,
+        **cache_params
+    ) -> PeriodAggregate:
+        """
+        逐天构建部分聚合并合并为时期聚合
+
+        先命中缓存的日期直接复用，其余日期并行读取后逐天构建，
+        原始标题数据在构建完部分聚合后即可释放。单日的关键词计数在缓存前
+        裁剪为 TOP-K 候选。
+
+        Args:
+            dates: 日期列表
+            build_day: 单日构建函数 (date, all_titles, id_to_name) -> PeriodAggregate
+            cache_namespace: 缓存命名空间（区分不同的构建逻辑）
+            platform_ids: 平台过滤列表
+            top_k: 合并结果保留的 TOP 新闻数量
+            **cache_params: 影响构建结果的其他参数（参与缓存 key）
+
+        Returns:
+            合并后的时期聚合
+        """
+        today = datetime.now().date()
+        day_aggregates: Dict[str, PeriodAggregate] = {}
+        missing = []
+
+        def cache_key_for(date: datetime) -> str:
+            return make_cache_key(
+                cache_namespace,
+                date=date.strftime("%Y-%m-%d"),
+                platforms=platform_ids,
+                top_k=top_k,
+                **cache_params
+            )
+
+        for date in dates:
+            ttl = OPEN_DAY_TTL if date.date() >= today else CLOSED_DAY_TTL
+            cache_key = cache_key_for(date)
+            cached = self.cache.get(cache_key, ttl=ttl)
+            if cached is not None:
+                self._touch(cache_key)
+                day_aggregates[date.strftime("%Y-%m-%d")] = cached
+            else:
+                missing.append(date)
+
+        for date, day_data in self.parser.iter_titles_for_dates(missing, platform_ids=platform_ids):
+            if day_data is None:
+                day_aggregate = PeriodAggregate(top_k)
+            else:
+                all_titles, id_to_name, _ = day_data
+                day_aggregate = build_day(date, all_titles, id_to_name)
+            day_aggregate.trim_keywords(KEYWORD_TOP_K)
+            cache_key = cache_key_for(date)
+            self.cache.set(cache_key, day_aggregate)
+            self._touch(cache_key)
+            day_aggregates[date.strftime("%Y-%m-%d")] = day_aggregate
+
+        # 按日期顺序合并，保证关键词计数的插入顺序与逐日遍历一致
+        result = PeriodAggregate(top_k)
+        for date in dates:
+            result.merge(day_aggregates[date.strftime("%Y-%m-%d")])
+        return result
+
+    def _touch(self, cache_key: str) -> None:
+        """记录部分聚合的使用，超过上限时从缓存中删除最久未使用的条目"""
+        with _partial_lock:
+            _partial_keys[cache_key] = None
+            _partial_keys.move_to_end(cache_key)
+            evicted = []
+            while len(_partial_keys) > MAX_CACHED_PARTIALS:
+                evicted.append(_partial_keys.popitem(last=False)[0])
+        for key in evicted:
+            self.cache.delete(key)
@@ -2,15 +2,23 @@
 缓存服务
 
 实现TTL缓存机制，提升数据访问性能。
+支持请求级快照：快照内每个键首次读到的值被固定，同一批查询共享同一份数据。
 """
 
 import hashlib
 import json
 import time
-from typing import Any, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
 from threading import Lock
 
 
+# 当前上下文的缓存快照（None 表示未启用）。asyncio.to_thread 等会复制上下文，
+# 快照对象在同一请求派生的线程间共享
+_snapshot: ContextVar[Optional[Dict[str, Any]]] = ContextVar("cache_snapshot", default=None)
+
+
 def make_cache_key(namespace: str, **params) -> str:
     """
     生成结构化缓存 key
@@ -75,13 +83,20 @@ class CacheService:
             ttl: 存活时间（秒），默认15分钟
 
         Returns:
-            缓存的值，如果不存在或已过期则返回None
+            缓存的值，如果不存在或已过期则返回None（快照内已固定的值不过期）
         """
+        snapshot = _snapshot.get()
+        if snapshot is not None and key in snapshot:
+            return snapshot[key]
+
         with self._lock:
             if key in self._cache:
                 # 检查是否过期
                 if time.time() - self._timestamps[key] < ttl:
-                    return self._cache[key]
+                    value = self._cache[key]
+                    if snapshot is not None:
+                        return snapshot.setdefault(key, value)
+                    return value
                 else:
                     # 已过期，删除缓存
                     del self._cache[key]
@@ -100,6 +115,34 @@ class CacheService:
             self._cache[key] = value
             self._timestamps[key] = time.time()
 
+        # 快照内先固定的值优先，保证同一批查询看到的数据一致
+        snapshot = _snapshot.get()
+        if snapshot is not None:
+            snapshot.setdefault(key, value)
+
+    @contextmanager
+    def snapshot(self) -> Iterator[Dict[str, Any]]:
+        """
+        在当前上下文中启用缓存快照
+
+        快照期间每个键首次读取或写入的值被固定：之后的读取直接返回该值
+        （不受 TTL 和新写入影响），同一批查询基于同一份数据。快照随上下文
+        传递给 asyncio.to_thread 等派生的线程，退出后恢复普通缓存行为。
+
+        Yields:
+            快照字典（键 -> 固定的值）
+        """
+        token = _snapshot.set({})
+        try:
+            yield _snapshot.get()
+        finally:
+            _snapshot.reset(token)
+
+    @staticmethod
+    def in_snapshot() -> bool:
+        """当前上下文是否处于缓存快照中（快照无法传递到其他进程）"""
+        return _snapshot.get() is not None
+
     def delete(self, key: str) -> bool:
         """
         删除缓存
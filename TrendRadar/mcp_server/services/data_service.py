@@ -4,11 +4,14 @@
 提供统一的数据查询接口,封装数据访问逻辑。
 """
 
+import heapq
 import re
 from collections import Counter
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
+from trendradar.core.tokenizer import tokenize_words
+
 from .cache_service import get_cache
 from .parser_service import ParserService
 from ..utils.errors import DataNotFoundError
@@ -314,9 +317,13 @@ class DataService:
         title = re.sub(r'\[.*?\]', '', title)  # 移除方括号内容
         title = re.sub(r'[【】《》「」『』""''・·•]', '', title)  # 移除中文标点
 
-        # 使用正则表达式分词（中文和英文）
-        # 匹配连续的中文字符或英文单词
-        words = re.findall(r'[\u4e00-\u9fff]{2,}|[a-zA-Z]{2,}[a-zA-Z0-9]*', title)
+        # 中文分词（与分析工具共用分词器，带 LRU 缓存），英文保留字母开头的单词
+        words = []
+        for token in tokenize_words(title):
+            if re.match(r'[\u4e00-\u9fff]', token):
+                words.append(token)
+            else:
+                words.extend(re.findall(r'[a-zA-Z]{2,}[a-zA-Z0-9]*', token))
 
         # 过滤停用词和短词
         keywords = [
@@ -701,63 +708,37 @@ class DataService:
         if cached:
             return cached
 
-        rss_list = []
-        seen_urls = set()  # 跨日期 URL 去重
-        today = datetime.now()
-
-        for i in range(days):
-            target_date = today - timedelta(days=i)
-
-            try:
-                all_items, id_to_name, timestamps = self.parser.read_all_titles_for_date(
-                    date=target_date,
-                    platform_ids=feeds,
-                    db_type="rss"
-                )
+        fetch_times = {}
+        result = []
+
+        for target_date, item in self._collect_rss_across_days(
+            feeds=feeds,
+            days=days,
+            limit=limit,
+            include_summary=include_summary
+        ):
+            date_str = target_date.strftime("%Y-%m-%d")
+
+            # 获取抓取时间（每天只查询一次）
+            if date_str not in fetch_times:
+                fetch_time = self.parser.read_rss_latest_crawl_time(target_date) or target_date
+                fetch_times[date_str] = fetch_time.strftime("%Y-%m-%d %H:%M:%S")
+
+            rss_item = {
+                "title": item["title"],
+                "feed_id": item["feed_id"],
+                "feed_name": item["feed_name"],
+                "url": item["url"],
+                "published_at": item["published_at"],
+                "author": item["author"],
+                "date": date_str,
+                "fetch_time": fetch_times[date_str]
+            }
 
-                # 获取抓取时间
-                if timestamps:
-                    latest_timestamp = max(timestamps.values())
-                    fetch_time = datetime.fromtimestamp(latest_timestamp)
-                else:
-                    fetch_time = target_date
-
-                # 转换为列表
-                for feed_id, items in all_items.items():
-                    feed_name = id_to_name.get(feed_id, feed_id)
-
-                    for title, info in items.items():
-                        # 跨日期 URL 去重
-                        url = info.get("url", "")
-                        if url and url in seen_urls:
-                            continue
-                        if url:
-                            seen_urls.add(url)
-
-                        rss_item = {
-                            "title": title,
-                            "feed_id": feed_id,
-                            "feed_name": feed_name,
-                            "url": url,
-                            "published_at": info.get("published_at", ""),
-                            "author": info.get("author", ""),
-                            "date": target_date.strftime("%Y-%m-%d"),
-                            "fetch_time": fetch_time.strftime("%Y-%m-%d %H:%M:%S") if isinstance(fetch_time, datetime) else target_date.strftime("%Y-%m-%d")
-                        }
-
-                        if include_summary:
-                            rss_item["summary"] = info.get("summary", "")
-
-                        rss_list.append(rss_item)
+            if include_summary:
+                rss_item["summary"] = item["summary"]
 
-            except DataNotFoundError:
-                continue
-
-        # 按发布时间排序（最新的在前）
-        rss_list.sort(key=lambda x: x.get("published_at", ""), reverse=True)
-
-        # 限制返回数量
-        result = rss_list[:limit]
+            result.append(rss_item)
 
         # 缓存结果
         self.cache.set(cache_key, result)
@@ -790,62 +771,133 @@ class DataService:
         if cached:
             return cached
 
-        results = []
-        seen_urls = set()  # 用于 URL 去重
-        today = datetime.now()
+        result = []
+
+        # 关键词匹配（标题或摘要）在 SQL 中完成，摘要仅在需要返回时读取
+        for target_date, item in self._collect_rss_across_days(
+            feeds=feeds,
+            days=days,
+            limit=limit,
+            include_summary=include_summary,
+            keyword=keyword
+        ):
+            rss_item = {
+                "title": item["title"],
+                "feed_id": item["feed_id"],
+                "feed_name": item["feed_name"],
+                "url": item["url"],
+                "published_at": item["published_at"],
+                "author": item["author"],
+                "date": target_date.strftime("%Y-%m-%d")
+            }
 
-        for i in range(days):
-            target_date = today - timedelta(days=i)
+            if include_summary:
+                rss_item["summary"] = item["summary"]
 
-            try:
-                all_items, id_to_name, _ = self.parser.read_all_titles_for_date(
-                    date=target_date,
-                    platform_ids=feeds,
-                    db_type="rss"
-                )
+            result.append(rss_item)
 
-                for feed_id, items in all_items.items():
-                    feed_name = id_to_name.get(feed_id, feed_id)
-
-                    for title, info in items.items():
-                        # 跨日期去重：如果 URL 已出现过则跳过
-                        url = info.get("url", "")
-                        if url and url in seen_urls:
-                            continue
-                        if url:
-                            seen_urls.add(url)
-
-                        # 关键词匹配（标题或摘要）
-                        summary = info.get("summary", "")
-                        if keyword.lower() in title.lower() or keyword.lower() in summary.lower():
-                            rss_item = {
-                                "title": title,
-                                "feed_id": feed_id,
-                                "feed_name": feed_name,
-                                "url": url,
-                                "published_at": info.get("published_at", ""),
-                                "author": info.get("author", ""),
-                                "date": target_date.strftime("%Y-%m-%d")
-                            }
+        # 缓存结果
+        self.cache.set(cache_key, result)
 
-                            if include_summary:
-                                rss_item["summary"] = summary
+        return result
 
-                            results.append(rss_item)
+    def _collect_rss_across_days(
+        self,
+        feeds: Optional[List[str]],
+        days: int,
+        limit: int,
+        include_summary: bool = False,
+        keyword: Optional[str] = None
+    ) -> List[Tuple[datetime, Dict]]:
+        """
+        跨日期读取按发布时间倒序的 RSS 条目（最多 limit 条）
 
-            except DataNotFoundError:
+        每天的数据库按 published_at 倒序分页读取，多路归并后只读取到凑够
+        limit 条为止。同一 URL 在多天出现时以较新日期的记录为准（与关键词
+        是否匹配无关）：较旧日期的候选条目会批量到较新日期中按 URL 索引核对。
+
+        Args:
+            feeds: RSS 源 ID 列表，None 表示所有源
+            days: 最近 N 天
+            limit: 最多返回条数
+            include_summary: 是否读取摘要
+            keyword: 关键词过滤（标题或摘要）
+
+        Returns:
+            [(日期, 条目), ...]，按发布时间倒序
+        """
+        if limit <= 0:
+            return []
+
+        today = datetime.now()
+        dates = [today - timedelta(days=i) for i in range(days)]
+
+        def tag(day_index: int, items):
+            for item in items:
+                yield day_index, item
+
+        # 每页略多于 limit，抵消去重造成的损耗
+        page_size = min(limit + max(limit // 5, 10), 500)
+        streams = [
+            self.parser.iter_rss_items(
+                date=date,
+                feed_ids=feeds,
+                keyword=keyword,
+                include_summary=include_summary,
+                page_size=page_size
+            )
+            for date in dates
+        ]
+        merged = heapq.merge(
+            *[tag(i, stream) for i, stream in enumerate(streams)],
+            key=lambda entry: entry[1]["published_at"],
+            reverse=True
+        )
+
+        results = []
+        seen_urls = set()    # 已返回的 URL
+        seen_titles = set()  # 同一天同一源的同名条目只保留一条
+        pending = []
+
+        def flush() -> None:
+            # 较旧日期的候选条目：URL 在较新日期出现过则以较新日期为准
+            oldest = max(day_index for day_index, _ in pending)
+            newer_urls = [set() for _ in range(oldest)]
+            for newer_index in range(oldest):
+                urls = [item["url"] for day_index, item in pending if day_index > newer_index]
+                newer_urls[newer_index] = self.parser.find_rss_urls(dates[newer_index], urls, feeds)
+
+            for day_index, item in pending:
+                url = item["url"]
+                if url:
+                    if url in seen_urls or any(url in newer_urls[j] for j in range(day_index)):
+                        continue
+                    seen_urls.add(url)
+                results.append((dates[day_index], item))
+                if len(results) >= limit:
+                    break
+            pending.clear()
+
+        for day_index, item in merged:
+            title_key = (day_index, item["feed_id"], item["title"])
+            if title_key in seen_titles:
                 continue
+            seen_titles.add(title_key)
 
-        # 按发布时间排序
-        results.sort(key=lambda x: x.get("published_at", ""), reverse=True)
+            pending.append((day_index, item))
+            if len(pending) >= limit - len(results):
+                flush()
+                if len(results) >= limit:
+                    break
 
-        # 限制返回数量
-        result = results[:limit]
+        if pending and len(results) < limit:
+            flush()
 
-        # 缓存结果
-        self.cache.set(cache_key, result)
+        # 提前结束归并时关闭各天的数据库连接
+        for stream in streams:
+            stream.close()
 
-        return result
+        return results
 
     def get_rss_feeds_status(self) -> Dict:
         """
@@ -5,18 +5,62 @@ v2.0.0: 仅支持 SQLite 数据库，移除 TXT 文件支持
 新存储结构：output/{type}/{date}.db
 """
 
+import heapq
+import math
+import os
 import re
 import sqlite3
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextvars import copy_context
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
+from datetime import datetime, timedelta
 
 import yaml
 
+from trendradar.core.anomaly import EMPTY_STATE, get_trend_state_signature, update_state
+from trendradar.core.keywords import get_extractor_signature
+from trendradar.core.title_index import (
+    TITLE_INDEX_VERSION,
+    get_title_index_signature,
+    get_topic_words,
+    title_grams,
+)
+from trendradar.storage.archive import extract_archived_day, list_archived_dates
+from trendradar.storage.sqlite_mixin import aggregate_platform_stats
+
 from ..utils.errors import FileParseError, DataNotFoundError
 from .cache_service import get_cache
 
 
+# 多日并行加载的默认并发数（每天一个独立 SQLite 文件，按 CPU 核数并行）
+DAY_LOADER_MAX_WORKERS = min(os.cpu_count() or 4, 16)
+
+# RSS 键集分页的默认每页条数
+RSS_PAGE_SIZE = 100
+
+# 标题检索 BM25 参数（词项为标题字符二元组，词频恒为 1）
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 读取数据库时的内存映射大小（字节）：多个工作进程读取同一天的数据库时直接共享
+# 操作系统页缓存，无需各自复制一份文件内容
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+
+
+def _connect_readonly(db_path: Path) -> sqlite3.Connection:
+    """
+    打开用于读取的数据库连接（只读，启用内存映射 I/O）
+
+    以 mode=ro 打开：文件在返回路径后被删除（如归档缓存被淘汰、过期数据被清理）
+    时连接失败，而不是在原路径新建一个空数据库。
+    """
+    conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True)
+    conn.execute(f"PRAGMA mmap_size = {SQLITE_MMAP_SIZE}")
+    return conn
+
+
 class ParserService:
     """数据解析服务类"""
 
@@ -61,6 +105,7 @@ class ParserService:
         获取数据库文件路径
 
         新结构：output/{type}/{date}.db
+        已归档的日期透明读取月度归档（解压到 output/{type}/archive/.cache/{date}.db）
 
         Args:
             date: 日期对象，默认为今天
@@ -70,10 +115,11 @@ class ParserService:
             数据库文件路径，如果不存在则返回 None
         """
         date_str = self.get_date_folder_name(date)
-        db_path = self.project_root / "output" / db_type / f"{date_str}.db"
+        db_dir = self.project_root / "output" / db_type
+        db_path = db_dir / f"{date_str}.db"
         if db_path.exists():
             return db_path
-        return None
+        return extract_archived_day(db_dir, date_str)
 
     def _read_from_sqlite(
         self,
@@ -101,7 +147,7 @@ class ParserService:
         all_timestamps = {}
 
         try:
-            conn = sqlite3.connect(str(db_path))
+            conn = _connect_readonly(db_path)
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
@@ -341,6 +387,1060 @@ class ParserService:
             suggestion="请先运行爬虫或检查日期是否正确"
         )
 
+    def _open_keyword_stats(self, date: datetime = None) -> Optional[sqlite3.Connection]:
+        """
+        打开包含可用关键词统计的热榜数据库
+
+        统计表不存在、尚未生成或提取规则签名（含分词词典）不一致时返回 None。
+        """
+        db_path = self._get_db_path(date, "news")
+        if db_path is None:
+            return None
+
+        conn = _connect_readonly(db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT name FROM sqlite_master
+                WHERE type='table' AND name='keyword_stats_meta'
+            """)
+            if not cursor.fetchone():
+                conn.close()
+                return None
+
+            cursor.execute("SELECT extractor_version FROM keyword_stats_meta WHERE id = 1")
+            row = cursor.fetchone()
+            if not row or row[0] != get_extractor_signature():
+                conn.close()
+                return None
+        except sqlite3.Error:
+            conn.close()
+            return None
+
+        return conn
+
+    def read_keyword_counts(self, date: datetime = None) -> Optional[Counter]:
+        """
+        读取抓取时预计算的关键词计数（带缓存）
+
+        Args:
+            date: 日期对象，默认为今天
+
+        Returns:
+            关键词 -> 出现次数；统计不可用时返回 None（调用方应回退到实时分词）
+        """
+        date_str = self.get_date_folder_name(date)
+        cache_key = f"keyword_counts:{date_str}"
+        cached = self.cache.get(cache_key, ttl=900)
+        if cached is not None:
+            return cached
+
+        conn = self._open_keyword_stats(date)
+        if conn is None:
+            return None
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT keyword, count FROM keyword_stats WHERE count > 0")
+            counts = Counter(dict(cursor.fetchall()))
+        except sqlite3.Error as e:
+            print(f"Warning: 读取关键词统计失败: {e}")
+            return None
+        finally:
+            conn.close()
+
+        self.cache.set(cache_key, counts)
+        return counts
+
+    def read_keyword_pairs(
+        self,
+        date: datetime = None,
+        min_count: int = 1,
+        limit: Optional[int] = None
+    ) -> Optional[List[Tuple[str, str, int]]]:
+        """
+        读取抓取时预计算的关键词共现计数
+
+        Args:
+            date: 日期对象，默认为今天
+            min_count: 最小共现次数
+            limit: 返回数量上限
+
+        Returns:
+            [(keyword1, keyword2, count), ...]，按次数降序、关键词升序；
+            统计不可用时返回 None
+        """
+        conn = self._open_keyword_stats(date)
+        if conn is None:
+            return None
+
+        try:
+            cursor = conn.cursor()
+            query = """
+                SELECT keyword1, keyword2, count FROM keyword_cooccurrence
+                WHERE count >= ?
+                ORDER BY count DESC, keyword1, keyword2
+            """
+            params: list = [min_count]
+            if limit is not None:
+                query += " LIMIT ?"
+                params.append(limit)
+            cursor.execute(query, params)
+            return [tuple(row) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            print(f"Warning: 读取关键词共现统计失败: {e}")
+            return None
+        finally:
+            conn.close()
+
+    def read_keyword_platform_counts(self, date: datetime = None) -> Optional[Dict[str, Counter]]:
+        """
+        读取抓取时预计算的关键词分平台计数（带缓存）
+
+        Args:
+            date: 日期对象，默认为今天
+
+        Returns:
+            {平台ID: Counter(关键词 -> 出现次数)}；统计不可用时返回 None
+        """
+        date_str = self.get_date_folder_name(date)
+        cache_key = f"keyword_platform_counts:{date_str}"
+        cached = self.cache.get(cache_key, ttl=900)
+        if cached is not None:
+            return cached
+
+        conn = self._open_keyword_stats(date)
+        if conn is None:
+            return None
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT platform_id, keyword, count FROM keyword_platform_stats
+                WHERE count > 0
+            """)
+            counts: Dict[str, Counter] = {}
+            for platform_id, keyword, count in cursor.fetchall():
+                counts.setdefault(platform_id, Counter())[keyword] = count
+        except sqlite3.Error as e:
+            print(f"Warning: 读取关键词分平台统计失败: {e}")
+            return None
+        finally:
+            conn.close()
+
+        self.cache.set(cache_key, counts)
+        return counts
+
+    def read_platform_stats(self, date: datetime = None) -> Optional[Dict]:
+        """
+        读取各平台的抓取聚合（带缓存）
+
+        优先读取抓取时写入的聚合表；聚合表缺失或未覆盖的抓取时间点（升级前的数据、
+        只读的归档日期）按与抓取端相同的口径由排名历史直接计算。各平台去重后的标题数
+        同样优先读取抓取时写入的计数，缺失时在 SQL 中计算，不读取标题本身。
+
+        Args:
+            date: 日期对象，默认为今天
+
+        Returns:
+            {
+                "id_to_name": {平台ID: 平台名称},
+                "crawls": [(抓取时间, 平台ID, 在榜条数, 新增条数, 排名之和, 最高排名, 是否失败), ...]
+                          （按抓取时间升序）,
+                "title_counts": {平台ID: 当天去重后的标题数}
+            }
+            数据库不存在、没有抓取记录或读取失败时返回 None
+        """
+        date_str = self.get_date_folder_name(date)
+        cache_key = f"platform_stats:{date_str}"
+        cached = self.cache.get(cache_key, ttl=900)
+        if cached is not None:
+            return cached
+
+        db_path = self._get_db_path(date, "news")
+        if db_path is None:
+            return None
+
+        conn = _connect_readonly(db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT crawl_time FROM crawl_records ORDER BY crawl_time")
+            crawl_times = [row[0] for row in cursor.fetchall()]
+            if not crawl_times:
+                return None
+
+            crawls = []
+            cursor.execute("""
+                SELECT name FROM sqlite_master
+                WHERE type='table' AND name='crawl_platform_stats'
+            """)
+            if cursor.fetchone():
+                cursor.execute("""
+                    SELECT crawl_time, platform_id, item_count, new_count,
+                           rank_sum, best_rank, failed
+                    FROM crawl_platform_stats ORDER BY crawl_time, platform_id
+                """)
+                crawls = [tuple(row) for row in cursor.fetchall()]
+
+            covered = {row[0] for row in crawls}
+            missing = [crawl_time for crawl_time in crawl_times if crawl_time not in covered]
+            if missing:
+                crawls = sorted(crawls + aggregate_platform_stats(cursor, missing))
+
+            cursor.execute("""
+                SELECT name FROM sqlite_master
+                WHERE type='table' AND name='platform_title_counts'
+            """)
+            if cursor.fetchone():
+                cursor.execute("SELECT platform_id, title_count FROM platform_title_counts")
+                title_counts = dict(cursor.fetchall())
+            else:
+                title_counts = {}
+            cursor.execute("SELECT DISTINCT platform_id FROM news_items")
+            if any(row[0] not in title_counts for row in cursor.fetchall()):
+                cursor.execute("""
+                    SELECT platform_id, COUNT(DISTINCT title) FROM news_items
+                    GROUP BY platform_id
+                """)
+                title_counts = dict(cursor.fetchall())
+
+            cursor.execute("SELECT id, name FROM platforms")
+            id_to_name = dict(cursor.fetchall())
+        except sqlite3.Error as e:
+            print(f"Warning: 读取平台聚合失败: {e}")
+            return None
+        finally:
+            conn.close()
+
+        stats = {
+            "id_to_name": id_to_name,
+            "crawls": crawls,
+            "title_counts": title_counts,
+        }
+        self.cache.set(cache_key, stats)
+        return stats
+
+    def count_unique_titles(self, dates: List[datetime]) -> Dict[str, int]:
+        """
+        统计日期范围内各平台去重后的标题数（带缓存）
+
+        单日直接使用当天的标题计数；多日时依次挂载各天的数据库，在临时数据库中按
+        (平台名称, 标题) 去重后计数，标题不载入 Python。无法读取的日期跳过。
+
+        Args:
+            dates: 日期列表
+
+        Returns:
+            {平台名称: 去重后的标题数}
+        """
+        if len(dates) == 1:
+            day_stats = self.read_platform_stats(dates[0])
+            if day_stats is None:
+                return {}
+            id_to_name = day_stats["id_to_name"]
+            counts = Counter()
+            for platform_id, count in day_stats["title_counts"].items():
+                counts[id_to_name.get(platform_id, platform_id)] += count
+            return dict(counts)
+
+        date_strs = [self.get_date_folder_name(date) for date in dates]
+        cache_key = f"unique_titles:{','.join(date_strs)}"
+        cached = self.cache.get(cache_key, ttl=900)
+        if cached is not None:
+            return cached
+
+        # 临时数据库（空文件名）按需落盘，去重集合不占用进程内存
+        conn = sqlite3.connect("file:", uri=True)
+        try:
+            conn.execute("""
+                CREATE TABLE titles (
+                    platform TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    PRIMARY KEY (platform, title)
+                ) WITHOUT ROWID
+            """)
+            for date, date_str in zip(dates, date_strs):
+                db_path = self._get_db_path(date, "news")
+                if db_path is None:
+                    continue
+                try:
+                    conn.execute(
+                        "ATTACH DATABASE ? AS day",
+                        (f"{Path(db_path).resolve().as_uri()}?mode=ro",),
+                    )
+                except sqlite3.Error as e:
+                    print(f"Warning: 挂载 {date_str} 数据库失败: {e}")
+                    continue
+                try:
+                    conn.execute("""
+                        INSERT OR IGNORE INTO titles (platform, title)
+                        SELECT COALESCE(p.name, n.platform_id), n.title
+                        FROM day.news_items n
+                        LEFT JOIN day.platforms p ON p.id = n.platform_id
+                    """)
+                    conn.commit()
+                except sqlite3.Error as e:
+                    conn.rollback()
+                    print(f"Warning: 统计 {date_str} 标题失败: {e}")
+                finally:
+                    conn.execute("DETACH DATABASE day")
+
+            counts = dict(conn.execute("SELECT platform, COUNT(*) FROM titles GROUP BY platform"))
+        finally:
+            conn.close()
+
+        self.cache.set(cache_key, counts)
+        return counts
+
+    def read_keyword_trend(self, date: datetime = None, slot: Optional[int] = None) -> Optional[Dict]:
+        """
+        读取抓取时维护的关键词热度状态（带缓存）
+
+        Args:
+            date: 日期对象，默认为今天
+            slot: 读取截至该时间点序号的状态（按序重放变化日志），None 表示最新状态
+
+        Returns:
+            {
+                "slots": [抓取时间, ...]（按时间升序，序号从 1 开始）,
+                "state": {关键词: (最后变化序号, 在榜条数, 累计在榜次数, 一阶矩, 二阶矩,
+                                   Holt 水平, Holt 趋势)}
+            }
+            状态表不存在、签名不一致或与抓取记录不符时返回 None
+        """
+        date_str = self.get_date_folder_name(date)
+        cache_key = f"keyword_trend:{date_str}:{slot}"
+        cached = self.cache.get(cache_key, ttl=900)
+        if cached is not None:
+            return cached
+
+        db_path = self._get_db_path(date, "news")
+        if db_path is None:
+            return None
+
+        conn = _connect_readonly(db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT name FROM sqlite_master
+                WHERE type='table' AND name='keyword_trend_meta'
+            """)
+            if not cursor.fetchone():
+                return None
+
+            cursor.execute("""
+                SELECT state_version, slot_count, last_crawl_time
+                FROM keyword_trend_meta WHERE id = 1
+            """)
+            meta = cursor.fetchone()
+            if not meta or meta[0] != get_trend_state_signature():
+                return None
+
+            cursor.execute("""
+                SELECT crawl_time FROM crawl_records
+                WHERE crawl_time <= ? ORDER BY crawl_time
+            """, (meta[2],))
+            slots = [row[0] for row in cursor.fetchall()]
+            if len(slots) != meta[1]:
+                return None
+
+            if slot is None:
+                cursor.execute("""
+                    SELECT keyword, slot, count, cum, m1, m2, level, trend
+                    FROM keyword_trend_state
+                """)
+                state = {row[0]: tuple(row[1:]) for row in cursor.fetchall()}
+            else:
+                # 日志只记录在榜条数变化，按与抓取端相同的顺序重放得到完全一致的状态
+                cursor.execute("""
+                    SELECT keyword, slot, count FROM keyword_trend_log
+                    WHERE slot <= ? ORDER BY keyword, slot
+                """, (slot,))
+                state = {}
+                for keyword, change_slot, count in cursor.fetchall():
+                    state[keyword] = update_state(state.get(keyword, EMPTY_STATE), change_slot, count)
+        except sqlite3.Error as e:
+            print(f"Warning: 读取关键词热度状态失败: {e}")
+            return None
+        finally:
+            conn.close()
+
+        trend = {"slots": slots, "state": state}
+        self.cache.set(cache_key, trend)
+        return trend
+
+    def _open_title_index(self, date: datetime = None) -> Optional[Tuple[sqlite3.Connection, str]]:
+        """
+        打开包含可用标题倒排索引的热榜数据库
+
+        Returns:
+            (连接, 索引签名)；索引表不存在、尚未生成或规则版本不一致时返回 None
+        """
+        db_path = self._get_db_path(date, "news")
+        if db_path is None:
+            return None
+
+        conn = _connect_readonly(db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT name FROM sqlite_master
+                WHERE type='table' AND name='title_index_meta'
+            """)
+            if not cursor.fetchone():
+                conn.close()
+                return None
+
+            cursor.execute("SELECT index_version FROM title_index_meta WHERE id = 1")
+            row = cursor.fetchone()
+            if not row or row[0].split(":", 1)[0] != str(TITLE_INDEX_VERSION):
+                conn.close()
+                return None
+        except sqlite3.Error:
+            conn.close()
+            return None
+
+        return conn, row[0]
+
+    def read_topic_series(
+        self,
+        topic: str,
+        date: datetime = None,
+        sample_limit: int = 0
+    ) -> Optional[Dict]:
+        """
+        读取话题在指定日期的时间序列（带缓存）
+
+        预置话题（frequency_words.txt 中的词）直接读取抓取时维护的统计；其他话题
+        通过二元组倒排索引求交得到候选标题，再做子串校验后聚合。统计口径与逐条
+        `topic.lower() in title.lower()` 扫描完全一致。
+
+        Args:
+            topic: 话题关键词（大小写不敏感）
+            date: 日期对象，默认为今天
+            sample_limit: 返回的样本标题数（按标题读取顺序取前 N 条）
+
+        Returns:
+            {
+                "count": 包含话题的（平台, 标题）数,
+                "sample_titles": 样本标题列表,
+                "best_rank": 当天最高排名（未上榜为 None）,
+                "slots": [(抓取时间, 在榜条数, 排名之和, 最高排名), ...]（按时间升序）
+            }
+            索引不可用时返回 None（调用方应回退到逐条扫描）
+        """
+        date_str = self.get_date_folder_name(date)
+        key = topic.lower()
+        cache_key = f"topic_series:{date_str}:{key}:{sample_limit}"
+        cached = self.cache.get(cache_key, ttl=900)
+        if cached is not None:
+            return cached
+
+        opened = self._open_title_index(date)
+        if opened is None:
+            return None
+        conn, signature = opened
+
+        try:
+            cursor = conn.cursor()
+            if (not sample_limit and signature == get_title_index_signature()
+                    and key in get_topic_words()):
+                series = self._read_topic_stats(cursor, key)
+            else:
+                series = self._scan_title_index(cursor, key, sample_limit)
+        except sqlite3.Error as e:
+            print(f"Warning: 读取话题时间序列失败: {e}")
+            return None
+        finally:
+            conn.close()
+
+        self.cache.set(cache_key, series)
+        return series
+
+    @staticmethod
+    def _read_topic_stats(cursor: sqlite3.Cursor, topic: str) -> Dict:
+        """读取预置话题的抓取时统计"""
+        cursor.execute("SELECT title_count FROM topic_stats WHERE topic = ?", (topic,))
+        row = cursor.fetchone()
+        cursor.execute("""
+            SELECT crawl_time, count, rank_sum, best_rank FROM topic_slot_stats
+            WHERE topic = ? ORDER BY crawl_time
+        """, (topic,))
+        slots = [tuple(r) for r in cursor.fetchall()]
+        return {
+            "count": row[0] if row else 0,
+            "sample_titles": [],
+            "best_rank": min((s[3] for s in slots), default=None),
+            "slots": slots,
+        }
+
+    @staticmethod
+    def _match_topic_docs(cursor: sqlite3.Cursor, topic: str) -> List[int]:
+        """通过二元组倒排索引查找标题包含话题（小写）的索引文档"""
+        grams = sorted(title_grams(topic))
+        if grams:
+            placeholders = ",".join("?" * len(grams))
+            cursor.execute(f"""
+                SELECT id, title FROM title_docs WHERE id IN (
+                    SELECT doc_id FROM title_grams WHERE gram IN ({placeholders})
+                    GROUP BY doc_id HAVING COUNT(*) = ?
+                )
+            """, [*grams, len(grams)])
+        else:
+            # 单字话题无法利用二元组，候选为全部标题
+            cursor.execute("SELECT id, title FROM title_docs")
+        return [doc_id for doc_id, title in cursor.fetchall() if topic in title.lower()]
+
+    def _scan_title_index(self, cursor: sqlite3.Cursor, topic: str, sample_limit: int) -> Dict:
+        """通过二元组倒排索引计算任意话题的时间序列"""
+        doc_ids = self._match_topic_docs(cursor, topic)
+
+        news_keys: Dict[int, Tuple[str, str]] = {}
+        first_ids: Dict[Tuple[str, str], int] = {}
+        slot_ranks: Dict[str, Dict[Tuple[str, str], int]] = {}
+        if doc_ids:
+            placeholders = ",".join("?" * len(doc_ids))
+            cursor.execute(f"""
+                SELECT n.id, n.platform_id, n.title
+                FROM title_docs d
+                JOIN news_items n ON n.platform_id = d.platform_id AND n.title = d.title
+                WHERE d.id IN ({placeholders})
+            """, doc_ids)
+            for news_id, platform_id, title in cursor.fetchall():
+                key = (platform_id, title)
+                news_keys[news_id] = key
+                if key not in first_ids or news_id < first_ids[key]:
+                    first_ids[key] = news_id
+
+            placeholders = ",".join("?" * len(news_keys))
+            cursor.execute(f"""
+                SELECT news_item_id, crawl_time, rank FROM rank_history
+                WHERE news_item_id IN ({placeholders}) AND rank > 0
+            """, list(news_keys))
+            for news_id, crawl_time, rank in cursor.fetchall():
+                key = news_keys[news_id]
+                ranks = slot_ranks.setdefault(crawl_time, {})
+                if key not in ranks or rank < ranks[key]:
+                    ranks[key] = rank
+
+        sample_titles: List[str] = []
+        if sample_limit and first_ids:
+            # 与 read_all_titles_for_date 的标题顺序一致：平台按首条记录、平台内按标题首条记录
+            cursor.execute("SELECT platform_id, MIN(id) FROM news_items GROUP BY platform_id")
+            platform_order = dict(cursor.fetchall())
+            ordered = sorted(first_ids, key=lambda k: (platform_order.get(k[0], 0), first_ids[k]))
+            sample_titles = [title for _, title in ordered[:sample_limit]]
+
+        slots = [
+            (crawl_time, len(ranks), sum(ranks.values()), min(ranks.values()))
+            for crawl_time, ranks in sorted(slot_ranks.items())
+        ]
+        return {
+            "count": len(first_ids),
+            "sample_titles": sample_titles,
+            "best_rank": min((s[3] for s in slots), default=None),
+            "slots": slots,
+        }
+
+    def read_topic_titles(
+        self,
+        topic: str,
+        date: datetime = None,
+        platform_ids: Optional[List[str]] = None
+    ) -> Optional[List[Dict]]:
+        """
+        通过标题倒排索引读取包含话题的标题（带缓存）
+
+        结果与从 read_all_titles_for_date 中逐条筛选 `topic.lower() in title.lower()`
+        一致，但只读取命中的标题及其排名历史。
+
+        Args:
+            topic: 话题关键词（大小写不敏感）
+            date: 日期对象，默认为今天
+            platform_ids: 平台ID列表，None表示所有平台
+
+        Returns:
+            [{"platform_id", "platform_name", "title", "info"}, ...]（按标题读取顺序）；
+            索引不可用时返回 None（调用方应回退到读取全部标题）
+        """
+        date_str = self.get_date_folder_name(date)
+        platform_key = ','.join(sorted(platform_ids)) if platform_ids else 'all'
+        cache_key = f"topic_titles:{date_str}:{topic.lower()}:{platform_key}"
+        cached = self.cache.get(cache_key, ttl=900)
+        if cached is not None:
+            return cached
+
+        opened = self._open_title_index(date)
+        if opened is None:
+            return None
+        conn, _ = opened
+
+        try:
+            cursor = conn.cursor()
+            doc_ids = self._match_topic_docs(cursor, topic.lower())
+            items = self._read_title_docs(cursor, doc_ids, platform_ids)
+        except sqlite3.Error as e:
+            print(f"Warning: 读取话题标题失败: {e}")
+            return None
+        finally:
+            conn.close()
+
+        for item in items:
+            del item["doc_id"]
+
+        self.cache.set(cache_key, items)
+        return items
+
+    def search_title_index(
+        self,
+        query: str,
+        dates: List[datetime],
+        top_k: int
+    ) -> Tuple[List[Dict], List[datetime]]:
+        """
+        在标题倒排索引中按 BM25 检索与查询文本相关的标题
+
+        只读取查询文本二元组的倒排记录；文档频率取自各天的倒排表并在所有日期上汇总，
+        得分最高的 top_k 条再读取平台、排名等信息。
+
+        Args:
+            query: 查询文本（如参考新闻标题）
+            dates: 日期列表
+            top_k: 返回的候选数
+
+        Returns:
+            (候选列表, 无可用索引的日期列表)
+            候选按日期列表顺序、同一天内按标题读取顺序排列，每项为
+            {"date", "platform_id", "platform_name", "title", "info", "bm25"}，
+            info 含 ranks / url / mobileUrl，与 read_all_titles_for_date 中的标题信息一致
+        """
+        grams = sorted(title_grams(query))
+        missing: List[datetime] = []
+        days = []  # (日期序号, 文档数, 二元组总数, {doc_id: (标题, 命中的二元组)}, {gram: df})
+
+        for index, date in enumerate(dates):
+            opened = self._open_title_index(date)
+            if opened is None:
+                missing.append(date)
+                continue
+            conn, _ = opened
+            try:
+                cursor = conn.cursor()
+                cursor.execute("SELECT COUNT(*) FROM title_docs")
+                doc_count = cursor.fetchone()[0]
+                cursor.execute("SELECT COUNT(*) FROM title_grams")
+                gram_total = cursor.fetchone()[0]
+                docs: Dict[int, Tuple[str, List[str]]] = {}
+                df: Dict[str, int] = {}
+                if grams and doc_count:
+                    placeholders = ",".join("?" * len(grams))
+                    cursor.execute(f"""
+                        SELECT g.gram, g.doc_id, d.title FROM title_grams g
+                        JOIN title_docs d ON d.id = g.doc_id
+                        WHERE g.gram IN ({placeholders})
+                    """, grams)
+                    for gram, doc_id, title in cursor.fetchall():
+                        df[gram] = df.get(gram, 0) + 1
+                        docs.setdefault(doc_id, (title, []))[1].append(gram)
+            except sqlite3.Error as e:
+                print(f"Warning: 读取标题索引失败: {e}")
+                missing.append(date)
+                continue
+            finally:
+                conn.close()
+            days.append((index, doc_count, gram_total, docs, df))
+
+        total_docs = sum(day[1] for day in days)
+        if not total_docs:
+            return [], missing
+
+        avg_length = sum(day[2] for day in days) / total_docs
+        idf = {}
+        for gram in grams:
+            df = sum(day[4].get(gram, 0) for day in days)
+            idf[gram] = math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+
+        scored = []
+        for index, _, _, docs, _ in days:
+            for doc_id, (title, matched) in docs.items():
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * len(title_grams(title)) / avg_length)
+                score = sum(idf[gram] for gram in matched) * (BM25_K1 + 1) / (1 + norm)
+                scored.append((score, index, doc_id))
+        top = heapq.nlargest(top_k, scored)
+
+        selected: Dict[int, Dict[int, float]] = {}
+        for score, index, doc_id in top:
+            selected.setdefault(index, {})[doc_id] = score
+
+        candidates = []
+        for index in sorted(selected):
+            date = dates[index]
+            opened = self._open_title_index(date)
+            if opened is None:
+                continue
+            conn, _ = opened
+            try:
+                for item in self._read_title_docs(conn.cursor(), list(selected[index])):
+                    item["date"] = date
+                    item["bm25"] = selected[index][item.pop("doc_id")]
+                    candidates.append(item)
+            except sqlite3.Error as e:
+                print(f"Warning: 读取标题信息失败: {e}")
+            finally:
+                conn.close()
+
+        return candidates, missing
+
+    @staticmethod
+    def _read_title_docs(
+        cursor: sqlite3.Cursor,
+        doc_ids: List[int],
+        platform_ids: Optional[List[str]] = None
+    ) -> List[Dict]:
+        """
+        读取索引文档对应的新闻信息
+
+        与 read_all_titles_for_date 保持一致：同一（平台, 标题）取最后一条记录的信息；
+        结果按平台首条记录（指定平台时按平台ID）、平台内标题首条记录的顺序排列。
+        """
+        if not doc_ids:
+            return []
+        placeholders = ",".join("?" * len(doc_ids))
+        cursor.execute(f"""
+            SELECT d.id, n.id, n.platform_id, p.name, n.title, n.rank, n.url, n.mobile_url
+            FROM title_docs d
+            JOIN news_items n ON n.platform_id = d.platform_id AND n.title = d.title
+            LEFT JOIN platforms p ON p.id = n.platform_id
+            WHERE d.id IN ({placeholders})
+        """, doc_ids)
+
+        first_ids: Dict[int, int] = {}
+        latest: Dict[int, tuple] = {}
+        for row in cursor.fetchall():
+            if platform_ids and row[2] not in platform_ids:
+                continue
+            doc_id, news_id = row[0], row[1]
+            if doc_id not in first_ids or news_id < first_ids[doc_id]:
+                first_ids[doc_id] = news_id
+            if doc_id not in latest or news_id > latest[doc_id][1]:
+                latest[doc_id] = row
+
+        news_ids = [row[1] for row in latest.values()]
+        rank_history: Dict[int, List[int]] = {}
+        if news_ids:
+            placeholders = ",".join("?" * len(news_ids))
+            cursor.execute(f"""
+                SELECT news_item_id, rank FROM rank_history
+                WHERE news_item_id IN ({placeholders})
+                ORDER BY news_item_id, crawl_time
+            """, news_ids)
+            for news_id, rank in cursor.fetchall():
+                rank_history.setdefault(news_id, []).append(rank)
+
+        if platform_ids:
+            # 按平台筛选时读取端经平台索引扫描，平台按ID排序
+            platform_order = {pid: pid for pid in platform_ids}
+        else:
+            cursor.execute("SELECT platform_id, MIN(id) FROM news_items GROUP BY platform_id")
+            platform_order = dict(cursor.fetchall())
+
+        items = []
+        for doc_id in sorted(latest, key=lambda d: (platform_order[latest[d][2]], first_ids[d])):
+            _, news_id, platform_id, platform_name, title, rank, url, mobile_url = latest[doc_id]
+            items.append({
+                "doc_id": doc_id,
+                "platform_id": platform_id,
+                "platform_name": platform_name or platform_id,
+                "title": title,
+                "info": {
+                    "ranks": rank_history.get(news_id, [rank]),
+                    "url": url or "",
+                    "mobileUrl": mobile_url or "",
+                },
+            })
+        return items
+
+    def iter_rss_items(
+        self,
+        date: datetime = None,
+        feed_ids: Optional[List[str]] = None,
+        keyword: Optional[str] = None,
+        include_summary: bool = False,
+        page_size: int = RSS_PAGE_SIZE
+    ) -> Iterator[Dict]:
+        """
+        按发布时间倒序逐页读取 RSS 条目（键集分页）
+
+        源过滤、关键词匹配、排序和分页都在 SQL 中完成（走 idx_rss_published /
+        idx_rss_feed 索引），只查询需要的列；摘要仅在 include_summary 时读取。
+        调用方停止迭代后不会再读取后续页。
+
+        Args:
+            date: 日期对象，默认为今天
+            feed_ids: RSS 源 ID 列表，None 表示所有源
+            keyword: 标题或摘要包含的关键词（ASCII 字母不区分大小写）
+            include_summary: 是否读取摘要
+            page_size: 每页条数
+
+        Yields:
+            条目字典：feed_id, feed_name, title, url, published_at, author[, summary]
+            顺序为 published_at DESC, id ASC（无发布时间的条目在最后）
+        """
+        db_path = self._get_db_path(date, "rss")
+        if db_path is None:
+            return
+
+        columns = "i.id, i.feed_id, f.name AS feed_name, i.title, i.url, i.published_at, i.author"
+        if include_summary:
+            columns += ", i.summary"
+
+        conditions = []
+        params: list = []
+        if feed_ids:
+            conditions.append(f"i.feed_id IN ({','.join('?' * len(feed_ids))})")
+            params.extend(feed_ids)
+        if keyword:
+            pattern = "%" + re.sub(r"([\\%_])", r"\\\1", keyword) + "%"
+            conditions.append("(i.title LIKE ? ESCAPE '\\' OR i.summary LIKE ? ESCAPE '\\')")
+            params.extend([pattern, pattern])
+
+        conn = _connect_readonly(db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT name FROM sqlite_master
+                WHERE type='table' AND name='rss_items'
+            """)
+            if not cursor.fetchone():
+                return
+
+            last_published, last_id = None, None
+            exhausted_dated = False
+            while True:
+                # 键集条件：先扫有发布时间的条目，扫完后再扫无发布时间的条目
+                if last_id is None:
+                    page_condition = "i.published_at IS NOT NULL"
+                    page_params: list = []
+                elif not exhausted_dated:
+                    page_condition = "(i.published_at < ? OR (i.published_at = ? AND i.id > ?))"
+                    page_params = [last_published, last_published, last_id]
+                else:
+                    page_condition = "i.published_at IS NULL AND i.id > ?"
+                    page_params = [last_id]
+
+                where = " AND ".join(conditions + [page_condition])
+                cursor.execute(f"""
+                    SELECT {columns}
+                    FROM rss_items i
+                    LEFT JOIN rss_feeds f ON i.feed_id = f.id
+                    WHERE {where}
+                    ORDER BY i.published_at DESC, i.id
+                    LIMIT ?
+                """, params + page_params + [page_size])
+                rows = cursor.fetchall()
+
+                for row in rows:
+                    item = {
+                        "feed_id": row["feed_id"],
+                        "feed_name": row["feed_name"] or row["feed_id"],
+                        "title": row["title"],
+                        "url": row["url"] or "",
+                        "published_at": row["published_at"] or "",
+                        "author": row["author"] or "",
+                    }
+                    if include_summary:
+                        item["summary"] = row["summary"] or ""
+                    yield item
+
+                if len(rows) < page_size:
+                    if exhausted_dated:
+                        return
+                    # 有发布时间的条目已读完，转入无发布时间的条目
+                    exhausted_dated = True
+                    last_id = 0
+                    continue
+
+                last_published, last_id = rows[-1]["published_at"], rows[-1]["id"]
+        except sqlite3.Error as e:
+            print(f"Warning: 读取 RSS 数据失败: {e}")
+        finally:
+            conn.close()
+
+    def find_rss_urls(
+        self,
+        date: datetime,
+        urls: Iterable[str],
+        feed_ids: Optional[List[str]] = None
+    ) -> set:
+        """
+        查询指定日期中已存在的 RSS URL（用于跨日期去重，走 idx_rss_url_feed 索引）
+
+        Args:
+            date: 日期对象
+            urls: 待查询的 URL
+            feed_ids: RSS 源 ID 列表，None 表示所有源
+
+        Returns:
+            存在于该日期数据中的 URL 集合
+        """
+        urls = [url for url in set(urls) if url]
+        db_path = self._get_db_path(date, "rss")
+        if not urls or db_path is None:
+            return set()
+
+        found = set()
+        conn = _connect_readonly(db_path)
+        try:
+            cursor = conn.cursor()
+            # 分批查询，避免超出 SQLite 参数数量上限
+            for start in range(0, len(urls), 500):
+                batch = urls[start:start + 500]
+                query = f"SELECT DISTINCT url FROM rss_items WHERE url IN ({','.join('?' * len(batch))})"
+                params = list(batch)
+                if feed_ids:
+                    query += f" AND feed_id IN ({','.join('?' * len(feed_ids))})"
+                    params.extend(feed_ids)
+                cursor.execute(query, params)
+                found.update(row[0] for row in cursor.fetchall())
+        except sqlite3.Error as e:
+            print(f"Warning: 查询 RSS URL 失败: {e}")
+        finally:
+            conn.close()
+
+        return found
+
+    def read_rss_latest_crawl_time(self, date: datetime = None) -> Optional[datetime]:
+        """
+        读取指定日期最后一次 RSS 抓取的记录时间
+
+        Args:
+            date: 日期对象，默认为今天
+
+        Returns:
+            最后一次抓取时间，无抓取记录时返回 None
+        """
+        db_path = self._get_db_path(date, "rss")
+        if db_path is None:
+            return None
+
+        conn = _connect_readonly(db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT MAX(created_at) FROM rss_crawl_records")
+            row = cursor.fetchone()
+            if row and row[0]:
+                return datetime.strptime(row[0], "%Y-%m-%d %H:%M:%S")
+        except (sqlite3.Error, ValueError):
+            pass
+        finally:
+            conn.close()
+
+        return None
+
+    @staticmethod
+    def get_dates_in_range(start_date: datetime, end_date: datetime) -> List[datetime]:
+        """
+        展开日期范围为逐日列表（包含首尾）
+
+        Args:
+            start_date: 开始日期
+            end_date: 结束日期
+
+        Returns:
+            日期列表（升序）
+        """
+        dates = []
+        current_date = start_date
+        while current_date <= end_date:
+            dates.append(current_date)
+            current_date += timedelta(days=1)
+        return dates
+
+    def _read_titles_or_none(
+        self,
+        date: datetime,
+        platform_ids: Optional[List[str]],
+        db_type: str
+    ) -> Optional[Tuple[Dict, Dict, Dict]]:
+        """读取单日数据，数据不存在时返回 None"""
+        try:
+            return self.read_all_titles_for_date(
+                date=date, platform_ids=platform_ids, db_type=db_type
+            )
+        except DataNotFoundError:
+            return None
+
+    def iter_titles_for_dates(
+        self,
+        dates: Iterable[datetime],
+        platform_ids: Optional[List[str]] = None,
+        db_type: str = "news",
+        max_workers: Optional[int] = None,
+        ordered: bool = False
+    ) -> Iterator[Tuple[datetime, Optional[Tuple[Dict, Dict, Dict]]]]:
+        """
+        并行读取多天数据，逐天产出结果
+
+        每天的数据是独立的 SQLite 文件，使用有界线程池并行读取
+        （sqlite3 查询期间释放 GIL）。同一时刻最多有 2 × max_workers 天
+        处于加载中或等待消费，调用方可以边加载边聚合，无需先读完全部日期。
+
+        Args:
+            dates: 日期列表
+            platform_ids: 平台/Feed ID列表，None表示所有
+            db_type: 数据库类型 ("news" 或 "rss")
+            max_workers: 最大并发数，默认 DAY_LOADER_MAX_WORKERS
+            ordered: 是否按输入日期顺序产出（默认按完成顺序）
+
+        Yields:
+            (date, (all_titles, id_to_name, all_timestamps)) 元组，
+            该日期无数据时第二项为 None
+        """
+        dates = list(dates)
+        if not dates:
+            return
+
+        workers = max(1, min(max_workers or DAY_LOADER_MAX_WORKERS, len(dates)))
+        if workers == 1:
+            for date in dates:
+                yield date, self._read_titles_or_none(date, platform_ids, db_type)
+            return
+
+        window = workers * 2
+        date_iter = iter(dates)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="day-loader") as executor:
+
+            def submit_next(pending):
+                date = next(date_iter, None)
+                if date is not None:
+                    # 在调用方上下文中读取（共享批量查询的缓存快照）
+                    future = executor.submit(
+                        copy_context().run,
+                        self._read_titles_or_none, date, platform_ids, db_type
+                    )
+                    pending.append((future, date))
+
+            pending = deque()
+            for _ in range(window):
+                submit_next(pending)
+
+            if ordered:
+                # 按输入顺序产出：先完成的后续日期在窗口内等待
+                while pending:
+                    future, date = pending.popleft()
+                    result = future.result()
+                    submit_next(pending)
+                    yield date, result
+            else:
+                while pending:
+                    done, _ = wait([f for f, _ in pending], return_when=FIRST_COMPLETED)
+                    finished = [(f, d) for f, d in pending if f in done]
+                    pending = deque((f, d) for f, d in pending if f not in done)
+                    for future, date in finished:
+                        submit_next(pending)
+                        yield date, future.result()
+
     def parse_yaml_config(self, config_path: str = None) -> dict:
         """
         解析YAML配置文件
@@ -428,7 +1528,10 @@ class ParserService:
             if date_match:
                 dates.append(date_match.group(1))
 
-        return sorted(dates, reverse=True)
+        # 已归档的日期
+        dates.extend(list_archived_dates(db_dir))
+
+        return sorted(set(dates), reverse=True)
 
     def get_available_date_range(self, db_type: str = "news") -> Tuple[Optional[datetime], Optional[datetime]]:
         """
@@ -0,0 +1,338 @@
+"""
+工具调度服务
+
+按查询成本把工具调用分配到独立的线程池，避免少数重查询拖慢轻量查询：
+- light: 最新数据、配置、状态等毫秒级查询
+- heavy: 多日分析、搜索、聚合等 CPU 密集查询（纯 Python 计算受 GIL 限制，
+  少量并发即可占满算力，更多并发只会放大内存占用）
+- io: 读取文章、检查版本、触发抓取、远程同步等访问外部网络的调用
+- process（可选）: 聚合、时段对比、关键词共现等纯 Python 计算，在进程池中执行以
+  摆脱 GIL，并发重查询的吞吐随核心数增长。设置 MCP_PROCESS_WORKERS > 0 启用；
+  工作进程启动时预先创建分析工具实例，按日期直接读取数据库（SQLite 内存映射，
+  多个进程共享操作系统页缓存），只有查询参数和结果在进程间传递
+
+每个成本类别有并发上限（线程数）和准入上限（排队 + 执行中的调用数），超出
+准入上限的调用立即返回 SERVER_BUSY；单个工具另有并发上限。尚未开始执行的调用
+在客户端断开（协程被取消）时直接撤销；已在执行的调用跑完后才释放名额。
+"""
+
+import asyncio
+import contextvars
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..utils.errors import ServerBusyError
+from .cache_service import get_cache
+
+
+def _env_int(key: str, default: int) -> int:
+    """读取整数环境变量，无效时返回默认值"""
+    value = os.environ.get(key, "").strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+# 成本类别默认配置：(线程数, 准入上限)，可通过 MCP_<类别>_WORKERS / MCP_<类别>_MAX_PENDING 调整
+DEFAULT_COST_CLASSES = {
+    "light": (8, 64),
+    "heavy": (2, 8),
+    "io": (4, 16),
+}
+
+# 工具成本类别（未列出的工具按 light 处理）
+TOOL_COST_CLASSES = {
+    "get_news_by_date": "heavy",
+    "search_news": "heavy",
+    "search_rss": "heavy",
+    "find_related_news": "heavy",
+    "analyze_topic_trend": "heavy",
+    "analyze_data_insights": "heavy",
+    "analyze_sentiment": "heavy",
+    "aggregate_news": "heavy",
+    "compare_periods": "heavy",
+    "generate_summary_report": "heavy",
+    "check_version": "io",
+    "trigger_crawl": "io",
+    "sync_from_remote": "io",
+    "read_article": "io",
+    "read_articles_batch": "io",
+}
+
+# 可在进程池中执行的工具：工具名 -> (工具实例名, 方法名)
+PROCESS_TOOLS = {
+    "aggregate_news": ("analytics", "aggregate_news"),
+    "compare_periods": ("analytics", "compare_periods"),
+    "analyze_data_insights": ("analytics", "analyze_data_insights_unified"),
+}
+
+# 单个工具的并发上限（未列出的工具以所属类别的线程数为上限）
+TOOL_CONCURRENCY_LIMITS = {
+    "aggregate_news": 1,
+    "generate_summary_report": 1,
+    "trigger_crawl": 1,
+    "sync_from_remote": 1,
+}
+
+
+# 工作进程中的工具实例（由 _init_process_worker 创建）
+_worker_tools: Dict[str, Any] = {}
+
+
+def _init_process_worker(project_root: Optional[str]) -> None:
+    """工作进程初始化：预先导入分析模块、创建工具实例并加载今天的数据"""
+    from ..tools.analytics import AnalyticsTools
+
+    tools = AnalyticsTools(project_root)
+    _worker_tools["analytics"] = tools
+    try:
+        tools.data_service.parser.read_all_titles_for_date()
+    except Exception:
+        # 今天暂无数据时首个查询再按需加载
+        pass
+
+
+def _run_in_worker(tools_key: str, method_name: str, args: tuple, kwargs: dict) -> Any:
+    """在工作进程中调用工具方法"""
+    return getattr(_worker_tools[tools_key], method_name)(*args, **kwargs)
+
+
+class CostClass:
+    """单个成本类别：独立执行器 + 准入计数（只在事件循环线程中修改）"""
+
+    def __init__(
+        self,
+        name: str,
+        workers: int,
+        max_pending: int,
+        executor_factory: Optional[Callable[[int], Executor]] = None
+    ):
+        self.name = name
+        self.workers = max(1, workers)
+        self.max_pending = max(self.workers, max_pending)
+        self._executor_factory = executor_factory or (
+            lambda n: ThreadPoolExecutor(max_workers=n, thread_name_prefix=f"mcp-{name}")
+        )
+        self._executor: Optional[Executor] = None
+        self.pending = 0
+        self.rejected = 0
+        self.completed = 0
+
+    @property
+    def executor(self) -> Executor:
+        """执行器（首次使用时创建）"""
+        if self._executor is None:
+            self._executor = self._executor_factory(self.workers)
+        return self._executor
+
+    def shutdown(self) -> None:
+        """关闭执行器（撤销尚未开始的调用），下次使用时重新创建"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+class ToolScheduler:
+    """
+    按成本类别调度工具调用
+
+    用法：
+        result = await get_scheduler().run("compare_periods", func, **kwargs)
+
+    调用在复制的上下文中执行（与 asyncio.to_thread 一致），请求级缓存快照等
+    上下文变量对工具函数可见。启用进程池后，PROCESS_TOOLS 中的工具改由工作进程
+    中的工具实例执行（func 不会被调用）；处于缓存快照中的调用（批量查询）仍在
+    线程池执行，以保证快照一致。
+    """
+
+    def __init__(
+        self,
+        cost_classes: Optional[Dict[str, tuple]] = None,
+        tool_classes: Optional[Dict[str, str]] = None,
+        tool_limits: Optional[Dict[str, int]] = None,
+        process_workers: Optional[int] = None,
+        project_root: Optional[str] = None
+    ):
+        cost_classes = cost_classes or DEFAULT_COST_CLASSES
+        self.classes: Dict[str, CostClass] = {}
+        for name, (workers, max_pending) in cost_classes.items():
+            key = name.upper()
+            self.classes[name] = CostClass(
+                name,
+                _env_int(f"MCP_{key}_WORKERS", workers),
+                _env_int(f"MCP_{key}_MAX_PENDING", max_pending),
+            )
+        self.tool_classes = TOOL_COST_CLASSES if tool_classes is None else tool_classes
+        self.tool_limits = TOOL_CONCURRENCY_LIMITS if tool_limits is None else tool_limits
+        self._tool_semaphores: Dict[Tuple[str, str], asyncio.Semaphore] = {}
+
+        # 进程池（默认关闭：每个工作进程各自缓存数据，内存占用随进程数增长）
+        self.project_root = project_root
+        if process_workers is None:
+            process_workers = _env_int("MCP_PROCESS_WORKERS", 0)
+        if process_workers > 0:
+            self.classes["process"] = CostClass(
+                "process",
+                process_workers,
+                _env_int("MCP_PROCESS_MAX_PENDING", process_workers * 4),
+                self._create_process_pool,
+            )
+
+    def _create_process_pool(self, workers: int) -> ProcessPoolExecutor:
+        # 使用 spawn：服务进程中已有线程池和事件循环线程，fork 后可能死锁
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_process_worker,
+            initargs=(self.project_root,),
+        )
+
+    def get_cost_class(self, tool_name: str) -> CostClass:
+        """获取工具所属的成本类别"""
+        return self.classes.get(self.tool_classes.get(tool_name, "light"), self.classes["light"])
+
+    def _use_process(self, tool_name: str) -> bool:
+        return (
+            "process" in self.classes
+            and tool_name in PROCESS_TOOLS
+            and not get_cache().in_snapshot()
+        )
+
+    def _get_tool_semaphore(self, tool_name: str, cost_class: CostClass) -> asyncio.Semaphore:
+        key = (cost_class.name, tool_name)
+        semaphore = self._tool_semaphores.get(key)
+        if semaphore is None:
+            # 单工具上限用于保护共享 GIL 的线程池；进程池中各调用互不影响
+            limit = cost_class.workers
+            if cost_class.name != "process":
+                limit = min(self.tool_limits.get(tool_name, limit), limit)
+            semaphore = asyncio.Semaphore(max(1, limit))
+            self._tool_semaphores[key] = semaphore
+        return semaphore
+
+    async def run(self, tool_name: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        在工具所属类别的线程池（或进程池）中执行调用
+
+        Args:
+            tool_name: 工具名（决定成本类别和并发上限）
+            func: 同步函数
+            *args, **kwargs: 函数参数
+
+        Returns:
+            函数返回值
+
+        Raises:
+            ServerBusyError: 该类别排队 + 执行中的调用已达准入上限
+        """
+        use_process = self._use_process(tool_name)
+        if not use_process:
+            return await self._dispatch(tool_name, self.get_cost_class(tool_name), False, func, args, kwargs)
+
+        try:
+            return await self._dispatch(tool_name, self.classes["process"], True, func, args, kwargs)
+        except BrokenProcessPool:
+            # 工作进程异常退出：重建进程池，本次调用改在所属类别的线程池执行
+            # （重新经过该类别的准入检查与并发名额）
+            print(f"[调度] 进程池异常，已重建: {tool_name}")
+            self.classes["process"].shutdown()
+            return await self._dispatch(tool_name, self.get_cost_class(tool_name), False, func, args, kwargs)
+
+    async def _dispatch(
+        self,
+        tool_name: str,
+        cost_class: CostClass,
+        use_process: bool,
+        func: Callable,
+        args: tuple,
+        kwargs: dict
+    ) -> Any:
+        """准入检查、获取工具并发名额后提交到 cost_class 的执行器，名额在调用结束后释放"""
+        if cost_class.pending >= cost_class.max_pending:
+            cost_class.rejected += 1
+            raise ServerBusyError(
+                f"{cost_class.name} 类查询繁忙（{cost_class.pending} 个排队或执行中），"
+                f"请稍后重试 {tool_name}"
+            )
+
+        loop = asyncio.get_running_loop()
+        semaphore = self._get_tool_semaphore(tool_name, cost_class)
+        cost_class.pending += 1
+        try:
+            await semaphore.acquire()
+        except BaseException:
+            # 等待工具并发名额时被取消
+            cost_class.pending -= 1
+            raise
+
+        try:
+            if use_process:
+                tools_key, method_name = PROCESS_TOOLS[tool_name]
+                future = cost_class.executor.submit(
+                    _run_in_worker, tools_key, method_name, args, kwargs
+                )
+            else:
+                future = cost_class.executor.submit(
+                    contextvars.copy_context().run, func, *args, **kwargs
+                )
+        except BaseException:
+            self._release(cost_class, semaphore)
+            raise
+
+        # 名额在线程真正结束（或排队中被撤销）后才释放
+        def on_done(_):
+            try:
+                loop.call_soon_threadsafe(self._release, cost_class, semaphore)
+            except RuntimeError:
+                # 事件循环已关闭（服务退出中），无需再释放
+                pass
+
+        future.add_done_callback(on_done)
+        return await asyncio.wrap_future(future)
+
+    @staticmethod
+    def _release(cost_class: CostClass, semaphore: asyncio.Semaphore) -> None:
+        cost_class.pending -= 1
+        cost_class.completed += 1
+        semaphore.release()
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """各成本类别的线程数、准入上限、当前排队 + 执行数和累计拒绝 / 完成数"""
+        return {
+            name: {
+                "workers": c.workers,
+                "max_pending": c.max_pending,
+                "pending": c.pending,
+                "rejected": c.rejected,
+                "completed": c.completed,
+            }
+            for name, c in self.classes.items()
+        }
+
+    def shutdown(self) -> None:
+        """关闭全部执行器（撤销尚未开始的调用）"""
+        for cost_class in self.classes.values():
+            cost_class.shutdown()
+
+
+# 全局调度器实例
+_global_scheduler = None
+
+
+def get_scheduler() -> ToolScheduler:
+    """
+    获取全局调度器实例
+
+    Returns:
+        全局工具调度器
+    """
+    global _global_scheduler
+    if _global_scheduler is None:
+        _global_scheduler = ToolScheduler()
+    return _global_scheduler
@@ -4,17 +4,32 @@
 提供热度趋势分析、平台对比、关键词共现、情感分析等高级分析功能。
 """
 
+import heapq
+import math
 import os
-import re
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from difflib import SequenceMatcher
 
 import yaml
 
-from trendradar.core.analyzer import calculate_news_weight as _calculate_news_weight
+from trendradar.core.analyzer import (
+    calculate_news_weight as _calculate_news_weight,
+    make_rank_summary_weight_func,
+    summarize_ranks,
+)
+from trendradar.core.anomaly import (
+    MIN_VARIANCE,
+    baseline_from_moments,
+    compose_day_states,
+    decay_factor,
+    z_score,
+)
+from trendradar.core.forecast import holt_forecast
+from trendradar.core.keywords import extract_keyword_pairs, extract_keywords
 
+from ..services.aggregate_service import AggregateService, PeriodAggregate
 from ..services.data_service import DataService
 from ..utils.validators import (
     validate_platforms,
@@ -27,13 +42,48 @@ from ..utils.validators import (
 from ..utils.errors import MCPError, InvalidParameterError, DataNotFoundError
 
 
+# 异常热度检测：窗口平均在榜条数相对基线的最小 z 分数
+VIRAL_MIN_ZSCORE = 3.0
+
+# 基线均值低于该值（每次抓取平均在榜条数）时视为新话题
+VIRAL_NEW_TOPIC_BASELINE = 0.05
+
+# 新话题至少出现的次数（按天对比的回退检测）
+VIRAL_NEW_TOPIC_MIN_COUNT = 5
+
+# 热度状态检测：时间窗口内累计在榜次数下限（过滤基线很小时少量在榜造成的高倍数）
+VIRAL_MIN_WINDOW_COUNT = 5
+
+# 窗口前的历史观测权重低于该值时基线不可靠，回退到按天对比
+VIRAL_MIN_BASELINE_WEIGHT = 0.5
+
+# 热点预测：预测在榜条数下限与最小相对增长
+PREDICT_MIN_COUNT = 3
+PREDICT_MIN_GROWTH = 0.3
+
+# 跨天叠加热度状态：最多回溯的天数，以及可忽略的衰减倍数
+VIRAL_MAX_LOOKBACK_DAYS = 7
+VIRAL_DECAY_CUTOFF = 1e-2
+
+# 摘要报告的精选新闻样本条数
+SUMMARY_SAMPLE_SIZE = 5
+
+
+# 权重配置缓存：(config.yaml 修改时间, 权重配置)
+_weight_config_cache: Optional[Tuple[float, Dict]] = None
+
+
 def _get_weight_config() -> Dict:
     """
     从 config.yaml 读取权重配置
 
+    结果按文件修改时间缓存，排序时逐条计算权重也只解析一次 YAML。
+
     Returns:
         权重配置字典，包含 RANK_WEIGHT, FREQUENCY_WEIGHT, HOTNESS_WEIGHT
     """
+    global _weight_config_cache
+
     # 默认值
     default_config = {
         "RANK_WEIGHT": 0.6,
@@ -46,14 +96,20 @@ def _get_weight_config() -> Dict:
         config_path = os.path.join(current_dir, "..", "..", "config", "config.yaml")
         config_path = os.path.normpath(config_path)
 
+        mtime = os.path.getmtime(config_path)
+        if _weight_config_cache is not None and _weight_config_cache[0] == mtime:
+            return _weight_config_cache[1]
+
         with open(config_path, 'r', encoding='utf-8') as f:
             config = yaml.safe_load(f)
             weight = config.get('advanced', {}).get('weight', {})
-            return {
+            weight_config = {
                 "RANK_WEIGHT": weight.get('rank', 0.6),
                 "FREQUENCY_WEIGHT": weight.get('frequency', 0.3),
                 "HOTNESS_WEIGHT": weight.get('hotness', 0.1),
             }
+        _weight_config_cache = (mtime, weight_config)
+        return weight_config
     except Exception:
         return default_config
 
@@ -86,6 +142,7 @@ class AnalyticsTools:
             project_root: 项目根目录
         """
         self.data_service = DataService(project_root)
+        self.aggregator = AggregateService(self.data_service.parser)
 
     def analyze_data_insights_unified(
         self,
@@ -307,41 +364,18 @@ class AnalyticsTools:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=6)
 
-            # 收集趋势数据
+            # 收集趋势数据（优先读取话题时间序列，无索引的日期回退到逐条扫描）
+            parser = self.data_service.parser
+            dates = parser.get_dates_in_range(start_date, end_date)
             trend_data = []
-            current_date = start_date
-
-            while current_date <= end_date:
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    # 统计该时间点的话题出现次数
-                    count = 0
-                    matched_titles = []
-
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
-                                matched_titles.append(title)
 
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": count,
-                        "sample_titles": matched_titles[:3]  # 只保留前3个样本
-                    })
-
-                except DataNotFoundError:
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": 0,
-                        "sample_titles": []
-                    })
-
-                # 按天增加时间
-                current_date += timedelta(days=1)
+            for current_date, series in self._iter_topic_series(topic, dates, sample_limit=3):
+                trend_data.append({
+                    "date": current_date.strftime("%Y-%m-%d"),
+                    "count": series["count"] if series else 0,
+                    "sample_titles": series["sample_titles"] if series else [],  # 只保留前3个样本
+                    "best_rank": series["best_rank"] if series else None
+                })
 
             # 计算趋势指标
             counts = [item["count"] for item in trend_data]
@@ -409,6 +443,10 @@ class AnalyticsTools:
         """
         平台对比分析 - 对比不同平台对同一话题的关注度
 
+        有关键词分平台计数（及话题索引）的日期直接查询，不再对全部标题分词；
+        total_news 为每天各平台去重后的标题数之和，unique_titles 为整个日期范围内
+        去重后的标题数（在 SQL 中跨天去重，不读取标题集合），两种读取方式口径一致。
+
         Args:
             topic: 话题关键词（可选，不指定则对比整体活跃度）
             date_range: 日期范围，格式: {"start": "YYYY-MM-DD", "end": "YYYY-MM-DD"}
@@ -446,37 +484,46 @@ class AnalyticsTools:
             platform_stats = defaultdict(lambda: {
                 "total_news": 0,
                 "topic_mentions": 0,
-                "unique_titles": set(),
                 "top_keywords": Counter()
             })
 
-            # 遍历日期范围
-            current_date = start_date
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
+            # 有抓取时统计的日期直接查表（平台标题数 + 关键词分平台计数 + 话题索引）
+            parser = self.data_service.parser
+            dates = parser.get_dates_in_range(start_date, end_date)
+            missing = []
+            for date in dates:
+                day_stats = self._read_platform_day_stats(date, topic)
+                if day_stats is None:
+                    missing.append(date)
+                    continue
+                for platform_name, stats in day_stats.items():
+                    target = platform_stats[platform_name]
+                    target["total_news"] += stats["title_count"]
+                    target["topic_mentions"] += stats["topic_mentions"]
+                    target["top_keywords"].update(stats["keywords"])
+
+            # 其余日期并行读取标题后实时统计（按日期顺序聚合）
+            for _, day_data in parser.iter_titles_for_dates(missing, ordered=True):
+                if day_data is None:
+                    continue
+                all_titles, id_to_name, _ = day_data
 
-                        for title in titles.keys():
-                            platform_stats[platform_name]["total_news"] += 1
-                            platform_stats[platform_name]["unique_titles"].add(title)
+                for platform_id, titles in all_titles.items():
+                    platform_name = id_to_name.get(platform_id, platform_id)
 
-                            # 如果指定了话题，统计包含话题的新闻
-                            if topic and topic.lower() in title.lower():
-                                platform_stats[platform_name]["topic_mentions"] += 1
+                    for title in titles.keys():
+                        platform_stats[platform_name]["total_news"] += 1
 
-                            # 提取关键词（简单分词）
-                            keywords = self._extract_keywords(title)
-                            platform_stats[platform_name]["top_keywords"].update(keywords)
+                        # 如果指定了话题，统计包含话题的新闻
+                        if topic and topic.lower() in title.lower():
+                            platform_stats[platform_name]["topic_mentions"] += 1
 
-                except DataNotFoundError:
-                    pass
+                        # 提取关键词（简单分词）
+                        keywords = self._extract_keywords(title)
+                        platform_stats[platform_name]["top_keywords"].update(keywords)
 
-                current_date += timedelta(days=1)
+            # 整个日期范围内去重后的标题数
+            unique_titles = parser.count_unique_titles(dates)
 
             # 转换为可序列化的格式
             result_stats = {}
@@ -488,11 +535,13 @@ class AnalyticsTools:
                 result_stats[platform] = {
                     "total_news": stats["total_news"],
                     "topic_mentions": stats["topic_mentions"],
-                    "unique_titles": len(stats["unique_titles"]),
+                    "unique_titles": unique_titles.get(platform, 0),
                     "coverage_rate": round(coverage_rate, 2),
                     "top_keywords": [
                         {"keyword": k, "count": v}
-                        for k, v in stats["top_keywords"].most_common(5)
+                        for k, v in heapq.nsmallest(
+                            5, stats["top_keywords"].items(), key=lambda x: (-x[1], x[0])
+                        )
                     ]
                 }
 
@@ -559,47 +608,45 @@ class AnalyticsTools:
             min_frequency = validate_limit(min_frequency, default=3, max_limit=100)
             top_n = validate_top_n(top_n, default=20)
 
-            # 读取今天的数据
-            all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
+            parser = self.data_service.parser
 
-            # 关键词共现统计
-            cooccurrence = Counter()
-            keyword_titles = defaultdict(list)
+            # 优先使用抓取时预计算的共现统计
+            top_pairs = parser.read_keyword_pairs(min_count=min_frequency, limit=top_n)
 
-            for platform_id, titles in all_titles.items():
-                for title in titles.keys():
-                    # 提取关键词
-                    keywords = self._extract_keywords(title)
-
-                    # 记录每个关键词出现的标题
-                    for kw in keywords:
-                        keyword_titles[kw].append(title)
-
-                    # 计算两两共现
-                    if len(keywords) >= 2:
-                        for i, kw1 in enumerate(keywords):
-                            for kw2 in keywords[i+1:]:
-                                # 统一排序，避免重复
-                                pair = tuple(sorted([kw1, kw2]))
-                                cooccurrence[pair] += 1
-
-            # 过滤低频共现
-            filtered_pairs = [
-                (pair, count) for pair, count in cooccurrence.items()
-                if count >= min_frequency
-            ]
+            if top_pairs is None:
+                # 统计不可用，读取今天的标题实时计算
+                all_titles, _, _ = parser.read_all_titles_for_date()
 
-            # 排序并取TOP N
-            top_pairs = sorted(filtered_pairs, key=lambda x: x[1], reverse=True)[:top_n]
+                cooccurrence = Counter()
+                for platform_id, titles in all_titles.items():
+                    for title in titles.keys():
+                        # 计算两两共现（关键词对已统一排序）
+                        cooccurrence.update(extract_keyword_pairs(title))
+
+                # 过滤低频共现，按频次降序、关键词升序取TOP N
+                top_pairs = sorted(
+                    (
+                        (kw1, kw2, count) for (kw1, kw2), count in cooccurrence.items()
+                        if count >= min_frequency
+                    ),
+                    key=lambda x: (-x[2], x[0], x[1])
+                )[:top_n]
+            else:
+                all_titles, _, _ = parser.read_all_titles_for_date()
 
             # 构建结果
             result_pairs = []
-            for (kw1, kw2), count in top_pairs:
+            for kw1, kw2, count in top_pairs:
                 # 找出同时包含两个关键词的标题样本
-                titles_with_both = [
-                    title for title in keyword_titles[kw1]
-                    if kw2 in self._extract_keywords(title)
-                ]
+                titles_with_both = []
+                for titles in all_titles.values():
+                    for title in titles.keys():
+                        if kw1 not in title or kw2 not in title:
+                            continue
+                        if (kw1, kw2) in extract_keyword_pairs(title):
+                            titles_with_both.append(title)
+                    if len(titles_with_both) >= 3:
+                        break
 
                 result_pairs.append({
                     "keyword1": kw1,
@@ -696,77 +743,85 @@ class AnalyticsTools:
                 # 默认今天
                 start_date = end_date = datetime.now()
 
-            # 收集新闻数据（支持多天）
-            all_news_items = []
-            current_date = start_date
-
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date,
-                        platform_ids=platforms
-                    )
+            # 流式收集新闻：同一（平台, 标题）只累加可合并的排名汇总值，
+            # 完整新闻数据只为最终入选的 limit 条读取
+            parser = self.data_service.parser
+            dates = parser.get_dates_in_range(start_date, end_date)
+            day_indexes = {date: i for i, date in enumerate(dates)}
+
+            # (平台名, 标题) -> [排名数, 截断排名和, 高排名次数, 首次出现顺序, 出现日期位图]
+            tallies: Dict[Tuple[str, str], List[int]] = {}
+            matched_count = 0
+            for current_date, day_items in self._iter_topic_titles(topic, dates, platforms):
+                day_bit = 1 << day_indexes[current_date]
+                for _, platform_name, title, info in day_items:
+                    matched_count += 1
+                    total, clipped_sum, high_rank_count = summarize_ranks(info.get("ranks", []), 5)
+                    tally = tallies.get((platform_name, title))
+                    if tally is None:
+                        tallies[(platform_name, title)] = [
+                            total, clipped_sum, high_rank_count, len(tallies), day_bit
+                        ]
+                    else:
+                        tally[0] += total
+                        tally[1] += clipped_sum
+                        tally[2] += high_rank_count
+                        tally[4] |= day_bit
 
-                    # 收集该日期的新闻
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-                        for title, info in titles.items():
-                            # 如果指定了话题，只收集包含话题的标题
-                            if topic and topic.lower() not in title.lower():
-                                continue
-
-                            news_item = {
-                                "platform": platform_name,
-                                "title": title,
-                                "ranks": info.get("ranks", []),
-                                "count": len(info.get("ranks", [])),
-                                "date": current_date.strftime("%Y-%m-%d")
-                            }
-
-                            # 条件性添加 URL 字段
-                            if include_url:
-                                news_item["url"] = info.get("url", "")
-                                news_item["mobileUrl"] = info.get("mobileUrl", "")
-
-                            all_news_items.append(news_item)
-
-                except DataNotFoundError:
-                    # 该日期没有数据，继续下一天
-                    pass
-
-                # 下一天
-                current_date += timedelta(days=1)
-
-            if not all_news_items:
+            if not tallies:
                 time_desc = "今天" if start_date == end_date else f"{start_date.strftime('%Y-%m-%d')} 至 {end_date.strftime('%Y-%m-%d')}"
                 raise DataNotFoundError(
                     f"未找到相关新闻（{time_desc}）",
                     suggestion="请尝试其他话题、日期范围或平台"
                 )
 
-            # 去重（同一标题只保留一次）
-            unique_news = {}
-            for item in all_news_items:
-                key = f"{item['platform']}::{item['title']}"
-                if key not in unique_news:
-                    unique_news[key] = item
-                else:
-                    # 合并 ranks（如果同一新闻在多天出现）
-                    existing = unique_news[key]
-                    existing["ranks"].extend(item["ranks"])
-                    existing["count"] = len(existing["ranks"])
-
-            deduplicated_news = list(unique_news.values())
-
-            # 按权重排序（如果启用）
+            # 选出前 limit 条（按权重降序，同分保持首次出现顺序；不排序时取最先出现的 limit 条）
             if sort_by_weight:
-                deduplicated_news.sort(
-                    key=lambda x: calculate_news_weight(x),
-                    reverse=True
+                summary_weight = make_rank_summary_weight_func(5, _get_weight_config())
+                selected_keys = heapq.nsmallest(
+                    limit,
+                    tallies,
+                    key=lambda k: (-summary_weight(tallies[k][0], tallies[k][1], tallies[k][2], tallies[k][0]),
+                                   tallies[k][3])
                 )
+            else:
+                selected_keys = list(tallies)[:limit]
+
+            # 只重读入选新闻出现过的日期，按日期顺序合并排名（同一新闻多天出现）
+            needed_days = 0
+            for key in selected_keys:
+                needed_days |= tallies[key][4]
+            needed_dates = [date for i, date in enumerate(dates) if needed_days >> i & 1]
+
+            selected: Dict[Tuple[str, str], Optional[Dict]] = dict.fromkeys(selected_keys)
+            for current_date, day_items in self._iter_topic_titles(topic, needed_dates, platforms):
+                for _, platform_name, title, info in day_items:
+                    key = (platform_name, title)
+                    if key not in selected:
+                        continue
+                    news_item = selected[key]
+                    if news_item is None:
+                        news_item = {
+                            "platform": platform_name,
+                            "title": title,
+                            # 复制 ranks，避免跨天合并时修改缓存中的原始数据
+                            "ranks": list(info.get("ranks", [])),
+                            "count": 0,
+                            "date": current_date.strftime("%Y-%m-%d")
+                        }
 
-            # 限制返回数量
-            selected_news = deduplicated_news[:limit]
+                        # 条件性添加 URL 字段
+                        if include_url:
+                            news_item["url"] = info.get("url", "")
+                            news_item["mobileUrl"] = info.get("mobileUrl", "")
+
+                        selected[key] = news_item
+                    else:
+                        news_item["ranks"].extend(info.get("ranks", []))
+                    news_item["count"] = len(news_item["ranks"])
+
+            selected_news = [selected[key] for key in selected_keys]
+            total_found = len(tallies)
 
             # 生成 AI 提示词
             ai_prompt = self._create_sentiment_analysis_prompt(
@@ -785,10 +840,10 @@ class AnalyticsTools:
                 "method": "ai_prompt_generation",
                 "summary": {
                     "description": "情感分析数据和AI提示词",
-                    "total_found": len(deduplicated_news),
+                    "total_found": total_found,
                     "returned": len(selected_news),
                     "requested_limit": limit,
-                    "duplicates_removed": len(all_news_items) - len(deduplicated_news),
+                    "duplicates_removed": matched_count - total_found,
                     "topic": topic,
                     "time_range": time_range_desc,
                     "platforms": list(set(item["platform"] for item in selected_news)),
@@ -800,10 +855,10 @@ class AnalyticsTools:
             }
 
             # 如果返回数量少于请求数量，增加提示
-            if len(selected_news) < limit and len(deduplicated_news) >= limit:
+            if len(selected_news) < limit and total_found >= limit:
                 result["note"] = "返回数量少于请求数量是因为去重逻辑（同一标题在不同平台只保留一次）"
-            elif len(deduplicated_news) < limit:
-                result["note"] = f"在指定时间范围内仅找到 {len(deduplicated_news)} 条匹配的新闻"
+            elif total_found < limit:
+                result["note"] = f"在指定时间范围内仅找到 {total_found} 条匹配的新闻"
 
             return result
 
@@ -1206,37 +1261,46 @@ class AnalyticsTools:
                     end_date = datetime.now()
                     start_date = end_date - timedelta(days=6)
 
-            # 收集数据
-            all_keywords = Counter()
-            all_platforms_news = defaultdict(int)
-            all_titles_list = []
+            # 收集数据：逐天构建部分聚合后合并，不保留全部标题
+            # （关键词计数为每天 TOP-K 候选之和，热门关键词数为进入过候选的关键词数）
+            dates = self.data_service.parser.get_dates_in_range(start_date, end_date)
 
-            current_date = start_date
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
+            def build_day(current_date, all_titles, id_to_name) -> PeriodAggregate:
+                # 精选新闻样本在同一遍中选出：先按原顺序统计当天关键词，再按当天 TOP 10
+                # 关键词打分，按标题字母顺序加入，权重相同时字母序靠前的标题优先
+                news = []
+                keywords = Counter()
+                for platform_id, titles in all_titles.items():
+                    platform_name = id_to_name.get(platform_id, platform_id)
+                    for title in titles.keys():
+                        keywords.update(self._extract_keywords(title))
+                        news.append((title, platform_name))
+
+                top_keywords = [(kw.lower(), count) for kw, count in keywords.most_common(10)]
+                day = PeriodAggregate(SUMMARY_SAMPLE_SIZE)
+                for title, platform_name in sorted(news):
+                    title_lower = title.lower()
+                    score = sum(
+                        count for keyword, count in top_keywords
+                        if keyword in title_lower
                     )
+                    day.add(
+                        current_date,
+                        {"title": title, "platform_name": platform_name},
+                        platform_name,
+                        [],
+                        score
+                    )
+                # 关键词计数保留原顺序，与逐条累加的结果一致
+                day.keywords = keywords
+                return day
 
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-                        all_platforms_news[platform_name] += len(titles)
-
-                        for title in titles.keys():
-                            all_titles_list.append({
-                                "title": title,
-                                "platform": platform_name,
-                                "date": current_date.strftime("%Y-%m-%d")
-                            })
-
-                            # 提取关键词
-                            keywords = self._extract_keywords(title)
-                            all_keywords.update(keywords)
-
-                except DataNotFoundError:
-                    pass
-
-                current_date += timedelta(days=1)
+            aggregate = self.aggregator.collect(
+                dates, build_day, "summary_aggregate", top_k=SUMMARY_SAMPLE_SIZE
+            )
+            all_keywords = aggregate.keywords
+            all_platforms_news = aggregate.platform_stats
+            total_news = aggregate.news_count
 
             # 生成报告
             report_title = f"{'每日' if report_type == 'daily' else '每周'}新闻热点摘要"
@@ -1252,7 +1316,7 @@ class AnalyticsTools:
 
 ## 📊 数据概览
 
-- **总新闻数**: {len(all_titles_list)}
+- **总新闻数**: {total_news}
 - **覆盖平台**: {len(all_platforms_news)}
 - **热门关键词数**: {len(all_keywords)}
 
@@ -1284,28 +1348,9 @@ class AnalyticsTools:
             # 添加样本新闻（按权重选择，确保确定性）
             markdown += "\n## 📰 精选新闻样本\n\n"
 
-            # 确定性选取：按标题的权重排序，取前5条
-            # 这样相同输入总是返回相同结果
-            if all_titles_list:
-                # 计算每条新闻的权重分数（基于关键词出现次数）
-                news_with_scores = []
-                for news in all_titles_list:
-                    # 简单权重：统计包含TOP关键词的次数
-                    score = 0
-                    title_lower = news['title'].lower()
-                    for keyword, count in all_keywords.most_common(10):
-                        if keyword.lower() in title_lower:
-                            score += count
-                    news_with_scores.append((news, score))
-
-                # 按权重降序排序，权重相同则按标题字母顺序（确保确定性）
-                news_with_scores.sort(key=lambda x: (-x[1], x[0]['title']))
-
-                # 取前5条
-                sample_news = [item[0] for item in news_with_scores[:5]]
-
-                for news in sample_news:
-                    markdown += f"- [{news['platform']}] {news['title']}\n"
+            # 确定性选取：每天按当天 TOP 关键词为标题打分，合并后取权重最高的前5条
+            for news_item in aggregate.top_news(SUMMARY_SAMPLE_SIZE):
+                markdown += f"- [{news_item['platform_name']}] {news_item['title']}\n"
 
             markdown += "\n---\n\n*本报告由 TrendRadar MCP 自动生成*\n"
 
@@ -1318,7 +1363,7 @@ class AnalyticsTools:
                 },
                 "markdown_report": markdown,
                 "statistics": {
-                    "total_news": len(all_titles_list),
+                    "total_news": total_news,
                     "platforms_count": len(all_platforms_news),
                     "keywords_count": len(all_keywords),
                     "top_keyword": all_keywords.most_common(1)[0] if all_keywords else None
@@ -1346,6 +1391,11 @@ class AnalyticsTools:
         """
         平台活跃度统计 - 统计各平台的发布频率和活跃时间段
 
+        读取各平台的抓取聚合（抓取时写入，缺失时由排名历史按相同口径计算），
+        更新次数为该平台成功抓取的次数，失败次数为抓取失败的次数，
+        新闻数为每天去重后的标题数之和，平均排名为在榜排名的平均值，活跃时间段按
+        每小时新增条数统计。
+
         Args:
             date_range: 日期范围（可选）
 
@@ -1378,40 +1428,38 @@ class AnalyticsTools:
             # 统计各平台活跃度
             platform_activity = defaultdict(lambda: {
                 "total_updates": 0,
+                "failed_updates": 0,
                 "days_active": set(),
                 "news_count": 0,
+                "on_list_count": 0,
+                "rank_sum": 0,
                 "hourly_distribution": Counter()
             })
 
-            # 遍历日期范围
-            current_date = start_date
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-
-                        platform_activity[platform_name]["news_count"] += len(titles)
-                        platform_activity[platform_name]["days_active"].add(current_date.strftime("%Y-%m-%d"))
-
-                        # 统计更新次数（基于文件数量）
-                        platform_activity[platform_name]["total_updates"] += len(timestamps)
-
-                        # 统计时间分布（基于文件名中的时间）
-                        for filename in timestamps.keys():
-                            # 解析文件名中的小时（格式：HHMM.txt）
-                            match = re.match(r'(\d{2})(\d{2})\.txt', filename)
-                            if match:
-                                hour = int(match.group(1))
-                                platform_activity[platform_name]["hourly_distribution"][hour] += 1
-
-                except DataNotFoundError:
-                    pass
-
-                current_date += timedelta(days=1)
+            parser = self.data_service.parser
+            for current_date in parser.get_dates_in_range(start_date, end_date):
+                day_stats = parser.read_platform_stats(current_date)
+                if day_stats is None:
+                    continue
+                id_to_name = day_stats["id_to_name"]
+                date_str = current_date.strftime("%Y-%m-%d")
+
+                for platform_id, title_count in day_stats["title_counts"].items():
+                    activity = platform_activity[id_to_name.get(platform_id, platform_id)]
+                    activity["news_count"] += title_count
+                    activity["days_active"].add(date_str)
+
+                for crawl_time, platform_id, item_count, new_count, rank_sum, _, failed in day_stats["crawls"]:
+                    activity = platform_activity[id_to_name.get(platform_id, platform_id)]
+                    if failed:
+                        activity["failed_updates"] += 1
+                        continue
+                    activity["total_updates"] += 1
+                    activity["on_list_count"] += item_count
+                    activity["rank_sum"] += rank_sum
+                    # 按抓取时间（HH-MM）的小时统计新增条数
+                    if new_count:
+                        activity["hourly_distribution"][int(crawl_time[:2])] += new_count
 
             # 转换为可序列化的格式
             result_activity = {}
@@ -1424,7 +1472,12 @@ class AnalyticsTools:
 
                 result_activity[platform] = {
                     "total_updates": stats["total_updates"],
+                    "failed_updates": stats["failed_updates"],
                     "news_count": stats["news_count"],
+                    "avg_rank": (
+                        round(stats["rank_sum"] / stats["on_list_count"], 2)
+                        if stats["on_list_count"] else None
+                    ),
                     "days_active": days_count,
                     "avg_news_per_day": round(avg_news_per_day, 2),
                     "most_active_hours": [
@@ -1511,34 +1564,24 @@ class AnalyticsTools:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=6)
 
-            # 收集话题历史数据
+            # 收集话题历史数据（优先读取话题时间序列，无索引的日期回退到逐条扫描）
+            parser = self.data_service.parser
+            dates = parser.get_dates_in_range(start_date, end_date)
             lifecycle_data = []
-            current_date = start_date
-            while current_date <= end_date:
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    # 统计该日的话题出现次数
-                    count = 0
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
-
-                    lifecycle_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": count
-                    })
-
-                except DataNotFoundError:
-                    lifecycle_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": 0
-                    })
-
-                current_date += timedelta(days=1)
+            peak_slot = None
+
+            for current_date, series in self._iter_topic_series(topic, dates):
+                date_str = current_date.strftime("%Y-%m-%d")
+                lifecycle_data.append({"date": date_str, "count": series["count"] if series else 0})
+                # 在榜条数最多的抓取时间点
+                for crawl_time, slot_count, rank_sum, _ in (series["slots"] if series else []):
+                    if peak_slot is None or slot_count > peak_slot["count"]:
+                        peak_slot = {
+                            "date": date_str,
+                            "time": crawl_time,
+                            "count": slot_count,
+                            "avg_rank": round(rank_sum / slot_count, 1)
+                        }
 
             # 计算分析天数
             total_days = (end_date - start_date).days + 1
@@ -1606,7 +1649,8 @@ class AnalyticsTools:
                     "active_days": active_days,
                     "avg_daily_mentions": round(avg_count, 2),
                     "lifecycle_stage": lifecycle_stage,
-                    "topic_type": topic_type
+                    "topic_type": topic_type,
+                    "peak_slot": peak_slot
                 }
             }
 
@@ -1632,6 +1676,11 @@ class AnalyticsTools:
         """
         异常热度检测 - 自动识别突然爆火的话题
 
+        优先使用抓取时维护的关键词热度状态：比较最近 time_window 小时内每次抓取的
+        平均在榜条数与窗口之前的指数加权基线（current_count 为窗口内累计在榜次数，
+        previous_count 为按基线均值推算的同一窗口预期在榜次数，并给出 z 分数）；
+        状态不可用时回退到今天与昨天的关键词计数对比（summary.method 标明所用方式）。
+
         Args:
             threshold: 热度突增倍数阈值
             time_window: 检测时间窗口（小时）
@@ -1658,72 +1707,25 @@ class AnalyticsTools:
             threshold = validate_threshold(threshold, default=3.0, min_value=1.0, max_value=100.0)
             time_window = validate_limit(time_window, default=24, max_limit=72)
 
-            # 读取当前和之前的数据
-            current_all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
-
-            # 读取昨天的数据作为基准
-            yesterday = datetime.now() - timedelta(days=1)
-            try:
-                previous_all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                    date=yesterday
-                )
-            except DataNotFoundError:
-                previous_all_titles = {}
-
-            # 统计当前的关键词频率
-            current_keywords = Counter()
-            current_keyword_titles = defaultdict(list)
-
-            for _, titles in current_all_titles.items():
-                for title in titles.keys():
-                    keywords = self._extract_keywords(title)
-                    current_keywords.update(keywords)
-
-                    for kw in keywords:
-                        current_keyword_titles[kw].append(title)
+            # 优先使用抓取时维护的热度状态按时间窗口检测，不可用时按天对比
+            viral_topics = self._detect_viral_from_trend(threshold, time_window)
+            method = "ewma"
+            if viral_topics is None:
+                viral_topics = self._detect_viral_by_day(threshold)
+                method = "day_over_day"
 
-            # 统计之前的关键词频率
-            previous_keywords = Counter()
-
-            for _, titles in previous_all_titles.items():
-                for title in titles.keys():
-                    keywords = self._extract_keywords(title)
-                    previous_keywords.update(keywords)
-
-            # 检测异常热度
-            viral_topics = []
-
-            for keyword, current_count in current_keywords.items():
-                previous_count = previous_keywords.get(keyword, 0)
-
-                # 计算增长倍数
-                if previous_count == 0:
-                    # 新出现的话题
-                    if current_count >= 5:  # 至少出现5次才认为是爆火
-                        growth_rate = float('inf')
-                        is_viral = True
-                    else:
-                        continue
-                else:
-                    growth_rate = current_count / previous_count
-                    is_viral = growth_rate >= threshold
-
-                if is_viral:
-                    viral_topics.append({
-                        "keyword": keyword,
-                        "current_count": current_count,
-                        "previous_count": previous_count,
-                        "growth_rate": round(growth_rate, 2) if growth_rate != float('inf') else "新话题",
-                        "sample_titles": current_keyword_titles[keyword][:3],
-                        "alert_level": "高" if growth_rate > threshold * 2 else "中"
-                    })
-
-            # 按增长率排序
+            # 按增长率排序（相同时按关键词排序，保证结果确定）
+            viral_topics.sort(key=lambda x: x["keyword"])
             viral_topics.sort(
                 key=lambda x: x["current_count"] if x["growth_rate"] == "新话题" else x["growth_rate"],
                 reverse=True
             )
 
+            # 只为检出的话题回查样本标题
+            samples = self._collect_sample_titles([t["keyword"] for t in viral_topics])
+            for topic in viral_topics:
+                topic["sample_titles"] = samples[topic["keyword"]]
+
             if not viral_topics:
                 return {
                     "success": True,
@@ -1731,7 +1733,8 @@ class AnalyticsTools:
                         "description": "异常热度检测结果",
                         "total": 0,
                         "threshold": threshold,
-                        "time_window": time_window
+                        "time_window": time_window,
+                        "method": method
                     },
                     "data": [],
                     "message": f"未检测到热度增长超过 {threshold} 倍的话题"
@@ -1744,6 +1747,7 @@ class AnalyticsTools:
                     "total": len(viral_topics),
                     "threshold": threshold,
                     "time_window": time_window,
+                    "method": method,
                     "detection_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 },
                 "data": viral_topics
@@ -1771,6 +1775,9 @@ class AnalyticsTools:
         """
         话题预测 - 基于历史数据预测未来可能的热点
 
+        优先使用抓取时增量维护的 Holt 线性趋势状态，对全部关键词批量预测
+        lookahead_hours 后的在榜条数；热度状态不可用时按最近几天的关键词计数对比。
+
         Args:
             lookahead_hours: 预测未来多少小时
             confidence_threshold: 置信度阈值
@@ -1803,105 +1810,25 @@ class AnalyticsTools:
                 param_name="confidence_threshold"
             )
 
-            # 收集最近3天的数据用于预测
-            keyword_trends = defaultdict(list)
-
-            for days_ago in range(3, 0, -1):
-                date = datetime.now() - timedelta(days=days_ago)
-
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=date
-                    )
-
-                    # 统计关键词
-                    keywords_count = Counter()
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            keywords = self._extract_keywords(title)
-                            keywords_count.update(keywords)
-
-                    # 记录每个关键词的历史数据
-                    for keyword, count in keywords_count.items():
-                        keyword_trends[keyword].append(count)
-
-                except DataNotFoundError:
-                    pass
+            # 优先使用抓取时维护的 Holt 趋势状态预测，不可用时按天计数对比
+            predicted_topics = self._predict_from_trend(lookahead_hours, confidence_threshold)
+            method = "holt"
+            if predicted_topics is None:
+                predicted_topics = self._predict_by_day(confidence_threshold)
+                method = "day_over_day"
 
-            # 添加今天的数据
-            try:
-                all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
-
-                keywords_count = Counter()
-                keyword_titles = defaultdict(list)
-
-                for _, titles in all_titles.items():
-                    for title in titles.keys():
-                        keywords = self._extract_keywords(title)
-                        keywords_count.update(keywords)
-
-                        for kw in keywords:
-                            keyword_titles[kw].append(title)
-
-                for keyword, count in keywords_count.items():
-                    keyword_trends[keyword].append(count)
-
-            except DataNotFoundError:
-                raise DataNotFoundError(
-                    "未找到今天的数据",
-                    suggestion="请等待爬虫任务完成"
-                )
-
-            # 预测潜力话题
-            predicted_topics = []
-
-            for keyword, trend_data in keyword_trends.items():
-                if len(trend_data) < 2:
-                    continue
-
-                # 简单的线性趋势预测
-                # 计算增长率
-                recent_value = trend_data[-1]
-                previous_value = trend_data[-2] if len(trend_data) >= 2 else 0
-
-                if previous_value == 0:
-                    if recent_value >= 3:
-                        growth_rate = 1.0
-                    else:
-                        continue
-                else:
-                    growth_rate = (recent_value - previous_value) / previous_value
-
-                # 判断是否是上升趋势
-                if growth_rate > 0.3:  # 增长超过30%
-                    # 计算置信度（基于趋势的稳定性）
-                    if len(trend_data) >= 3:
-                        # 检查是否连续增长
-                        is_consistent = all(
-                            trend_data[i] <= trend_data[i+1]
-                            for i in range(len(trend_data)-1)
-                        )
-                        confidence = 0.9 if is_consistent else 0.7
-                    else:
-                        confidence = 0.6
-
-                    if confidence >= confidence_threshold:
-                        predicted_topics.append({
-                            "keyword": keyword,
-                            "current_count": recent_value,
-                            "growth_rate": round(growth_rate * 100, 2),
-                            "confidence": round(confidence, 2),
-                            "trend_data": trend_data,
-                            "prediction": "上升趋势，可能成为热点",
-                            "sample_titles": keyword_titles.get(keyword, [])[:3]
-                        })
-
-            # 按置信度和增长率排序
+            # 按置信度和增长率排序（相同时按关键词排序，保证结果确定）
+            predicted_topics.sort(key=lambda x: x["keyword"])
             predicted_topics.sort(
                 key=lambda x: (x["confidence"], x["growth_rate"]),
                 reverse=True
             )
 
+            # 只为返回的话题回查今天的样本标题
+            samples = self._collect_sample_titles([t["keyword"] for t in predicted_topics[:20]])
+            for topic in predicted_topics[:20]:
+                topic["sample_titles"] = samples[topic["keyword"]]
+
             return {
                 "success": True,
                 "summary": {
@@ -1910,6 +1837,7 @@ class AnalyticsTools:
                     "returned": min(20, len(predicted_topics)),
                     "lookahead_hours": lookahead_hours,
                     "confidence_threshold": confidence_threshold,
+                    "method": method,
                     "prediction_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 },
                 "data": predicted_topics[:20],  # 返回TOP 20
@@ -1934,7 +1862,7 @@ class AnalyticsTools:
 
     def _extract_keywords(self, title: str, min_length: int = 2) -> List[str]:
         """
-        从标题中提取关键词（简单实现）
+        从标题中提取关键词（与抓取端关键词统计表使用同一规则）
 
         Args:
             title: 标题文本
@@ -1943,22 +1871,488 @@ class AnalyticsTools:
         Returns:
             关键词列表
         """
-        # 移除URL和特殊字符
-        title = re.sub(r'http[s]?://\S+', '', title)
-        title = re.sub(r'[^\w\s]', ' ', title)
+        return extract_keywords(title, min_length)
+
+    def _count_title_keywords(self, all_titles: Dict) -> Counter:
+        """对一天的全部标题实时分词并计数"""
+        counts = Counter()
+        for titles in all_titles.values():
+            for title in titles.keys():
+                counts.update(self._extract_keywords(title))
+        return counts
+
+    def _detect_viral_from_trend(
+        self,
+        threshold: float,
+        time_window: int
+    ) -> Optional[List[Dict]]:
+        """
+        基于抓取时维护的指数加权状态检测时间窗口内的异常热度
+
+        窗口为最近一次抓取往前 time_window 小时内的抓取时间点：窗口内在榜次数由
+        首尾累计值相减得到，基线为窗口起点的指数加权均值 / 方差（跨天状态按衰减
+        叠加），每个关键词只需常数次计算。窗口内累计在榜至少 VIRAL_MIN_WINDOW_COUNT
+        次且最近一次抓取仍在榜、窗口平均在榜条数的 z 分数达到 VIRAL_MIN_ZSCORE、且
+        相对基线的增长倍数达到 threshold（基线近似为 0 时视为新话题）的关键词视为爆火。
+
+        Returns:
+            爆火话题列表；今天的状态不可用或窗口前历史不足时返回 None
+        """
+        parser = self.data_service.parser
+        today = datetime.now()
+        today_trend = parser.read_keyword_trend(today)
+        if not today_trend or not today_trend["slots"]:
+            return None
+
+        def slot_datetime(date: datetime, crawl_time: str) -> datetime:
+            return datetime.strptime(
+                f"{date.strftime('%Y-%m-%d')} {crawl_time.replace('-', ':')}", "%Y-%m-%d %H:%M"
+            )
+
+        window_start = slot_datetime(today, today_trend["slots"][-1]) - timedelta(hours=time_window)
+
+        # 从今天往前：窗口内累计在榜次数，窗口起点及更早的状态作为基线
+        window_counts: Dict[str, int] = defaultdict(int)
+        window_slots = 0
+        baseline_days: List[Tuple[int, Dict]] = []
+        offset = 0
+        for back in range(VIRAL_MAX_LOOKBACK_DAYS + 1):
+            date = today - timedelta(days=back)
+            trend = today_trend if back == 0 else parser.read_keyword_trend(date)
+            if not trend or not trend["slots"]:
+                break
+            slot_count = len(trend["slots"])
+
+            if baseline_days:
+                baseline_days.append((slot_count, trend["state"]))
+                offset += slot_count
+            else:
+                start_slot = sum(
+                    1 for crawl_time in trend["slots"]
+                    if slot_datetime(date, crawl_time) <= window_start
+                )
+                # 累计在榜次数按闭式推进：cum + count * (目标序号 - 变化序号)
+                for keyword, (last_slot, count, cum, *_) in trend["state"].items():
+                    window_counts[keyword] += cum + count * (slot_count - last_slot)
+                window_slots += slot_count - start_slot
+                if start_slot == 0:
+                    continue
 
-        # 简单分词（按空格和常见分隔符）
-        words = re.split(r'[\s，。！？、]+', title)
+                start_trend = parser.read_keyword_trend(date, slot=start_slot)
+                if start_trend is None:
+                    break
+                for keyword, (last_slot, count, cum, *_) in start_trend["state"].items():
+                    window_counts[keyword] -= cum + count * (start_slot - last_slot)
+                baseline_days.append((start_slot, start_trend["state"]))
+                offset = start_slot
 
-        # 过滤停用词和短词
-        stopwords = {'的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一', '一个', '上', '也', '很', '到', '说', '要', '去', '你', '会', '着', '没有', '看', '好', '自己', '这'}
+            if decay_factor(offset) < VIRAL_DECAY_CUTOFF:
+                break
 
-        keywords = [
-            word.strip() for word in words
-            if word.strip() and len(word.strip()) >= min_length and word.strip() not in stopwords
+        # 窗口内在榜次数不足或最近一次抓取已不在榜的关键词不参与检测
+        latest_counts = {
+            keyword: state[1] for keyword, state in today_trend["state"].items() if state[1] > 0
+        }
+        active = [
+            keyword for keyword, total in window_counts.items()
+            if total >= VIRAL_MIN_WINDOW_COUNT and keyword in latest_counts
         ]
+        moments, weight = compose_day_states(baseline_days, active)
+        if weight < VIRAL_MIN_BASELINE_WEIGHT:
+            return None
+
+        viral_topics = []
+        for keyword in active:
+            total = window_counts[keyword]
+            m1, m2, _, _ = moments.get(keyword, (0.0, 0.0, 0.0, 0.0))
+            mean, variance = baseline_from_moments(m1, m2, weight)
+            window_mean = total / window_slots
+            score = z_score(window_mean, mean, variance)
+            if score < VIRAL_MIN_ZSCORE:
+                continue
 
-        return keywords
+            if mean < VIRAL_NEW_TOPIC_BASELINE:
+                growth_rate = float('inf')
+            else:
+                growth_rate = window_mean / mean
+                if growth_rate < threshold:
+                    continue
+
+            viral_topics.append({
+                "keyword": keyword,
+                "current_count": total,
+                "previous_count": round(mean * window_slots),
+                "growth_rate": round(growth_rate, 2) if growth_rate != float('inf') else "新话题",
+                "z_score": round(score, 2),
+                "latest_count": latest_counts[keyword],
+                "sample_titles": [],
+                "alert_level": "高" if growth_rate > threshold * 2 else "中"
+            })
+
+        return viral_topics
+
+    def _detect_viral_by_day(self, threshold: float) -> List[Dict]:
+        """
+        按天对比检测异常热度（热度状态不可用时的回退）
+
+        比较今天与昨天的关键词计数，增长倍数达到 threshold 或新出现且至少
+        出现 VIRAL_NEW_TOPIC_MIN_COUNT 次的关键词视为爆火。
+        """
+        # 读取今天和昨天（基准）的关键词计数，优先使用抓取时预计算的统计表
+        current_keywords = self._get_day_keyword_counts()
+
+        yesterday = datetime.now() - timedelta(days=1)
+        try:
+            previous_keywords = self._get_day_keyword_counts(yesterday)
+        except DataNotFoundError:
+            previous_keywords = Counter()
+
+        viral_topics = []
+        for keyword, current_count in current_keywords.items():
+            previous_count = previous_keywords.get(keyword, 0)
+
+            # 计算增长倍数
+            if previous_count == 0:
+                # 新出现的话题
+                if current_count >= VIRAL_NEW_TOPIC_MIN_COUNT:
+                    growth_rate = float('inf')
+                    is_viral = True
+                else:
+                    continue
+            else:
+                growth_rate = current_count / previous_count
+                is_viral = growth_rate >= threshold
+
+            if is_viral:
+                viral_topics.append({
+                    "keyword": keyword,
+                    "current_count": current_count,
+                    "previous_count": previous_count,
+                    "growth_rate": round(growth_rate, 2) if growth_rate != float('inf') else "新话题",
+                    "sample_titles": [],
+                    "alert_level": "高" if growth_rate > threshold * 2 else "中"
+                })
+
+        return viral_topics
+
+    def _predict_from_trend(
+        self,
+        lookahead_hours: int,
+        confidence_threshold: float
+    ) -> Optional[List[Dict]]:
+        """
+        基于抓取时维护的 Holt 线性趋势状态预测上升话题
+
+        今天及之前几天的状态按衰减叠加为截至最近一次抓取的水平 / 趋势，按今天的
+        平均抓取间隔把 lookahead_hours 换算为预测步数，以当前在榜条数为起点叠加
+        阻尼趋势，对全部关键词批量预测。
+        趋势向上、预测在榜条数不少于 PREDICT_MIN_COUNT、且比指数加权均值（最近约
+        1 / EWMA_ALPHA 次抓取的平均在榜条数）高出 PREDICT_MIN_GROWTH 的关键词为候选。
+
+        在榜条数多为阶梯式变化，逐点预测误差上沿用当前值难以超越，因此不以"预测值
+        高于当前值"判定上升，而是判定预测时点仍高于近期均值；置信度为正态近似下的
+        概率 Φ(s)，s = (预测值 - 均值) / (标准差 · √预测步数)，误差标准差随预测步数
+        增长，预测步数越长候选越少。
+
+        Returns:
+            预测话题列表；今天的状态不可用时返回 None
+        """
+        parser = self.data_service.parser
+        today = datetime.now()
+        today_trend = parser.read_keyword_trend(today)
+        if not today_trend or not today_trend["slots"]:
+            return None
+
+        days = [(today, today_trend)]
+        offset = len(today_trend["slots"])
+        for back in range(1, VIRAL_MAX_LOOKBACK_DAYS + 1):
+            if decay_factor(offset) < VIRAL_DECAY_CUTOFF:
+                break
+            date = today - timedelta(days=back)
+            trend = parser.read_keyword_trend(date)
+            if not trend or not trend["slots"]:
+                break
+            days.append((date, trend))
+            offset += len(trend["slots"])
+
+        moments, weight = compose_day_states(
+            (len(trend["slots"]), trend["state"]) for _, trend in days
+        )
+
+        # 今天的平均抓取间隔换算预测步数
+        slots = today_trend["slots"]
+        first = datetime.strptime(slots[0].replace("-", ":"), "%H:%M")
+        last = datetime.strptime(slots[-1].replace("-", ":"), "%H:%M")
+        span_hours = (last - first).total_seconds() / 3600
+        slots_per_hour = (len(slots) - 1) / span_hours if span_hours > 0 else 1.0
+        horizon = max(1, round(lookahead_hours * slots_per_hour))
+
+        # 每天累计在榜次数（从早到晚），作为趋势数据返回
+        day_totals: Dict[str, List[int]] = defaultdict(list)
+        for index, (_, trend) in enumerate(reversed(days)):
+            slot_count = len(trend["slots"])
+            for keyword, (last_slot, count, cum, *_) in trend["state"].items():
+                totals = day_totals[keyword]
+                totals.extend([0] * (index - len(totals)))
+                totals.append(cum + count * (slot_count - last_slot))
+
+        predicted_topics = []
+        for keyword, (m1, m2, _, trend) in moments.items():
+            if trend <= 0:
+                continue
+            latest = today_trend["state"].get(keyword)
+            current = latest[1] if latest else 0
+            predicted = holt_forecast(current, trend, horizon)
+            if predicted < PREDICT_MIN_COUNT:
+                continue
+            mean, variance = baseline_from_moments(m1, m2, weight)
+            rise = predicted - mean
+            growth_rate = rise / max(mean, 1)
+            if growth_rate <= PREDICT_MIN_GROWTH:
+                continue
+
+            signal = rise / (max(variance, mean, MIN_VARIANCE) * horizon) ** 0.5
+            confidence = 0.5 * (1 + math.erf(signal / math.sqrt(2)))
+            if confidence < confidence_threshold:
+                continue
+
+            totals = day_totals.get(keyword, [])
+            predicted_topics.append({
+                "keyword": keyword,
+                "current_count": current,
+                "baseline_count": round(mean, 2),
+                "predicted_count": round(predicted, 2),
+                "growth_rate": round(growth_rate * 100, 2),
+                "trend_per_hour": round(trend * slots_per_hour, 3),
+                "confidence": round(confidence, 2),
+                "trend_data": totals + [0] * (len(days) - len(totals)),
+                "prediction": "上升趋势，可能成为热点",
+                "sample_titles": []
+            })
+
+        return predicted_topics
+
+    def _predict_by_day(self, confidence_threshold: float) -> List[Dict]:
+        """
+        按天计数预测上升话题（热度状态不可用时的回退）
+
+        比较最近 3 天与今天的关键词计数，今天相对前一天增长超过 PREDICT_MIN_GROWTH
+        的关键词为候选，连续增长时置信度更高。
+
+        Raises:
+            DataNotFoundError: 今天的数据不存在
+        """
+        # 收集最近3天 + 今天的关键词计数用于预测（优先查预计算统计表）
+        keyword_trends = defaultdict(list)
+
+        today = datetime.now()
+        dates = [today - timedelta(days=days_ago) for days_ago in range(3, -1, -1)]
+
+        for date, keywords_count in self._iter_day_keyword_counts(dates):
+            if keywords_count is None:
+                if date == dates[-1]:
+                    raise DataNotFoundError(
+                        "未找到今天的数据",
+                        suggestion="请等待爬虫任务完成"
+                    )
+                continue
+
+            # 记录每个关键词的历史数据
+            for keyword, count in keywords_count.items():
+                keyword_trends[keyword].append(count)
+
+        predicted_topics = []
+        for keyword, trend_data in keyword_trends.items():
+            if len(trend_data) < 2:
+                continue
+
+            # 简单的线性趋势预测
+            # 计算增长率
+            recent_value = trend_data[-1]
+            previous_value = trend_data[-2] if len(trend_data) >= 2 else 0
+
+            if previous_value == 0:
+                if recent_value >= PREDICT_MIN_COUNT:
+                    growth_rate = 1.0
+                else:
+                    continue
+            else:
+                growth_rate = (recent_value - previous_value) / previous_value
+
+            # 判断是否是上升趋势
+            if growth_rate > PREDICT_MIN_GROWTH:
+                # 计算置信度（基于趋势的稳定性）
+                if len(trend_data) >= 3:
+                    # 检查是否连续增长
+                    is_consistent = all(
+                        trend_data[i] <= trend_data[i+1]
+                        for i in range(len(trend_data)-1)
+                    )
+                    confidence = 0.9 if is_consistent else 0.7
+                else:
+                    confidence = 0.6
+
+                if confidence >= confidence_threshold:
+                    predicted_topics.append({
+                        "keyword": keyword,
+                        "current_count": recent_value,
+                        "growth_rate": round(growth_rate * 100, 2),
+                        "confidence": round(confidence, 2),
+                        "trend_data": trend_data,
+                        "prediction": "上升趋势，可能成为热点",
+                        "sample_titles": []
+                    })
+
+        return predicted_topics
+
+    def _get_day_keyword_counts(self, date: Optional[datetime] = None) -> Counter:
+        """
+        获取某天的关键词计数
+
+        优先读取抓取时预计算的关键词统计表，不可用时读取标题实时分词。
+
+        Raises:
+            DataNotFoundError: 当天数据不存在
+        """
+        parser = self.data_service.parser
+        counts = parser.read_keyword_counts(date)
+        if counts is not None:
+            return counts
+        all_titles, _, _ = parser.read_all_titles_for_date(date=date)
+        return self._count_title_keywords(all_titles)
+
+    def _iter_day_keyword_counts(self, dates: List[datetime]):
+        """
+        按日期顺序产出 (date, 关键词计数或 None)
+
+        有预计算统计的日期直接查表，其余日期并行读取标题后实时分词。
+        """
+        parser = self.data_service.parser
+        counts_by_date = {date: parser.read_keyword_counts(date) for date in dates}
+        missing = [date for date in dates if counts_by_date[date] is None]
+
+        for date, day_data in parser.iter_titles_for_dates(missing):
+            if day_data is not None:
+                counts_by_date[date] = self._count_title_keywords(day_data[0])
+
+        for date in dates:
+            yield date, counts_by_date[date]
+
+    def _iter_topic_titles(
+        self,
+        topic: Optional[str],
+        dates: List[datetime],
+        platform_ids: Optional[List[str]] = None
+    ):
+        """
+        按日期顺序产出 (date, [(platform_id, platform_name, title, info), ...])
+
+        指定话题且有标题索引的日期只读取命中的标题；其余日期并行读取全部标题后
+        按 `topic.lower() in title.lower()` 筛选。无数据的日期跳过。
+        """
+        parser = self.data_service.parser
+        indexed = {}
+        if topic:
+            for date in dates:
+                items = parser.read_topic_titles(topic, date, platform_ids)
+                if items is not None:
+                    indexed[date] = items
+
+        missing = [date for date in dates if date not in indexed]
+        scanned = parser.iter_titles_for_dates(missing, platform_ids=platform_ids, ordered=True)
+        key = topic.lower() if topic else None
+
+        for date in dates:
+            if date in indexed:
+                yield date, [
+                    (item["platform_id"], item["platform_name"], item["title"], item["info"])
+                    for item in indexed[date]
+                ]
+                continue
+
+            _, day_data = next(scanned)
+            if day_data is None:
+                continue
+            all_titles, id_to_name, _ = day_data
+            yield date, [
+                (platform_id, id_to_name.get(platform_id, platform_id), title, info)
+                for platform_id, titles in all_titles.items()
+                for title, info in titles.items()
+                if key is None or key in title.lower()
+            ]
+
+    @staticmethod
+    def _scan_topic_series(all_titles: Dict, topic: str, sample_limit: int = 0) -> Dict:
+        """逐条扫描标题计算话题的单日序列（无标题索引时的回退路径）"""
+        key = topic.lower()
+        count = 0
+        sample_titles = []
+        best_rank = None
+        for titles in all_titles.values():
+            for title, info in titles.items():
+                if key not in title.lower():
+                    continue
+                count += 1
+                if len(sample_titles) < sample_limit:
+                    sample_titles.append(title)
+                ranks = [r for r in info.get("ranks", []) if r > 0]
+                if ranks and (best_rank is None or min(ranks) < best_rank):
+                    best_rank = min(ranks)
+        return {"count": count, "sample_titles": sample_titles, "best_rank": best_rank, "slots": []}
+
+    def _iter_topic_series(self, topic: str, dates: List[datetime], sample_limit: int = 0):
+        """
+        按日期顺序产出 (date, 话题单日序列或 None)
+
+        有标题索引的日期直接读取话题时间序列，其余日期并行读取标题后逐条扫描。
+        当天无数据时第二项为 None。
+        """
+        parser = self.data_service.parser
+        series_by_date = {date: parser.read_topic_series(topic, date, sample_limit) for date in dates}
+        missing = [date for date in dates if series_by_date[date] is None]
+
+        for date, day_data in parser.iter_titles_for_dates(missing):
+            if day_data is not None:
+                series_by_date[date] = self._scan_topic_series(day_data[0], topic, sample_limit)
+
+        for date in dates:
+            yield date, series_by_date[date]
+
+    def _collect_sample_titles(
+        self,
+        keywords: List[str],
+        date: Optional[datetime] = None,
+        limit: int = 3
+    ) -> Dict[str, List[str]]:
+        """
+        为指定关键词收集样本标题（按读取顺序）
+
+        只对包含关键词子串的标题分词，避免对全天标题重新分词。
+        """
+        samples = {kw: [] for kw in keywords}
+        if not samples:
+            return samples
+
+        try:
+            all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(date=date)
+        except DataNotFoundError:
+            return samples
+
+        pending = set(samples)
+        for titles in all_titles.values():
+            for title in titles.keys():
+                candidates = [kw for kw in pending if kw in title]
+                if not candidates:
+                    continue
+                title_keywords = self._extract_keywords(title)
+                for kw in candidates:
+                    if kw in title_keywords:
+                        samples[kw].append(title)
+                        if len(samples[kw]) >= limit:
+                            pending.discard(kw)
+                if not pending:
+                    return samples
+        return samples
 
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """
@@ -1974,6 +2368,45 @@ class AnalyticsTools:
         # 使用 SequenceMatcher 计算相似度
         return SequenceMatcher(None, text1, text2).ratio()
 
+    def _read_platform_day_stats(
+        self,
+        date: datetime,
+        topic: Optional[str] = None
+    ) -> Optional[Dict[str, Dict]]:
+        """
+        由抓取时统计读取一天的各平台统计（供平台对比使用）
+
+        标题数取当天各平台去重后的标题数，关键词取关键词分平台计数，
+        指定话题时通过标题索引统计包含话题的标题数。
+
+        Returns:
+            {平台名称: {"title_count": 标题数, "topic_mentions", "keywords": Counter}}；
+            任一统计不可用时返回 None（调用方应回退到读取标题）
+        """
+        parser = self.data_service.parser
+        platform_stats = parser.read_platform_stats(date)
+        if platform_stats is None:
+            return None
+        keyword_counts = parser.read_keyword_platform_counts(date)
+        if keyword_counts is None:
+            return None
+        mentions = Counter()
+        if topic:
+            items = parser.read_topic_titles(topic, date)
+            if items is None:
+                return None
+            mentions.update(item["platform_id"] for item in items)
+
+        id_to_name = platform_stats["id_to_name"]
+        return {
+            id_to_name.get(platform_id, platform_id): {
+                "title_count": title_count,
+                "topic_mentions": mentions[platform_id],
+                "keywords": keyword_counts.get(platform_id, Counter()),
+            }
+            for platform_id, title_count in platform_stats["title_counts"].items()
+        }
+
     def _find_unique_topics(self, platform_stats: Dict) -> Dict[str, List[str]]:
         """
         找出各平台独有的热点话题
@@ -1986,10 +2419,14 @@ class AnalyticsTools:
         """
         unique_topics = {}
 
-        # 获取每个平台的TOP关键词
+        # 获取每个平台的TOP关键词（频次相同按关键词排序，结果不依赖计数的累加顺序）
         platform_keywords = {}
         for platform, stats in platform_stats.items():
-            top_keywords = set([kw for kw, _ in stats["top_keywords"].most_common(10)])
+            top_keywords = [
+                kw for kw, _ in heapq.nsmallest(
+                    10, stats["top_keywords"].items(), key=lambda x: (-x[1], x[0])
+                )
+            ]
             platform_keywords[platform] = top_keywords
 
         # 找出独有关键词
@@ -2001,9 +2438,9 @@ class AnalyticsTools:
                     other_keywords.update(other_kws)
 
             # 找出独有的
-            unique = keywords - other_keywords
+            unique = [kw for kw in keywords if kw not in other_keywords]
             if unique:
-                unique_topics[platform] = list(unique)[:5]  # 最多5个
+                unique_topics[platform] = unique[:5]  # 最多5个
 
         return unique_topics
 
@@ -2054,41 +2491,37 @@ class AnalyticsTools:
 
             # 收集所有新闻
             all_news = []
-            current_date = start_date
-
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date,
-                        platform_ids=platforms
-                    )
+            parser = self.data_service.parser
+            dates = parser.get_dates_in_range(start_date, end_date)
 
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-
-                        for title, info in titles.items():
-                            news_item = {
-                                "title": title,
-                                "platform": platform_id,
-                                "platform_name": platform_name,
-                                "date": current_date.strftime("%Y-%m-%d"),
-                                "ranks": info.get("ranks", []),
-                                "count": len(info.get("ranks", [])),
-                                "rank": info["ranks"][0] if info["ranks"] else 999
-                            }
+            for current_date, day_data in parser.iter_titles_for_dates(
+                dates, platform_ids=platforms, ordered=True
+            ):
+                if day_data is None:
+                    continue
+                all_titles, id_to_name, _ = day_data
 
-                            if include_url:
-                                news_item["url"] = info.get("url", "")
-                                news_item["mobileUrl"] = info.get("mobileUrl", "")
+                for platform_id, titles in all_titles.items():
+                    platform_name = id_to_name.get(platform_id, platform_id)
 
-                            # 计算权重
-                            news_item["weight"] = calculate_news_weight(news_item)
-                            all_news.append(news_item)
+                    for title, info in titles.items():
+                        news_item = {
+                            "title": title,
+                            "platform": platform_id,
+                            "platform_name": platform_name,
+                            "date": current_date.strftime("%Y-%m-%d"),
+                            "ranks": info.get("ranks", []),
+                            "count": len(info.get("ranks", [])),
+                            "rank": info["ranks"][0] if info["ranks"] else 999
+                        }
 
-                except DataNotFoundError:
-                    pass
+                        if include_url:
+                            news_item["url"] = info.get("url", "")
+                            news_item["mobileUrl"] = info.get("mobileUrl", "")
 
-                current_date += timedelta(days=1)
+                        # 计算权重
+                        news_item["weight"] = calculate_news_weight(news_item)
+                        all_news.append(news_item)
 
             if not all_news:
                 return {
@@ -2342,8 +2775,10 @@ class AnalyticsTools:
                 )
 
             # 收集两个时期的数据
-            data1 = self._collect_period_data(date_range1, platforms, topic)
-            data2 = self._collect_period_data(date_range2, platforms, topic)
+            # 只有 overview 需要 TOP 新闻，其余类型跳过权重计算
+            news_top_n = top_n if compare_type == "overview" else 0
+            data1 = self._collect_period_data(date_range1, platforms, topic, news_top_n)
+            data2 = self._collect_period_data(date_range2, platforms, topic, news_top_n)
 
             # 根据对比类型执行不同的分析
             if compare_type == "overview":
@@ -2419,58 +2854,70 @@ class AnalyticsTools:
         self,
         date_range: tuple,
         platforms: Optional[List[str]],
-        topic: Optional[str]
+        topic: Optional[str],
+        top_n: int = 0
     ) -> Dict:
-        """收集指定时期的新闻数据"""
-        start_date, end_date = date_range
-        all_news = []
-        all_keywords = Counter()
-        platform_stats = Counter()
-
-        current_date = start_date
-        while current_date <= end_date:
-            try:
-                all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                    date=current_date,
-                    platform_ids=platforms
-                )
-
-                for platform_id, titles in all_titles.items():
-                    platform_name = id_to_name.get(platform_id, platform_id)
+        """
+        收集指定时期的聚合数据
 
-                    for title, info in titles.items():
-                        # 如果指定了话题，过滤不相关的新闻
-                        if topic and topic.lower() not in title.lower():
-                            continue
+        按天构建部分聚合（计数器 + TOP-K 新闻）后合并，不保留全部新闻列表。
 
-                        news_item = {
-                            "title": title,
-                            "platform": platform_id,
-                            "platform_name": platform_name,
-                            "date": current_date.strftime("%Y-%m-%d"),
-                            "ranks": info.get("ranks", []),
-                            "rank": info["ranks"][0] if info["ranks"] else 999
-                        }
-                        news_item["weight"] = calculate_news_weight(news_item)
-                        all_news.append(news_item)
-
-                        # 统计平台
-                        platform_stats[platform_name] += 1
+        Args:
+            date_range: (开始日期, 结束日期)
+            platforms: 平台过滤列表
+            topic: 话题过滤关键词
+            top_n: 保留的 TOP 新闻数量，0 表示不计算新闻权重
+        """
+        start_date, end_date = date_range
+        topic_lower = topic.lower() if topic else None
 
-                        # 提取关键词
-                        keywords = self._extract_keywords(title)
-                        all_keywords.update(keywords)
+        def build_day(current_date, all_titles, id_to_name) -> PeriodAggregate:
+            day = PeriodAggregate(top_n)
+            for platform_id, titles in all_titles.items():
+                platform_name = id_to_name.get(platform_id, platform_id)
 
-            except DataNotFoundError:
-                pass
+                for title, info in titles.items():
+                    # 如果指定了话题，过滤不相关的新闻
+                    if topic_lower and topic_lower not in title.lower():
+                        continue
 
-            current_date += timedelta(days=1)
+                    news_item = {
+                        "title": title,
+                        "platform": platform_id,
+                        "platform_name": platform_name,
+                        "date": current_date.strftime("%Y-%m-%d"),
+                        "ranks": info.get("ranks", []),
+                        "rank": info["ranks"][0] if info["ranks"] else 999
+                    }
+                    weight = 0.0
+                    if top_n > 0:
+                        weight = calculate_news_weight(news_item)
+                        news_item["weight"] = weight
+
+                    day.add(
+                        current_date,
+                        news_item,
+                        platform_name,
+                        self._extract_keywords(title),
+                        weight
+                    )
+            return day
+
+        dates = self.data_service.parser.get_dates_in_range(start_date, end_date)
+        aggregate = self.aggregator.collect(
+            dates,
+            build_day,
+            "period_aggregate",
+            platform_ids=platforms,
+            top_k=top_n,
+            topic=topic
+        )
 
         return {
-            "news": all_news,
-            "news_count": len(all_news),
-            "keywords": all_keywords,
-            "platform_stats": platform_stats,
+            "top_news": aggregate.top_news(top_n),
+            "news_count": aggregate.news_count,
+            "keywords": aggregate.keywords,
+            "platform_stats": aggregate.platform_stats,
             "date_range": date_range
         }
 
@@ -2496,8 +2943,8 @@ class AnalyticsTools:
         persistent_keywords = [kw for kw in top_kw1 if kw in top_kw2]
 
         # TOP 新闻对比
-        top_news1 = sorted(data1["news"], key=lambda x: x.get("weight", 0), reverse=True)[:top_n]
-        top_news2 = sorted(data2["news"], key=lambda x: x.get("weight", 0), reverse=True)[:top_n]
+        top_news1 = data1["top_news"][:top_n]
+        top_news2 = data2["top_news"][:top_n]
 
         return {
             "overview": {
@@ -2,14 +2,27 @@
 文章内容读取工具
 
 通过 Jina AI Reader API 将 URL 转换为 LLM 友好的 Markdown 格式。
-支持单篇和批量读取，内置速率限制和并发控制。
+支持单篇和批量读取，内置令牌桶限速、并发控制和内容缓存。
 
+环境变量（均可选）：
+    JINA_API_KEY: Jina API Key，有 Key 可提升速率限制
+    JINA_READER_BASE: Reader 服务地址，可指向本地自建的 Reader 服务
+    JINA_MAX_CONCURRENCY: 批量读取的最大并发数
+    JINA_RATE_LIMIT_RPM: 每分钟最大请求数（令牌桶速率）
+    JINA_CACHE_TTL: 文章内容缓存时间（秒），0 表示不缓存
+    JINA_CACHE_MAX_ENTRIES: 文章内容缓存的最大篇数
+    JINA_CACHE_MAX_BYTES: 文章内容缓存的最大总字节数
 """
 
+import os
+import threading
 import time
-from typing import Dict, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..utils.errors import MCPError, InvalidParameterError
 
@@ -17,24 +30,183 @@ from ..utils.errors import MCPError, InvalidParameterError
 # Jina Reader 配置
 JINA_READER_BASE = "https://r.jina.ai"
 DEFAULT_TIMEOUT = 30  # 秒
-MAX_BATCH_SIZE = 5  # 单次批量最大篇数
-BATCH_INTERVAL = 5.0  # 批量请求间隔（秒）
+MAX_BATCH_SIZE = 5  # 单次批量最大篇数（公共 Jina 服务）
+LOCAL_MAX_BATCH_SIZE = 20  # 单次批量最大篇数（自建 Reader 服务）
+DEFAULT_MAX_CONCURRENCY = 2  # 默认并发数（Jina 免费限制 2 并发）
+DEFAULT_RATE_LIMIT_RPM = 100  # 默认每分钟请求数（Jina 免费限制 100 RPM）
+DEFAULT_CACHE_TTL = 3600  # 文章内容缓存时间（秒）
+DEFAULT_CACHE_MAX_ENTRIES = 200  # 文章内容缓存最大篇数
+DEFAULT_CACHE_MAX_BYTES = 32 * 1024 * 1024  # 文章内容缓存最大总字节数（32MB）
+
+
+def _env_int(key: str, default: int) -> int:
+    """读取整数环境变量，无效时返回默认值"""
+    value = os.environ.get(key, "").strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+class TokenBucket:
+    """
+    线程安全的令牌桶限速器
+
+    以 rate_per_minute 的速率补充令牌，桶容量为 capacity，
+    允许短时突发的同时保证长期速率不超过上限。
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: int = 1):
+        self.rate = max(rate_per_minute, 1) / 60.0  # 每秒补充的令牌数
+        self.capacity = max(capacity, 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """获取一个令牌，不足时阻塞等待"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class ArticleCache:
+    """
+    线程安全的文章内容 LRU 缓存
+
+    同时按篇数和正文字节数设上限，超出时淘汰最久未使用的文章；
+    单篇超过字节上限的内容不缓存。条目超过 ttl 秒视为过期。
+    """
+
+    def __init__(self, ttl: int, max_entries: int, max_bytes: int):
+        self.ttl = ttl
+        self.max_entries = max(max_entries, 1)
+        self.max_bytes = max(max_bytes, 1)
+        self._items: "OrderedDict[str, tuple]" = OrderedDict()  # url -> (时间戳, 字节数, 结果)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[Dict]:
+        """读取缓存的结果，不存在或已过期返回 None"""
+        with self._lock:
+            entry = self._items.get(url)
+            if entry is None:
+                return None
+            timestamp, size, result = entry
+            if time.time() - timestamp >= self.ttl:
+                del self._items[url]
+                self._bytes -= size
+                return None
+            self._items.move_to_end(url)
+            return result
+
+    def set(self, url: str, result: Dict, size: int) -> None:
+        """写入结果并按篇数、字节数上限淘汰最久未使用的条目"""
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(url, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._items[url] = (time.time(), size, result)
+            self._bytes += size
+            while len(self._items) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._items.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def get_stats(self) -> Dict:
+        """缓存条目数与占用字节数"""
+        with self._lock:
+            return {"entries": len(self._items), "bytes": self._bytes}
 
 
 class ArticleReaderTools:
     """文章内容读取工具类"""
 
-    def __init__(self, project_root: str = None, jina_api_key: str = None):
+    def __init__(
+        self,
+        project_root: str = None,
+        jina_api_key: str = None,
+        reader_base: str = None,
+        max_concurrency: int = None,
+        rate_limit_rpm: int = None,
+        cache_ttl: int = None,
+        cache_max_entries: int = None,
+        cache_max_bytes: int = None
+    ):
         """
         初始化文章读取工具
 
         Args:
             project_root: 项目根目录
             jina_api_key: Jina API Key（可选，有 Key 可提升速率限制）
+            reader_base: Reader 服务地址（可选，默认 https://r.jina.ai）
+            max_concurrency: 批量读取最大并发数（可选）
+            rate_limit_rpm: 每分钟最大请求数（可选）
+            cache_ttl: 文章内容缓存时间（秒，可选，0 表示不缓存）
+            cache_max_entries: 文章内容缓存最大篇数（可选）
+            cache_max_bytes: 文章内容缓存最大总字节数（可选）
         """
         self.project_root = project_root
-        self.jina_api_key = jina_api_key
-        self._last_request_time = 0.0
+        self.jina_api_key = jina_api_key or os.environ.get("JINA_API_KEY", "")
+        self.reader_base = (
+            reader_base or os.environ.get("JINA_READER_BASE", "") or JINA_READER_BASE
+        ).rstrip("/")
+        self.max_concurrency = max(
+            max_concurrency or _env_int("JINA_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY), 1
+        )
+        self.rate_limit_rpm = max(
+            rate_limit_rpm or _env_int("JINA_RATE_LIMIT_RPM", DEFAULT_RATE_LIMIT_RPM), 1
+        )
+        self.cache_ttl = cache_ttl if cache_ttl is not None else _env_int(
+            "JINA_CACHE_TTL", DEFAULT_CACHE_TTL
+        )
+
+        # 自建 Reader 服务不受公共服务的批量上限约束
+        self.is_local_reader = self.reader_base != JINA_READER_BASE
+        self.max_batch_size = LOCAL_MAX_BATCH_SIZE if self.is_local_reader else MAX_BATCH_SIZE
+
+        # 文章正文体积大，使用独立的有界缓存，不放入进程级的通用缓存
+        self.cache = ArticleCache(
+            ttl=self.cache_ttl,
+            max_entries=cache_max_entries or _env_int(
+                "JINA_CACHE_MAX_ENTRIES", DEFAULT_CACHE_MAX_ENTRIES
+            ),
+            max_bytes=cache_max_bytes or _env_int(
+                "JINA_CACHE_MAX_BYTES", DEFAULT_CACHE_MAX_BYTES
+            ),
+        )
+        self._bucket = TokenBucket(self.rate_limit_rpm, capacity=self.max_concurrency)
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+
+    def _get_session(self) -> requests.Session:
+        """获取复用连接池的 HTTP 会话（延迟创建）"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=1,
+                        pool_maxsize=self.max_concurrency
+                    )
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    session.headers.update(self._build_headers())
+                    self._session = session
+        return self._session
 
     def _build_headers(self) -> Dict[str, str]:
         """构建请求头"""
@@ -48,12 +220,8 @@ class ArticleReaderTools:
         return headers
 
     def _throttle(self):
-        """速率控制：确保请求间隔 5 秒"""
-        now = time.time()
-        elapsed = now - self._last_request_time
-        if elapsed < BATCH_INTERVAL:
-            time.sleep(BATCH_INTERVAL - elapsed)
-        self._last_request_time = time.time()
+        """速率控制：从令牌桶获取一个请求令牌"""
+        self._bucket.acquire()
 
     def read_article(
         self,
@@ -63,6 +231,9 @@ class ArticleReaderTools:
         """
         读取单篇文章内容（Markdown 格式）
 
+        成功结果按 URL 缓存 cache_ttl 秒（缓存按篇数和字节数有上限），
+        期间重复读取直接返回缓存。
+
         Args:
             url: 文章链接
             timeout: 请求超时时间（秒），默认 30
@@ -77,16 +248,20 @@ class ArticleReaderTools:
                     suggestion="URL 必须以 http:// 或 https:// 开头"
                 )
 
+            if self.cache_ttl > 0:
+                cached = self.cache.get(url)
+                if cached:
+                    return {**cached, "cached": True}
+
             self._throttle()
 
-            response = requests.get(
-                f"{JINA_READER_BASE}/{url}",
-                headers=self._build_headers(),
+            response = self._get_session().get(
+                f"{self.reader_base}/{url}",
                 timeout=timeout
             )
 
             if response.status_code == 200:
-                return {
+                result = {
                     "success": True,
                     "data": {
                         "url": url,
@@ -95,6 +270,9 @@ class ArticleReaderTools:
                         "content_length": len(response.text)
                     }
                 }
+                if self.cache_ttl > 0:
+                    self.cache.set(url, result, len(response.content))
+                return result
             elif response.status_code == 429:
                 return {
                     "success": False,
@@ -142,7 +320,11 @@ class ArticleReaderTools:
         timeout: int = DEFAULT_TIMEOUT
     ) -> Dict:
         """
-        批量读取多篇文章内容（最多 5 篇，间隔 5 秒）
+        批量并发读取多篇文章内容
+
+        以 max_concurrency 并发请求，所有请求共享同一令牌桶限速，
+        结果按输入顺序返回。公共 Jina 服务单次最多 5 篇，
+        配置自建 Reader 服务（JINA_READER_BASE）时上限为 20 篇。
 
         Args:
             urls: 文章链接列表
@@ -158,17 +340,24 @@ class ArticleReaderTools:
                     suggestion="请提供至少一个 URL"
                 )
 
-            # 限制最多 5 篇
-            actual_urls = urls[:MAX_BATCH_SIZE]
+            # 限制单次批量篇数
+            actual_urls = urls[:self.max_batch_size]
             skipped = len(urls) - len(actual_urls)
 
+            workers = min(self.max_concurrency, len(actual_urls))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # executor.map 按输入顺序返回结果
+                fetched = list(executor.map(
+                    lambda u: self.read_article(url=u, timeout=timeout),
+                    actual_urls
+                ))
+
             results = []
             succeeded = 0
             failed = 0
+            cached = 0
 
-            for i, url in enumerate(actual_urls):
-                result = self.read_article(url=url, timeout=timeout)
-
+            for i, (url, result) in enumerate(zip(actual_urls, fetched)):
                 results.append({
                     "index": i + 1,
                     "url": url,
@@ -179,6 +368,8 @@ class ArticleReaderTools:
 
                 if result["success"]:
                     succeeded += 1
+                    if result.get("cached"):
+                        cached += 1
                 else:
                     failed += 1
 
@@ -191,10 +382,12 @@ class ArticleReaderTools:
                     "succeeded": succeeded,
                     "failed": failed,
                     "skipped": skipped,
-                    "interval_seconds": BATCH_INTERVAL,
+                    "cached": cached,
+                    "concurrency": workers,
+                    "rate_limit_rpm": self.rate_limit_rpm,
                 },
                 "articles": results,
-                "note": f"已跳过 {skipped} 篇（单次上限 {MAX_BATCH_SIZE} 篇）" if skipped > 0 else None
+                "note": f"已跳过 {skipped} 篇（单次上限 {self.max_batch_size} 篇）" if skipped > 0 else None
             }
 
         except MCPError as e:
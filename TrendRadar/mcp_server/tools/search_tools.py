@@ -10,9 +10,16 @@ from datetime import datetime, timedelta
 from difflib import SequenceMatcher
 from typing import Dict, List, Optional, Tuple, Union
 
+from trendradar.core.tokenizer import tokenize
+
 from ..services.data_service import DataService
 from ..utils.validators import validate_keyword, validate_limit, validate_threshold, normalize_date_range
-from ..utils.errors import MCPError, InvalidParameterError, DataNotFoundError
+from ..utils.errors import MCPError, InvalidParameterError
+
+
+# 相关新闻检索：有标题索引的日期按 BM25 取前 max(limit × 倍数, 下限) 条候选再精确打分
+RELATED_RERANK_FACTOR = 4
+RELATED_RERANK_MIN = 200
 
 
 class SearchTools:
@@ -119,36 +126,32 @@ class SearchTools:
 
             # 收集所有匹配的新闻
             all_matches = []
-            current_date = start_date
+            parser = self.data_service.parser
+            dates = parser.get_dates_in_range(start_date, end_date)
 
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date,
-                        platform_ids=platforms
-                    )
-
-                    # 根据搜索模式执行不同的搜索逻辑
-                    if search_mode == "keyword":
-                        matches = self._search_by_keyword_mode(
-                            query, all_titles, id_to_name, current_date, include_url
-                        )
-                    elif search_mode == "fuzzy":
-                        matches = self._search_by_fuzzy_mode(
-                            query, all_titles, id_to_name, current_date, threshold, include_url
-                        )
-                    else:  # entity
-                        matches = self._search_by_entity_mode(
-                            query, all_titles, id_to_name, current_date, include_url
-                        )
-
-                    all_matches.extend(matches)
-
-                except DataNotFoundError:
+            for current_date, day_data in parser.iter_titles_for_dates(
+                dates, platform_ids=platforms, ordered=True
+            ):
+                if day_data is None:
                     # 该日期没有数据，继续下一天
-                    pass
+                    continue
+                all_titles, id_to_name, _ = day_data
+
+                # 根据搜索模式执行不同的搜索逻辑
+                if search_mode == "keyword":
+                    matches = self._search_by_keyword_mode(
+                        query, all_titles, id_to_name, current_date, include_url
+                    )
+                elif search_mode == "fuzzy":
+                    matches = self._search_by_fuzzy_mode(
+                        query, all_titles, id_to_name, current_date, threshold, include_url
+                    )
+                else:  # entity
+                    matches = self._search_by_entity_mode(
+                        query, all_titles, id_to_name, current_date, include_url
+                    )
 
-                current_date += timedelta(days=1)
+                all_matches.extend(matches)
 
             if not all_matches:
                 # 获取可用日期范围用于错误提示
@@ -464,11 +467,11 @@ class SearchTools:
             关键词列表
         """
         # 移除URL和特殊字符
-        text = re.sub(r'http[s]?://\S+', '', text)
-        text = re.sub(r'\[.*?\]', '', text)  # 移除方括号内容
+        text = re.sub(r'http[s]?://\S+', ' ', text)
+        text = re.sub(r'\[.*?\]', ' ', text)  # 移除方括号内容
 
-        # 使用正则表达式分词（中文和英文）
-        words = re.findall(r'[\w]+', text)
+        # 中文分词（与分析工具共用分词器，带 LRU 缓存）
+        words = tokenize(text)
 
         # 过滤短词
         keywords = [word for word in words if word and len(word) >= min_length]
@@ -526,6 +529,36 @@ class SearchTools:
 
         return intersection / union
 
+    def _iter_related_candidates(self, reference_title: str, dates: List[datetime], limit: int):
+        """
+        按日期顺序产出相关新闻候选 (date, platform_id, platform_name, title, info)
+
+        有标题索引的日期只产出 BM25 得分靠前的候选（由调用方用原有相似度重新打分），
+        无索引的日期读取全部标题。
+        """
+        parser = self.data_service.parser
+        top_k = max(limit * RELATED_RERANK_FACTOR, RELATED_RERANK_MIN)
+        indexed, missing = parser.search_title_index(reference_title, dates, top_k)
+
+        by_date: Dict[datetime, list] = {date: [] for date in dates}
+        for item in indexed:
+            by_date[item["date"]].append(
+                (item["platform_id"], item["platform_name"], item["title"], item["info"])
+            )
+        for date, day_data in parser.iter_titles_for_dates(missing, ordered=True):
+            if day_data is None:
+                continue
+            all_titles, id_to_name, _ = day_data
+            by_date[date] = [
+                (platform_id, id_to_name.get(platform_id, platform_id), title, info)
+                for platform_id, titles in all_titles.items()
+                for title, info in titles.items()
+            ]
+
+        for date in dates:
+            for platform_id, platform_name, title, info in by_date[date]:
+                yield date, platform_id, platform_name, title, info
+
     def search_related_news_history(
         self,
         reference_title: str,
@@ -607,64 +640,47 @@ class SearchTools:
                     suggestion="请提供更详细的文本内容"
                 )
 
-            # 收集所有相关新闻
+            # 收集所有相关新闻（有索引的日期只对 BM25 候选计算相似度）
             all_related_news = []
-            current_date = search_start
-
-            while current_date <= search_end:
-                try:
-                    # 读取该日期的数据
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(current_date)
-
-                    # 搜索相关新闻
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-
-                        for title, info in titles.items():
-                            # 计算标题相似度
-                            title_similarity = self._calculate_similarity(reference_title, title)
-
-                            # 提取标题关键词
-                            title_keywords = self._extract_keywords(title)
-
-                            # 计算关键词重合度
-                            keyword_overlap = self._calculate_keyword_overlap(
-                                reference_keywords,
-                                title_keywords
-                            )
-
-                            # 综合相似度 (70% 关键词重合 + 30% 文本相似度)
-                            combined_score = keyword_overlap * 0.7 + title_similarity * 0.3
-
-                            if combined_score >= threshold:
-                                news_item = {
-                                    "title": title,
-                                    "platform": platform_id,
-                                    "platform_name": platform_name,
-                                    "date": current_date.strftime("%Y-%m-%d"),
-                                    "similarity_score": round(combined_score, 4),
-                                    "keyword_overlap": round(keyword_overlap, 4),
-                                    "text_similarity": round(title_similarity, 4),
-                                    "common_keywords": list(set(reference_keywords) & set(title_keywords)),
-                                    "rank": info["ranks"][0] if info["ranks"] else 0
-                                }
-
-                                # 条件性添加 URL 字段
-                                if include_url:
-                                    news_item["url"] = info.get("url", "")
-                                    news_item["mobileUrl"] = info.get("mobileUrl", "")
-
-                                all_related_news.append(news_item)
-
-                except DataNotFoundError:
-                    # 该日期没有数据，继续下一天
-                    pass
-                except Exception as e:
-                    # 记录错误但继续处理其他日期
-                    print(f"Warning: 处理日期 {current_date.strftime('%Y-%m-%d')} 时出错: {e}")
+            parser = self.data_service.parser
+            dates = parser.get_dates_in_range(search_start, search_end)
+            candidates = self._iter_related_candidates(reference_title, dates, limit)
+
+            for current_date, platform_id, platform_name, title, info in candidates:
+                # 计算标题相似度
+                title_similarity = self._calculate_similarity(reference_title, title)
 
-                # 移动到下一天
-                current_date += timedelta(days=1)
+                # 提取标题关键词
+                title_keywords = self._extract_keywords(title)
+
+                # 计算关键词重合度
+                keyword_overlap = self._calculate_keyword_overlap(
+                    reference_keywords,
+                    title_keywords
+                )
+
+                # 综合相似度 (70% 关键词重合 + 30% 文本相似度)
+                combined_score = keyword_overlap * 0.7 + title_similarity * 0.3
+
+                if combined_score >= threshold:
+                    news_item = {
+                        "title": title,
+                        "platform": platform_id,
+                        "platform_name": platform_name,
+                        "date": current_date.strftime("%Y-%m-%d"),
+                        "similarity_score": round(combined_score, 4),
+                        "keyword_overlap": round(keyword_overlap, 4),
+                        "text_similarity": round(title_similarity, 4),
+                        "common_keywords": list(set(reference_keywords) & set(title_keywords)),
+                        "rank": info["ranks"][0] if info["ranks"] else 0
+                    }
+
+                    # 条件性添加 URL 字段
+                    if include_url:
+                        news_item["url"] = info.get("url", "")
+                        news_item["mobileUrl"] = info.get("mobileUrl", "")
+
+                    all_related_news.append(news_item)
 
             if not all_related_news:
                 return {
@@ -813,51 +829,41 @@ class SearchTools:
             # 提取参考标题的关键词
             reference_keywords = self._extract_keywords(reference_title)
 
-            # 收集所有相关新闻
+            # 收集所有相关新闻（有索引的日期只对 BM25 候选计算相似度）
             all_related_news = []
-            
-            for search_date in search_dates:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(search_date)
-                    
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-                        
-                        for title, info in titles.items():
-                            if title == reference_title:
-                                continue
-                            
-                            # 计算相似度（使用混合算法）
-                            text_similarity = self._calculate_similarity(reference_title, title)
-                            
-                            # 如果有关键词，也计算关键词重合度
-                            if reference_keywords:
-                                title_keywords = self._extract_keywords(title)
-                                keyword_similarity = self._jaccard_similarity(reference_keywords, title_keywords)
-                                # 混合相似度：70% 文本 + 30% 关键词
-                                similarity = 0.7 * text_similarity + 0.3 * keyword_similarity
-                            else:
-                                similarity = text_similarity
-                            
-                            if similarity >= threshold:
-                                news_item = {
-                                    "title": title,
-                                    "platform": platform_id,
-                                    "platform_name": platform_name,
-                                    "date": search_date.strftime("%Y-%m-%d"),
-                                    "similarity": round(similarity, 3),
-                                    "rank": info["ranks"][0] if info["ranks"] else 0
-                                }
-                                
-                                if include_url:
-                                    news_item["url"] = info.get("url", "")
-                                
-                                all_related_news.append(news_item)
-                                
-                except Exception:
-                    # 某天数据读取失败，跳过
+            candidates = self._iter_related_candidates(reference_title, search_dates, limit)
+
+            for search_date, platform_id, platform_name, title, info in candidates:
+                if title == reference_title:
                     continue
 
+                # 计算相似度（使用混合算法）
+                text_similarity = self._calculate_similarity(reference_title, title)
+
+                # 如果有关键词，也计算关键词重合度
+                if reference_keywords:
+                    title_keywords = self._extract_keywords(title)
+                    keyword_similarity = self._jaccard_similarity(reference_keywords, title_keywords)
+                    # 混合相似度：70% 文本 + 30% 关键词
+                    similarity = 0.7 * text_similarity + 0.3 * keyword_similarity
+                else:
+                    similarity = text_similarity
+
+                if similarity >= threshold:
+                    news_item = {
+                        "title": title,
+                        "platform": platform_id,
+                        "platform_name": platform_name,
+                        "date": search_date.strftime("%Y-%m-%d"),
+                        "similarity": round(similarity, 3),
+                        "rank": info["ranks"][0] if info["ranks"] else 0
+                    }
+
+                    if include_url:
+                        news_item["url"] = info.get("url", "")
+
+                    all_related_news.append(news_item)
+
             # 按相似度排序
             all_related_news.sort(key=lambda x: x["similarity"], reverse=True)
             
@@ -917,16 +923,16 @@ class SearchTools:
         """
         all_rss_matches = []
         query_lower = query.lower()
-        current_date = start_date
+        parser = self.data_service.parser
+        dates = parser.get_dates_in_range(start_date, end_date)
+
+        for current_date, day_data in parser.iter_titles_for_dates(dates, db_type="rss", ordered=True):
+            if day_data is None:
+                # 该日期没有 RSS 数据，继续下一天
+                continue
 
-        while current_date <= end_date:
             try:
-                # 读取该日期的 RSS 数据
-                all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                    date=current_date,
-                    platform_ids=None,
-                    db_type="rss"
-                )
+                all_titles, id_to_name, _ = day_data
 
                 for feed_id, items in all_titles.items():
                     feed_name = id_to_name.get(feed_id, feed_id)
@@ -953,15 +959,10 @@ class SearchTools:
 
                             all_rss_matches.append(rss_item)
 
-            except DataNotFoundError:
-                # 该日期没有 RSS 数据，继续下一天
-                pass
             except Exception:
                 # 其他错误，跳过
                 pass
 
-            current_date += timedelta(days=1)
-
         # 按发布时间排序（最新的在前）
         all_rss_matches.sort(key=lambda x: x.get("published_at", ""), reverse=True)
 
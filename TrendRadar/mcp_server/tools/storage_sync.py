@@ -178,6 +178,10 @@ class StorageSyncTools:
                     if folder_date:
                         dates.add(folder_date.strftime("%Y-%m-%d"))
 
+            # 已归档的日期（output/{db_type}/archive/YYYY-MM.db）
+            from trendradar.storage.archive import list_archived_dates
+            dates.update(list_archived_dates(type_dir))
+
         return sorted(list(dates), reverse=True)
 
     def _get_all_local_dates(self) -> Dict[str, List[str]]:
@@ -248,59 +252,44 @@ class StorageSyncTools:
             local_dir = self._get_local_data_dir()
             local_dir.mkdir(parents=True, exist_ok=True)
 
-            # 获取远程可用日期
-            remote_dates = remote_backend.list_remote_dates()
-
-            # 获取本地已有日期
-            local_dates = set(self._get_local_dates())
-
             # 计算需要拉取的日期（最近 N 天）
             from trendradar.utils.time import get_configured_time
+            from trendradar.storage.sync import RemoteSyncEngine
             config = self._load_config()
             timezone = config.get("app", {}).get("timezone", "Asia/Shanghai")
             now = get_configured_time(timezone)
+            target_dates = [(now - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days)]
 
-            target_dates = []
-            for i in range(days):
-                date = now - timedelta(days=i)
-                date_str = date.strftime("%Y-%m-%d")
-                if date_str in remote_dates:
-                    target_dates.append(date_str)
-
-            # 执行拉取
-            synced_dates = []
-            skipped_dates = []
-            failed_dates = []
-
-            for date_str in target_dates:
-                # 检查本地是否已存在
-                if date_str in local_dates:
-                    skipped_dates.append(date_str)
-                    continue
-
-                # 拉取单个日期
-                try:
-                    local_date_dir = local_dir / date_str
-                    local_db_path = local_date_dir / "news.db"
-                    remote_key = f"news/{date_str}.db"
-
-                    local_date_dir.mkdir(parents=True, exist_ok=True)
-                    remote_backend.s3_client.download_file(
-                        remote_backend.bucket_name,
-                        remote_key,
-                        str(local_db_path)
-                    )
-                    synced_dates.append(date_str)
-                    print(f"[存储同步] 已拉取: {date_str}")
-                except Exception as e:
-                    failed_dates.append({"date": date_str, "error": str(e)})
-                    print(f"[存储同步] 拉取失败 ({date_str}): {e}")
+            # 一次 list 比对 ETag / 大小，缺失或有更新的文件并发分片下载
+            engine = RemoteSyncEngine(
+                remote_backend.s3_client,
+                remote_backend.bucket_name,
+                str(local_dir),
+            )
+            result = engine.sync(target_dates)
+
+            def _dates_of(keys):
+                return sorted({Path(key).stem for key in keys}, reverse=True)
+
+            synced_dates = _dates_of(result["synced"])
+            # 本地已存在（未变化或本地有修改）且没有任何文件被更新的日期
+            skipped_dates = sorted(
+                set(_dates_of(result["unchanged"] + result["skipped"])) - set(synced_dates),
+                reverse=True
+            )
+            failed_dates = [
+                {"date": Path(item["key"]).stem, "key": item["key"], "error": item["error"]}
+                for item in result["failed"]
+            ]
+            for date_str in synced_dates:
+                print(f"[存储同步] 已拉取: {date_str}")
 
             return {
                 "success": True,
                 "summary": {
                     "description": "远程存储同步结果",
-                    "synced_files": len(synced_dates),
+                    "synced_files": len(result["synced"]),
+                    "synced_bytes": result["bytes"],
                     "skipped_count": len(skipped_dates),
                     "failed_count": len(failed_dates)
                 },
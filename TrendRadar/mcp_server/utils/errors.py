@@ -67,6 +67,17 @@ class InvalidParameterError(MCPError):
         )
 
 
+class ServerBusyError(MCPError):
+    """服务繁忙错误（查询排队已满）"""
+
+    def __init__(self, message: str, suggestion: Optional[str] = None):
+        super().__init__(
+            message=message,
+            code="SERVER_BUSY",
+            suggestion=suggestion or "请稍后重试，或缩小日期范围以降低查询成本"
+        )
+
+
 class ConfigurationError(MCPError):
     """配置错误"""
 
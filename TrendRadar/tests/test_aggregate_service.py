@@ -0,0 +1,157 @@
+# coding=utf-8
+"""部分聚合：单日关键词裁剪、缓存条目上限与摘要报告的单遍读取"""
+
+from collections import Counter
+from datetime import datetime, timedelta
+
+import pytest
+
+from mcp_server.services import aggregate_service
+from mcp_server.services.aggregate_service import AggregateService, PeriodAggregate
+from mcp_server.services.cache_service import get_cache
+from mcp_server.tools.analytics import AnalyticsTools
+from trendradar.core import tokenizer
+from trendradar.core.tokenizer import ChineseTokenizer
+from trendradar.storage.base import NewsData, NewsItem
+from trendradar.storage.local import LocalStorageBackend
+
+
+class FakeParser:
+    """按日期返回固定标题的解析服务，记录读取过的日期"""
+
+    def __init__(self, titles_by_date):
+        self.titles_by_date = titles_by_date
+        self.loaded = []
+
+    def iter_titles_for_dates(self, dates, platform_ids=None, **kwargs):
+        for date in dates:
+            self.loaded.append(date)
+            titles = self.titles_by_date.get(date.strftime("%Y-%m-%d"))
+            if titles is None:
+                yield date, None
+            else:
+                yield date, ({"weibo": {title: {"ranks": [1]} for title in titles}}, {"weibo": "微博"}, {})
+
+
+def _build_day(date, all_titles, id_to_name):
+    day = PeriodAggregate()
+    for titles in all_titles.values():
+        for title in titles:
+            day.add(date, None, "微博", title.split())
+    return day
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    aggregate_service._partial_keys.clear()
+    get_cache().clear()
+    yield
+    aggregate_service._partial_keys.clear()
+    get_cache().clear()
+
+
+def test_trim_keeps_top_k_per_day_and_merges_series():
+    day1 = PeriodAggregate()
+    date1, date2 = datetime(2025, 1, 5), datetime(2025, 1, 6)
+    for words in (["a", "b"], ["a", "c"], ["a", "b"], ["d"]):
+        day1.add(date1, None, "微博", words)
+    day1.trim_keywords(2)
+    assert day1.keywords == Counter({"a": 3, "b": 2})
+
+    day2 = PeriodAggregate()
+    for words in (["c"], ["c", "a"]):
+        day2.add(date2, None, "微博", words)
+    day2.trim_keywords(2)
+
+    merged = PeriodAggregate().merge(day1).merge(day2)
+    assert merged.keywords == Counter({"a": 4, "b": 2, "c": 2})
+    assert merged.keyword_series("c", ["2025-01-05", "2025-01-06"]) == [0, 2]
+    assert merged.news_count == 6
+    # 合并不修改单日部分聚合
+    assert day1.keywords == Counter({"a": 3, "b": 2})
+
+
+def test_collect_trims_vocabulary_before_caching(monkeypatch):
+    monkeypatch.setattr(aggregate_service, "KEYWORD_TOP_K", 3)
+    parser = FakeParser({"2025-01-05": [f"kw{i} common" for i in range(50)]})
+    service = AggregateService(parser)
+    dates = [datetime(2025, 1, 5)]
+
+    result = service.collect(dates, _build_day, "test_aggregate")
+    assert len(result.keywords) == 3
+    assert result.keywords["common"] == 50
+
+    # 第二次直接命中缓存
+    assert service.collect(dates, _build_day, "test_aggregate").keywords == result.keywords
+    assert len(parser.loaded) == 1
+
+
+def test_collect_caps_cached_partials(monkeypatch):
+    monkeypatch.setattr(aggregate_service, "MAX_CACHED_PARTIALS", 3)
+    start = datetime(2025, 1, 1)
+    dates = [start + timedelta(days=i) for i in range(5)]
+    parser = FakeParser({d.strftime("%Y-%m-%d"): [f"title {i}"] for i, d in enumerate(dates)})
+    service = AggregateService(parser)
+
+    result = service.collect(dates, _build_day, "test_aggregate")
+    assert result.news_count == 5
+    assert len(aggregate_service._partial_keys) == 3
+    assert get_cache().get_stats()["total_entries"] == 3
+
+    # 只有最近使用的 3 天仍在缓存中
+    parser.loaded.clear()
+    service.collect(dates, _build_day, "test_aggregate")
+    assert parser.loaded[:2] == dates[:2]
+
+
+TITLES = ["美国关税调整", "美国股市上涨", "城市交通拥堵", "中国经济增长", "美国大选结果"]
+
+
+@pytest.fixture
+def tools(tmp_path, monkeypatch):
+    monkeypatch.setattr(tokenizer, "_default_tokenizer", ChineseTokenizer())
+    backend = LocalStorageBackend(data_dir=str(tmp_path / "output"), enable_txt=False, enable_html=False)
+    items = [
+        NewsItem(title=title, source_id="weibo", rank=rank, url=f"https://weibo.com/{title}")
+        for rank, title in enumerate(TITLES, 1)
+    ]
+    today = datetime.now().strftime("%Y-%m-%d")
+    assert backend.save_news_data(NewsData(today, "08:00", {"weibo": items}, {"weibo": "微博"}))
+    backend.cleanup()
+    instance = AnalyticsTools(project_root=str(tmp_path))
+    instance.data_service.parser.cache.clear()
+    return instance
+
+
+def test_summary_report_reads_titles_once(tools, monkeypatch):
+    parser = tools.data_service.parser
+    calls = []
+    original = parser.iter_titles_for_dates
+
+    def counting(dates, *args, **kwargs):
+        calls.append(list(dates))
+        return original(calls[-1], *args, **kwargs)
+
+    monkeypatch.setattr(parser, "iter_titles_for_dates", counting)
+
+    result = tools.generate_summary_report("daily")
+    assert result["success"]
+    assert sum(len(dates) for dates in calls) == 1
+    assert result["statistics"]["total_news"] == 5
+    assert result["statistics"]["top_keyword"] == ("美国", 3)
+
+    # 精选样本与对全部标题按 TOP 10 关键词打分、按 (-权重, 标题) 排序的结果一致
+    top_keywords = [(kw.lower(), count) for kw, count in Counter(
+        kw for title in TITLES for kw in tools._extract_keywords(title)
+    ).most_common(10)]
+    scored = sorted(
+        TITLES,
+        key=lambda title: (-sum(count for kw, count in top_keywords if kw in title.lower()), title),
+    )
+    samples = result["markdown_report"].split("## 📰 精选新闻样本\n\n")[1].split("\n---")[0]
+    assert samples.strip().splitlines() == [f"- [微博] {title}" for title in scored]
+
+    # 同一天再次生成直接使用缓存的部分聚合
+    again = tools.generate_summary_report("daily")
+    assert again["statistics"] == result["statistics"]
+    assert sum(len(dates) for dates in calls) == 1
@@ -0,0 +1,161 @@
+# coding=utf-8
+"""AI 分析缓存：指纹命中、提示词 / 模型变化失效、增量分析深度与节省 token 记录"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from trendradar.ai.analyzer import AIAnalyzer
+from trendradar.ai.cache import MAX_DELTA_DEPTH, diff_context_items, make_fingerprint
+from trendradar.storage.local import LocalStorageBackend
+
+
+TITLES = [f"美国新闻标题{i}" for i in range(10)]
+
+RESPONSE = json.dumps({
+    "core_trends": "美国相关新闻集中",
+    "sentiment_controversy": "讨论平稳",
+    "signals": "无明显异动",
+    "outlook_strategy": "持续关注",
+}, ensure_ascii=False)
+
+
+def _stats(ranks=None):
+    ranks = ranks or {}
+    return [{
+        "word": "美国",
+        "titles": [
+            {"title": title, "source_name": "微博", "ranks": [ranks.get(i, i + 1)], "count": 1}
+            for i, title in enumerate(TITLES)
+        ],
+    }]
+
+
+def _analyzer(storage, model="openai/test", delta=True):
+    return AIAnalyzer(
+        {"API_KEY": "sk-test", "MODEL": model},
+        {"CACHE": {"ENABLED": True, "DELTA_ANALYSIS": delta}},
+        datetime.now,
+        cache_storage=storage,
+    )
+
+
+@pytest.fixture
+def storage(tmp_path):
+    backend = LocalStorageBackend(data_dir=str(tmp_path / "output"), enable_txt=False, enable_html=False)
+    yield backend
+    backend.cleanup()
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    prompts = []
+
+    def fake_call(self, user_prompt):
+        prompts.append(user_prompt)
+        return RESPONSE
+
+    monkeypatch.setattr(AIAnalyzer, "_call_ai", fake_call)
+    return prompts
+
+
+def _entry(analyzer, stats):
+    """读取同一基线下最近一条缓存记录，并确认它对应 stats 的新闻集合"""
+    base_key = make_fingerprint(
+        analyzer.ai_config["MODEL"], analyzer.system_prompt,
+        analyzer.user_prompt_template, "daily", analyzer.language,
+    )
+    latest = analyzer.cache.latest(base_key)
+    assert latest["context"] == analyzer._prepare_news_content(stats)[5]["items"]
+    return latest
+
+
+def test_identical_input_hits_cache_and_records_saved_tokens(storage, calls):
+    analyzer = _analyzer(storage, delta=False)
+    first = analyzer.analyze(_stats())
+    assert first.success and first.cache_status == ""
+    assert len(calls) == 1
+
+    second = analyzer.analyze(_stats())
+    assert second.cache_status == "hit"
+    assert second.core_trends == first.core_trends
+    assert second.total_news == len(TITLES)
+    assert len(calls) == 1
+
+    analyzer.analyze(_stats())
+    entry = _entry(analyzer, _stats())
+    assert entry["hits"] == 2
+    assert entry["saved_tokens"] > 0
+    assert entry["last_hit_at"]
+
+
+@pytest.mark.parametrize("change", ["model", "prompt"])
+def test_model_or_prompt_change_misses(storage, calls, change):
+    _analyzer(storage, delta=False).analyze(_stats())
+    assert len(calls) == 1
+
+    if change == "model":
+        analyzer = _analyzer(storage, model="openai/other", delta=False)
+    else:
+        analyzer = _analyzer(storage, delta=False)
+        analyzer.system_prompt += "\n请更简洁。"
+    result = analyzer.analyze(_stats())
+    assert result.success and result.cache_status == ""
+    assert len(calls) == 2
+
+
+def test_delta_depth_forces_full_analysis(storage, calls):
+    analyzer = _analyzer(storage)
+    assert analyzer.analyze(_stats()).cache_status == ""
+
+    # 每次只有一条新闻的排名变化：连续增量分析，深度递增
+    for depth in range(1, MAX_DELTA_DEPTH + 1):
+        stats = _stats({depth: 20 + depth})
+        result = analyzer.analyze(stats)
+        assert result.cache_status == "delta"
+        assert "上次分析结论" in calls[-1]
+        assert _entry(analyzer, stats)["delta_depth"] == depth
+
+    # 达到 MAX_DELTA_DEPTH 后，即使变化很小也强制全量分析
+    stats = _stats({0: 30})
+    result = analyzer.analyze(stats)
+    assert result.cache_status == ""
+    assert "上次分析结论" not in calls[-1]
+    assert _entry(analyzer, stats)["delta_depth"] == 0
+    assert len(calls) == MAX_DELTA_DEPTH + 2
+
+
+def test_delta_records_saved_tokens(storage, calls):
+    analyzer = _analyzer(storage)
+    analyzer.analyze(_stats())
+    stats = _stats({5: 40})
+    analyzer.analyze(stats)
+    entry = _entry(analyzer, stats)
+    assert entry["delta_depth"] == 1
+    assert entry["saved_tokens"] > 0
+    assert entry["hits"] == 0
+
+
+def test_large_change_falls_back_to_full_analysis(storage, calls):
+    analyzer = _analyzer(storage)
+    analyzer.analyze(_stats())
+    result = analyzer.analyze(_stats({i: 30 + i for i in range(6)}))
+    assert result.cache_status == ""
+    assert "上次分析结论" not in calls[-1]
+
+
+def test_diff_context_items():
+    previous = {"a": ["微博|1", "A", 1], "b": ["微博|2", "B", 1], "c": ["微博|3", "C", 0], "d": ["微博|4", "D", 0]}
+    current = {
+        "a": ["微博|1", "A", 1],      # 未变化
+        "b": ["微博|5", "B", 1],      # 排名变化
+        "c": ["微博|3", "C", 1],      # 仅因预算边界装入
+        "e": ["知乎|1", "E", 1],      # 新出现
+        "f": ["知乎|2", "F", 0],      # 新出现但未装入
+    }
+    changed, dropped = diff_context_items(previous, current)
+    assert changed == ["b", "e"]
+    # 只有上次装入过的新闻下榜才列出
+    assert dropped == []
+    assert diff_context_items(previous, {}) == ([], ["A", "B"])
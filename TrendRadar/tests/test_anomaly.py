@@ -0,0 +1,119 @@
+# coding=utf-8
+"""关键词热度状态：闭式推进、跨天叠加、变化日志重放与 z 分数"""
+
+from datetime import datetime
+
+import pytest
+
+from mcp_server.services.parser_service import ParserService
+from trendradar.core import tokenizer
+from trendradar.core.anomaly import (
+    EMPTY_STATE,
+    MIN_VARIANCE,
+    advance_state,
+    compose_day_states,
+    decay_factor,
+    update_state,
+    z_score,
+)
+from trendradar.core.tokenizer import ChineseTokenizer
+from trendradar.storage.base import NewsData, NewsItem
+from trendradar.storage.local import LocalStorageBackend
+
+
+DATE = "2026-10-19"
+
+
+def _stepwise(series, state=EMPTY_STATE, start=1):
+    """每个时间点都调用 update_state（不跳过条数不变的时间点）"""
+    for offset, count in enumerate(series):
+        state = update_state(state, start + offset, count)
+    return state
+
+
+def _changes_only(series):
+    """只在条数变化时调用 update_state，与抓取端写入日志的方式一致"""
+    state = EMPTY_STATE
+    for slot, count in enumerate(series, 1):
+        if count != state[1]:
+            state = update_state(state, slot, count)
+    return state
+
+
+SERIES = [0, 2, 2, 2, 5, 5, 1, 0, 0, 3, 3, 3, 3, 0]
+
+
+def test_advance_matches_stepwise_updates():
+    state = _stepwise([1, 4])
+    advanced = advance_state(state, 9)
+    expected = _stepwise([4] * 7, state, start=3)
+    assert advanced[:3] == expected[:3]
+    assert advanced[3:] == pytest.approx(expected[3:])
+
+
+def test_change_log_state_matches_stepwise():
+    expected = _stepwise(SERIES)
+    state = advance_state(_changes_only(SERIES), len(SERIES))
+    assert state[1:3] == expected[1:3]
+    assert state[2] == sum(SERIES)
+    assert state[3:] == pytest.approx(expected[3:])
+
+
+def test_compose_day_states_matches_continuous_series():
+    day1, day2 = SERIES[:9], SERIES[9:]
+    continuous = _stepwise(SERIES)
+    days = [
+        (len(day2), {"kw": _changes_only(day2)}),
+        (len(day1), {"kw": _changes_only(day1)}),
+    ]
+    moments, weight = compose_day_states(days)
+    assert moments["kw"] == pytest.approx(continuous[3:])
+    assert weight == pytest.approx(1 - decay_factor(len(SERIES)))
+
+    # 只叠加指定关键词
+    assert compose_day_states(days, ["other"])[0] == {}
+
+
+def test_z_score_does_not_scale_with_window():
+    # 方差取样本方差、均值与下限中的最大值
+    assert z_score(3.0, 1.0, 0.0) == pytest.approx(2.0)
+    assert z_score(2.0, 0.0, 0.0) == pytest.approx(2.0 / MIN_VARIANCE ** 0.5)
+    assert z_score(5.0, 1.0, 4.0) == pytest.approx(2.0)
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    monkeypatch.setattr(tokenizer, "_default_tokenizer", ChineseTokenizer())
+    instance = LocalStorageBackend(data_dir=str(tmp_path / "output"), enable_txt=False, enable_html=False)
+    yield instance
+    instance.cleanup()
+
+
+def test_log_replay_matches_stored_state(backend, tmp_path):
+    crawls = [
+        ("08:00", ["美国关税调整", "中国经济增长"]),
+        ("08:30", ["美国关税调整", "中国经济增长", "美国股市上涨"]),
+        ("09:00", ["美国股市上涨"]),
+        ("09:30", ["美国股市上涨", "中国经济增长"]),
+    ]
+    for crawl_time, titles in crawls:
+        items = [
+            NewsItem(title=title, source_id="weibo", rank=rank, url=f"https://weibo.com/{title}")
+            for rank, title in enumerate(titles, 1)
+        ]
+        assert backend.save_news_data(NewsData(DATE, crawl_time, {"weibo": items}, {"weibo": "微博"}))
+
+    parser = ParserService(project_root=str(tmp_path))
+    parser.cache.clear()
+    date = datetime.strptime(DATE, "%Y-%m-%d")
+    stored = parser.read_keyword_trend(date)
+    assert stored["slots"] == [crawl_time for crawl_time, _ in crawls]
+    assert stored["state"]["美国"][:3] == (3, 1, 4)
+
+    replayed = parser.read_keyword_trend(date, slot=len(crawls))
+    assert replayed["state"] == stored["state"]
+
+    # 截至第 2 个时间点的状态
+    early = parser.read_keyword_trend(date, slot=2)["state"]
+    assert early["美国"][:3] == (2, 2, 3)
+    assert early["中国"][:3] == (1, 1, 1)
@@ -0,0 +1,114 @@
+# coding=utf-8
+"""按月归档：归档 → 解压读取往返、写入已归档日期、解压缓存淘汰"""
+
+import os
+import sqlite3
+import time
+from datetime import datetime
+
+import pytest
+
+from mcp_server.services.parser_service import ParserService, _connect_readonly
+from trendradar.storage import archive
+from trendradar.storage.archive import extract_archived_day, list_archived_dates
+from trendradar.storage.base import NewsData, NewsItem
+from trendradar.storage.local import LocalStorageBackend
+
+
+DATES = ["2025-01-05", "2025-01-06", "2025-01-07"]
+
+
+def _news(date, crawl_time, titles):
+    items = [
+        NewsItem(title=title, source_id="weibo", rank=rank, url=f"https://weibo.com/{title}")
+        for rank, title in enumerate(titles, 1)
+    ]
+    return NewsData(date, crawl_time, {"weibo": items}, {"weibo": "微博"})
+
+
+@pytest.fixture
+def backend(tmp_path):
+    instance = LocalStorageBackend(data_dir=str(tmp_path / "output"), enable_txt=False, enable_html=False)
+    for date in DATES:
+        assert instance.save_news_data(_news(date, "08:00", [f"{date} 新闻一", f"{date} 新闻二"]))
+    assert instance.archive_old_data(archive_after_days=7) == len(DATES)
+    yield instance
+    instance.cleanup()
+
+
+def _titles(data):
+    return sorted(item.title for items in data.items.values() for item in items)
+
+
+def test_archive_round_trip(backend, tmp_path):
+    news_dir = tmp_path / "output" / "news"
+    assert not any((news_dir / f"{date}.db").exists() for date in DATES)
+    assert list_archived_dates(news_dir) == DATES
+
+    # 存储后端读取：解压到缓存后透明读取
+    data = backend.get_today_all_data(DATES[0])
+    assert _titles(data) == [f"{DATES[0]} 新闻一", f"{DATES[0]} 新闻二"]
+
+    # MCP 读取端同样透明读取
+    parser = ParserService(project_root=str(tmp_path))
+    all_titles, id_to_name, _ = parser._read_from_sqlite(
+        date=datetime.strptime(DATES[1], "%Y-%m-%d")
+    )
+    assert sorted(all_titles["weibo"]) == [f"{DATES[1]} 新闻一", f"{DATES[1]} 新闻二"]
+    assert id_to_name == {"weibo": "微博"}
+
+
+def test_cache_connection_is_read_only(backend):
+    conn = backend._get_connection(DATES[0])
+    with pytest.raises(sqlite3.OperationalError):
+        conn.execute("DELETE FROM news_items")
+    # 写入类操作被拒绝，而不是写进下次解压就会被覆盖的缓存
+    assert not backend.record_push("daily", DATES[0])
+
+
+def test_save_to_archived_day_restores_it(backend, tmp_path):
+    news_dir = tmp_path / "output" / "news"
+    date = DATES[1]
+    # 先读取一次，确保已有指向缓存的连接
+    assert backend.get_today_all_data(date) is not None
+
+    assert backend.save_news_data(_news(date, "09:00", [f"{date} 新闻一", f"{date} 新闻三"]))
+
+    assert (news_dir / f"{date}.db").exists()
+    assert date not in list_archived_dates(news_dir)
+    assert not (news_dir / "archive" / ".cache" / f"{date}.db").exists()
+    assert _titles(backend.get_today_all_data(date)) == [
+        f"{date} 新闻一", f"{date} 新闻三", f"{date} 新闻二",
+    ]
+    assert backend.get_crawl_times(date) == ["08:00", "09:00"]
+
+    # 取回的日期在下次归档时重新归档
+    backend.cleanup()
+    assert backend.archive_old_data(archive_after_days=7) == 1
+    assert list_archived_dates(news_dir) == DATES
+    assert backend.get_crawl_times(date) == ["08:00", "09:00"]
+
+
+def test_prune_keeps_leased_files(backend, tmp_path, monkeypatch):
+    news_dir = tmp_path / "output" / "news"
+    cache_dir = news_dir / "archive" / ".cache"
+    monkeypatch.setattr(archive, "ARCHIVE_CACHE_MAX_FILES", 1)
+
+    paths = [extract_archived_day(news_dir, date) for date in DATES]
+    # 租期内的文件即使超出上限也不淘汰（一次查询用到的日期都保留）
+    assert all(path.exists() for path in paths)
+
+    # 租期已过的文件按最近使用淘汰到上限
+    expired = time.time() - archive.ARCHIVE_CACHE_LEASE_SECONDS - 60
+    for offset, path in enumerate(paths):
+        os.utime(path, (expired + offset, expired + offset))
+    archive._prune_cache(cache_dir)
+    assert [path.exists() for path in paths] == [False, False, True]
+
+
+def test_readonly_connect_does_not_create_missing_file(tmp_path):
+    missing = tmp_path / "archive" / ".cache" / "2025-01-05.db"
+    missing.parent.mkdir(parents=True)
+    with pytest.raises(sqlite3.OperationalError):
+        _connect_readonly(missing)
+    assert not missing.exists()
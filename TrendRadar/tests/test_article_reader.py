@@ -0,0 +1,143 @@
+# coding=utf-8
+"""文章读取：令牌桶限速、批量篇数上限与有界内容缓存"""
+
+import threading
+
+import pytest
+
+from mcp_server.tools import article_reader
+from mcp_server.tools.article_reader import (
+    LOCAL_MAX_BATCH_SIZE,
+    MAX_BATCH_SIZE,
+    ArticleCache,
+    ArticleReaderTools,
+    TokenBucket,
+)
+
+
+class FakeClock:
+    """替换 article_reader 中的 time 模块：sleep 直接推进时钟"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeResponse:
+    status_code = 200
+    reason = "OK"
+
+    def __init__(self, text):
+        self.text = text
+        self.content = text.encode("utf-8")
+
+
+class FakeSession:
+    def __init__(self):
+        self.urls = []
+        self._lock = threading.Lock()
+
+    def get(self, url, timeout):
+        with self._lock:
+            self.urls.append(url)
+        return FakeResponse(f"# {url}")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(article_reader, "time", fake)
+    return fake
+
+
+def _reader(monkeypatch, **kwargs):
+    tools = ArticleReaderTools(**kwargs)
+    session = FakeSession()
+    monkeypatch.setattr(tools, "_get_session", lambda: session)
+    return tools, session
+
+
+def test_token_bucket_allows_burst_then_holds_rate(clock):
+    bucket = TokenBucket(rate_per_minute=60, capacity=2)
+    start = clock.now
+    for _ in range(6):
+        bucket.acquire()
+    # 容量 2 的突发立即通过，其余 4 个令牌按每秒 1 个补充
+    assert clock.now - start == pytest.approx(4.0)
+    assert len(clock.sleeps) == 4
+
+
+def test_token_bucket_refills_up_to_capacity(clock):
+    bucket = TokenBucket(rate_per_minute=120, capacity=2)
+    bucket.acquire()
+    bucket.acquire()
+    clock.now += 60  # 空闲很久也只补满到容量
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+@pytest.mark.parametrize(
+    "reader_base, expected",
+    [
+        (None, MAX_BATCH_SIZE),
+        ("https://r.jina.ai/", MAX_BATCH_SIZE),
+        ("http://localhost:3000", LOCAL_MAX_BATCH_SIZE),
+    ],
+)
+def test_batch_size_cap_follows_reader_base(monkeypatch, reader_base, expected):
+    if reader_base is None:
+        monkeypatch.delenv("JINA_READER_BASE", raising=False)
+    else:
+        monkeypatch.setenv("JINA_READER_BASE", reader_base)
+    tools, session = _reader(monkeypatch, rate_limit_rpm=6000)
+
+    urls = [f"https://example.com/{i}" for i in range(LOCAL_MAX_BATCH_SIZE + 5)]
+    result = tools.read_articles_batch(urls)
+    assert result["success"]
+    assert result["summary"]["processed"] == expected
+    assert result["summary"]["skipped"] == len(urls) - expected
+    assert [article["url"] for article in result["articles"]] == urls[:expected]
+    assert len(session.urls) == expected
+
+
+def test_article_cache_hits_within_ttl(monkeypatch, clock):
+    tools, session = _reader(monkeypatch, cache_ttl=60)
+    url = "https://example.com/a"
+    assert "cached" not in tools.read_article(url)
+    assert tools.read_article(url)["cached"] is True
+    assert len(session.urls) == 1
+
+    clock.now += 61
+    assert "cached" not in tools.read_article(url)
+    assert len(session.urls) == 2
+
+
+def test_article_cache_bounded_by_entries_and_bytes(clock):
+    cache = ArticleCache(ttl=3600, max_entries=3, max_bytes=100)
+    for name in "abc":
+        cache.set(name, {"name": name}, 30)
+    cache.get("a")  # a 最近被读取，淘汰 b
+    cache.set("d", {"name": "d"}, 30)
+    assert cache.get("b") is None
+    assert cache.get_stats() == {"entries": 3, "bytes": 90}
+
+    # 按字节数淘汰最久未使用的条目
+    cache.set("e", {"name": "e"}, 70)
+    assert cache.get_stats() == {"entries": 2, "bytes": 100}
+    assert cache.get("e") is not None and cache.get("d") is not None
+
+    # 单篇超过字节上限不缓存
+    cache.set("huge", {"name": "huge"}, 101)
+    assert cache.get("huge") is None
+    assert cache.get_stats()["bytes"] == 100
@@ -0,0 +1,135 @@
+# coding=utf-8
+"""批量查询：工具白名单、子查询数上限、单个子查询失败隔离与共享同一份缓存快照"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+pytest.importorskip("fastmcp", exc_type=ImportError)
+
+from mcp_server import server  # noqa: E402
+from mcp_server.services.cache_service import get_cache  # noqa: E402
+from mcp_server.utils.errors import DataNotFoundError  # noqa: E402
+
+
+VALUE_KEY = "test_batch_query:value"
+
+
+class FakeTools:
+    """记录调用的只读查询工具"""
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def echo(self, value: int = 0):
+        with self._lock:
+            self.calls.append(value)
+        return {"success": True, "value": value}
+
+    def read_value(self):
+        return {"success": True, "value": get_cache().get(VALUE_KEY)}
+
+    def crawl_then_read(self):
+        # 模拟批量查询期间完成的一次抓取：在快照之外的线程中写入新数据
+        writer = threading.Thread(target=get_cache().set, args=(VALUE_KEY, "new"))
+        writer.start()
+        writer.join()
+        return self.read_value()
+
+    def fail(self):
+        raise ValueError("boom")
+
+    def not_found(self):
+        raise DataNotFoundError("没有数据")
+
+
+def _prime_snapshot():
+    """快照建立时固定当前数据（对应加载今天的热榜数据）"""
+    return "08:00" if get_cache().get(VALUE_KEY) is not None else None
+
+
+@pytest.fixture
+def fake_tools(monkeypatch):
+    tools = FakeTools()
+    monkeypatch.setitem(server._tools_instances, "fake", tools)
+    for name in ("echo", "read_value", "crawl_then_read", "fail", "not_found"):
+        monkeypatch.setitem(server._BATCH_QUERY_TOOLS, name, ("fake", name, {}))
+    monkeypatch.setattr(server, "_prime_batch_snapshot", _prime_snapshot)
+    get_cache().clear()
+    yield tools
+    get_cache().clear()
+
+
+def _batch(queries):
+    batch_query = getattr(server.batch_query, "fn", server.batch_query)
+    return json.loads(asyncio.run(batch_query(queries)))
+
+
+def test_rejects_unknown_and_side_effect_tools(fake_tools):
+    assert "trigger_crawl" not in server._BATCH_QUERY_TOOLS
+    assert "read_article" not in server._BATCH_QUERY_TOOLS
+
+    result = _batch([
+        {"tool": "trigger_crawl", "params": {}},
+        {"tool": "no_such_tool"},
+        "echo",
+        {"tool": "echo", "params": {"value": 1}},
+    ])
+    assert result["success"]
+    assert [item["success"] for item in result["results"]] == [False, False, False, True]
+    assert result["results"][0]["result"]["error"]["code"] == "INVALID_PARAMETER"
+    assert "trigger_crawl" in result["results"][0]["result"]["error"]["message"]
+    assert fake_tools.calls == [1]
+
+    empty = _batch([])
+    assert not empty["success"] and empty["error"]["code"] == "INVALID_PARAMETER"
+
+
+def test_caps_queries_at_batch_max(fake_tools):
+    queries = [{"tool": "echo", "params": {"value": i}, "id": f"q{i}"} for i in range(server.BATCH_MAX_QUERIES + 2)]
+    result = _batch(queries)
+    assert server.BATCH_MAX_QUERIES == 10
+    assert result["summary"]["total"] == 10
+    assert [item["id"] for item in result["results"]] == [f"q{i}" for i in range(10)]
+    assert sorted(fake_tools.calls) == list(range(10))
+    assert "2 个子查询已跳过" in result["note"]
+
+    assert "note" not in _batch(queries[:10])
+
+
+def test_sub_query_errors_are_isolated(fake_tools):
+    result = _batch([
+        {"tool": "fail"},
+        {"tool": "echo", "params": {"value": 7}},
+        {"tool": "not_found"},
+        {"tool": "echo", "params": {"unknown": 1}},
+        {"tool": "echo", "params": "value=1"},
+        {"tool": "echo"},
+    ])
+    items = result["results"]
+    assert result["success"]
+    assert [item["success"] for item in items] == [False, True, False, False, False, True]
+    assert items[0]["result"]["error"] == {"code": "INTERNAL_ERROR", "message": "boom"}
+    assert items[1]["result"]["value"] == 7
+    assert items[2]["result"]["error"]["code"] == "DATA_NOT_FOUND"
+    assert items[3]["result"]["error"]["code"] == "INVALID_PARAMETER"
+    assert items[4]["result"]["error"]["code"] == "INVALID_PARAMETER"
+    assert items[5]["result"]["value"] == 0
+    assert (result["summary"]["succeeded"], result["summary"]["failed"]) == (2, 4)
+
+
+def test_sub_queries_share_one_cache_snapshot(fake_tools):
+    get_cache().set(VALUE_KEY, "old")
+    queries = [{"tool": "read_value"}, {"tool": "crawl_then_read"}] + [{"tool": "read_value"}] * 6
+    result = _batch(queries)
+
+    # 批量期间写入的新数据对所有子查询都不可见，子查询并发执行也读到同一份数据
+    assert [item["result"]["value"] for item in result["results"]] == ["old"] * len(queries)
+    assert result["summary"]["latest_crawl_time"] == "08:00"
+
+    # 快照结束后恢复普通缓存行为
+    assert get_cache().get(VALUE_KEY) == "new"
+    assert not get_cache().in_snapshot()
@@ -0,0 +1,114 @@
+# coding=utf-8
+"""Holt 阻尼趋势：闭式推进与逐点更新一致、回测，以及热点预测与按天回退的对比"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from mcp_server.tools.analytics import AnalyticsTools
+from trendradar.core import tokenizer
+from trendradar.core.forecast import (
+    HOLT_PHI,
+    backtest,
+    holt_advance,
+    holt_decay,
+    holt_forecast,
+    holt_update,
+)
+from trendradar.core.tokenizer import ChineseTokenizer
+from trendradar.storage.base import NewsData, NewsItem
+from trendradar.storage.local import LocalStorageBackend
+
+
+def test_holt_advance_matches_stepwise_updates():
+    level, trend = 0.0, 0.0
+    for count in (1, 3, 4):
+        level, trend = holt_update(level, trend, count)
+
+    stepped = (level, trend)
+    for _ in range(9):
+        stepped = holt_update(*stepped, 2)
+    assert holt_advance(level, trend, 2, 9) == pytest.approx(stepped)
+
+
+def test_holt_decay_composes():
+    state = (1.5, 0.3)
+    assert holt_decay(*holt_decay(*state, 4), 7) == pytest.approx(holt_decay(*state, 11))
+    assert holt_decay(*state, 0) == state
+
+
+def test_holt_forecast_damps_trend():
+    damped_steps = sum(HOLT_PHI ** k for k in range(1, 7))
+    assert holt_forecast(3, 0.5, 6) == pytest.approx(3 + 0.5 * damped_steps)
+    # 阻尼后任意步数的增量不超过 trend · φ / (1 - φ)
+    assert holt_forecast(3, 0.5, 1000) <= 3 + 0.5 * HOLT_PHI / (1 - HOLT_PHI) + 1e-9
+    assert holt_forecast(1, -2.0, 6) == 0.0
+
+
+def test_backtest_on_flat_series_matches_naive():
+    report = backtest({"a": [2] * 30, "b": [0] * 30}, horizons=(1, 3), warmup=5)
+    assert report["keywords"] == 2 and report["slots"] == 30
+    for metrics in report["horizons"].values():
+        # 从零开始的状态在预热后只剩很小的残余趋势
+        assert metrics["holt"]["mae"] < 0.01
+        assert metrics["naive"]["mae"] == 0.0
+
+
+# ==================== 热点预测与按天回退 ====================
+
+STABLE_TITLES = ["股市震荡调整", "球队赢得比赛", "城市交通拥堵", "高铁票价调整"]
+CRAWL_HOURS = range(12)
+
+
+def _save_day(backend, date, titles_for_crawl):
+    for hour in CRAWL_HOURS:
+        titles = titles_for_crawl(hour)
+        items = [
+            NewsItem(title=title, source_id="weibo", rank=rank, url=f"https://weibo.com/{title}")
+            for rank, title in enumerate(titles, 1)
+        ]
+        news = NewsData(date, f"{hour:02d}:00", {"weibo": items}, {"weibo": "微博"})
+        assert backend.save_news_data(news)
+
+
+@pytest.fixture
+def tools(tmp_path, monkeypatch):
+    """最近 4 天的历史：其余关键词平稳，"暴雨" 今天持续上升"""
+    monkeypatch.setattr(tokenizer, "_default_tokenizer", ChineseTokenizer())
+    backend = LocalStorageBackend(data_dir=str(tmp_path / "output"), enable_txt=False, enable_html=False)
+    today = datetime.now()
+    for days_ago in (3, 2, 1):
+        date = (today - timedelta(days=days_ago)).strftime("%Y-%m-%d")
+        _save_day(backend, date, lambda hour: STABLE_TITLES + (["多地发布暴雨预警"] if hour < 4 else []))
+    _save_day(
+        backend,
+        today.strftime("%Y-%m-%d"),
+        lambda hour: STABLE_TITLES + [f"南方暴雨持续 第{n}报" for n in range(1 + hour // 2)],
+    )
+    backend.cleanup()
+    instance = AnalyticsTools(project_root=str(tmp_path))
+    # 解析缓存是进程级的，按日期缓存的状态可能来自其他测试的数据目录
+    instance.data_service.parser.cache.clear()
+    return instance
+
+
+def test_predict_matches_day_over_day_fallback(tools, monkeypatch):
+    result = tools.predict_trending_topics()
+    assert result["success"]
+    assert result["summary"]["method"] == "holt"
+    topics = {topic["keyword"]: topic for topic in result["data"]}
+    # 平稳的关键词不应被预测为上升
+    assert set(topics) == {"暴雨", "南方", "持续"}
+    topic = topics["暴雨"]
+    assert topic["current_count"] == 6
+    assert topic["predicted_count"] >= topic["current_count"]
+    assert topic["confidence"] >= 0.7
+    assert topic["sample_titles"]
+    assert all("暴雨" in title for title in topic["sample_titles"])
+
+    # 按天回退在同一份历史上同样给出该关键词（"南方"、"持续" 今天才出现，回退需要至少两天的计数）
+    monkeypatch.setattr(tools, "_predict_from_trend", lambda *args: None)
+    tools.data_service.parser.cache.clear()
+    fallback = tools.predict_trending_topics()
+    assert fallback["summary"]["method"] == "day_over_day"
+    assert [topic["keyword"] for topic in fallback["data"]] == ["暴雨"]
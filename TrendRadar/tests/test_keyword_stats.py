@@ -0,0 +1,138 @@
+# coding=utf-8
+"""抓取时的关键词统计：last_seen 刷新不重新分词，派生表按口径版本重建"""
+
+import sqlite3
+
+import pytest
+
+from trendradar.core import tokenizer
+from trendradar.core.tokenizer import ChineseTokenizer
+from trendradar.storage import sqlite_mixin
+from trendradar.storage.base import NewsData, NewsItem
+from trendradar.storage.local import LocalStorageBackend
+
+
+DATE = "2025-01-05"
+
+
+def _save(backend, crawl_time, titles):
+    items = [
+        NewsItem(title=title, source_id="weibo", rank=rank, url=f"https://weibo.com/{title}")
+        for rank, title in enumerate(titles, 1)
+    ]
+    assert backend.save_news_data(NewsData(DATE, crawl_time, {"weibo": items}, {"weibo": "微博"}))
+
+
+def _backend(tmp_path):
+    return LocalStorageBackend(data_dir=str(tmp_path / "output"), enable_txt=False, enable_html=False)
+
+
+def _query(tmp_path, sql):
+    conn = sqlite3.connect(tmp_path / "output" / "news" / f"{DATE}.db")
+    try:
+        return conn.execute(sql).fetchall()
+    finally:
+        conn.close()
+
+
+@pytest.fixture(autouse=True)
+def default_tokenizer(monkeypatch):
+    monkeypatch.setattr(tokenizer, "_default_tokenizer", ChineseTokenizer())
+
+
+def test_last_seen_refreshed_without_retokenizing(tmp_path, monkeypatch):
+    backend = _backend(tmp_path)
+    _save(backend, "08:00", ["美国关税调整", "中国经济增长"])
+
+    calls = []
+    original = sqlite_mixin.extract_keywords
+
+    def counting(title):
+        calls.append(title)
+        return original(title)
+
+    monkeypatch.setattr(sqlite_mixin, "extract_keywords", counting)
+    # 在榜标题不变：不需要分词
+    _save(backend, "08:30", ["美国关税调整", "中国经济增长"])
+    assert calls == []
+
+    # 只有新上榜的标题被分词
+    _save(backend, "09:00", ["美国关税调整", "美国股市上涨"])
+    assert set(calls) == {"美国股市上涨", "中国经济增长"}
+    backend.cleanup()
+
+    stats = dict(
+        (kw, (first, last))
+        for kw, first, last in _query(tmp_path, "SELECT keyword, first_seen, last_seen FROM keyword_stats")
+    )
+    assert stats["美国"] == ("08:00", "09:00")
+    assert stats["关税"] == ("08:00", "09:00")
+    assert stats["股市"] == ("09:00", "09:00")
+    assert stats["中国"] == ("08:00", "08:30")
+
+
+def test_title_keywords_follow_title_changes(tmp_path):
+    backend = _backend(tmp_path)
+    _save(backend, "08:00", ["美国关税调整"])
+    # 同一链接的标题变更：旧标题及其关键词移除
+    items = [NewsItem(title="美国关税取消", source_id="weibo", rank=1, url="https://weibo.com/美国关税调整")]
+    assert backend.save_news_data(NewsData(DATE, "08:30", {"weibo": items}, {"weibo": "微博"}))
+    backend.cleanup()
+
+    rows = _query(tmp_path, "SELECT DISTINCT title FROM keyword_title_keywords")
+    assert rows == [("美国关税取消",)]
+    assert dict(_query(tmp_path, "SELECT keyword, count FROM keyword_stats")).get("调整") is None
+
+
+@pytest.mark.parametrize("group_index", range(len(sqlite_mixin._DERIVED_TABLE_GROUPS)))
+def test_version_bump_rebuilds_derived_group(tmp_path, monkeypatch, group_index):
+    backend = _backend(tmp_path)
+    _save(backend, "08:00", ["美国关税调整", "中国经济增长"])
+    backend.cleanup()
+    table = sqlite_mixin._DERIVED_TABLE_GROUPS[group_index][1][0]
+    expected = _query(tmp_path, f"SELECT * FROM {table}")
+    assert expected
+
+    # 模拟按旧口径写入的残留数据，随后提升该组的版本
+    conn = sqlite3.connect(tmp_path / "output" / "news" / f"{DATE}.db")
+    conn.execute(f"DELETE FROM {table}")
+    conn.commit()
+    conn.close()
+
+    groups = list(sqlite_mixin._DERIVED_TABLE_GROUPS)
+    version, tables = groups[group_index]
+    groups[group_index] = (version + 1, tables)
+    monkeypatch.setattr(sqlite_mixin, "_DERIVED_TABLE_GROUPS", tuple(groups))
+
+    backend = _backend(tmp_path)
+    _save(backend, "08:30", ["美国关税调整", "中国经济增长"])
+    backend.cleanup()
+    assert _query(tmp_path, f"SELECT version FROM derived_table_versions WHERE name = '{table}'") == [(version + 1,)]
+    rebuilt = _query(tmp_path, f"SELECT * FROM {table}")
+    if table == "keyword_trend_state":
+        # 两个时间点在榜条数相同：状态重放后只多出平稳期的推进
+        assert [row[0] for row in rebuilt] == [row[0] for row in expected]
+    elif table == "crawl_platform_stats":
+        assert rebuilt[0] == expected[0]
+        assert len(rebuilt) == 2
+    else:
+        assert {row[0] for row in rebuilt} == {row[0] for row in expected}
+
+
+def test_unversioned_database_rebuilds_keyword_stats(tmp_path):
+    backend = _backend(tmp_path)
+    _save(backend, "08:00", ["美国关税调整"])
+    backend.cleanup()
+
+    # 升级前的数据库：没有版本表，也没有标题关键词表
+    conn = sqlite3.connect(tmp_path / "output" / "news" / f"{DATE}.db")
+    conn.execute("DROP TABLE derived_table_versions")
+    conn.execute("DROP TABLE keyword_title_keywords")
+    conn.commit()
+    conn.close()
+
+    backend = _backend(tmp_path)
+    _save(backend, "08:30", ["美国关税调整"])
+    backend.cleanup()
+    assert {row[0] for row in _query(tmp_path, "SELECT keyword FROM keyword_title_keywords")} == {"美国", "关税", "调整"}
+    assert dict(_query(tmp_path, "SELECT keyword, last_seen FROM keyword_stats"))["美国"] == "08:30"
@@ -0,0 +1,88 @@
+# coding=utf-8
+"""新闻权重排序：批量打分与堆选择的结果与原有的全量排序完全一致"""
+
+import random
+
+import pytest
+
+from trendradar.core.analyzer import calculate_news_weight, rank_news_titles
+
+
+WEIGHT_CONFIG = {"RANK_WEIGHT": 0.6, "FREQUENCY_WEIGHT": 0.3, "HOTNESS_WEIGHT": 0.1}
+RANK_THRESHOLD = 5
+
+
+def _legacy_weight(title_data, rank_threshold, weight_config):
+    """改动前的 calculate_news_weight 实现"""
+    ranks = title_data.get("ranks", [])
+    if not ranks:
+        return 0.0
+
+    count = title_data.get("count", len(ranks))
+
+    rank_scores = []
+    for rank in ranks:
+        score = 11 - min(rank, 10)
+        rank_scores.append(score)
+
+    rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
+
+    frequency_weight = min(count, 10) * 10
+
+    high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
+    hotness_ratio = high_rank_count / len(ranks) if ranks else 0
+    hotness_weight = hotness_ratio * 100
+
+    return (
+        rank_weight * weight_config["RANK_WEIGHT"]
+        + frequency_weight * weight_config["FREQUENCY_WEIGHT"]
+        + hotness_weight * weight_config["HOTNESS_WEIGHT"]
+    )
+
+
+def _legacy_rank(titles, limit):
+    """改动前 count_word_frequency 中的排序与截取"""
+    ordered = sorted(
+        titles,
+        key=lambda x: (
+            -_legacy_weight(x, RANK_THRESHOLD, WEIGHT_CONFIG),
+            min(x["ranks"]) if x["ranks"] else 999,
+            -x["count"],
+        ),
+    )
+    return ordered[:limit] if limit > 0 else ordered
+
+
+def _random_titles(seed, size):
+    rng = random.Random(seed)
+    titles = []
+    for i in range(size):
+        ranks = [rng.randint(1, 30) for _ in range(rng.randint(0, 12))]
+        titles.append({"title": f"t{i}", "ranks": ranks, "count": max(len(ranks), rng.randint(0, 15))})
+    # 完全相同的排名与次数：同分时必须保持原有相对顺序
+    for i in range(size // 4):
+        source = titles[rng.randrange(len(titles))]
+        titles.insert(rng.randrange(len(titles) + 1), {**source, "title": f"dup{i}"})
+    return titles
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_weight_matches_legacy_bit_for_bit(seed):
+    for title in _random_titles(seed, 200):
+        assert calculate_news_weight(title, RANK_THRESHOLD, WEIGHT_CONFIG) == \
+            _legacy_weight(title, RANK_THRESHOLD, WEIGHT_CONFIG)
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("limit", [0, 1, 10, 150, 1000])
+def test_rank_matches_sorted_order(seed, limit):
+    titles = _random_titles(seed, 200)
+    ranked = rank_news_titles(titles, RANK_THRESHOLD, WEIGHT_CONFIG, limit=limit)
+    assert [t["title"] for t in ranked] == [t["title"] for t in _legacy_rank(titles, limit)]
+
+
+def test_rank_ties_keep_input_order():
+    same = {"ranks": [3, 4], "count": 2}
+    titles = [{**same, "title": name} for name in "cab"] + [{"title": "top", "ranks": [1], "count": 5}]
+    assert [t["title"] for t in rank_news_titles(titles, RANK_THRESHOLD, WEIGHT_CONFIG)] == ["top", "c", "a", "b"]
+    assert [t["title"] for t in rank_news_titles(titles, RANK_THRESHOLD, WEIGHT_CONFIG, limit=3)] == ["top", "c", "a"]
@@ -0,0 +1,145 @@
+# coding=utf-8
+"""平台对比 / 平台活跃度：抓取时聚合、由排名历史计算与读取标题三种方式口径一致，标题只在 SQL 中计数"""
+
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from mcp_server.tools.analytics import AnalyticsTools
+from trendradar.core import tokenizer
+from trendradar.core.tokenizer import ChineseTokenizer
+from trendradar.storage.base import NewsData, NewsItem
+from trendradar.storage.local import LocalStorageBackend
+
+
+DATE_RANGE = {"start": "2025-01-05", "end": "2025-01-06"}
+NAMES = {"weibo": "微博", "zhihu": "知乎"}
+
+# (日期, 抓取时间, {平台: [标题, ...]}, 失败平台)
+CRAWLS = [
+    ("2025-01-05", "08:00", {"weibo": ["美国关税调整", "中国经济增长"], "zhihu": ["如何看待美国关税调整"]}, []),
+    ("2025-01-05", "09:00", {"weibo": ["美国关税调整", "美国股市上涨"]}, ["zhihu"]),
+    ("2025-01-06", "08:00", {"weibo": ["美国关税调整", "城市交通拥堵"], "zhihu": ["如何看待美国关税调整"]}, []),
+]
+
+
+@pytest.fixture
+def tools(tmp_path, monkeypatch):
+    monkeypatch.setattr(tokenizer, "_default_tokenizer", ChineseTokenizer())
+    backend = LocalStorageBackend(data_dir=str(tmp_path / "output"), enable_txt=False, enable_html=False)
+    for date, crawl_time, titles, failed_ids in CRAWLS:
+        items = {
+            platform_id: [
+                NewsItem(title=title, source_id=platform_id, rank=rank, url=f"https://{platform_id}/{title}")
+                for rank, title in enumerate(platform_titles, 1)
+            ]
+            for platform_id, platform_titles in titles.items()
+        }
+        assert backend.save_news_data(NewsData(date, crawl_time, items, NAMES, failed_ids=failed_ids))
+    backend.cleanup()
+    instance = AnalyticsTools(project_root=str(tmp_path))
+    instance.data_service.parser.cache.clear()
+    return instance
+
+
+def _drop_platform_aggregate(tools):
+    """模拟升级前的数据：删除抓取时写入的平台聚合表与标题计数表"""
+    news_dir = tools.data_service.parser.project_root / "output" / "news"
+    for db_path in news_dir.glob("*.db"):
+        conn = sqlite3.connect(db_path)
+        conn.execute("DROP TABLE crawl_platform_stats")
+        conn.execute("DROP TABLE platform_title_counts")
+        conn.commit()
+        conn.close()
+    tools.data_service.parser.cache.clear()
+
+
+def _query(tools, date, sql):
+    conn = sqlite3.connect(tools.data_service.parser.project_root / "output" / "news" / f"{date}.db")
+    try:
+        return conn.execute(sql).fetchall()
+    finally:
+        conn.close()
+
+
+def test_activity_stats_fields(tools):
+    result = tools.get_platform_activity_stats(DATE_RANGE)
+    assert result["success"]
+    weibo = result["platform_activity"]["微博"]
+    assert weibo["total_updates"] == 3
+    assert weibo["failed_updates"] == 0
+    # 每天去重后的标题数之和：第一天 3 条，第二天 2 条
+    assert weibo["news_count"] == 5
+    assert weibo["avg_rank"] == 1.5
+    assert weibo["days_active"] == 2
+    assert weibo["most_active_hours"] == [
+        {"hour": "08:00", "count": 4},
+        {"hour": "09:00", "count": 1},
+    ]
+
+    zhihu = result["platform_activity"]["知乎"]
+    assert (zhihu["total_updates"], zhihu["failed_updates"], zhihu["news_count"]) == (2, 1, 2)
+    assert zhihu["avg_rank"] == 1.0
+
+
+def test_activity_stats_without_aggregate_table(tools):
+    expected = tools.get_platform_activity_stats(DATE_RANGE)
+    _drop_platform_aggregate(tools)
+    assert tools.get_platform_activity_stats(DATE_RANGE) == expected
+
+
+def test_compare_platforms_dedups_titles_across_days(tools):
+    result = tools.compare_platforms("关税", DATE_RANGE)
+    assert result["success"]
+    weibo = result["platform_stats"]["微博"]
+    assert weibo["total_news"] == 5
+    # "美国关税调整" 两天都在榜，只计一次
+    assert weibo["unique_titles"] == 4
+    assert weibo["topic_mentions"] == 2
+    zhihu = result["platform_stats"]["知乎"]
+    assert (zhihu["total_news"], zhihu["unique_titles"], zhihu["topic_mentions"]) == (2, 1, 2)
+
+
+@pytest.mark.parametrize("topic", [None, "关税"])
+def test_compare_platforms_matches_title_fallback(tools, monkeypatch, topic):
+    expected = tools.compare_platforms(topic, DATE_RANGE)
+
+    _drop_platform_aggregate(tools)
+    assert tools.compare_platforms(topic, DATE_RANGE) == expected
+
+    # 关键词统计不可用时读取标题实时统计
+    monkeypatch.setattr(tools, "_read_platform_day_stats", lambda *args, **kwargs: None)
+    tools.data_service.parser.cache.clear()
+    assert tools.compare_platforms(topic, DATE_RANGE) == expected
+
+
+def test_title_counts_written_at_save_time(tools):
+    rows = _query(tools, "2025-01-05", "SELECT platform_id, title_count FROM platform_title_counts")
+    assert dict(rows) == {"weibo": 3, "zhihu": 1}
+
+    stats = tools.data_service.parser.read_platform_stats(datetime(2025, 1, 5))
+    assert stats["title_counts"] == {"weibo": 3, "zhihu": 1}
+    assert "titles" not in stats
+
+
+def test_title_counts_follow_title_changes(tmp_path, tools):
+    backend = LocalStorageBackend(data_dir=str(tmp_path / "output"), enable_txt=False, enable_html=False)
+    # 同一链接的标题变更：旧标题不再计数；新平台补齐计数
+    items = {
+        "weibo": [NewsItem(title="美国关税取消", source_id="weibo", rank=1, url="https://weibo/美国关税调整")],
+        "douyin": [NewsItem(title="城市交通拥堵", source_id="douyin", rank=1, url="https://douyin/1")],
+    }
+    assert backend.save_news_data(NewsData("2025-01-06", "09:00", items, {**NAMES, "douyin": "抖音"}))
+    backend.cleanup()
+
+    rows = _query(tools, "2025-01-06", "SELECT platform_id, title_count FROM platform_title_counts")
+    assert dict(rows) == {"weibo": 2, "zhihu": 1, "douyin": 1}
+
+
+def test_unique_titles_counted_across_days_in_sql(tools):
+    parser = tools.data_service.parser
+    dates = parser.get_dates_in_range(datetime(2025, 1, 4), datetime(2025, 1, 6))
+    # 2025-01-04 没有数据库：跳过
+    assert parser.count_unique_titles(dates) == {"微博": 4, "知乎": 1}
+    assert parser.count_unique_titles(dates[1:2]) == {"微博": 3, "知乎": 1}
@@ -0,0 +1,183 @@
+# coding=utf-8
+"""RSS 流式解析与 feedparser 整体解析的一致性"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("feedparser")
+
+from trendradar.crawler.rss.parser import STALE_STREAK_LIMIT, RSSParser
+
+
+RSS2 = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/"
+     xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel>
+  <title>示例频道</title>
+  <link>https://example.com/</link>
+  <item>
+    <title>第一条 &amp; 新闻</title>
+    <link>https://example.com/1</link>
+    <guid isPermaLink="false">id-1</guid>
+    <pubDate>Mon, 19 Oct 2026 08:00:00 +0800</pubDate>
+    <description><![CDATA[<p>摘要 <b>一</b></p>]]></description>
+    <dc:creator>张三</dc:creator>
+  </item>
+  <item>
+    <title><![CDATA[第二条  新闻]]></title>
+    <guid>https://example.com/2</guid>
+    <pubDate>Mon, 19 Oct 2026 07:00:00 +0800</pubDate>
+    <content:encoded><![CDATA[正文内容]]></content:encoded>
+  </item>
+  <item>
+    <title>没有日期的条目</title>
+    <link>https://example.com/3</link>
+  </item>
+</channel>
+</rss>
+"""
+
+ATOM = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Atom 示例</title>
+  <entry>
+    <title>Atom 条目一</title>
+    <link rel="self" href="https://example.com/self/1"/>
+    <link rel="alternate" type="text/html" href="https://example.com/a/1"/>
+    <id>urn:uuid:1</id>
+    <published>2026-10-19T08:00:00+08:00</published>
+    <updated>2026-10-19T09:00:00+08:00</updated>
+    <summary>Atom 摘要</summary>
+    <author><name>李四</name></author>
+  </entry>
+  <entry>
+    <title>Atom 条目二</title>
+    <link href="https://example.com/a/2"/>
+    <id>urn:uuid:2</id>
+    <updated>2026-10-18T08:00:00Z</updated>
+  </entry>
+</feed>
+"""
+
+RDF = """<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns="http://purl.org/rss/1.0/" xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel rdf:about="https://example.com/"><title>RDF 示例</title></channel>
+  <item rdf:about="https://example.com/r/1">
+    <title>RDF 条目</title>
+    <link>https://example.com/r/1</link>
+    <dc:date>2026-10-19T08:00:00+08:00</dc:date>
+    <description>RDF 摘要</description>
+  </item>
+</rdf:RDF>
+"""
+
+
+def _chunks(text: str, size: int):
+    data = text.encode("utf-8")
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def _rss_items(count: int, start: datetime) -> str:
+    """按时间倒序生成 count 条每小时一条的 RSS 条目"""
+    items = "".join(
+        f"<item><title>条目{i}</title><link>https://example.com/{i}</link>"
+        f"<pubDate>{(start - timedelta(hours=i)).strftime('%a, %d %b %Y %H:%M:%S +0000')}</pubDate></item>"
+        for i in range(count)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>{items}</channel></rss>'
+
+
+@pytest.fixture
+def parser():
+    return RSSParser()
+
+
+@pytest.mark.parametrize("feed", [RSS2, ATOM, RDF], ids=["rss2", "atom", "rdf"])
+@pytest.mark.parametrize("chunk_size", [7, 64, 1 << 16])
+def test_stream_matches_feedparser(parser, feed, chunk_size):
+    expected = parser.parse(feed)
+    assert expected
+    assert parser.parse_stream(_chunks(feed, chunk_size)) == expected
+
+
+def test_rss2_fields(parser):
+    first, second, third = parser.parse_stream(_chunks(RSS2, 32))
+    assert first.title == "第一条 & 新闻"
+    assert first.url == "https://example.com/1"
+    assert first.guid == "id-1"
+    assert first.author == "张三"
+    assert first.summary == "摘要 一"
+    # 无 link 时使用 isPermaLink 的 guid
+    assert second.url == "https://example.com/2"
+    assert second.title == "第二条 新闻"
+    assert third.published_at is None
+
+
+def test_atom_prefers_alternate_link(parser):
+    first, _ = parser.parse_stream(_chunks(ATOM, 16))
+    assert first.url == "https://example.com/a/1"
+    assert first.author == "李四"
+
+
+@pytest.mark.parametrize("max_items", [1, 2, 5])
+def test_max_items_parity(parser, max_items):
+    feed = _rss_items(20, datetime(2026, 10, 19, 12, tzinfo=timezone.utc))
+    expected = parser.parse(feed, max_items=max_items)
+    assert len(expected) == max_items
+    assert parser.parse_stream(_chunks(feed, 50), max_items=max_items) == expected
+
+
+def test_cutoff_parity_and_early_stop(parser):
+    start = datetime(2026, 10, 19, 12, tzinfo=timezone.utc)
+    # 足够长的响应：iterparse 按 16KB 读取，提前停止才能体现为少读分块
+    feed = _rss_items(1000, start)
+    cutoff = start - timedelta(hours=4, minutes=30)
+
+    expected = parser.parse(feed, cutoff=cutoff)
+    assert [item.title for item in expected] == [f"条目{i}" for i in range(5)]
+
+    consumed = []
+
+    def tracked(chunks):
+        for chunk in chunks:
+            consumed.append(chunk)
+            yield chunk
+
+    chunks = _chunks(feed, 64)
+    assert parser.parse_stream(tracked(chunks), cutoff=cutoff) == expected
+    # 连续 STALE_STREAK_LIMIT 条过期后提前停止，不读取完整响应
+    assert len(consumed) < len(chunks) // 2
+
+
+def test_short_stale_run_does_not_stop_stream(parser):
+    # 不足 STALE_STREAK_LIMIT 条的过期条目之后仍有新条目（乱序 Feed）
+    start = datetime(2026, 10, 19, 12, tzinfo=timezone.utc)
+    old = _rss_items(STALE_STREAK_LIMIT - 1, start - timedelta(days=2))
+    fresh = _rss_items(1, start)
+    feed = old.replace("</channel>", fresh[fresh.index("<item>"):fresh.index("</channel>")] + "</channel>")
+    cutoff = start - timedelta(days=1)
+
+    expected = parser.parse(feed, cutoff=cutoff)
+    assert len(expected) == 1
+    assert parser.parse_stream(_chunks(feed, 7), cutoff=cutoff) == expected
+
+
+def test_non_utf8_falls_back_to_feedparser(parser):
+    feed = RSS2.replace('encoding="UTF-8"', 'encoding="GBK"')
+    data = feed.encode("gbk")
+    expected = parser.parse(feed)
+    streamed = parser.parse_stream([data[i:i + 100] for i in range(0, len(data), 100)])
+    assert [item.title for item in streamed] == [item.title for item in expected]
+
+
+def test_json_feed_through_stream(parser):
+    feed = (
+        '{"version": "https://jsonfeed.org/version/1.1", "title": "j", "items": ['
+        '{"id": "1", "title": "JSON 条目", "url": "https://example.com/j/1",'
+        ' "date_published": "2026-10-19T08:00:00+08:00"}]}'
+    )
+    expected = parser.parse(feed)
+    assert [item.title for item in expected] == ["JSON 条目"]
+    assert parser.parse_stream(_chunks(feed, 10)) == expected
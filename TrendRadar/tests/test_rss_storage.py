@@ -0,0 +1,140 @@
+# coding=utf-8
+"""RSS 条目批量 upsert 与逐条保存的一致性"""
+
+import sqlite3
+
+import pytest
+
+from trendradar.storage.base import RSSData, RSSItem
+from trendradar.storage.local import LocalStorageBackend
+
+
+DATE = "2026-10-19"
+
+# 不比较 id：ON CONFLICT 转为更新时 AUTOINCREMENT 也会消耗序号，两条路径的 id 不连续程度不同
+_ITEM_COLUMNS = (
+    "title, feed_id, url, published_at, summary, author, "
+    "first_crawl_time, last_crawl_time, crawl_count"
+)
+
+
+def _crawls():
+    """三次抓取：含同批次重复 URL、空 URL、跨源同 URL、失败源"""
+    def item(title, feed_id, url="", published_at="2026-10-19T08:00:00+08:00"):
+        return RSSItem(title=title, feed_id=feed_id, url=url, published_at=published_at,
+                       summary=f"{title} 摘要", author="作者")
+
+    names = {"a": "源A", "b": "源B"}
+    return [
+        RSSData(DATE, "08:00", {
+            "a": [
+                item("一", "a", "https://a/1"),
+                item("二", "a", "https://a/2"),
+                item("一（重复）", "a", "https://a/1"),
+                item("无链接一", "a"),
+                item("无链接二", "a"),
+            ],
+        }, names),
+        RSSData(DATE, "09:00", {
+            "a": [
+                item("一（改标题）", "a", "https://a/1", "2026-10-19T09:00:00+08:00"),
+                item("三", "a", "https://a/3"),
+            ],
+            "b": [
+                item("一", "b", "https://a/1"),
+                item("无链接", "b"),
+            ],
+        }, names, failed_ids=["c"]),
+        RSSData(DATE, "10:00", {
+            "b": [item("一", "b", "https://a/1"), item("四", "b", "https://b/4")],
+        }, names),
+    ]
+
+
+def _save_all(backend):
+    counts = []
+    for data in _crawls():
+        success, new_count, updated_count = backend._save_rss_data_impl(data)
+        assert success
+        counts.append((new_count, updated_count))
+    return counts
+
+
+def _snapshot(backend):
+    conn = backend._get_connection(DATE, db_type="rss")
+    items = conn.execute(f"SELECT {_ITEM_COLUMNS} FROM rss_items ORDER BY id").fetchall()
+    records = conn.execute(
+        "SELECT crawl_time, total_items FROM rss_crawl_records ORDER BY crawl_time"
+    ).fetchall()
+    status = conn.execute("""
+        SELECT r.crawl_time, s.feed_id, s.status
+        FROM rss_crawl_status s JOIN rss_crawl_records r ON s.crawl_record_id = r.id
+        ORDER BY r.crawl_time, s.feed_id
+    """).fetchall()
+    return [tuple(row) for row in items], [tuple(row) for row in records], [tuple(row) for row in status]
+
+
+@pytest.fixture
+def make_backend(tmp_path):
+    backends = []
+
+    def factory(name):
+        backend = LocalStorageBackend(data_dir=str(tmp_path / name), enable_txt=False, enable_html=False)
+        backends.append(backend)
+        return backend
+
+    yield factory
+    for backend in backends:
+        backend.cleanup()
+
+
+def test_batch_upsert_matches_rowwise(make_backend, monkeypatch):
+    batch = make_backend("batch")
+    batch_counts = _save_all(batch)
+
+    rowwise = make_backend("rowwise")
+
+    def fail_batch(*args, **kwargs):
+        raise sqlite3.OperationalError("forced")
+
+    monkeypatch.setattr(rowwise, "_upsert_rss_items_batch", fail_batch)
+    rowwise_counts = _save_all(rowwise)
+
+    assert batch_counts == rowwise_counts
+    assert _snapshot(batch) == _snapshot(rowwise)
+
+
+def test_batch_upsert_counts(make_backend):
+    backend = make_backend("batch")
+    # 第一次：a/1、a/2、首条空 URL 新增；同批次重复的 a/1 计为更新；第二条空 URL 跳过
+    # 第二次：a/3、b 的 a/1、b 的空 URL 新增；a/1 更新
+    # 第三次：b/4 新增；b 的 a/1 更新
+    assert _save_all(backend) == [(3, 1), (3, 1), (1, 1)]
+
+    items, records, status = _snapshot(backend)
+    by_key = {(row[1], row[2], row[0]): row for row in items}
+    first = by_key[("a", "https://a/1", "一（改标题）")]
+    assert first[6:] == ("08:00", "09:00", 3)
+    assert ("a", "", "无链接二") not in by_key
+    assert records == [("08:00", 4), ("09:00", 4), ("10:00", 2)]
+    assert ("09:00", "c", "failed") in status
+
+
+def test_failed_batch_leaves_no_partial_rows(make_backend):
+    backend = make_backend("batch")
+    conn = backend._get_connection(DATE, db_type="rss")
+    # 触发器让批量写入在第二条中途失败：保存点回滚后由逐条路径保存其余条目
+    conn.execute("""
+        CREATE TRIGGER reject_bad BEFORE INSERT ON rss_items
+        WHEN NEW.url = 'https://a/bad'
+        BEGIN SELECT RAISE(ABORT, 'rejected'); END
+    """)
+    crawl = _crawls()[0]
+    crawl.items["a"].insert(1, RSSItem(title="坏条目", feed_id="a", url="https://a/bad"))
+
+    success, new_count, updated_count = backend._save_rss_data_impl(crawl)
+    assert success
+    assert (new_count, updated_count) == (3, 1)
+
+    items, _, _ = _snapshot(backend)
+    assert [row[2] for row in items] == ["https://a/1", "https://a/2", ""]
@@ -0,0 +1,174 @@
+# coding=utf-8
+"""工具调度：准入上限、取消后释放名额，进程池异常退出后回退到线程池时仍经过准入检查"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from mcp_server.services.scheduler_service import ToolScheduler
+from mcp_server.utils.errors import ServerBusyError
+
+
+COST_CLASSES = {"light": (2, 4), "heavy": (1, 1), "io": (1, 2)}
+
+
+@pytest.fixture
+def crashing_pool(monkeypatch):
+    """工作进程启动即退出：提交到进程池的调用以 BrokenProcessPool 失败"""
+    def create(self, workers):
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=os._exit,
+            initargs=(1,),
+        )
+
+    monkeypatch.setattr(ToolScheduler, "_create_process_pool", create)
+
+
+def _scheduler(**kwargs):
+    return ToolScheduler(cost_classes=COST_CLASSES, **kwargs)
+
+
+async def _settle():
+    """让线程结束后投递的名额释放回调执行"""
+    for _ in range(5):
+        await asyncio.sleep(0.01)
+
+
+def test_saturated_class_rejects_with_server_busy():
+    scheduler = _scheduler()
+    release = threading.Event()
+
+    async def main():
+        # light 类 2 个线程、准入上限 4：2 个执行中，2 个等待并发名额
+        calls = [asyncio.ensure_future(scheduler.run("get_latest_news", release.wait)) for _ in range(4)]
+        await _settle()
+        assert scheduler.get_stats()["light"]["pending"] == 4
+
+        for _ in range(2):
+            with pytest.raises(ServerBusyError) as exc_info:
+                await scheduler.run("get_latest_news", lambda: "never")
+            assert exc_info.value.code == "SERVER_BUSY"
+
+        # 其他类别不受影响
+        assert await scheduler.run("search_news", lambda: "heavy") == "heavy"
+
+        release.set()
+        assert await asyncio.gather(*calls) == [True] * 4
+        await _settle()
+
+    asyncio.run(main())
+    stats = scheduler.get_stats()
+    assert stats["light"] == {"workers": 2, "max_pending": 4, "pending": 0, "rejected": 2, "completed": 4}
+    assert stats["heavy"]["rejected"] == 0 and stats["heavy"]["pending"] == 0
+    scheduler.shutdown()
+
+
+def test_cancel_while_waiting_for_tool_limit_releases_pending():
+    scheduler = ToolScheduler(cost_classes={"light": (2, 4), "heavy": (2, 4)})
+    release = threading.Event()
+    ran = []
+
+    async def main():
+        # aggregate_news 单工具上限为 1：第二个调用在等待并发名额时被取消
+        running = asyncio.ensure_future(scheduler.run("aggregate_news", release.wait))
+        waiting = asyncio.ensure_future(scheduler.run("aggregate_news", lambda: ran.append(1)))
+        await _settle()
+        assert scheduler.get_stats()["heavy"]["pending"] == 2
+
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert scheduler.get_stats()["heavy"]["pending"] == 1
+
+        release.set()
+        await running
+        await _settle()
+
+    asyncio.run(main())
+    assert ran == []
+    stats = scheduler.get_stats()["heavy"]
+    assert (stats["pending"], stats["completed"], stats["rejected"]) == (0, 1, 0)
+    scheduler.shutdown()
+
+
+def test_cancel_while_queued_in_executor_releases_pending():
+    scheduler = _scheduler()
+    release = threading.Event()
+    ran = []
+
+    async def main():
+        # io 类只有 1 个线程：第二个工具拿到并发名额后在线程池中排队，随后被取消
+        running = asyncio.ensure_future(scheduler.run("read_article", release.wait))
+        await _settle()
+        queued = asyncio.ensure_future(scheduler.run("check_version", lambda: ran.append(1)))
+        await _settle()
+        assert scheduler.get_stats()["io"]["pending"] == 2
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        await _settle()
+        assert scheduler.get_stats()["io"]["pending"] == 1
+
+        release.set()
+        await running
+        await _settle()
+
+        # 名额已全部归还：可以再次占满准入上限
+        assert await asyncio.gather(
+            scheduler.run("read_article", lambda: "a"), scheduler.run("check_version", lambda: "b")
+        ) == ["a", "b"]
+        await _settle()
+
+    asyncio.run(main())
+    assert ran == []
+    stats = scheduler.get_stats()["io"]
+    assert (stats["pending"], stats["rejected"]) == (0, 0)
+    scheduler.shutdown()
+
+
+def test_broken_process_pool_falls_back_to_thread_class(crashing_pool):
+    scheduler = _scheduler(process_workers=1)
+
+    async def main():
+        try:
+            return await scheduler.run("aggregate_news", lambda value: f"thread:{value}", "ok")
+        finally:
+            await _settle()
+
+    assert asyncio.run(main()) == "thread:ok"
+    stats = scheduler.get_stats()
+    assert stats["process"]["pending"] == 0 and stats["process"]["completed"] == 1
+    assert stats["heavy"]["pending"] == 0 and stats["heavy"]["completed"] == 1
+    assert stats["heavy"]["rejected"] == 0
+    scheduler.shutdown()
+
+
+def test_fallback_respects_thread_class_admission(crashing_pool):
+    scheduler = _scheduler(process_workers=1)
+    release = threading.Event()
+
+    async def main():
+        # heavy 类准入上限为 1：先占满，再让进程池调用回退
+        blocking = asyncio.ensure_future(scheduler.run("search_news", release.wait))
+        await asyncio.sleep(0.05)
+        try:
+            with pytest.raises(ServerBusyError):
+                await scheduler.run("aggregate_news", lambda: "thread")
+        finally:
+            release.set()
+        await blocking
+        await _settle()
+
+    asyncio.run(main())
+    stats = scheduler.get_stats()
+    assert stats["heavy"]["rejected"] == 1
+    assert stats["heavy"]["completed"] == 1
+    assert stats["heavy"]["pending"] == 0 and stats["process"]["pending"] == 0
+    scheduler.shutdown()
@@ -0,0 +1,98 @@
+# coding=utf-8
+"""分词器与关键词提取"""
+
+import pytest
+
+from trendradar.core import keywords, tokenizer
+from trendradar.core.keywords import extract_keyword_pairs, extract_keywords
+from trendradar.core.tokenizer import ChineseTokenizer, load_user_words
+
+
+@pytest.fixture
+def default_tokenizer(monkeypatch):
+    """全局分词器只使用内置词典 + 指定用户词（不读取 config/frequency_words.txt）"""
+    instance = ChineseTokenizer(user_words={"斩杀线"})
+    monkeypatch.setattr(tokenizer, "_default_tokenizer", instance)
+    return instance
+
+
+def test_forward_maximum_matching_prefers_longest_word():
+    tok = ChineseTokenizer(user_words={"斩杀线"})
+    assert tok.tokenize("美国斩杀线引发热议") == ["美国", "斩杀线", "引发", "热议"]
+    # "人工智能" 优先于其中的 "智能"
+    assert tok.tokenize("人工智能发展") == ["人工智能", "发展"]
+
+
+def test_function_chars_split_unknown_spans():
+    tok = ChineseTokenizer()
+    # "的" 切开未登录片段，本身不输出
+    assert tok.tokenize("蓝莓的果汁") == ["蓝莓", "果汁"]
+
+
+def test_short_unknown_span_kept_whole():
+    tok = ChineseTokenizer()
+    assert tok.segment("骄阳似我") == (("骄阳似我",),)
+
+
+def test_long_unknown_span_emits_fragment_group():
+    tok = ChineseTokenizer()
+    span = "甲乙丙丁戊己"
+    assert tok.segment(span) == (("甲乙", "乙丙", "丙丁", "丁戊", "戊己"),)
+    # tokenize 保留碎片用于检索匹配，tokenize_words 不返回碎片
+    assert tok.tokenize(span) == ["甲乙", "乙丙", "丙丁", "丁戊", "戊己"]
+    assert tok.tokenize_words(span) == []
+
+
+def test_non_cjk_runs_are_single_tokens():
+    tok = ChineseTokenizer()
+    assert tok.tokenize("OpenAI发布GPT5模型") == ["OpenAI", "发布", "GPT5", "模型"]
+
+
+def test_fingerprint_tracks_dictionary():
+    assert ChineseTokenizer().fingerprint == ChineseTokenizer().fingerprint
+    assert ChineseTokenizer().fingerprint != ChineseTokenizer(user_words={"斩杀线"}).fingerprint
+
+
+def test_extract_keywords_never_returns_fragments(default_tokenizer):
+    # 未登录长片段只产生碎片，不作为关键词
+    assert extract_keywords("甲乙丙丁戊己宣布合作") == ["宣布", "合作"]
+    # 登录的人名整体返回，不拆成 "特朗" / "朗普"
+    result = extract_keywords("特朗普签署行政令")
+    assert "特朗普" in result
+    assert "特朗" not in result and "朗普" not in result
+
+
+def test_extract_keywords_dedup_and_stopwords(default_tokenizer):
+    # 同一标题中的重复词只计一次，停用词（"回应"）被过滤
+    assert extract_keywords("中国回应中国") == ["中国"]
+    assert extract_keywords("外交部回应美国关税") == ["外交部", "美国", "关税"]
+
+
+def test_extract_keyword_pairs(default_tokenizer):
+    assert extract_keyword_pairs("美国斩杀线引发热议") == [("斩杀线", "美国")]
+    assert extract_keyword_pairs("甲乙丙丁戊己") == []
+
+
+def test_extractor_signature_changes_with_dictionary(monkeypatch, default_tokenizer):
+    before = keywords.get_extractor_signature()
+    monkeypatch.setattr(tokenizer, "_default_tokenizer", ChineseTokenizer())
+    assert keywords.get_extractor_signature() != before
+
+
+def test_load_user_words(tmp_path):
+    path = tmp_path / "frequency_words.txt"
+    path.write_text(
+        "# 注释\n"
+        "[GLOBAL_FILTER]\n"
+        "!震惊\n"
+        "[WORD_GROUPS]\n"
+        "[科技巨头]\n"
+        "+华为\n"
+        "/小米|雷军\\b/\n"
+        "斩杀线 => 斩杀\n"
+        "/a.*b/\n"
+        "Tesla\n",
+        encoding="utf-8",
+    )
+    assert load_user_words(str(path)) == {"震惊", "科技巨头", "华为", "小米", "雷军", "斩杀线", "斩杀"}
+    assert load_user_words(str(tmp_path / "missing.txt")) == set()
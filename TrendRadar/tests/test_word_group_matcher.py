@@ -0,0 +1,175 @@
+# coding=utf-8
+"""词组匹配器：与逐词 _word_matches 判定一致，配置变化时使用新的匹配器"""
+
+import random
+
+import pytest
+
+from trendradar.core import frequency
+from trendradar.core.frequency import (
+    _word_matches,
+    get_word_group_matcher,
+    load_frequency_words,
+    matches_word_groups,
+)
+
+
+CONFIG = """[GLOBAL_FILTER]
+广告
+推广
+
+[WORD_GROUPS]
+[科技巨头]
+华为
+/苹果|iphone/
+!二手
+@5
+
++中国
+经济
+/gdp/
+
++美国
++/关税|贸易/
+
+/^【突发】/ => 突发
+!/演习$/
+
+特斯拉
+!股价
+"""
+
+WORDS = [
+    "华为", "苹果", "iPhone", "IPHONE", "二手", "中国", "经济", "GDP", "美国", "关税",
+    "贸易", "【突发】", "演习", "特斯拉", "股价", "广告", "推广", "发布", "新款",
+]
+
+
+def _legacy_first_group(title, word_groups, filter_words, global_filters):
+    """改动前 matches_word_groups + count_word_frequency 逐词查找词组的判定"""
+    if not isinstance(title, str):
+        title = str(title) if title is not None else ""
+    if not title.strip():
+        return -1
+    title_lower = title.lower()
+    if global_filters and any(word.lower() in title_lower for word in global_filters):
+        return -1
+    if not word_groups:
+        return -1
+    if any(_word_matches(item, title_lower) for item in filter_words):
+        return -1
+    for index, group in enumerate(word_groups):
+        if group["required"] and not all(_word_matches(w, title_lower) for w in group["required"]):
+            continue
+        if group["normal"] and not any(_word_matches(w, title_lower) for w in group["normal"]):
+            continue
+        return index
+    return -1
+
+
+def _legacy_matches(title, word_groups, filter_words, global_filters):
+    if not word_groups:
+        if not isinstance(title, str):
+            title = str(title) if title is not None else ""
+        if not title.strip():
+            return False
+        return not (global_filters and any(w.lower() in title.lower() for w in global_filters))
+    return _legacy_first_group(title, word_groups, filter_words, global_filters) >= 0
+
+
+def _titles(seed=0, size=2000):
+    rng = random.Random(seed)
+    titles = ["", "   ", None, 12345, "【突发】某地发生地震", "海上军事演习", "【突发】海上军事演习"]
+    for _ in range(size):
+        titles.append("".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4))))
+    return titles
+
+
+@pytest.fixture(autouse=True)
+def clean_matcher_cache(monkeypatch):
+    monkeypatch.setattr(frequency, "_matcher_cache", {})
+    monkeypatch.setattr(frequency, "_last_matcher", None)
+
+
+@pytest.fixture
+def config(tmp_path):
+    path = tmp_path / "frequency_words.txt"
+    path.write_text(CONFIG, encoding="utf-8")
+    return path
+
+
+def test_parsed_config_covers_all_word_kinds(config):
+    word_groups, filter_words, global_filters = load_frequency_words(str(config))
+    assert global_filters == ["广告", "推广"]
+    assert [group["display_name"] for group in word_groups][0] == "科技巨头"
+    assert any(w["is_regex"] for w in filter_words) and any(not w["is_regex"] for w in filter_words)
+    assert any(w["is_regex"] for g in word_groups for w in g["required"])
+    assert any(not w["is_regex"] for g in word_groups for w in g["required"])
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_first_group_matches_legacy(config, seed):
+    word_groups, filter_words, global_filters = load_frequency_words(str(config))
+    matcher = get_word_group_matcher(word_groups, filter_words, global_filters)
+    for title in _titles(seed):
+        expected = _legacy_first_group(title, word_groups, filter_words, global_filters)
+        assert matcher.first_group(title) == expected, title
+        assert matches_word_groups(title, word_groups, filter_words, global_filters) == (expected >= 0)
+
+
+def test_string_filter_words_and_no_global_filters(config):
+    word_groups, _, _ = load_frequency_words(str(config))
+    filter_words = ["二手", "股价"]  # 旧格式：纯字符串
+    matcher = get_word_group_matcher(word_groups, filter_words, None)
+    for title in _titles(7, 500):
+        assert matcher.first_group(title) == _legacy_first_group(title, word_groups, filter_words, None)
+
+
+def test_all_news_group_and_empty_config():
+    all_news = [{"required": [], "normal": [], "group_key": "全部新闻"}]
+    global_filters = ["广告"]
+    matcher = get_word_group_matcher(all_news, [], global_filters)
+    for title in _titles(1, 300):
+        assert matcher.first_group(title) == _legacy_first_group(title, all_news, [], global_filters)
+    assert matcher.first_group("华为发布新款") == 0
+    assert matcher.first_group("华为广告") == -1
+
+    # 未配置词组：只做全局过滤
+    for title in _titles(2, 300):
+        assert matches_word_groups(title, [], [], global_filters) == _legacy_matches(title, [], [], global_filters)
+
+
+def test_same_config_reuses_matcher(config):
+    first = get_word_group_matcher(*load_frequency_words(str(config)))
+    # 重新加载的同一份配置（新对象）按内容签名复用同一个匹配器及其缓存
+    assert get_word_group_matcher(*load_frequency_words(str(config))) is first
+
+
+def test_changed_config_invalidates_matcher(config):
+    word_groups, filter_words, global_filters = load_frequency_words(str(config))
+    matcher = get_word_group_matcher(word_groups, filter_words, global_filters)
+    assert matcher.first_group("特斯拉股价下跌") == -1
+    assert matcher.first_group("小米发布新款") == -1
+
+    config.write_text(CONFIG.replace("!股价\n", "") + "\n小米\n", encoding="utf-8")
+    new_groups, new_filters, new_globals = load_frequency_words(str(config))
+    updated = get_word_group_matcher(new_groups, new_filters, new_globals)
+    assert updated is not matcher
+    assert updated.first_group("特斯拉股价下跌") == 4
+    assert updated.first_group("小米发布新款") == 5
+
+    # 切回原配置时仍使用原来的匹配器
+    assert get_word_group_matcher(word_groups, filter_words, global_filters) is matcher
+
+
+def test_regex_and_plain_word_with_same_text_differ():
+    plain = [{"required": [], "normal": [frequency._parse_word("a.c")], "group_key": "a.c"}]
+    regex = [{"required": [], "normal": [frequency._parse_word("/a.c/")], "group_key": "a.c"}]
+    assert get_word_group_matcher(plain, [], None).first_group("abc") == -1
+    assert get_word_group_matcher(regex, [], None).first_group("abc") == 0
+
+
+def test_global_filter_change_invalidates_matcher(config):
+    word_groups, filter_words, _ = load_frequency_words(str(config))
+    assert get_word_group_matcher(word_groups, filter_words, ["广告"]).first_group("华为推广") == 0
+    assert get_word_group_matcher(word_groups, filter_words, ["推广"]).first_group("华为推广") == -1
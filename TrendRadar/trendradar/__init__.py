@@ -7,7 +7,13 @@ TrendRadar - 热点新闻聚合与分析工具
   trendradar                  # 安装后执行
 """
 
-from trendradar.context import AppContext
-
 __version__ = "5.5.3"
 __all__ = ["AppContext", "__version__"]
+
+
+def __getattr__(name):
+    """AppContext 按需导入（依赖通知、报告等模块，MCP 服务只用到 core 时不加载）"""
+    if name == "AppContext":
+        from trendradar.context import AppContext
+        return AppContext
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
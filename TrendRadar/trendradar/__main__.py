@@ -484,7 +484,14 @@ class NewsAnalyzer:
         try:
             ai_config = self.ctx.config.get("AI", {})
             debug_mode = self.ctx.config.get("DEBUG", False)
-            analyzer = AIAnalyzer(ai_config, analysis_config, self.ctx.get_time, debug=debug_mode)
+            analyzer = AIAnalyzer(
+                ai_config,
+                analysis_config,
+                self.ctx.get_time,
+                debug=debug_mode,
+                weight_config=self.ctx.weight_config,
+                cache_storage=self.ctx.get_storage_manager(),
+            )
 
             # 确定 AI 分析使用的模式
             ai_mode_config = analysis_config.get("MODE", "follow_report")
@@ -1108,6 +1115,7 @@ class NewsAnalyzer:
             freshness_config = rss_config.get("FRESHNESS_FILTER", {})
             freshness_enabled = freshness_config.get("ENABLED", True)
             default_max_age_days = freshness_config.get("MAX_AGE_DAYS", 3)
+            skip_stale_on_fetch = freshness_config.get("SKIP_ON_FETCH", False)
 
             fetcher = RSSFetcher(
                 feeds=feeds,
@@ -1118,6 +1126,7 @@ class NewsAnalyzer:
                 timezone=timezone,
                 freshness_enabled=freshness_enabled,
                 default_max_age_days=default_max_age_days,
+                skip_stale_on_fetch=skip_stale_on_fetch,
             )
 
             # 抓取数据
@@ -1664,11 +1673,17 @@ def main():
   --reset-ai-state       重置今日 AI 分析状态
   --force-push           忽略 once_per_day 限制，强制推送
 
+诊断命令:
+  --forecast-backtest [N] 在最近 N 天（默认 7）的热度状态上回测热点预测模型
+  --startup-benchmark [N] 测量 CLI 和 MCP 服务的启动导入耗时（运行 N 次，默认 3），超出预算时返回非零退出码
+
 示例:
   python -m trendradar                    # 正常运行
   python -m trendradar --show-push-status # 查看推送状态
   python -m trendradar --reset-push-state # 重置推送状态后再运行
   python -m trendradar --force-push       # 强制推送（忽略今日已推送限制）
+  python -m trendradar --forecast-backtest 3  # 回测最近 3 天的预测效果
+  python -m trendradar --startup-benchmark    # 检查启动耗时是否超出预算
 """
     )
     parser.add_argument(
@@ -1701,9 +1716,30 @@ def main():
         action="store_true",
         help="忽略 once_per_day 限制，强制 AI 分析"
     )
+    parser.add_argument(
+        "--forecast-backtest",
+        type=int,
+        nargs="?",
+        const=7,
+        metavar="DAYS",
+        help="在最近 DAYS 天的热度状态上回测热点预测模型（默认 7 天）"
+    )
+    parser.add_argument(
+        "--startup-benchmark",
+        type=int,
+        nargs="?",
+        const=3,
+        metavar="RUNS",
+        help="测量启动导入耗时（每个入口运行 RUNS 次，默认 3 次）"
+    )
 
     args = parser.parse_args()
 
+    # 启动耗时基准不依赖配置文件
+    if args.startup_benchmark is not None:
+        _handle_startup_benchmark(args.startup_benchmark)
+        return
+
     debug_mode = False
     try:
         # 先加载配置
@@ -1714,6 +1750,10 @@ def main():
             _handle_status_commands(config, args)
             return
 
+        if args.forecast_backtest is not None:
+            _handle_forecast_backtest(config, args.forecast_backtest)
+            return
+
         # 设置强制推送标志
         if args.force_push:
             config["_FORCE_PUSH"] = True
@@ -1822,5 +1862,82 @@ def _handle_status_commands(config: Dict, args) -> None:
     ctx.cleanup()
 
 
+def _handle_forecast_backtest(config: Dict, days: int) -> None:
+    """在已存储的关键词热度状态上回测热点预测模型（误差与耗时）"""
+    from datetime import timedelta
+
+    from trendradar.core.forecast import BACKTEST_HORIZONS, backtest, series_from_log
+
+    ctx = AppContext(config)
+    storage = ctx.get_storage_manager()
+    today = ctx.get_time()
+
+    # 按时间顺序拼接每天的在榜条数序列（当天未出现的关键词补 0）
+    series: Dict[str, List[int]] = {}
+    slot_total = 0
+    used_dates = []
+    for days_ago in range(max(days, 1) - 1, -1, -1):
+        date_str = (today - timedelta(days=days_ago)).strftime("%Y-%m-%d")
+        trend_log = storage.get_keyword_trend_log(date_str)
+        if not trend_log or not trend_log["slot_count"]:
+            continue
+        day_series = series_from_log(trend_log["slot_count"], trend_log["rows"], series.keys())
+        for keyword, values in day_series.items():
+            series.setdefault(keyword, [0] * slot_total).extend(values)
+        slot_total += trend_log["slot_count"]
+        used_dates.append(date_str)
+
+    print("=" * 60)
+    print(f"TrendRadar v{__version__} 热点预测回测")
+    print("=" * 60)
+    if not series:
+        print("\n未找到可用的关键词热度状态（需要新版本抓取后生成）")
+        ctx.cleanup()
+        return
+
+    report = backtest(series, BACKTEST_HORIZONS)
+    print(f"\n数据范围: {used_dates[0]} ~ {used_dates[-1]}（{len(used_dates)} 天）")
+    print(f"关键词数: {report['keywords']}，抓取时间点数: {report['slots']}")
+    print(f"单次更新: {report['update_us_per_keyword']} 微秒/关键词")
+    print(f"批量预测: {report['forecast_ms']} 毫秒/次（全部关键词）")
+    labels = {"holt": "Holt", "naive": "沿用当前值", "ewma": "滑动平均"}
+    for horizon, metrics in report["horizons"].items():
+        print(f"\n预测 {horizon} 个时间点后（样本 {metrics['samples']}，在榜条数 MAE / RMSE）:")
+        for model, label in labels.items():
+            print(f"  {label}: {metrics[model]['mae']} / {metrics[model]['rmse']}")
+        rising = metrics["rising"]
+        print(f"  上升判定: {rising['predicted']} 次，命中率 {rising['precision']}（基准 {rising['base_rate']}）")
+    print("=" * 60)
+
+    ctx.cleanup()
+
+
+def _handle_startup_benchmark(runs: int) -> None:
+    """测量入口模块的启动导入耗时，超出预算或提前加载可选子系统时以退出码 1 结束"""
+    from trendradar.utils.startup import run_startup_benchmark
+
+    print("=" * 60)
+    print(f"TrendRadar v{__version__} 启动耗时基准（python -X importtime）")
+    print("=" * 60)
+
+    report = run_startup_benchmark(max(runs, 1))
+    for module, result in report["targets"].items():
+        status = "通过" if result["passed"] else "未通过"
+        print(f"\n{module}: {status}")
+        if not result["ok"]:
+            print(f"  导入失败: {result['error']}")
+            continue
+        print(f"  导入耗时: {result['total_ms']} ms（预算 {result['budget_ms']} ms，"
+              f"各次 {result['runs_ms']}）")
+        if result["eager"]:
+            print(f"  提前加载: {', '.join(result['eager'])}（应在首次使用时导入）")
+        for name, ms in result["top"]:
+            print(f"  - {name}: {ms} ms")
+    print("=" * 60)
+
+    if not report["passed"]:
+        raise SystemExit(1)
+
+
 if __name__ == "__main__":
     main()
@@ -7,11 +7,29 @@ AI 分析器模块
 """
 
 import json
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, fields
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
+from trendradar.ai.cache import (
+    MAX_DELTA_DEPTH,
+    MAX_DELTA_RATIO,
+    MAX_DROPPED_TITLES,
+    AnalysisCache,
+    diff_context_items,
+    format_previous_summary,
+    make_fingerprint,
+)
 from trendradar.ai.client import AIClient
+from trendradar.ai.packer import (
+    ContextLine,
+    PackedContext,
+    cluster_titles,
+    estimate_tokens,
+    normalize_title,
+    pack_sections,
+)
+from trendradar.core.analyzer import make_news_weight_func
 
 
 @dataclass
@@ -37,6 +55,12 @@ class AIAnalysisResult:
     rss_count: int = 0                   # RSS 新闻数
     ai_mode: str = ""                    # AI 分析使用的模式 (daily/current/incremental)
 
+    # 上下文装填统计
+    context_tokens: int = 0              # 实际发送的新闻内容估算 token 数
+    context_total_tokens: int = 0        # 不去重、不截断时的估算 token 数
+    merged_news: int = 0                 # 因跨平台重复被合并的新闻数
+    cache_status: str = ""               # 结果来源：""=完整分析, "hit"=缓存命中, "delta"=增量分析
+
 
 class AIAnalyzer:
     """AI 分析器"""
@@ -47,6 +71,8 @@ class AIAnalyzer:
         analysis_config: Dict[str, Any],
         get_time_func: Callable,
         debug: bool = False,
+        weight_config: Optional[Dict] = None,
+        cache_storage: Optional[Any] = None,
     ):
         """
         初始化 AI 分析器
@@ -56,6 +82,8 @@ class AIAnalyzer:
             analysis_config: AI 分析功能配置（language, prompt_file 等）
             get_time_func: 获取当前时间的函数
             debug: 是否开启调试模式
+            weight_config: 新闻权重配置（决定 token 预算内的装填优先级）
+            cache_storage: 分析结果缓存使用的存储管理器（None 表示不缓存）
         """
         self.ai_config = ai_config
         self.analysis_config = analysis_config
@@ -72,9 +100,22 @@ class AIAnalyzer:
 
         # 从分析配置获取功能参数
         self.max_news = analysis_config.get("MAX_NEWS_FOR_ANALYSIS", 50)
+        self.max_context_tokens = max(int(analysis_config.get("MAX_CONTEXT_TOKENS", 0) or 0), 0)
         self.include_rss = analysis_config.get("INCLUDE_RSS", True)
         self.include_rank_timeline = analysis_config.get("INCLUDE_RANK_TIMELINE", False)
         self.language = analysis_config.get("LANGUAGE", "Chinese")
+        self.weight_config = weight_config or {
+            "RANK_WEIGHT": 0.6,
+            "FREQUENCY_WEIGHT": 0.3,
+            "HOTNESS_WEIGHT": 0.1,
+        }
+        self._weight_funcs: Dict[int, Callable[[Dict], float]] = {}
+
+        # 分析结果缓存
+        cache_config = analysis_config.get("CACHE", {})
+        self.cache: Optional[AnalysisCache] = None
+        if cache_storage is not None and cache_config.get("ENABLED", False):
+            self.cache = AnalysisCache(cache_storage, cache_config.get("DELTA_ANALYSIS", False))
 
         # 加载提示词模板
         self.system_prompt, self.user_prompt_template = self._load_prompt_template(
@@ -160,9 +201,19 @@ class AIAnalyzer:
             )
 
         # 准备新闻内容并获取统计数据
-        news_content, rss_content, hotlist_total, rss_total, analyzed_count = self._prepare_news_content(stats, rss_stats)
+        (
+            news_content, rss_content, hotlist_total, rss_total, analyzed_count, context_info
+        ) = self._prepare_news_content(stats, rss_stats)
         total_news = hotlist_total + rss_total
 
+        if context_info["total_tokens"]:
+            ratio = context_info["tokens"] / context_info["total_tokens"] * 100
+            print(
+                f"[AI] 上下文: {context_info['lines']} 行覆盖 {analyzed_count}/{total_news} 条新闻"
+                f"（合并重复 {context_info['merged']} 条），"
+                f"约 {context_info['tokens']}/{context_info['total_tokens']} tokens ({ratio:.0f}%)"
+            )
+
         if not news_content and not rss_content:
             return AIAnalysisResult(
                 success=False,
@@ -174,25 +225,84 @@ class AIAnalyzer:
                 max_news_limit=self.max_news
             )
 
-        # 构建提示词
-        current_time = self.get_time_func().strftime("%Y-%m-%d %H:%M:%S")
-
         # 提取关键词
         if not keywords:
             keywords = [s.get("word", "") for s in stats if s.get("word")] if stats else []
 
-        # 使用安全的字符串替换，避免模板中其他花括号（如 JSON 示例）被误解析
-        user_prompt = self.user_prompt_template
-        user_prompt = user_prompt.replace("{report_mode}", report_mode)
-        user_prompt = user_prompt.replace("{report_type}", report_type)
-        user_prompt = user_prompt.replace("{current_time}", current_time)
-        user_prompt = user_prompt.replace("{news_count}", str(hotlist_total))
-        user_prompt = user_prompt.replace("{rss_count}", str(rss_total))
-        user_prompt = user_prompt.replace("{platforms}", ", ".join(platforms) if platforms else "多平台")
-        user_prompt = user_prompt.replace("{keywords}", ", ".join(keywords[:20]) if keywords else "无")
-        user_prompt = user_prompt.replace("{news_content}", news_content)
-        user_prompt = user_prompt.replace("{rss_content}", rss_content)
-        user_prompt = user_prompt.replace("{language}", self.language)
+        def build_prompt(current_time: str, news_text: str, rss_text: str) -> str:
+            # 使用安全的字符串替换，避免模板中其他花括号（如 JSON 示例）被误解析
+            user_prompt = self.user_prompt_template
+            user_prompt = user_prompt.replace("{report_mode}", report_mode)
+            user_prompt = user_prompt.replace("{report_type}", report_type)
+            user_prompt = user_prompt.replace("{current_time}", current_time)
+            user_prompt = user_prompt.replace("{news_count}", str(hotlist_total))
+            user_prompt = user_prompt.replace("{rss_count}", str(rss_total))
+            user_prompt = user_prompt.replace("{platforms}", ", ".join(platforms) if platforms else "多平台")
+            user_prompt = user_prompt.replace("{keywords}", ", ".join(keywords[:20]) if keywords else "无")
+            user_prompt = user_prompt.replace("{news_content}", news_text)
+            user_prompt = user_prompt.replace("{rss_content}", rss_text)
+            user_prompt = user_prompt.replace("{language}", self.language)
+            return user_prompt
+
+        def fill_stats(result: AIAnalysisResult, sent_tokens: int) -> AIAnalysisResult:
+            result.total_news = total_news
+            result.hotlist_count = hotlist_total
+            result.rss_count = rss_total
+            result.analyzed_news = analyzed_count
+            result.max_news_limit = self.max_news
+            result.context_tokens = sent_tokens
+            result.context_total_tokens = context_info["total_tokens"]
+            result.merged_news = context_info["merged"]
+            return result
+
+        # 构建提示词
+        current_time = self.get_time_func().strftime("%Y-%m-%d %H:%M:%S")
+        user_prompt = build_prompt(current_time, news_content, rss_content)
+        prompt_tokens = estimate_tokens(self.system_prompt) + estimate_tokens(user_prompt)
+        sent_tokens = context_info["tokens"]
+
+        # 结果缓存：指纹不含当前时间，输入相同即复用
+        fingerprint = base_key = ""
+        delta_depth = 0
+        delta_saved = 0
+        if self.cache is not None:
+            model = self.ai_config.get("MODEL", "")
+            fingerprint = make_fingerprint(
+                model, self.system_prompt, build_prompt("", news_content, rss_content)
+            )
+            base_key = make_fingerprint(
+                model, self.system_prompt, self.user_prompt_template, report_mode, self.language
+            )
+
+            entry = self.cache.get(fingerprint)
+            if entry:
+                saved = prompt_tokens + estimate_tokens(entry["result"].get("raw_response", ""))
+                self.cache.record_hit(fingerprint, saved)
+                print(f"[AI] 命中分析缓存（{entry['created_at']}），跳过 AI 调用，节省约 {saved} tokens")
+                result = fill_stats(self._result_from_dict(entry["result"]), 0)
+                result.cache_status = "hit"
+                return result
+
+            # 增量重分析：只发送新增 / 变化的新闻与上次结论
+            if self.cache.delta_enabled:
+                delta = self._prepare_delta(base_key, context_info)
+                if delta is not None:
+                    previous, delta_news, delta_rss = delta
+                    if not delta_news and not delta_rss:
+                        saved = prompt_tokens + estimate_tokens(previous["result"].get("raw_response", ""))
+                        self.cache.record_hit(previous["fingerprint"], saved)
+                        print(f"[AI] 新闻无新增或变化，复用 {previous['created_at']} 的分析结果，节省约 {saved} tokens")
+                        result = fill_stats(self._result_from_dict(previous["result"]), 0)
+                        result.cache_status = "hit"
+                        return result
+
+                    user_prompt = build_prompt(current_time, delta_news, delta_rss)
+                    delta_tokens = estimate_tokens(self.system_prompt) + estimate_tokens(user_prompt)
+                    delta_saved = max(prompt_tokens - delta_tokens, 0)
+                    delta_depth = previous["delta_depth"] + 1
+                    sent_tokens = estimate_tokens(delta_news) + estimate_tokens(delta_rss)
+                    prompt_tokens = delta_tokens
+                    print(f"[AI] 增量分析：基于 {previous['created_at']} 的结论，节省约 {delta_saved} tokens")
 
         if self.debug:
             print("\n" + "=" * 80)
@@ -215,11 +325,22 @@ class AIAnalyzer:
                 result.rss_insights = ""
 
             # 填充统计数据
-            result.total_news = total_news
-            result.hotlist_count = hotlist_total
-            result.rss_count = rss_total
-            result.analyzed_news = analyzed_count
-            result.max_news_limit = self.max_news
+            fill_stats(result, sent_tokens)
+            if delta_depth:
+                result.cache_status = "delta"
+
+            # 仅缓存完整解析成功的结果
+            if self.cache is not None and result.success and not result.error:
+                self.cache.save(
+                    fingerprint,
+                    base_key,
+                    report_mode,
+                    asdict(result),
+                    context_info["items"],
+                    prompt_tokens,
+                    delta_depth,
+                    delta_saved,
+                )
             return result
         except Exception as e:
             error_type = type(e).__name__
@@ -235,124 +356,279 @@ class AIAnalyzer:
                 error=friendly_msg
             )
 
+    def _prepare_delta(self, base_key: str, context_info: Dict) -> Optional[tuple]:
+        """
+        准备增量分析内容
+
+        Returns:
+            (上次缓存记录, 增量热榜内容, 增量 RSS 内容)；不适合增量分析时返回 None
+        """
+        previous = self.cache.latest(base_key)
+        if not previous or not previous["context"]:
+            return None
+        if previous["delta_depth"] >= MAX_DELTA_DEPTH:
+            print(f"[AI] 已连续增量分析 {previous['delta_depth']} 次，本次全量分析")
+            return None
+
+        items = context_info["items"]
+        changed, dropped = diff_context_items(previous["context"], items)
+        if not changed and not dropped:
+            return previous, "", ""
+        packed_count = context_info["lines"]
+        if len(changed) > packed_count * MAX_DELTA_RATIO:
+            print(f"[AI] 新增/变化新闻 {len(changed)}/{packed_count} 条，变化较大，本次全量分析")
+            return None
+
+        summary = format_previous_summary(previous["result"])
+        if not summary:
+            return None
+
+        unchanged = packed_count - len(changed)
+        previous_time = previous["created_at"][11:16] or previous["created_at"]
+        parts = [
+            f"【上次分析结论（{previous_time}）】",
+            summary,
+            "",
+            f"【{previous_time} 之后新增或排名变化的新闻】"
+            f"（{len(changed)} 条；其余 {unchanged} 条已分析新闻无明显变化，结论见上。"
+            "请结合上次结论与以下变化，给出完整的最新分析）",
+        ]
+        delta_news = context_info["news"].render(changed)
+        if delta_news:
+            parts.append(delta_news)
+        if dropped:
+            shown = "；".join(dropped[:MAX_DROPPED_TITLES])
+            more = f" 等 {len(dropped)} 条" if len(dropped) > MAX_DROPPED_TITLES else ""
+            parts.append(f"\n【已下榜】{shown}{more}")
+
+        delta_rss = context_info["rss"].render(changed)
+        return previous, "\n".join(parts), delta_rss
+
+    @staticmethod
+    def _result_from_dict(data: Dict) -> AIAnalysisResult:
+        """从缓存数据还原分析结果"""
+        names = {f.name for f in fields(AIAnalysisResult)}
+        return AIAnalysisResult(**{k: v for k, v in data.items() if k in names})
+
     def _prepare_news_content(
         self,
         stats: List[Dict],
         rss_stats: Optional[List[Dict]] = None,
     ) -> tuple:
         """
-        准备新闻内容文本（增强版）
+        准备新闻内容文本（去重 + token 预算装填）
 
         热榜新闻包含：来源、标题、排名范围、时间范围、出现次数
         RSS 包含：来源、标题、发布时间
 
+        同一分组内多平台重复的标题合并为一行（来源合并），按权重优先级在
+        max_news（行数）与 max_context_tokens（token 预算）内装填；
+        热榜优先，RSS 使用剩余的行数与预算。
+
         Returns:
-            tuple: (news_content, rss_content, hotlist_total, rss_total, analyzed_count)
+            tuple: (news_content, rss_content, hotlist_total, rss_total, analyzed_count, context_info)
+            context_info: {"tokens", "total_tokens", "lines", "merged",
+                           "items": {key: [状态签名, 标题, 是否装入]}, "news"/"rss": PackedContext}
         """
-        news_lines = []
-        rss_lines = []
-        news_count = 0
-        rss_count = 0
-
         # 计算总新闻数
         hotlist_total = sum(len(s.get("titles", [])) for s in stats) if stats else 0
         rss_total = sum(len(s.get("titles", [])) for s in rss_stats) if rss_stats else 0
 
         # 热榜内容
-        if stats:
-            for stat in stats:
-                word = stat.get("word", "")
-                titles = stat.get("titles", [])
-                if word and titles:
-                    news_lines.append(f"\n**{word}** ({len(titles)}条)")
-                    for t in titles:
-                        if not isinstance(t, dict):
-                            continue
-                        title = t.get("title", "")
-                        if not title:
-                            continue
-
-                        # 来源
-                        source = t.get("source_name", t.get("source", ""))
-
-                        # 构建行
-                        if source:
-                            line = f"- [{source}] {title}"
-                        else:
-                            line = f"- {title}"
-
-                        # 始终显示简化格式：排名范围 + 时间范围 + 出现次数
-                        ranks = t.get("ranks", [])
-                        if ranks:
-                            min_rank = min(ranks)
-                            max_rank = max(ranks)
-                            rank_str = f"{min_rank}" if min_rank == max_rank else f"{min_rank}-{max_rank}"
-                        else:
-                            rank_str = "-"
-
-                        first_time = t.get("first_time", "")
-                        last_time = t.get("last_time", "")
-                        time_str = self._format_time_range(first_time, last_time)
-
-                        appear_count = t.get("count", 1)
-
-                        line += f" | 排名:{rank_str} | 时间:{time_str} | 出现:{appear_count}次"
-
-                        # 开启完整时间线时，额外添加轨迹
-                        if self.include_rank_timeline:
-                            rank_timeline = t.get("rank_timeline", [])
-                            timeline_str = self._format_rank_timeline(rank_timeline)
-                            line += f" | 轨迹:{timeline_str}"
-
-                        news_lines.append(line)
-
-                        news_count += 1
-                        if news_count >= self.max_news:
-                            break
-                if news_count >= self.max_news:
-                    break
+        news_sections, news_full_tokens = self._build_sections(
+            stats or [], self._format_hotlist_line, self._news_weight, ""
+        )
+        packed_news = pack_sections(
+            news_sections, self.max_context_tokens, self.max_news, news_full_tokens
+        )
 
-        # RSS 内容（仅在启用时构建）
+        # RSS 内容（仅在启用时构建），保持原有顺序作为优先级
+        packed_rss = PackedContext()
+        rss_sections = []
         if self.include_rss and rss_stats:
-            remaining = self.max_news - news_count
-            for stat in rss_stats:
-                if rss_count >= remaining:
+            remaining_lines = self.max_news - packed_news.lines
+            remaining_tokens = self.max_context_tokens - packed_news.tokens if self.max_context_tokens else 0
+            if remaining_lines > 0 and (not self.max_context_tokens or remaining_tokens > 0):
+                rss_sections, rss_full_tokens = self._build_sections(
+                    rss_stats, self._format_rss_line, None, "rss:"
+                )
+                packed_rss = pack_sections(
+                    rss_sections, remaining_tokens, remaining_lines, rss_full_tokens
+                )
+
+        lines = packed_news.lines + packed_rss.lines
+        analyzed_count = packed_news.covered + packed_rss.covered
+        # 全部候选新闻（含未装入的），供增量分析区分"新出现"与"预算边界进出"
+        items = {}
+        for _, section_lines in news_sections + rss_sections:
+            for line in section_lines:
+                items[line.key] = [line.signature, line.title, 0]
+        for packed in (packed_news, packed_rss):
+            for _, section_lines in packed.sections:
+                for line in section_lines:
+                    items[line.key][2] = 1
+
+        context_info = {
+            "tokens": packed_news.tokens + packed_rss.tokens,
+            "total_tokens": packed_news.total_tokens + packed_rss.total_tokens,
+            "lines": lines,
+            "merged": analyzed_count - lines,
+            "items": items,
+            "news": packed_news,
+            "rss": packed_rss,
+        }
+
+        return (
+            packed_news.content,
+            packed_rss.content,
+            hotlist_total,
+            rss_total,
+            analyzed_count,
+            context_info,
+        )
+
+    def _build_sections(
+        self,
+        stats: List[Dict],
+        format_line: Callable[[List[Dict]], str],
+        weight_func: Optional[Callable[[Dict], float]],
+        key_prefix: str,
+    ) -> tuple:
+        """
+        构建待装填的分组内容
+
+        每行以代表标题的归一化结果为 key，以来源与最高排名为状态签名，供增量分析比对。
+
+        Returns:
+            tuple: (sections, full_tokens)
+            full_tokens 为不去重、不截断时逐条列出的估算 token 数
+        """
+        sections = []
+        full_tokens = 0
+        order = 0
+        for stat in stats:
+            word = stat.get("word", "")
+            titles = stat.get("titles", [])
+            if not word or not titles:
+                continue
+
+            valid = [t for t in titles if isinstance(t, dict) and t.get("title", "")]
+            if not valid:
+                continue
+
+            header = f"\n**{word}** ({len(titles)}条)"
+            full_tokens += estimate_tokens(header)
+            for t in valid:
+                full_tokens += estimate_tokens(format_line([t]))
+
+            lines = []
+            for cluster in cluster_titles(valid):
+                if weight_func is not None:
+                    priority = sum(weight_func(t) for t in cluster)
+                else:
+                    # 无权重时按原有顺序装填
+                    order += 1
+                    priority = float(-order)
+                primary = cluster[0]
+                title = primary.get("title", "")
+                signature = self._merge_sources(cluster, "source_name", "source", "feed_name")
+                ranks = [rank for t in cluster for rank in t.get("ranks", [])]
+                if weight_func is not None and ranks:
+                    signature += f"|{min(ranks)}"
+                lines.append(ContextLine(
+                    format_line(cluster),
+                    priority,
+                    len(cluster),
+                    key=key_prefix + normalize_title(title),
+                    signature=signature,
+                    title=title,
+                ))
+            sections.append((header, lines))
+
+        return sections, full_tokens
+
+    def _news_weight(self, title_data: Dict) -> float:
+        """热榜新闻权重（按标题自身的排名阈值计算）"""
+        rank_threshold = title_data.get("rank_threshold", 5)
+        weight_func = self._weight_funcs.get(rank_threshold)
+        if weight_func is None:
+            weight_func = make_news_weight_func(rank_threshold, self.weight_config)
+            self._weight_funcs[rank_threshold] = weight_func
+        return weight_func(title_data)
+
+    @staticmethod
+    def _merge_sources(cluster: List[Dict], *keys: str) -> str:
+        """合并聚类内的来源名称（去重，保持顺序）"""
+        sources = []
+        for t in cluster:
+            for key in keys:
+                source = t.get(key, "")
+                if source:
                     break
-                word = stat.get("word", "")
-                titles = stat.get("titles", [])
-                if word and titles:
-                    rss_lines.append(f"\n**{word}** ({len(titles)}条)")
-                    for t in titles:
-                        if not isinstance(t, dict):
-                            continue
-                        title = t.get("title", "")
-                        if not title:
-                            continue
-
-                        # 来源
-                        source = t.get("source_name", t.get("feed_name", ""))
-
-                        # 发布时间
-                        time_display = t.get("time_display", "")
-
-                        # 构建行：[来源] 标题 | 发布时间
-                        if source:
-                            line = f"- [{source}] {title}"
-                        else:
-                            line = f"- {title}"
-                        if time_display:
-                            line += f" | {time_display}"
-                        rss_lines.append(line)
-
-                        rss_count += 1
-                        if rss_count >= remaining:
-                            break
-
-        news_content = "\n".join(news_lines) if news_lines else ""
-        rss_content = "\n".join(rss_lines) if rss_lines else ""
-        total_count = news_count + rss_count
-
-        return news_content, rss_content, hotlist_total, rss_total, total_count
+            if source and source not in sources:
+                sources.append(source)
+        return "/".join(sources)
+
+    def _format_hotlist_line(self, cluster: List[Dict]) -> str:
+        """格式化热榜行：聚类内来源合并，排名/时间取并集，出现次数取最大值"""
+        primary = cluster[0]
+        title = primary.get("title", "")
+
+        # 来源
+        source = self._merge_sources(cluster, "source_name", "source")
+
+        # 构建行
+        if source:
+            line = f"- [{source}] {title}"
+        else:
+            line = f"- {title}"
+
+        # 始终显示简化格式：排名范围 + 时间范围 + 出现次数
+        ranks = [rank for t in cluster for rank in t.get("ranks", [])]
+        if ranks:
+            min_rank = min(ranks)
+            max_rank = max(ranks)
+            rank_str = f"{min_rank}" if min_rank == max_rank else f"{min_rank}-{max_rank}"
+        else:
+            rank_str = "-"
+
+        first_times = [t.get("first_time", "") for t in cluster if t.get("first_time", "")]
+        last_times = [t.get("last_time", "") for t in cluster if t.get("last_time", "")]
+        time_str = self._format_time_range(
+            min(first_times) if first_times else "",
+            max(last_times) if last_times else "",
+        )
+
+        appear_count = max(t.get("count", 1) for t in cluster)
+
+        line += f" | 排名:{rank_str} | 时间:{time_str} | 出现:{appear_count}次"
+
+        # 开启完整时间线时，额外添加轨迹（取首个来源的轨迹）
+        if self.include_rank_timeline:
+            rank_timeline = primary.get("rank_timeline", [])
+            timeline_str = self._format_rank_timeline(rank_timeline)
+            line += f" | 轨迹:{timeline_str}"
+
+        return line
+
+    def _format_rss_line(self, cluster: List[Dict]) -> str:
+        """格式化 RSS 行：[来源] 标题 | 发布时间"""
+        primary = cluster[0]
+        title = primary.get("title", "")
+
+        # 来源
+        source = self._merge_sources(cluster, "source_name", "feed_name")
+
+        # 发布时间
+        time_display = primary.get("time_display", "")
+
+        if source:
+            line = f"- [{source}] {title}"
+        else:
+            line = f"- {title}"
+        if time_display:
+            line += f" | {time_display}"
+        return line
 
     def _call_ai(self, user_prompt: str) -> str:
         """调用 AI API（使用 LiteLLM）"""
@@ -391,20 +667,30 @@ class AIAnalyzer:
         return f"{first}~{last}"
 
     def _format_rank_timeline(self, rank_timeline: List[Dict]) -> str:
-        """格式化排名时间线"""
+        """
+        格式化排名时间线
+
+        连续相同的排名合并为一段：2(10:00)→2(10:30)→2(11:00) 显示为 2(10:00~11:00)
+        """
         if not rank_timeline:
             return "-"
 
         parts = []
+        run_rank = None
+        run_start = run_end = ""
         for item in rank_timeline:
             time_str = item.get("time", "")
             if len(time_str) == 5 and time_str[2] == '-':
                 time_str = time_str.replace('-', ':')
             rank = item.get("rank")
             if rank is None:
-                parts.append(f"0({time_str})")
-            else:
-                parts.append(f"{rank}({time_str})")
+                rank = 0
+            if parts and rank == run_rank:
+                run_end = time_str
+                parts[-1] = f"{rank}({run_start}~{run_end})"
+                continue
+            run_rank, run_start, run_end = rank, time_str, time_str
+            parts.append(f"{rank}({time_str})")
 
         return "→".join(parts)
 
@@ -0,0 +1,159 @@
+# coding=utf-8
+"""
+AI 分析结果缓存模块
+
+分析结果按输入指纹持久化到当天的新闻数据库（ai_analysis_cache 表）：
+- 指纹 = 打包后的新闻内容 + 提示词 + 模型，输入完全相同时直接复用结果，不再调用 AI
+- 增量重分析：同一提示词 / 模型 / 模式下以最近一次结果为基线，只发送新增或状态
+  变化的新闻和上次的分析结论，由 AI 给出更新后的完整分析
+- 命中次数与节省的 token 数记录在缓存表中，与 record_ai_analysis 的分析记录同库保存
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# 连续增量分析的最大次数，超过后强制全量分析，避免多次叠加后结论漂移
+MAX_DELTA_DEPTH = 3
+
+# 新增 / 变化新闻占比超过该比例时直接全量分析
+MAX_DELTA_RATIO = 0.5
+
+# 增量分析时附带的上次结论最大字数
+PREVIOUS_SUMMARY_MAX_CHARS = 1200
+
+# 增量提示中列出的已下榜新闻数上限
+MAX_DROPPED_TITLES = 20
+
+# 上次结论中附带的板块（字段名, 显示名）
+SUMMARY_SECTIONS = (
+    ("core_trends", "核心热点"),
+    ("sentiment_controversy", "舆论风向"),
+    ("signals", "异动信号"),
+    ("rss_insights", "RSS 洞察"),
+    ("outlook_strategy", "研判策略"),
+)
+
+
+def make_fingerprint(*parts: str) -> str:
+    """计算多段文本的组合指纹（SHA-256）"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update((part or "").encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def diff_context_items(
+    previous: Dict[str, List],
+    current: Dict[str, List],
+) -> Tuple[List[str], List[str]]:
+    """
+    比较两次分析的新闻集合
+
+    只把本次装入上下文、且上次未出现或状态签名变化的新闻视为变化；上次已在候选中、
+    仅因预算边界进出的新闻不算变化。
+
+    Args:
+        previous: 上次分析的 {key: [状态签名, 标题, 是否装入]}
+        current: 本次分析的 {key: [状态签名, 标题, 是否装入]}
+
+    Returns:
+        (新增或状态变化的 key 列表, 已下榜的标题列表)
+    """
+    changed = [
+        key for key, (signature, _, packed) in current.items()
+        if packed and (key not in previous or previous[key][0] != signature)
+    ]
+    dropped = [
+        title for key, (_, title, packed) in previous.items()
+        if packed and key not in current
+    ]
+    return changed, dropped
+
+
+def format_previous_summary(result_data: Dict[str, Any]) -> str:
+    """把上次分析结果压缩为增量提示中的结论摘要"""
+    lines = []
+    remaining = PREVIOUS_SUMMARY_MAX_CHARS
+    for field_name, label in SUMMARY_SECTIONS:
+        text = " ".join(str(result_data.get(field_name, "") or "").split())
+        if not text or remaining <= 0:
+            continue
+        if len(text) > remaining:
+            text = text[:remaining] + "…"
+        remaining -= len(text)
+        lines.append(f"- {label}：{text}")
+    return "\n".join(lines)
+
+
+class AnalysisCache:
+    """
+    AI 分析缓存（基于存储后端的 ai_analysis_cache 表）
+
+    存储异常不影响分析流程：读取失败视为未命中，写入失败只打印日志。
+    """
+
+    def __init__(self, storage: Any, delta_enabled: bool = False):
+        """
+        Args:
+            storage: 存储管理器或存储后端（需提供 get_ai_analysis_cache 等方法）
+            delta_enabled: 是否启用增量重分析
+        """
+        self.storage = storage
+        self.delta_enabled = delta_enabled
+
+    def get(self, fingerprint: str) -> Optional[Dict]:
+        """按输入指纹读取缓存记录"""
+        return self._load(fingerprint=fingerprint)
+
+    def latest(self, base_key: str) -> Optional[Dict]:
+        """读取同一基线下最近一条缓存记录（增量分析基线）"""
+        return self._load(base_key=base_key)
+
+    def save(
+        self,
+        fingerprint: str,
+        base_key: str,
+        analysis_mode: str,
+        result_data: Dict[str, Any],
+        context_items: Dict[str, List],
+        input_tokens: int,
+        delta_depth: int = 0,
+        saved_tokens: int = 0,
+    ) -> bool:
+        """保存分析结果"""
+        try:
+            return self.storage.save_ai_analysis_cache({
+                "fingerprint": fingerprint,
+                "base_key": base_key,
+                "analysis_mode": analysis_mode,
+                "result_json": json.dumps(result_data, ensure_ascii=False),
+                "context_json": json.dumps(context_items, ensure_ascii=False),
+                "input_tokens": input_tokens,
+                "delta_depth": delta_depth,
+                "saved_tokens": saved_tokens,
+            })
+        except Exception as e:
+            print(f"[AI 缓存] 保存分析结果失败: {e}")
+            return False
+
+    def record_hit(self, fingerprint: str, saved_tokens: int) -> None:
+        """记录缓存命中及节省的 token 数"""
+        try:
+            self.storage.record_ai_analysis_cache_hit(fingerprint, saved_tokens)
+        except Exception as e:
+            print(f"[AI 缓存] 记录缓存命中失败: {e}")
+
+    def _load(self, fingerprint: Optional[str] = None, base_key: Optional[str] = None) -> Optional[Dict]:
+        try:
+            entry = self.storage.get_ai_analysis_cache(fingerprint, base_key)
+            if not entry:
+                return None
+            entry["result"] = json.loads(entry["result_json"])
+            entry["context"] = json.loads(entry.get("context_json") or "{}")
+            return entry
+        except Exception as e:
+            print(f"[AI 缓存] 读取缓存失败: {e}")
+            return None
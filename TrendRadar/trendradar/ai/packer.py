@@ -0,0 +1,224 @@
+# coding=utf-8
+"""
+AI 分析上下文打包模块
+
+把按关键词分组的新闻压缩成发送给 AI 的上下文：
+- 同一新闻在多个平台上榜时合并为一行，来源合并显示（[微博/知乎] 标题）
+- 按字符类型估算每行 token 数（无需 tokenizer 依赖）
+- 按权重优先级在 token 预算与条数上限内贪心装填，输出时保持原有分组顺序
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# 近似重复判定：标题字符二元组 Jaccard 相似度阈值
+NEAR_DUPLICATE_SIMILARITY = 0.75
+
+# 标题归一化后少于该长度时只做精确合并，避免短标题误合并
+NEAR_DUPLICATE_MIN_LENGTH = 8
+
+_NON_WORD_PATTERN = re.compile(r"[\W_]+")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    估算文本 token 数
+
+    中日韩等非 ASCII 字符按 1 字 1 token 计（主流模型中文约 0.6~1 token/字，取保守值），
+    ASCII 字符按 4 字符 1 token 计。
+
+    Args:
+        text: 文本
+
+    Returns:
+        估算的 token 数
+    """
+    if not text:
+        return 0
+    ascii_count = len(text.encode("ascii", "ignore"))
+    return len(text) - ascii_count + (ascii_count + 3) // 4
+
+
+def normalize_title(title: str) -> str:
+    """归一化标题：去除空白与标点，统一小写"""
+    return _NON_WORD_PATTERN.sub("", title).lower()
+
+
+def _bigrams(text: str) -> frozenset:
+    return frozenset(text[i:i + 2] for i in range(len(text) - 1))
+
+
+def cluster_titles(
+    titles: Iterable[Dict],
+    similarity: float = NEAR_DUPLICATE_SIMILARITY,
+) -> List[List[Dict]]:
+    """
+    将同一分组内的重复 / 近似重复标题聚类
+
+    归一化后完全相同的标题直接合并；较长的标题再按字符二元组 Jaccard 相似度
+    合并近似重复项（通过二元组倒排索引只比较有交集的候选，避免两两比较）。
+
+    Args:
+        titles: 标题字典列表（需包含 title 字段）
+        similarity: 近似重复阈值，<= 0 或 >= 1 时只做精确合并
+
+    Returns:
+        聚类列表，按首次出现顺序排列；每个聚类内保持原有顺序
+    """
+    clusters: List[List[Dict]] = []
+    exact_index: Dict[str, int] = {}
+    cluster_grams: List[frozenset] = []
+    gram_index: Dict[str, List[int]] = {}
+    fuzzy = 0 < similarity < 1
+
+    for t in titles:
+        key = normalize_title(t.get("title", ""))
+        idx = exact_index.get(key)
+
+        grams = None
+        if idx is None and fuzzy and len(key) >= NEAR_DUPLICATE_MIN_LENGTH:
+            grams = _bigrams(key)
+            shared: Dict[int, int] = {}
+            for gram in grams:
+                for candidate in gram_index.get(gram, ()):
+                    shared[candidate] = shared.get(candidate, 0) + 1
+            best = 0.0
+            for candidate, common in shared.items():
+                union = len(grams) + len(cluster_grams[candidate]) - common
+                score = common / union if union else 0.0
+                if score >= similarity and score > best:
+                    best = score
+                    idx = candidate
+
+        if idx is None:
+            idx = len(clusters)
+            clusters.append([t])
+            if grams is None and fuzzy and len(key) >= NEAR_DUPLICATE_MIN_LENGTH:
+                grams = _bigrams(key)
+            cluster_grams.append(grams or frozenset())
+            for gram in grams or ():
+                gram_index.setdefault(gram, []).append(idx)
+        else:
+            clusters[idx].append(t)
+        exact_index.setdefault(key, idx)
+
+    return clusters
+
+
+@dataclass
+class ContextLine:
+    """待装填的一行上下文"""
+    text: str                      # 行文本
+    priority: float = 0.0          # 优先级（越大越优先）
+    covered: int = 1               # 该行覆盖的原始新闻条数
+    key: str = ""                  # 新闻标识（归一化标题），用于增量比对
+    signature: str = ""            # 新闻状态签名（来源、最高排名等），变化即视为有更新
+    title: str = ""                # 代表标题
+    tokens: int = field(init=False)
+
+    def __post_init__(self):
+        self.tokens = estimate_tokens(self.text)
+
+
+@dataclass
+class PackedContext:
+    """装填结果"""
+    content: str = ""              # 上下文文本
+    lines: int = 0                 # 装入的行数
+    covered: int = 0               # 装入行覆盖的原始新闻条数
+    tokens: int = 0                # 装入内容的估算 token 数
+    total_tokens: int = 0          # 不去重、不截断时全部内容的估算 token 数
+    sections: List[Tuple[str, List[ContextLine]]] = field(default_factory=list)  # 装入的分组与行
+
+    def render(self, keys: Optional[Iterable[str]] = None) -> str:
+        """
+        渲染装入的内容
+
+        Args:
+            keys: 仅渲染 key 在该集合中的行（None 表示全部），无行的分组标题一并省略
+        """
+        if keys is None:
+            return self.content
+        wanted = set(keys)
+        parts: List[str] = []
+        for header, lines in self.sections:
+            chosen = [line.text for line in lines if line.key in wanted]
+            if chosen:
+                parts.append(header)
+                parts.extend(chosen)
+        return "\n".join(parts)
+
+
+def pack_sections(
+    sections: List[Tuple[str, List[ContextLine]]],
+    token_budget: int = 0,
+    max_lines: int = 0,
+    full_tokens: Optional[int] = None,
+) -> PackedContext:
+    """
+    按优先级在预算内装填分组内容
+
+    所有分组的行按 priority 全局降序依次尝试装入（同优先级保持原顺序）；
+    某行放不下时跳过并继续尝试后续较短的行。分组标题在该组首行装入时计入预算。
+    输出时按原分组顺序和组内顺序排列。
+
+    Args:
+        sections: [(分组标题, 行列表), ...]
+        token_budget: token 预算（0 表示不限制）
+        max_lines: 行数上限（0 表示不限制）
+        full_tokens: 未去重时全部内容的 token 数（None 时按 sections 计算）
+
+    Returns:
+        PackedContext
+    """
+    header_tokens = [estimate_tokens(header) for header, _ in sections]
+    total_tokens = sum(header_tokens) + sum(
+        line.tokens for _, lines in sections for line in lines
+    )
+
+    candidates = [
+        (-line.priority, s, i)
+        for s, (_, lines) in enumerate(sections)
+        for i, line in enumerate(lines)
+    ]
+    candidates.sort()
+
+    selected: Dict[int, List[int]] = {}
+    used_tokens = 0
+    line_count = 0
+    for _, s, i in candidates:
+        if max_lines and line_count >= max_lines:
+            break
+        cost = sections[s][1][i].tokens
+        if s not in selected:
+            cost += header_tokens[s]
+        if token_budget and used_tokens + cost > token_budget:
+            continue
+        selected.setdefault(s, []).append(i)
+        used_tokens += cost
+        line_count += 1
+
+    parts: List[str] = []
+    packed_sections: List[Tuple[str, List[ContextLine]]] = []
+    covered = 0
+    for s, (header, lines) in enumerate(sections):
+        chosen = selected.get(s)
+        if not chosen:
+            continue
+        chosen_lines = [lines[i] for i in sorted(chosen)]
+        packed_sections.append((header, chosen_lines))
+        parts.append(header)
+        for line in chosen_lines:
+            parts.append(line.text)
+            covered += line.covered
+
+    return PackedContext(
+        content="\n".join(parts),
+        lines=line_count,
+        covered=covered,
+        tokens=used_tokens,
+        total_tokens=total_tokens if full_tokens is None else full_tokens,
+        sections=packed_sections,
+    )
@@ -179,6 +179,8 @@ class AppContext:
                 },
                 local_retention_days=local_config.get("RETENTION_DAYS", 0),
                 remote_retention_days=remote_config.get("RETENTION_DAYS", 0),
+                remote_upload_delay=remote_config.get("UPLOAD_DELAY", 0),
+                local_archive_after_days=local_config.get("ARCHIVE_AFTER_DAYS", 0),
                 pull_enabled=pull_config.get("ENABLED", False),
                 pull_days=pull_config.get("DAYS", 7),
                 timezone=self.timezone,
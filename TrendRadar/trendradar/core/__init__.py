@@ -20,6 +20,7 @@ from trendradar.core.data import (
 )
 from trendradar.core.analyzer import (
     calculate_news_weight,
+    rank_news_titles,
     format_time_display,
     count_word_frequency,
     count_rss_frequency,
@@ -41,6 +42,7 @@ __all__ = [
     "detect_latest_new_titles",
     # 统计分析
     "calculate_news_weight",
+    "rank_news_titles",
     "format_time_display",
     "count_word_frequency",
     "count_rss_frequency",
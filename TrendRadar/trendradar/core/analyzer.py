@@ -4,16 +4,108 @@
 
 提供新闻统计和分析功能：
 - calculate_news_weight: 计算新闻权重
+- rank_news_titles: 按权重批量排序标题
 - format_time_display: 格式化时间显示
 - count_word_frequency: 统计词频
 """
 
+import heapq
 from typing import Dict, List, Tuple, Optional, Callable
 
-from trendradar.core.frequency import matches_word_groups, _word_matches
+from trendradar.core.frequency import get_word_group_matcher
 from trendradar.utils.time import DEFAULT_TIMEZONE
 
 
+def make_rank_summary_weight_func(
+    rank_threshold: int,
+    weight_config: Dict,
+) -> Callable[[int, int, int, int], float]:
+    """
+    生成基于排名汇总值的权重计算函数
+
+    汇总值可以逐条累加（如合并同一新闻多天的排名），无需保留完整的排名列表，
+    计算结果与 make_news_weight_func 完全一致。
+
+    Args:
+        rank_threshold: 排名阈值
+        weight_config: 权重配置 {RANK_WEIGHT, FREQUENCY_WEIGHT, HOTNESS_WEIGHT}
+
+    Returns:
+        weight_func(total, clipped_sum, high_rank_count, count) -> float
+        - total: 排名记录数
+        - clipped_sum: Σ min(rank, 10)
+        - high_rank_count: 排名 <= rank_threshold 的次数
+        - count: 出现次数
+    """
+    rank_factor = weight_config["RANK_WEIGHT"]
+    frequency_factor = weight_config["FREQUENCY_WEIGHT"]
+    hotness_factor = weight_config["HOTNESS_WEIGHT"]
+
+    def weight_func(total: int, clipped_sum: int, high_rank_count: int, count: int) -> float:
+        if not total:
+            return 0.0
+
+        # 排名权重：Σ(11 - min(rank, 10)) / 出现次数
+        rank_weight = (11 * total - clipped_sum) / total
+
+        # 频次权重：min(出现次数, 10) × 10
+        frequency_weight = (count if count < 10 else 10) * 10
+
+        # 热度加成：高排名次数 / 总出现次数 × 100
+        hotness_weight = high_rank_count / total * 100
+
+        return (
+            rank_weight * rank_factor
+            + frequency_weight * frequency_factor
+            + hotness_weight * hotness_factor
+        )
+
+    return weight_func
+
+
+def summarize_ranks(ranks: List[int], rank_threshold: int) -> Tuple[int, int, int]:
+    """
+    计算排名列表的汇总值
+
+    Returns:
+        (total, clipped_sum, high_rank_count)，含义见 make_rank_summary_weight_func
+    """
+    return (
+        len(ranks),
+        sum(rank if rank < 10 else 10 for rank in ranks),
+        sum(1 for rank in ranks if rank <= rank_threshold),
+    )
+
+
+def make_news_weight_func(
+    rank_threshold: int,
+    weight_config: Dict,
+) -> Callable[[Dict], float]:
+    """
+    生成新闻权重计算函数（权重系数只读取一次，供批量排序复用）
+
+    Args:
+        rank_threshold: 排名阈值
+        weight_config: 权重配置 {RANK_WEIGHT, FREQUENCY_WEIGHT, HOTNESS_WEIGHT}
+
+    Returns:
+        weight_func(title_data) -> float
+    """
+    summary_weight = make_rank_summary_weight_func(rank_threshold, weight_config)
+
+    def weight_func(title_data: Dict) -> float:
+        ranks = title_data.get("ranks", [])
+        if not ranks:
+            return 0.0
+
+        total, clipped_sum, high_rank_count = summarize_ranks(ranks, rank_threshold)
+        return summary_weight(
+            total, clipped_sum, high_rank_count, title_data.get("count", total)
+        )
+
+    return weight_func
+
+
 def calculate_news_weight(
     title_data: Dict,
     rank_threshold: int,
@@ -30,35 +122,43 @@ def calculate_news_weight(
     Returns:
         float: 计算出的权重值
     """
-    ranks = title_data.get("ranks", [])
-    if not ranks:
-        return 0.0
-
-    count = title_data.get("count", len(ranks))
+    return make_news_weight_func(rank_threshold, weight_config)(title_data)
 
-    # 排名权重：Σ(11 - min(rank, 10)) / 出现次数
-    rank_scores = []
-    for rank in ranks:
-        score = 11 - min(rank, 10)
-        rank_scores.append(score)
 
-    rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
+def rank_news_titles(
+    titles: List[Dict],
+    rank_threshold: int,
+    weight_config: Dict,
+    limit: int = 0,
+) -> List[Dict]:
+    """
+    按权重排序标题（权重降序 → 最高排名升序 → 出现次数降序）
 
-    # 频次权重：min(出现次数, 10) × 10
-    frequency_weight = min(count, 10) * 10
+    排序键对每个标题只计算一次；只取前 limit 条时用堆选择代替全量排序，
+    结果与 sorted(...)[:limit] 完全一致（同分时保持原有相对顺序）。
 
-    # 热度加成：高排名次数 / 总出现次数 × 100
-    high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
-    hotness_ratio = high_rank_count / len(ranks) if ranks else 0
-    hotness_weight = hotness_ratio * 100
+    Args:
+        titles: 标题数据列表
+        rank_threshold: 排名阈值
+        weight_config: 权重配置
+        limit: 最多返回条数（0 表示不限制）
 
-    total_weight = (
-        rank_weight * weight_config["RANK_WEIGHT"]
-        + frequency_weight * weight_config["FREQUENCY_WEIGHT"]
-        + hotness_weight * weight_config["HOTNESS_WEIGHT"]
-    )
+    Returns:
+        排序后的标题列表
+    """
+    weight_func = make_news_weight_func(rank_threshold, weight_config)
+
+    def sort_key(title_data: Dict) -> Tuple[float, int, int]:
+        ranks = title_data["ranks"]
+        return (
+            -weight_func(title_data),
+            min(ranks) if ranks else 999,
+            -title_data["count"],
+        )
 
-    return total_weight
+    if 0 < limit < len(titles):
+        return heapq.nsmallest(limit, titles, key=sort_key)
+    return sorted(titles, key=sort_key)
 
 
 def format_time_display(
@@ -222,6 +322,8 @@ def count_word_frequency(
         group_key = group["group_key"]
         word_stats[group_key] = {"count": 0, "titles": {}}
 
+    matcher = get_word_group_matcher(word_groups, filter_words, global_filters)
+
     for source_id, titles_data in results_to_process.items():
         total_titles += len(titles_data)
 
@@ -232,12 +334,9 @@ def count_word_frequency(
             if title in processed_titles.get(source_id, {}):
                 continue
 
-            # 使用统一的匹配逻辑
-            matches_frequency_words = matches_word_groups(
-                title, word_groups, filter_words, global_filters
-            )
-
-            if not matches_frequency_words:
+            # 一次匹配同时完成过滤判定和词组归属（标题只归入第一个命中的词组）
+            group_index = matcher.first_group(title)
+            if group_index < 0:
                 continue
 
             # 如果是增量模式或 current 模式第一次，统计匹配的新增新闻数量
@@ -250,119 +349,87 @@ def count_word_frequency(
             source_url = title_data.get("url", "")
             source_mobile_url = title_data.get("mobileUrl", "")
 
-            # 找到匹配的词组（防御性转换确保类型安全）
-            title_lower = str(title).lower() if not isinstance(title, str) else title.lower()
-            for group in word_groups:
-                required_words = group["required"]
-                normal_words = group["normal"]
-
-                # 如果是"全部新闻"模式，所有标题都匹配第一个（唯一的）词组
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻":
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-                else:
-                    # 原有的匹配逻辑（支持正则语法）
-                    if required_words:
-                        all_required_present = all(
-                            _word_matches(req_item, title_lower)
-                            for req_item in required_words
-                        )
-                        if not all_required_present:
-                            continue
-
-                    if normal_words:
-                        any_normal_present = any(
-                            _word_matches(normal_item, title_lower)
-                            for normal_item in normal_words
-                        )
-                        if not any_normal_present:
-                            continue
-
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-
-                first_time = ""
-                last_time = ""
-                count_info = 1
-                ranks = source_ranks if source_ranks else []
-                url = source_url
-                mobile_url = source_mobile_url
-                rank_timeline = []
-
-                # 对于 current 模式，从历史统计信息中获取完整数据
-                if (
-                    mode == "current"
-                    and title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                    rank_timeline = info.get("rank_timeline", [])
-                elif (
-                    title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                    rank_timeline = info.get("rank_timeline", [])
-
-                if not ranks:
-                    ranks = [99]
-
-                time_display = format_time_display(first_time, last_time, convert_time_func)
-
-                source_name = id_to_name.get(source_id, source_id)
-
-                # 判断是否为新增
-                is_new = False
-                if all_news_are_new:
-                    # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
-                    is_new = True
-                elif new_titles and source_id in new_titles:
-                    # 检查是否在新增列表中
-                    new_titles_for_source = new_titles[source_id]
-                    is_new = title in new_titles_for_source
-
-                word_stats[group_key]["titles"][source_id].append(
-                    {
-                        "title": title,
-                        "source_name": source_name,
-                        "first_time": first_time,
-                        "last_time": last_time,
-                        "time_display": time_display,
-                        "count": count_info,
-                        "ranks": ranks,
-                        "rank_threshold": rank_threshold,
-                        "url": url,
-                        "mobileUrl": mobile_url,
-                        "is_new": is_new,
-                        "rank_timeline": rank_timeline,
-                    }
-                )
-
-                if source_id not in processed_titles:
-                    processed_titles[source_id] = {}
-                processed_titles[source_id][title] = True
+            group_key = word_groups[group_index]["group_key"]
+            word_stats[group_key]["count"] += 1
+            if source_id not in word_stats[group_key]["titles"]:
+                word_stats[group_key]["titles"][source_id] = []
+
+            first_time = ""
+            last_time = ""
+            count_info = 1
+            ranks = source_ranks if source_ranks else []
+            url = source_url
+            mobile_url = source_mobile_url
+            rank_timeline = []
+
+            # 对于 current 模式，从历史统计信息中获取完整数据
+            if (
+                mode == "current"
+                and title_info
+                and source_id in title_info
+                and title in title_info[source_id]
+            ):
+                info = title_info[source_id][title]
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+                rank_timeline = info.get("rank_timeline", [])
+            elif (
+                title_info
+                and source_id in title_info
+                and title in title_info[source_id]
+            ):
+                info = title_info[source_id][title]
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+                rank_timeline = info.get("rank_timeline", [])
+
+            if not ranks:
+                ranks = [99]
+
+            time_display = format_time_display(first_time, last_time, convert_time_func)
+
+            source_name = id_to_name.get(source_id, source_id)
+
+            # 判断是否为新增
+            is_new = False
+            if all_news_are_new:
+                # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
+                is_new = True
+            elif new_titles and source_id in new_titles:
+                # 检查是否在新增列表中
+                new_titles_for_source = new_titles[source_id]
+                is_new = title in new_titles_for_source
+
+            word_stats[group_key]["titles"][source_id].append(
+                {
+                    "title": title,
+                    "source_name": source_name,
+                    "first_time": first_time,
+                    "last_time": last_time,
+                    "time_display": time_display,
+                    "count": count_info,
+                    "ranks": ranks,
+                    "rank_threshold": rank_threshold,
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                    "is_new": is_new,
+                    "rank_timeline": rank_timeline,
+                }
+            )
 
-                break
+            if source_id not in processed_titles:
+                processed_titles[source_id] = {}
+            processed_titles[source_id][title] = True
 
     # 最后统一打印汇总信息
     if mode == "incremental":
@@ -436,24 +503,16 @@ def count_word_frequency(
         for source_id, title_list in data["titles"].items():
             all_titles.extend(title_list)
 
-        # 按权重排序
-        sorted_titles = sorted(
-            all_titles,
-            key=lambda x: (
-                -calculate_news_weight(x, rank_threshold, weight_config),
-                min(x["ranks"]) if x["ranks"] else 999,
-                -x["count"],
-            ),
-        )
-
-        # 应用最大显示数量限制（优先级：单独配置 > 全局配置）
+        # 最大显示数量限制（优先级：单独配置 > 全局配置）
         group_max_count = group_key_to_max_count.get(group_key, 0)
         if group_max_count == 0:
             # 使用全局配置
             group_max_count = max_news_per_keyword
 
-        if group_max_count > 0:
-            sorted_titles = sorted_titles[:group_max_count]
+        # 按权重排序并截取
+        sorted_titles = rank_news_titles(
+            all_titles, rank_threshold, weight_config, limit=max(group_max_count, 0)
+        )
 
         # 优先使用 display_name，否则使用 group_key
         display_word = group_key_to_display_name.get(group_key) or group_key
@@ -572,6 +631,7 @@ def count_rss_frequency(
 
     total_items = len(rss_items)
     processed_urls = set()  # 用于去重
+    matcher = get_word_group_matcher(word_groups, filter_words, global_filters)
 
     # 为每个条目分配一个基于发布时间的"排名"
     # 按发布时间排序，最新的排在前面
@@ -592,67 +652,36 @@ def count_rss_frequency(
         if url:
             processed_urls.add(url)
 
-        # 使用统一的匹配逻辑
-        if not matches_word_groups(title, word_groups, filter_words, global_filters):
+        # 一次匹配同时完成过滤判定和词组归属（一个条目只归入第一个命中的词组）
+        group_index = matcher.first_group(title)
+        if group_index < 0:
             continue
 
-        # 找到匹配的词组
-        title_lower = title.lower()
-        for group in word_groups:
-            required_words = group["required"]
-            normal_words = group["normal"]
-            group_key = group["group_key"]
-
-            # "全部 RSS" 模式：所有条目都匹配
-            if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部 RSS":
-                matched = True
-            else:
-                # 检查必须词（支持正则语法）
-                if required_words:
-                    all_required_present = all(
-                        _word_matches(req_item, title_lower)
-                        for req_item in required_words
-                    )
-                    if not all_required_present:
-                        continue
-
-                # 检查普通词（支持正则语法）
-                if normal_words:
-                    any_normal_present = any(
-                        _word_matches(normal_item, title_lower)
-                        for normal_item in normal_words
-                    )
-                    if not any_normal_present:
-                        continue
-
-                matched = True
-
-            if matched:
-                word_stats[group_key]["count"] += 1
-
-                # 格式化时间显示
-                published_at = item.get("published_at", "")
-                time_display = format_iso_time_friendly(published_at, timezone, include_date=True) if published_at else ""
-
-                # 判断是否为新增
-                is_new = url in new_urls if url else False
-
-                # 获取排名（基于发布时间顺序）
-                rank = url_to_rank.get(url, 99) if url else 99
-
-                title_data = {
-                    "title": title,
-                    "source_name": item.get("feed_name", item.get("feed_id", "RSS")),
-                    "time_display": time_display,
-                    "count": 1,  # RSS 条目通常只出现一次
-                    "ranks": [rank],
-                    "rank_threshold": rank_threshold,
-                    "url": url,
-                    "mobile_url": "",
-                    "is_new": is_new,
-                }
-                word_stats[group_key]["titles"].append(title_data)
-                break  # 一个条目只匹配第一个词组
+        group_key = word_groups[group_index]["group_key"]
+        word_stats[group_key]["count"] += 1
+
+        # 格式化时间显示
+        published_at = item.get("published_at", "")
+        time_display = format_iso_time_friendly(published_at, timezone, include_date=True) if published_at else ""
+
+        # 判断是否为新增
+        is_new = url in new_urls if url else False
+
+        # 获取排名（基于发布时间顺序）
+        rank = url_to_rank.get(url, 99) if url else 99
+
+        title_data = {
+            "title": title,
+            "source_name": item.get("feed_name", item.get("feed_id", "RSS")),
+            "time_display": time_display,
+            "count": 1,  # RSS 条目通常只出现一次
+            "ranks": [rank],
+            "rank_threshold": rank_threshold,
+            "url": url,
+            "mobile_url": "",
+            "is_new": is_new,
+        }
+        word_stats[group_key]["titles"].append(title_data)
 
     # 构建统计结果
     stats = []
@@ -752,14 +781,7 @@ def convert_keyword_stats_to_platform_stats(
 
     # 3. 按权重排序每个平台内的新闻
     for source_name, titles in platform_map.items():
-        platform_map[source_name] = sorted(
-            titles,
-            key=lambda x: (
-                -calculate_news_weight(x, rank_threshold, weight_config),
-                min(x["ranks"]) if x["ranks"] else 999,
-                -x["count"],
-            ),
-        )
+        platform_map[source_name] = rank_news_titles(titles, rank_threshold, weight_config)
 
     # 4. 构建平台统计结果
     platform_stats = []
@@ -0,0 +1,161 @@
+# coding=utf-8
+"""
+关键词热度异常检测（指数加权滑动统计）
+
+抓取端在每次抓取时增量维护关键词在榜条数的指数加权一阶 / 二阶矩（EWMA）与累计
+在榜次数，MCP 分析端据此在常数时间内得到任意时间窗口的基线与 z 分数：
+- 每个抓取时间点为一个观测；两次变化之间在榜条数不变，状态可按闭式直接推进，
+  因此只需在条数变化时记录一次状态（变化日志），任一时间点的状态都可由其之前
+  最近一条记录推出
+- 状态每天从零开始维护；一阶 / 二阶矩对历史观测是线性的，读取端按衰减系数把
+  多天的状态叠加为连续状态，抓取端无需读取前一天的数据库
+- 同一状态中还维护 Holt 线性趋势模型的水平 / 趋势（见 forecast 模块），供热点预测使用
+"""
+
+from typing import Dict, Iterable, Optional, Tuple
+
+from trendradar.core.forecast import (
+    HOLT_ALPHA,
+    HOLT_BETA,
+    HOLT_PHI,
+    holt_advance,
+    holt_decay,
+    holt_update,
+)
+from trendradar.core.keywords import get_extractor_signature
+
+
+# 状态规则版本号：统计口径变化时递增，旧状态将被重建
+ANOMALY_STATE_VERSION = 2
+
+# 每个抓取时间点的衰减系数（约等于最近 1 / EWMA_ALPHA 次抓取的滑动平均）
+EWMA_ALPHA = 0.1
+
+# 方差下限（在榜条数很小时避免 z 分数失真）
+MIN_VARIANCE = 0.25
+
+# 关键词状态：(时间点序号, 在榜条数, 累计在榜次数, 一阶矩, 二阶矩, Holt 水平, Holt 趋势)
+TrendState = Tuple[int, int, int, float, float, float, float]
+
+EMPTY_STATE: TrendState = (0, 0, 0, 0.0, 0.0, 0.0, 0.0)
+
+
+def get_trend_state_signature() -> str:
+    """获取热度状态签名（状态规则版本 + 平滑系数 + 关键词提取规则签名）"""
+    return (
+        f"{ANOMALY_STATE_VERSION}:{EWMA_ALPHA}:{HOLT_ALPHA}:{HOLT_BETA}:{HOLT_PHI}:"
+        f"{get_extractor_signature()}"
+    )
+
+
+def decay_factor(steps: int) -> float:
+    """经过 steps 个抓取时间点后的衰减倍数"""
+    return (1 - EWMA_ALPHA) ** steps if steps > 0 else 1.0
+
+
+def advance_state(state: TrendState, slot: int) -> TrendState:
+    """
+    把状态推进到指定时间点（期间在榜条数保持不变）
+
+    Args:
+        state: 关键词状态
+        slot: 目标时间点序号（不早于状态的时间点）
+
+    Returns:
+        推进后的状态
+    """
+    last_slot, count, cum, m1, m2, level, trend = state
+    steps = slot - last_slot
+    if steps <= 0:
+        return state
+    decay = decay_factor(steps)
+    return (
+        slot,
+        count,
+        cum + count * steps,
+        m1 * decay + count * (1 - decay),
+        m2 * decay + count * count * (1 - decay),
+    ) + holt_advance(level, trend, count, steps)
+
+
+def update_state(state: TrendState, slot: int, count: int) -> TrendState:
+    """
+    在指定时间点以新的在榜条数更新状态
+
+    Args:
+        state: 关键词状态（上次变化时记录）
+        slot: 本次时间点序号（当天从 1 开始）
+        count: 本次在榜条数
+
+    Returns:
+        更新后的状态
+    """
+    _, _, cum, m1, m2, level, trend = advance_state(state, slot - 1)
+    keep = 1 - EWMA_ALPHA
+    return (
+        slot,
+        count,
+        cum + count,
+        keep * m1 + EWMA_ALPHA * count,
+        keep * m2 + EWMA_ALPHA * count * count,
+    ) + holt_update(level, trend, count)
+
+
+def compose_day_states(
+    days: Iterable[Tuple[int, Dict[str, TrendState]]],
+    keywords: Optional[Iterable[str]] = None,
+) -> Tuple[Dict[str, Tuple[float, float, float, float]], float]:
+    """
+    叠加多天的状态，得到截至最新时间点的连续状态
+
+    Args:
+        days: [(当天截止时间点序号, {关键词: 状态}), ...]，从最新一天开始
+        keywords: 只叠加这些关键词（None 表示全部）
+
+    Returns:
+        ({关键词: (一阶矩, 二阶矩, Holt 水平, Holt 趋势)}, 观测权重之和)；
+        权重用于修正一阶 / 二阶矩从零开始维护的偏差
+    """
+    moments: Dict[str, Tuple[float, float, float, float]] = {}
+    weight = 0.0
+    offset = 0
+    wanted = None if keywords is None else set(keywords)
+    for until_slot, states in days:
+        day_decay = decay_factor(offset)
+        if wanted is None:
+            items = states.items()
+        else:
+            items = ((kw, states[kw]) for kw in wanted if kw in states)
+        for keyword, state in items:
+            _, _, _, m1, m2, level, trend = advance_state(state, until_slot)
+            level, trend = holt_decay(level, trend, offset)
+            prev = moments.get(keyword, (0.0, 0.0, 0.0, 0.0))
+            moments[keyword] = (
+                prev[0] + m1 * day_decay,
+                prev[1] + m2 * day_decay,
+                prev[2] + level,
+                prev[3] + trend,
+            )
+        weight += day_decay * (1 - decay_factor(until_slot))
+        offset += until_slot
+    return moments, weight
+
+
+def baseline_from_moments(m1: float, m2: float, weight: float) -> Tuple[float, float]:
+    """由一阶 / 二阶矩和观测权重计算基线均值与方差"""
+    if weight <= 0:
+        return 0.0, 0.0
+    mean = m1 / weight
+    return mean, max(m2 / weight - mean * mean, 0.0)
+
+
+def z_score(window_mean: float, mean: float, variance: float) -> float:
+    """
+    窗口平均在榜条数相对基线的 z 分数
+
+    方差取样本方差、基线均值（计数型数据的泊松方差）与 MIN_VARIANCE 中的最大值。
+    同一标题通常连续多次在榜，相邻抓取的在榜条数高度相关，窗口内的时间点不是
+    独立观测，因此不按窗口时间点数缩小标准差（否则长窗口内的微小波动也会显著）。
+    """
+    variance = max(variance, mean, MIN_VARIANCE)
+    return (window_mean - mean) / variance ** 0.5
@@ -0,0 +1,247 @@
+# coding=utf-8
+"""
+关键词热度预测（Holt 线性趋势模型）
+
+在榜条数序列上维护 Holt 双参数指数平滑的水平 / 趋势状态：
+- 状态随抓取增量更新（与 anomaly 模块的热度状态一同持久化），预测时只需
+  按闭式推进到最新时间点，不再重新读取标题和分词
+- 趋势带阻尼（HOLT_PHI）：在榜条数多为阶梯式变化，未阻尼的趋势外推在长预测步数
+  上误差明显大于沿用当前值，阻尼后多步预测的增量有上限；预测以当前在榜条数为
+  起点叠加阻尼趋势（平滑后的水平滞后于阶梯变化，作为起点时误差更大）
+- Holt 递推是线性的：s_t = A·s_{t-1} + c·x_t。在榜条数不变的 k 个时间点可按
+  s_k = s* + A^k·(s_0 - s*)（s* = (x, 0) 为不动点）一次推进；每天从零开始维护的
+  状态同样可以按 A^k 跨天叠加
+- 矩阵幂按步数缓存，数千个关键词的批量预测只有常数次浮点运算
+- backtest() 在历史在榜序列上回测预测误差与耗时（对比朴素预测和滑动平均）
+"""
+
+import math
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# 水平平滑系数
+HOLT_ALPHA = 0.5
+
+# 趋势平滑系数
+HOLT_BETA = 0.05
+
+# 趋势阻尼系数（每个时间点趋势衰减为原来的 HOLT_PHI 倍，1 表示不阻尼）
+HOLT_PHI = 0.8
+
+# 回测默认的预测步数（抓取时间点数）
+BACKTEST_HORIZONS = (1, 3, 6)
+
+# 回测上升判定：预测值比滑动平均至少高出的在榜条数
+BACKTEST_RISE_MARGIN = 1.0
+
+
+def holt_update(level: float, trend: float, count: int) -> Tuple[float, float]:
+    """
+    用一次观测更新 Holt 状态
+
+    Args:
+        level: 水平
+        trend: 趋势（每个时间点的变化量）
+        count: 本次在榜条数
+
+    Returns:
+        (水平, 趋势)
+    """
+    damped = HOLT_PHI * trend
+    new_level = HOLT_ALPHA * count + (1 - HOLT_ALPHA) * (level + damped)
+    return new_level, HOLT_BETA * (new_level - level) + (1 - HOLT_BETA) * damped
+
+
+@lru_cache(maxsize=1024)
+def holt_power(steps: int) -> Tuple[float, float, float, float]:
+    """
+    Holt 转移矩阵 A 的 steps 次幂 (a11, a12, a21, a22)
+
+    A = [[1-α, (1-α)φ], [-αβ, φ(1-αβ)]]，按二分幂计算并缓存。
+    """
+    if steps <= 0:
+        return 1.0, 0.0, 0.0, 1.0
+    if steps == 1:
+        ab = HOLT_ALPHA * HOLT_BETA
+        return 1 - HOLT_ALPHA, (1 - HOLT_ALPHA) * HOLT_PHI, -ab, HOLT_PHI * (1 - ab)
+    a11, a12, a21, a22 = holt_power(steps // 2)
+    p = (
+        a11 * a11 + a12 * a21, a11 * a12 + a12 * a22,
+        a21 * a11 + a22 * a21, a21 * a12 + a22 * a22,
+    )
+    if steps % 2:
+        b11, b12, b21, b22 = holt_power(1)
+        p = (
+            p[0] * b11 + p[1] * b21, p[0] * b12 + p[1] * b22,
+            p[2] * b11 + p[3] * b21, p[2] * b12 + p[3] * b22,
+        )
+    return p
+
+
+def holt_decay(level: float, trend: float, steps: int) -> Tuple[float, float]:
+    """对（零输入的）Holt 状态施加 steps 个时间点的转移：A^steps · (水平, 趋势)"""
+    a11, a12, a21, a22 = holt_power(steps)
+    return a11 * level + a12 * trend, a21 * level + a22 * trend
+
+
+def holt_advance(level: float, trend: float, count: int, steps: int) -> Tuple[float, float]:
+    """
+    在榜条数保持为 count 的情况下把 Holt 状态推进 steps 个时间点
+
+    Returns:
+        (水平, 趋势)
+    """
+    if steps <= 0:
+        return level, trend
+    d_level, d_trend = holt_decay(level - count, trend, steps)
+    return count + d_level, d_trend
+
+
+def holt_forecast(current: float, trend: float, steps: int) -> float:
+    """
+    预测 steps 个时间点后的在榜条数（不小于 0）
+
+    以当前在榜条数为起点叠加趋势，趋势每个时间点按 HOLT_PHI 阻尼。
+    """
+    if HOLT_PHI == 1:
+        return max(current + trend * steps, 0.0)
+    damped_steps = HOLT_PHI * (1 - HOLT_PHI ** steps) / (1 - HOLT_PHI)
+    return max(current + trend * damped_steps, 0.0)
+
+
+def backtest(
+    series: Dict[str, Sequence[int]],
+    horizons: Iterable[int] = BACKTEST_HORIZONS,
+    warmup: int = 12,
+    ewma_alpha: float = 0.1,
+) -> Dict:
+    """
+    在历史在榜序列上回测预测效果
+
+    每个时间点（预热期之后）对全部关键词做一次批量预测，与 horizon 个时间点后的
+    实际值比较。对比对象为朴素预测（沿用当前值）和指数加权滑动平均。
+    另统计上升判定（Holt 预测值比滑动平均高出 BACKTEST_RISE_MARGIN）的命中率
+    （实际值同样高出滑动平均）及全部样本中实际高出的基准比例，
+    对应热点预测的实际用法。
+
+    Args:
+        series: {关键词: 每个抓取时间点的在榜条数}（等长）
+        horizons: 预测步数列表
+        warmup: 预热时间点数（不计入误差）
+        ewma_alpha: 滑动平均基线的衰减系数
+
+    Returns:
+        {
+            "keywords": 关键词数,
+            "slots": 时间点数,
+            "horizons": {步数: {"holt"/"naive"/"ewma": {"mae", "rmse"}, "samples",
+                               "rising": {"predicted", "precision", "base_rate"}}},
+            "update_us_per_keyword": 每个关键词每次更新的平均耗时（微秒）,
+            "forecast_ms": 一次批量预测全部关键词的平均耗时（毫秒）
+        }
+    """
+    horizons = sorted({h for h in horizons if h > 0})
+    keywords = list(series)
+    slot_count = max((len(values) for values in series.values()), default=0)
+    models = ("holt", "naive", "ewma")
+    errors = {h: {m: [0.0, 0.0] for m in models} for h in horizons}
+    samples = {h: 0 for h in horizons}
+    rising = {h: [0, 0, 0] for h in horizons}  # [判定上升次数, 其中实际上升次数, 全部实际上升次数]
+    # 待评估的预测：{目标时间点: [(步数, [(关键词序号, holt, naive, ewma), ...])]}
+    pending: Dict[int, List[Tuple[int, List[Tuple[int, float, float, float]]]]] = {}
+
+    levels = [0.0] * len(keywords)
+    trends = [0.0] * len(keywords)
+    means = [0.0] * len(keywords)
+    update_time = 0.0
+    forecast_time = 0.0
+    forecast_rounds = 0
+
+    for t in range(slot_count):
+        values = [series[kw][t] if t < len(series[kw]) else 0 for kw in keywords]
+
+        for h, predictions in pending.pop(t, []):
+            for i, holt, naive, ewma in predictions:
+                actual = values[i]
+                for model, predicted in zip(models, (holt, naive, ewma)):
+                    diff = predicted - actual
+                    errors[h][model][0] += abs(diff)
+                    errors[h][model][1] += diff * diff
+                actual_rise = actual - ewma >= BACKTEST_RISE_MARGIN
+                rising[h][2] += actual_rise
+                if holt - ewma >= BACKTEST_RISE_MARGIN:
+                    rising[h][0] += 1
+                    rising[h][1] += actual_rise
+            samples[h] += len(predictions)
+
+        start = time.perf_counter()
+        for i, x in enumerate(values):
+            levels[i], trends[i] = holt_update(levels[i], trends[i], x)
+            means[i] += ewma_alpha * (x - means[i])
+        update_time += time.perf_counter() - start
+
+        if t + 1 < warmup:
+            continue
+        start = time.perf_counter()
+        for h in horizons:
+            if t + h >= slot_count:
+                continue
+            predictions = [
+                (i, holt_forecast(values[i], trends[i], h), float(values[i]), means[i])
+                for i in range(len(keywords))
+            ]
+            pending.setdefault(t + h, []).append((h, predictions))
+        forecast_time += time.perf_counter() - start
+        forecast_rounds += 1
+
+    report = {}
+    for h in horizons:
+        n = samples[h]
+        report[h] = {
+            model: {
+                "mae": round(errors[h][model][0] / n, 4) if n else None,
+                "rmse": round(math.sqrt(errors[h][model][1] / n), 4) if n else None,
+            }
+            for model in models
+        }
+        report[h]["samples"] = n
+        report[h]["rising"] = {
+            "predicted": rising[h][0],
+            "precision": round(rising[h][1] / rising[h][0], 4) if rising[h][0] else None,
+            "base_rate": round(rising[h][2] / n, 4) if n else None,
+        }
+
+    updates = len(keywords) * slot_count
+    return {
+        "keywords": len(keywords),
+        "slots": slot_count,
+        "horizons": report,
+        "update_us_per_keyword": round(update_time / updates * 1e6, 3) if updates else None,
+        "forecast_ms": round(forecast_time / forecast_rounds * 1000, 3) if forecast_rounds else None,
+    }
+
+
+def series_from_log(
+    slot_count: int,
+    log_rows: Iterable[Tuple[str, int, int]],
+    keywords: Optional[Iterable[str]] = None,
+) -> Dict[str, List[int]]:
+    """
+    由状态变化日志还原每个时间点的在榜条数序列
+
+    Args:
+        slot_count: 当天时间点数
+        log_rows: [(关键词, 时间点序号, 变化后的在榜条数), ...]
+        keywords: 需要补齐的关键词（当天没有变化记录的关键词序列全为 0）
+
+    Returns:
+        {关键词: [在榜条数, ...]}（长度为 slot_count）
+    """
+    series: Dict[str, List[int]] = {kw: [0] * slot_count for kw in keywords or ()}
+    for keyword, slot, count in sorted(log_rows, key=lambda row: (row[0], row[1])):
+        values = series.setdefault(keyword, [0] * slot_count)
+        for i in range(slot - 1, slot_count):
+            values[i] = count
+    return series
@@ -240,6 +240,207 @@ def load_frequency_words(
     return processed_groups, filter_words, global_filters
 
 
+# 匹配器缓存数量（按词组配置内容区分）
+MATCHER_CACHE_SIZE = 8
+
+# 单个匹配器缓存的标题数上限（超出后清空重建，防止常驻进程内存增长）
+MATCH_MEMO_SIZE = 100000
+
+
+def _compile_words(word_configs: List) -> Tuple[Tuple[str, ...], Tuple]:
+    """把词配置拆分为 (小写子串元组, 正则元组)，与 _word_matches 判定一致"""
+    plain = []
+    patterns = []
+    for word_config in word_configs:
+        if isinstance(word_config, str):
+            plain.append(word_config.lower())
+        elif word_config.get("is_regex") and word_config.get("pattern"):
+            patterns.append(word_config["pattern"])
+        else:
+            plain.append(word_config["word"].lower())
+    return tuple(plain), tuple(patterns)
+
+
+class WordGroupMatcher:
+    """
+    预编译的词组匹配器
+
+    一次遍历同时完成全局过滤、过滤词和词组判定，返回标题命中的第一个词组，
+    结果按标题缓存（同一次运行中多次统计只匹配一次）。词组配置视为只读。
+
+    Examples:
+        >>> matcher = get_word_group_matcher(word_groups, filter_words, global_filters)
+        >>> matcher.first_group("华为发布新手机")
+        0
+    """
+
+    def __init__(
+        self,
+        word_groups: List[Dict],
+        filter_words: List,
+        global_filters: Optional[List[str]] = None,
+    ):
+        self._global_filters = tuple(word.lower() for word in global_filters or ())
+        self._filter_plain, self._filter_patterns = _compile_words(filter_words)
+        self._groups = tuple(
+            _compile_words(group["required"]) + _compile_words(group["normal"])
+            for group in word_groups
+        )
+        self._memo: Dict[str, int] = {}
+
+    def first_group(self, title: str) -> int:
+        """
+        获取标题命中的第一个词组序号
+
+        Args:
+            title: 标题文本
+
+        Returns:
+            词组序号；被过滤、未命中或未配置词组时返回 -1
+        """
+        memo = self._memo
+        index = memo.get(title)
+        if index is None:
+            index = self._match(title)
+            if len(memo) >= MATCH_MEMO_SIZE:
+                memo.clear()
+            memo[title] = index
+        return index
+
+    def matches(self, title: str) -> bool:
+        """与 matches_word_groups 判定一致（未配置词组时只做全局过滤）"""
+        if not self._groups:
+            title_lower = _normalize_title(title)
+            return bool(title_lower) and not any(
+                word in title_lower for word in self._global_filters
+            )
+        return self.first_group(title) >= 0
+
+    def _match(self, title: str) -> int:
+        title_lower = _normalize_title(title)
+        if not title_lower or not self._groups:
+            return -1
+
+        # 全局过滤检查（优先级最高）
+        for word in self._global_filters:
+            if word in title_lower:
+                return -1
+
+        # 过滤词检查
+        for word in self._filter_plain:
+            if word in title_lower:
+                return -1
+        for pattern in self._filter_patterns:
+            if pattern.search(title_lower):
+                return -1
+
+        # 词组匹配：必须词全部命中，普通词任一命中
+        # （多数词组只有一两个词，显式循环比 all/any + 生成器开销更小）
+        for index, (req_plain, req_patterns, normal_plain, normal_patterns) in enumerate(self._groups):
+            required_ok = True
+            for word in req_plain:
+                if word not in title_lower:
+                    required_ok = False
+                    break
+            if required_ok:
+                for pattern in req_patterns:
+                    if not pattern.search(title_lower):
+                        required_ok = False
+                        break
+            if not required_ok:
+                continue
+
+            if not normal_plain and not normal_patterns:
+                return index
+            for word in normal_plain:
+                if word in title_lower:
+                    return index
+            for pattern in normal_patterns:
+                if pattern.search(title_lower):
+                    return index
+
+        return -1
+
+
+def _normalize_title(title) -> str:
+    """小写标题；非字符串或空白标题返回空字符串"""
+    if not isinstance(title, str):
+        title = str(title) if title is not None else ""
+    if not title.strip():
+        return ""
+    return title.lower()
+
+
+def _config_signature(
+    word_groups: List[Dict],
+    filter_words: List,
+    global_filters: Optional[List[str]],
+) -> Tuple:
+    """词组配置的内容签名（重新加载的同一份配置得到相同签名）"""
+    def word_key(word_config):
+        if isinstance(word_config, str):
+            return (False, word_config)
+        is_regex = bool(word_config.get("is_regex") and word_config.get("pattern"))
+        return (is_regex, word_config["word"])
+
+    return (
+        tuple(
+            (
+                tuple(word_key(w) for w in group["required"]),
+                tuple(word_key(w) for w in group["normal"]),
+            )
+            for group in word_groups
+        ),
+        tuple(word_key(w) for w in filter_words),
+        tuple(global_filters or ()),
+    )
+
+
+_matcher_cache: Dict[Tuple, WordGroupMatcher] = {}
+_last_matcher: Optional[Tuple[List, List, Optional[List], WordGroupMatcher]] = None
+
+
+def get_word_group_matcher(
+    word_groups: List[Dict],
+    filter_words: List,
+    global_filters: Optional[List[str]] = None,
+) -> WordGroupMatcher:
+    """
+    获取词组匹配器（同一份配置复用同一个实例及其标题缓存）
+
+    逐条调用时直接按对象身份命中上一次的匹配器；配置被重新加载时按内容签名查找。
+
+    Args:
+        word_groups: 词组列表
+        filter_words: 过滤词列表
+        global_filters: 全局过滤词列表
+
+    Returns:
+        WordGroupMatcher 实例
+    """
+    global _last_matcher
+
+    last = _last_matcher
+    if (
+        last is not None
+        and last[0] is word_groups
+        and last[1] is filter_words
+        and last[2] is global_filters
+    ):
+        return last[3]
+
+    signature = _config_signature(word_groups, filter_words, global_filters)
+    matcher = _matcher_cache.get(signature)
+    if matcher is None:
+        if len(_matcher_cache) >= MATCHER_CACHE_SIZE:
+            _matcher_cache.pop(next(iter(_matcher_cache)))
+        matcher = WordGroupMatcher(word_groups, filter_words, global_filters)
+        _matcher_cache[signature] = matcher
+
+    _last_matcher = (word_groups, filter_words, global_filters, matcher)
+    return matcher
+
+
 def matches_word_groups(
     title: str,
     word_groups: List[Dict],
@@ -258,49 +459,4 @@ def matches_word_groups(
     Returns:
         是否匹配
     """
-    # 防御性类型检查：确保 title 是有效字符串
-    if not isinstance(title, str):
-        title = str(title) if title is not None else ""
-    if not title.strip():
-        return False
-
-    title_lower = title.lower()
-
-    # 全局过滤检查（优先级最高）
-    if global_filters:
-        if any(global_word.lower() in title_lower for global_word in global_filters):
-            return False
-
-    # 如果没有配置词组，则匹配所有标题（支持显示全部新闻）
-    if not word_groups:
-        return True
-
-    # 过滤词检查（兼容新旧格式）
-    for filter_item in filter_words:
-        if _word_matches(filter_item, title_lower):
-            return False
-
-    # 词组匹配检查
-    for group in word_groups:
-        required_words = group["required"]
-        normal_words = group["normal"]
-
-        # 必须词检查
-        if required_words:
-            all_required_present = all(
-                _word_matches(req_item, title_lower) for req_item in required_words
-            )
-            if not all_required_present:
-                continue
-
-        # 普通词检查
-        if normal_words:
-            any_normal_present = any(
-                _word_matches(normal_item, title_lower) for normal_item in normal_words
-            )
-            if not any_normal_present:
-                continue
-
-        return True
-
-    return False
+    return get_word_group_matcher(word_groups, filter_words, global_filters).matches(title)
@@ -0,0 +1,84 @@
+# coding=utf-8
+"""
+标题关键词提取模块
+
+抓取端（写入每日关键词统计表）与 MCP 分析端共用同一套提取规则，
+保证预计算的统计结果与实时提取的结果一致。
+"""
+
+import re
+from typing import List, Tuple
+
+from trendradar.core.tokenizer import TOKENIZER_VERSION, get_tokenizer
+
+
+# 提取规则版本号：规则变化时递增，旧版本的预计算统计将被视为不可用
+KEYWORD_EXTRACTOR_VERSION = 3
+
+# 分析用停用词
+KEYWORD_STOPWORDS = frozenset({
+    '的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一', '一个',
+    '上', '也', '很', '到', '说', '要', '去', '你', '会', '着', '没有', '看', '好',
+    '自己', '这',
+    # 分词后会单独出现的新闻套话
+    '回应', '发布', '表示', '最新', '引发', '热议', '关注', '网友', '官方', '曝光',
+    '透露', '今天', '今日', '什么', '怎么', '如何', '为什么', '可能', '已经',
+    '哪些', '为何', '有多', '如何评价', '如何看待',
+})
+
+_URL_PATTERN = re.compile(r'http[s]?://\S+')
+
+
+def get_extractor_signature() -> str:
+    """
+    获取关键词提取规则签名
+
+    由提取规则版本、分词规则版本和词典指纹组成，任一变化（包括修改
+    frequency_words.txt）都会使已有的预计算关键词统计失效。
+    """
+    return f"{KEYWORD_EXTRACTOR_VERSION}.{TOKENIZER_VERSION}:{get_tokenizer().fingerprint}"
+
+
+def extract_keywords(title: str, min_length: int = 2) -> List[str]:
+    """
+    从标题中提取关键词
+
+    只返回完整的词：未登录长片段拆出的二元组只是碎片（如"特朗"、"朗普"），
+    不作为关键词返回。
+
+    Args:
+        title: 标题文本
+        min_length: 最小关键词长度
+
+    Returns:
+        关键词列表（按首次出现顺序去重，一个标题中的同一关键词只计一次）
+    """
+    # 移除URL后分词
+    title = _URL_PATTERN.sub(' ', title)
+
+    keywords = []
+    seen = set()
+    for word in get_tokenizer().tokenize_words(title):
+        if len(word) >= min_length and word not in KEYWORD_STOPWORDS and word not in seen:
+            seen.add(word)
+            keywords.append(word)
+    return keywords
+
+
+def extract_keyword_pairs(title: str, min_length: int = 2) -> List[Tuple[str, str]]:
+    """
+    提取标题中的关键词共现对
+
+    Args:
+        title: 标题文本
+        min_length: 最小关键词长度
+
+    Returns:
+        [(keyword1, keyword2), ...]，每对按字典序排列
+    """
+    keywords = extract_keywords(title, min_length)
+    pairs = []
+    for i, kw1 in enumerate(keywords):
+        for kw2 in keywords[i + 1:]:
+            pairs.append((kw1, kw2) if kw1 <= kw2 else (kw2, kw1))
+    return pairs
@@ -176,6 +176,7 @@ def _load_rss_config(config_data: Dict) -> Dict:
         "FRESHNESS_FILTER": {
             "ENABLED": freshness_filter.get("enabled", True),  # 默认启用
             "MAX_AGE_DAYS": max_age_days,
+            "SKIP_ON_FETCH": freshness_filter.get("skip_on_fetch", False),  # 默认全部入库
         },
     }
 
@@ -246,6 +247,7 @@ def _load_ai_analysis_config(config_data: Dict) -> Dict:
     """加载 AI 分析配置（功能配置，模型配置见 _load_ai_config）"""
     ai_config = config_data.get("ai_analysis", {})
     analysis_window = ai_config.get("analysis_window", {})
+    cache_config = ai_config.get("cache", {})
 
     enabled_env = _get_env_bool("AI_ANALYSIS_ENABLED")
     window_enabled_env = _get_env_bool("AI_ANALYSIS_WINDOW_ENABLED")
@@ -257,8 +259,13 @@ def _load_ai_analysis_config(config_data: Dict) -> Dict:
         "PROMPT_FILE": ai_config.get("prompt_file", "ai_analysis_prompt.txt"),
         "MODE": ai_config.get("mode", "follow_report"),
         "MAX_NEWS_FOR_ANALYSIS": ai_config.get("max_news_for_analysis", 50),
+        "MAX_CONTEXT_TOKENS": ai_config.get("max_context_tokens", 0),
         "INCLUDE_RSS": ai_config.get("include_rss", True),
         "INCLUDE_RANK_TIMELINE": ai_config.get("include_rank_timeline", False),
+        "CACHE": {
+            "ENABLED": cache_config.get("enabled", True),
+            "DELTA_ANALYSIS": cache_config.get("delta_analysis", False),
+        },
         "ANALYSIS_WINDOW": {
             "ENABLED": window_enabled_env if window_enabled_env is not None else analysis_window.get("enabled", False),
             "TIME_RANGE": {
@@ -294,6 +301,7 @@ def _load_storage_config(config_data: Dict) -> Dict:
     txt_enabled_env = _get_env_bool("STORAGE_TXT_ENABLED")
     html_enabled_env = _get_env_bool("STORAGE_HTML_ENABLED")
     pull_enabled_env = _get_env_bool("PULL_ENABLED")
+    upload_delay_env = _get_env_int_or_none("REMOTE_UPLOAD_DELAY")
 
     return {
         "BACKEND": _get_env_str("STORAGE_BACKEND") or storage.get("backend", "auto"),
@@ -305,6 +313,7 @@ def _load_storage_config(config_data: Dict) -> Dict:
         "LOCAL": {
             "DATA_DIR": local.get("data_dir", "output"),
             "RETENTION_DAYS": _get_env_int("LOCAL_RETENTION_DAYS") or local.get("retention_days", 0),
+            "ARCHIVE_AFTER_DAYS": _get_env_int("LOCAL_ARCHIVE_AFTER_DAYS") or local.get("archive_after_days", 0),
         },
         "REMOTE": {
             "ENDPOINT_URL": _get_env_str("S3_ENDPOINT_URL") or remote.get("endpoint_url", ""),
@@ -313,6 +322,7 @@ def _load_storage_config(config_data: Dict) -> Dict:
             "SECRET_ACCESS_KEY": _get_env_str("S3_SECRET_ACCESS_KEY") or remote.get("secret_access_key", ""),
             "REGION": _get_env_str("S3_REGION") or remote.get("region", ""),
             "RETENTION_DAYS": _get_env_int("REMOTE_RETENTION_DAYS") or remote.get("retention_days", 0),
+            "UPLOAD_DELAY": upload_delay_env if upload_delay_env is not None else remote.get("upload_delay", 30),
         },
         "PULL": {
             "ENABLED": pull_enabled_env if pull_enabled_env is not None else pull.get("enabled", False),
@@ -0,0 +1,63 @@
+# coding=utf-8
+"""
+标题 n-gram 倒排索引与话题时间序列规则
+
+抓取端（写入每日标题索引 / 话题统计表）与 MCP 分析端共用同一套规则：
+- 标题按小写后的字符二元组建立倒排索引，任意子串查询都可以先用二元组求交缩小候选，
+  再做子串校验，结果与逐条 `topic.lower() in title.lower()` 完全一致
+- frequency_words.txt 中的词（用户词典）作为预置话题，抓取时直接维护每日计数
+  和每个抓取时间点的在榜条数 / 排名聚合
+"""
+
+import hashlib
+from typing import Iterable, List, Set
+
+from trendradar.core.tokenizer import get_tokenizer
+
+
+# 索引规则版本号：n-gram 规则或统计口径变化时递增，旧索引将被重建
+TITLE_INDEX_VERSION = 1
+
+
+def title_grams(text: str) -> Set[str]:
+    """
+    提取文本的字符二元组（小写）
+
+    不做分词与去标点，保证查询词的二元组一定是包含它的标题二元组的子集。
+
+    Args:
+        text: 标题或查询词
+
+    Returns:
+        二元组集合（长度不足 2 时为空集合）
+    """
+    text = (text or "").lower()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def get_topic_words() -> List[str]:
+    """
+    获取预置话题词（用户词典中的词，小写去重后排序）
+
+    Returns:
+        话题词列表
+    """
+    words = {w.strip().lower() for w in get_tokenizer().user_words}
+    words.discard("")
+    return sorted(words)
+
+
+def match_topics(title: str, topics: Iterable[str]) -> List[str]:
+    """返回标题包含的话题词（大小写不敏感的子串匹配）"""
+    lowered = title.lower()
+    return [topic for topic in topics if topic in lowered]
+
+
+def get_title_index_signature() -> str:
+    """
+    获取标题索引签名
+
+    由索引规则版本和预置话题词指纹组成，修改 frequency_words.txt 后话题统计会被重建。
+    """
+    digest = hashlib.md5("\n".join(get_topic_words()).encode("utf-8")).hexdigest()[:8]
+    return f"{TITLE_INDEX_VERSION}:{digest}"
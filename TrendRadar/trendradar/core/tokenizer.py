@@ -0,0 +1,295 @@
+# coding=utf-8
+"""
+中文分词模块
+
+纯 Python 实现的轻量分词器（不引入 jieba 等额外依赖），供抓取端和 MCP 分析端共用：
+- 词典正向最大匹配：内置常见新闻词汇 + 用户词典（默认从 frequency_words.txt 提取）
+- 未登录片段：按单字虚词切开，2~4 字片段整体保留，更长片段输出重叠二元组
+  （二元组只用于检索匹配和索引，tokenize_words() 不返回，不会作为关键词展示或统计）
+- 非中文部分（英文、数字等）按连续字符整体输出
+- 标题 → 分词结果使用 LRU 缓存，同一标题在多次分析中只切分一次
+"""
+
+import hashlib
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, List, Optional, Set, Tuple
+
+
+# 分词规则版本号：切分算法变化时递增
+TOKENIZER_VERSION = 1
+
+# LRU 缓存容量（标题数）
+TOKENIZER_CACHE_SIZE = 50000
+
+# 未登录片段整体保留的最大长度，超过则输出重叠二元组
+MAX_UNKNOWN_WORD_LEN = 4
+
+# 内置常见新闻词汇
+BUILTIN_WORDS = (
+    # 国家与地区
+    "中国", "美国", "日本", "韩国", "朝鲜", "俄罗斯", "乌克兰", "英国", "法国", "德国",
+    "意大利", "西班牙", "加拿大", "澳大利亚", "印度", "巴西", "以色列", "伊朗", "伊拉克",
+    "叙利亚", "土耳其", "沙特", "巴勒斯坦", "加沙", "黎巴嫩", "埃及", "南非", "墨西哥",
+    "阿根廷", "委内瑞拉", "越南", "泰国", "菲律宾", "新加坡", "马来西亚", "印尼", "缅甸",
+    "柬埔寨", "巴基斯坦", "阿富汗", "欧盟", "欧洲", "亚洲", "非洲", "中东", "北约", "联合国",
+    "台湾", "香港", "澳门", "北京", "上海", "广州", "深圳", "杭州", "成都", "重庆", "武汉",
+    "南京", "天津", "西安", "苏州", "长沙", "郑州", "东北", "新疆", "西藏", "海南",
+    # 机构与身份
+    "外交部", "国防部", "商务部", "教育部", "公安部", "财政部", "央行", "国务院", "白宫",
+    "政府", "总统", "总理", "首相", "部长", "外长", "议员", "议会", "国会", "法院", "警方",
+    "军方", "官方", "媒体", "记者", "专家", "学者", "网友", "粉丝", "球迷", "明星", "演员",
+    "歌手", "导演", "选手", "球员", "教练", "学生", "老师", "家长", "孩子", "老人", "女子",
+    "男子", "女孩", "男孩", "司机", "医生", "患者", "公司", "企业", "集团", "银行", "大学",
+    "学校", "医院", "平台", "品牌", "球队", "国足", "中超", "女排", "男篮", "女篮",
+    # 经济与科技
+    "经济", "市场", "股市", "港股", "美股", "基金", "股票", "债券", "汇率", "人民币",
+    "美元", "黄金", "油价", "房价", "楼市", "房地产", "关税", "贸易", "出口", "进口", "消费",
+    "投资", "融资", "上市", "财报", "营收", "利润", "亏损", "裁员", "就业", "工资", "养老金",
+    "医保", "社保", "退休", "科技", "技术", "芯片", "半导体", "人工智能", "大模型", "机器人",
+    "手机", "电脑", "汽车", "新能源", "电动车", "电池", "充电", "自动驾驶", "智能", "算力",
+    "互联网", "数据", "网络", "游戏", "电影", "电视剧", "综艺", "短剧", "直播", "视频",
+    "航天", "卫星", "火箭", "飞船", "空间站", "能源", "光伏", "核电", "电力",
+    # 社会与事件
+    "事故", "火灾", "地震", "台风", "暴雨", "洪水", "降温", "寒潮", "天气", "气温", "疫情",
+    "病毒", "流感", "疫苗", "安全", "调查", "通报", "回应", "声明", "辟谣", "谣言", "举报",
+    "处罚", "判决", "起诉", "逮捕", "死亡", "受伤", "失踪", "救援", "冲突", "战争", "停火",
+    "谈判", "会谈", "访问", "会见", "峰会", "会议", "选举", "制裁", "军演", "导弹", "无人机",
+    "航母", "军队", "国防", "外交", "政策", "改革", "发展", "合作", "协议", "计划", "方案",
+    "项目", "工程", "比赛", "冠军", "决赛", "半决赛", "奥运", "世界杯", "联赛", "春节", "元旦",
+    "国庆", "中秋", "假期", "旅游", "景区", "高铁", "机场", "航班", "地铁", "交通", "高考",
+    "考研", "教育", "招生", "毕业", "婚礼", "离婚", "结婚", "恋情", "官宣", "道歉",
+    "身亡", "去世", "获刑", "吸毒", "召开", "跨年", "年度", "国家", "世界", "历史", "家庭",
+    "工作", "领导", "主任", "产业", "运动", "影响", "挑战", "持续", "发现", "疑似", "高速",
+    "第一", "一次", "一年", "集体", "新高",
+    # 新闻人物
+    "特朗普", "拜登", "普京", "泽连斯基", "马斯克", "内塔尼亚胡", "马克龙", "赖清德",
+    "高市早苗", "石破茂", "爱泼斯坦", "尼日利亚", "委员会",
+    # 常见动词与时间
+    "宣布", "发布", "表示", "曝光", "引发", "热议", "关注", "透露", "确认", "否认", "警告",
+    "呼吁", "要求", "支持", "反对", "启动", "开启", "推出", "上线", "下架", "暂停", "恢复",
+    "晋级", "横扫", "对手", "言论", "错误", "事件", "问题", "情况", "原因", "结果", "真相",
+    "增长", "下降", "上涨", "下跌", "突破", "创新高", "首次", "最新", "今年", "明年", "去年",
+    "今天", "明天", "昨天", "今日", "本周", "全国", "全球", "国际", "国内", "海外",
+    # 疑问词（登录后可从长片段中切出，再由调用方按停用词过滤）
+    "什么", "如何", "哪些", "怎么", "为什么", "为何", "有多", "如何评价", "如何看待", "可能",
+    "没有", "自己",
+)
+
+# 单字虚词：未登录片段中遇到即切开（不会拆开已登录的词）
+FUNCTION_CHARS = frozenset(
+    "的了是在和与及或将被把对向从为于等也都就还又再这那个吗呢吧啊着过让给跟同并而但却已其之所此该各每称"
+)
+
+_CJK_RUN_PATTERN = re.compile(r'[\u4e00-\u9fff]+|[^\W\u4e00-\u9fff]+')
+_CJK_CHAR_PATTERN = re.compile(r'[\u4e00-\u9fff]')
+_REGEX_META_PATTERN = re.compile(r'[\\^$.*+?()\[\]{}]')
+
+
+def load_user_words(frequency_file: Optional[str] = None) -> Set[str]:
+    """
+    从频率词配置文件提取用户词典
+
+    普通词、必须词（+）、过滤词（!）、显示别名（=>）、组别名（[...]）以及
+    正则中的纯文本分支（如 /华为|任正非/）都会作为词典词。
+
+    Args:
+        frequency_file: 频率词文件路径，默认从环境变量 FREQUENCY_WORDS_PATH 获取
+            或使用项目根目录下的 config/frequency_words.txt
+
+    Returns:
+        词集合（文件不存在时返回空集合）
+    """
+    if frequency_file is None:
+        default_path = Path(__file__).parent.parent.parent / "config" / "frequency_words.txt"
+        frequency_file = os.environ.get("FREQUENCY_WORDS_PATH", str(default_path))
+
+    path = Path(frequency_file)
+    if not path.exists():
+        return set()
+
+    words = set()
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#") or line.startswith("@"):
+                continue
+
+            # 区域标记 / 组别名
+            if line.startswith("[") and line.endswith("]"):
+                words.add(line[1:-1].strip())
+                continue
+
+            # 显示别名
+            if "=>" in line:
+                line, alias = line.split("=>", 1)
+                words.add(alias.strip())
+                line = line.strip()
+
+            line = line.lstrip("+!").strip()
+
+            # 正则：只取纯文本分支
+            if len(line) > 2 and line.startswith("/") and line.endswith("/"):
+                for branch in line[1:-1].split("|"):
+                    branch = branch.replace(r"\b", "").strip()
+                    if branch and not _REGEX_META_PATTERN.search(branch):
+                        words.add(branch)
+                continue
+
+            words.add(line)
+
+    # 只有包含汉字的词参与中文切分，区域名等非词条目一并排除
+    return {w for w in words if _CJK_CHAR_PATTERN.search(w) and " " not in w and "/" not in w}
+
+
+class ChineseTokenizer:
+    """
+    词典正向最大匹配分词器
+
+    Examples:
+        >>> tokenizer = ChineseTokenizer(user_words={"斩杀线"})
+        >>> tokenizer.tokenize("美国斩杀线引发热议")
+        ['美国', '斩杀线', '引发', '热议']
+    """
+
+    def __init__(
+        self,
+        user_words: Optional[Iterable[str]] = None,
+        cache_size: int = TOKENIZER_CACHE_SIZE
+    ):
+        """
+        Args:
+            user_words: 用户词典（与内置词汇合并）
+            cache_size: LRU 缓存容量
+        """
+        self.user_words = set(user_words or ())
+        self.words = set(BUILTIN_WORDS) | self.user_words
+        # 候选长度从长到短，只尝试词典中实际存在的长度
+        self._lengths = sorted({len(w) for w in self.words if len(w) >= 2}, reverse=True)
+        self._cached_segment = lru_cache(maxsize=cache_size)(self._segment)
+        self.fingerprint = hashlib.md5(
+            "\n".join(sorted(self.words)).encode("utf-8")
+        ).hexdigest()[:8]
+
+    def tokenize(self, text: str) -> List[str]:
+        """
+        分词（带 LRU 缓存）
+
+        Args:
+            text: 输入文本
+
+        Returns:
+            词列表（按出现顺序，可能包含单字和重复词，由调用方过滤）
+        """
+        return [token for group in self._cached_segment(text) for token in group]
+
+    def tokenize_words(self, text: str) -> List[str]:
+        """
+        分词，只返回完整的词（带 LRU 缓存）
+
+        与 tokenize() 相同，但不包含未登录长片段拆出的二元组碎片（如"特朗普访华"
+        未登录时的"特朗"、"朗普"）。用于关键词提取、统计等对外展示的场景；
+        检索匹配和索引使用 tokenize()。
+
+        Args:
+            text: 输入文本
+
+        Returns:
+            词列表（按出现顺序）
+        """
+        return [group[0] for group in self._cached_segment(text) if len(group) == 1]
+
+    def segment(self, text: str) -> Tuple[Tuple[str, ...], ...]:
+        """
+        分组分词（带 LRU 缓存）
+
+        每个登录词、短未登录片段、非中文片段各为单元素组；同一未登录长片段拆出的
+        二元组归为一组（多元素组即碎片），便于调用方区分"词"和"碎片"。
+
+        Args:
+            text: 输入文本
+
+        Returns:
+            词组元组，按出现顺序
+        """
+        return self._cached_segment(text)
+
+    def cache_info(self):
+        """返回 LRU 缓存统计"""
+        return self._cached_segment.cache_info()
+
+    def _segment(self, text: str) -> Tuple[Tuple[str, ...], ...]:
+        groups: List[Tuple[str, ...]] = []
+        for match in _CJK_RUN_PATTERN.finditer(text):
+            run = match.group()
+            if _CJK_CHAR_PATTERN.match(run):
+                self._segment_cjk(run, groups)
+            else:
+                groups.append((run,))
+        return tuple(groups)
+
+    def _segment_cjk(self, run: str, groups: List[Tuple[str, ...]]) -> None:
+        """对连续汉字片段做正向最大匹配，未登录部分交给 _emit_unknown"""
+        words = self.words
+        n = len(run)
+        i = 0
+        unknown_start = 0
+
+        while i < n:
+            matched = None
+            for length in self._lengths:
+                if i + length <= n and run[i:i + length] in words:
+                    matched = run[i:i + length]
+                    break
+
+            if matched:
+                self._emit_unknown(run[unknown_start:i], groups)
+                groups.append((matched,))
+                i += len(matched)
+                unknown_start = i
+            elif run[i] in FUNCTION_CHARS:
+                self._emit_unknown(run[unknown_start:i], groups)
+                i += 1
+                unknown_start = i
+            else:
+                i += 1
+
+        self._emit_unknown(run[unknown_start:], groups)
+
+    @staticmethod
+    def _emit_unknown(span: str, groups: List[Tuple[str, ...]]) -> None:
+        """未登录片段：短片段整体保留，长片段输出重叠二元组（同属一组）"""
+        if not span:
+            return
+        if len(span) <= MAX_UNKNOWN_WORD_LEN:
+            groups.append((span,))
+        else:
+            groups.append(tuple(span[i:i + 2] for i in range(len(span) - 1)))
+
+
+_default_tokenizer: Optional[ChineseTokenizer] = None
+
+
+def get_tokenizer() -> ChineseTokenizer:
+    """
+    获取全局分词器实例（用户词典来自 frequency_words.txt）
+
+    Returns:
+        ChineseTokenizer 实例
+    """
+    global _default_tokenizer
+    if _default_tokenizer is None:
+        _default_tokenizer = ChineseTokenizer(user_words=load_user_words())
+    return _default_tokenizer
+
+
+def tokenize(text: str) -> List[str]:
+    """使用全局分词器分词（含二元组碎片，用于检索匹配）"""
+    return get_tokenizer().tokenize(text)
+
+
+def tokenize_words(text: str) -> List[str]:
+    """使用全局分词器分词，只返回完整的词（用于关键词提取和统计）"""
+    return get_tokenizer().tokenize_words(text)
@@ -8,7 +8,7 @@ RSS 抓取器
 import time
 import random
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple, Callable
 
 import requests
@@ -42,6 +42,7 @@ class RSSFetcher:
         timezone: str = DEFAULT_TIMEZONE,
         freshness_enabled: bool = True,
         default_max_age_days: int = 3,
+        skip_stale_on_fetch: bool = False,
     ):
         """
         初始化抓取器
@@ -55,6 +56,8 @@ class RSSFetcher:
             timezone: 时区配置（如 'Asia/Shanghai'）
             freshness_enabled: 是否启用新鲜度过滤
             default_max_age_days: 默认最大文章年龄（天）
+            skip_stale_on_fetch: 抓取时即跳过过期文章（不入库）；默认 False，
+                所有文章入库，过期文章只在推送阶段过滤
         """
         self.feeds = [f for f in feeds if f.enabled]
         self.request_interval = request_interval
@@ -64,6 +67,7 @@ class RSSFetcher:
         self.timezone = timezone
         self.freshness_enabled = freshness_enabled
         self.default_max_age_days = default_max_age_days
+        self.skip_stale_on_fetch = skip_stale_on_fetch
 
         self.parser = RSSParser()
         self.session = self._create_session()
@@ -85,6 +89,37 @@ class RSSFetcher:
 
         return session
 
+    def _get_max_age_days(self, feed: RSSFeedConfig) -> int:
+        """
+        获取 feed 的最大文章年龄（天）
+
+        Returns:
+            最大天数；0 表示不过滤（全局禁用或此 feed 设为 0）
+        """
+        if not self.freshness_enabled:
+            return 0
+
+        # feed 级配置优先，None 使用全局默认
+        max_days = feed.max_age_days
+        if max_days is None:
+            max_days = self.default_max_age_days
+        return max_days
+
+    def _get_fetch_cutoff(self, feed: RSSFeedConfig) -> Optional[datetime]:
+        """
+        获取抓取阶段的发布时间下限
+
+        仅在启用 skip_stale_on_fetch 时生效，与 is_within_days 的判断口径一致。
+        """
+        if not self.skip_stale_on_fetch:
+            return None
+
+        max_days = self._get_max_age_days(feed)
+        if max_days <= 0:
+            return None
+
+        return get_configured_time(self.timezone) - timedelta(days=max_days)
+
     def _filter_by_freshness(
         self,
         items: List[RSSItem],
@@ -100,16 +135,7 @@ class RSSFetcher:
         Returns:
             (过滤后的文章列表, 被过滤的文章数)
         """
-        # 如果全局禁用，直接返回
-        if not self.freshness_enabled:
-            return items, 0
-
-        # 确定此 feed 的 max_age_days
-        max_days = feed.max_age_days
-        if max_days is None:
-            max_days = self.default_max_age_days
-
-        # 如果设为 0，禁用此 feed 的过滤
+        max_days = self._get_max_age_days(feed)
         if max_days == 0:
             return items, 0
 
@@ -138,14 +164,16 @@ class RSSFetcher:
             (条目列表, 错误信息) 元组
         """
         try:
-            response = self.session.get(feed.url, timeout=self.timeout)
-            response.raise_for_status()
-
-            parsed_items = self.parser.parse(response.text, feed.url)
-
-            # 限制条目数量（0=不限制）
-            if feed.max_items > 0:
-                parsed_items = parsed_items[:feed.max_items]
+            # 流式读取响应：达到条数上限（0=不限制）或遇到连续过期条目后即停止下载
+            with self.session.get(feed.url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+
+                parsed_items = self.parser.parse_stream(
+                    response.iter_content(chunk_size=16384),
+                    feed.url,
+                    max_items=feed.max_items,
+                    cutoff=self._get_fetch_cutoff(feed),
+                )
 
             # 转换为 RSSItem（使用配置的时区）
             now = get_configured_time(self.timezone)
@@ -168,8 +196,9 @@ class RSSFetcher:
                 )
                 items.append(item)
 
-            # 注意：新鲜度过滤已移至推送阶段（_convert_rss_items_to_list）
-            # 这样所有文章都会存入数据库，但旧文章不会推送
+            # 注意：新鲜度过滤默认在推送阶段（_convert_rss_items_to_list）
+            # 这样所有文章都会存入数据库，但旧文章不会推送；
+            # 启用 skip_stale_on_fetch 时过期文章在解析阶段即被跳过
             print(f"[RSS] {feed.name}: 获取 {len(items)} 条")
             return items, None
 
@@ -264,6 +293,7 @@ class RSSFetcher:
         freshness_config = config.get("freshness_filter", {})
         freshness_enabled = freshness_config.get("enabled", True)  # 默认启用
         default_max_age_days = freshness_config.get("max_age_days", 3)  # 默认3天
+        skip_stale_on_fetch = freshness_config.get("skip_on_fetch", False)  # 默认全部入库
 
         feeds = []
         for feed_config in config.get("feeds", []):
@@ -302,4 +332,5 @@ class RSSFetcher:
             timezone=config.get("timezone", DEFAULT_TIMEZONE),
             freshness_enabled=freshness_enabled,
             default_max_age_days=default_max_age_days,
+            skip_stale_on_fetch=skip_stale_on_fetch,
         )
@@ -3,14 +3,21 @@
 RSS 解析器
 
 支持 RSS 2.0、Atom 和 JSON Feed 1.1 格式的解析
+
+提供两种解析方式：
+- parse: 整体解析（feedparser）
+- parse_stream: 基于 iterparse 的流式解析，逐条判断发布时间，
+  达到条数上限或连续遇到过期条目后提前停止读取；
+  XML 不规范（未声明实体、非 UTF 编码等）时自动回退到 feedparser
 """
 
 import re
 import html
 import json
+import xml.etree.ElementTree as ET
 from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Dict, Any, Tuple
 from email.utils import parsedate_to_datetime
 
 try:
@@ -21,6 +28,55 @@ except ImportError:
     feedparser = None
 
 
+# 流式解析时连续遇到多少条过期条目后停止读取（Feed 通常按时间倒序排列）
+STALE_STREAK_LIMIT = 10
+
+# 流式解析识别的条目标签（RSS 2.0 / RSS 1.0 / Atom）
+_ITEM_TAGS = frozenset({
+    "item",
+    "{http://purl.org/rss/1.0/}item",
+    "{http://www.w3.org/2005/Atom}entry",
+})
+
+# 流式解析识别的 Feed 根标签（本地名）
+_FEED_ROOTS = frozenset({"rss", "RDF", "feed"})
+
+
+def _local_name(tag: str) -> str:
+    """去掉命名空间前缀"""
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+class _ChunkReader:
+    """
+    把响应分块包装为 iterparse 可读取的文件对象
+
+    记录已读取的原始字节，流式解析失败时可拼接剩余内容交给 feedparser。
+    """
+
+    def __init__(self, chunks: Iterable[bytes], head: bytes = b""):
+        self._chunks = iter(chunks)
+        self._buffer = head
+        self.consumed: List[bytes] = []
+
+    def read(self, size: int = -1) -> bytes:
+        while self._buffer == b"" or (size >= 0 and len(self._buffer) < size):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0 or size >= len(self._buffer):
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        self.consumed.append(data)
+        return data
+
+    def read_all(self) -> bytes:
+        """读取全部内容（含已消费部分）"""
+        return b"".join(self.consumed) + self._buffer + b"".join(self._chunks)
+
+
 @dataclass
 class ParsedRSSItem:
     """解析后的 RSS 条目"""
@@ -47,22 +103,40 @@ class RSSParser:
 
         self.max_summary_length = max_summary_length
 
-    def parse(self, content: str, feed_url: str = "") -> List[ParsedRSSItem]:
+    def parse(
+        self,
+        content: str,
+        feed_url: str = "",
+        max_items: int = 0,
+        cutoff: Optional[datetime] = None
+    ) -> List[ParsedRSSItem]:
         """
         解析 RSS/Atom/JSON Feed 内容
 
         Args:
             content: Feed 内容（XML 或 JSON）
             feed_url: Feed URL（用于错误提示）
+            max_items: 最多返回条数（0=不限制）
+            cutoff: 发布时间下限（带时区），早于此时间的条目跳过；无发布时间的条目保留
 
         Returns:
             解析后的条目列表
         """
         # 先尝试检测 JSON Feed
         if self._is_json_feed(content):
-            return self._parse_json_feed(content, feed_url)
-
-        # 使用 feedparser 解析 RSS/Atom
+            items = self._parse_json_feed(content, feed_url)
+            return items[:max_items] if max_items > 0 else items
+
+        return self._parse_with_feedparser(content, feed_url, max_items, cutoff)
+
+    def _parse_with_feedparser(
+        self,
+        content: Any,
+        feed_url: str,
+        max_items: int,
+        cutoff: Optional[datetime]
+    ) -> List[ParsedRSSItem]:
+        """使用 feedparser 解析 RSS/Atom（content 可为字符串或原始字节）"""
         feed = feedparser.parse(content)
 
         if feed.bozo and not feed.entries:
@@ -70,12 +144,184 @@ class RSSParser:
 
         items = []
         for entry in feed.entries:
-            item = self._parse_entry(entry)
+            item = self._parse_entry(entry, cutoff)
             if item:
                 items.append(item)
+                if 0 < max_items <= len(items):
+                    break
+
+        return items
+
+    def parse_stream(
+        self,
+        chunks: Iterable[bytes],
+        feed_url: str = "",
+        max_items: int = 0,
+        cutoff: Optional[datetime] = None
+    ) -> List[ParsedRSSItem]:
+        """
+        流式解析 RSS/Atom（JSON Feed 自动整体解析）
+
+        边读取边解析，每个条目先判断发布时间，只为保留的条目清理摘要；
+        达到 max_items 或连续 STALE_STREAK_LIMIT 条过期后停止读取。
+
+        Args:
+            chunks: 响应内容分块（如 response.iter_content()）
+            feed_url: Feed URL（用于错误提示）
+            max_items: 最多返回条数（0=不限制）
+            cutoff: 发布时间下限（带时区），早于此时间的条目跳过；无发布时间的条目保留
+
+        Returns:
+            解析后的条目列表
+        """
+        chunk_iter = iter(chunks)
+
+        # 读取开头判断是否为 JSON Feed
+        head = b""
+        for chunk in chunk_iter:
+            head += chunk
+            if head.lstrip():
+                break
+        if head.lstrip(b" \t\r\n\xef\xbb\xbf").startswith(b"{"):
+            content = head + b"".join(chunk_iter)
+            return self.parse(content.decode("utf-8", errors="replace"), feed_url, max_items, cutoff)
+
+        reader = _ChunkReader(chunk_iter, head)
+        try:
+            items = self._iterparse_items(reader, max_items, cutoff)
+        except (ET.ParseError, ValueError):
+            # ValueError: expat 不支持的多字节编码（如 GBK）
+            items = None
+
+        if items is None:
+            # 非标准 XML 或无法识别的根元素：回退到 feedparser（支持字节内容自动识别编码）
+            return self._parse_with_feedparser(reader.read_all(), feed_url, max_items, cutoff)
+
+        return items
+
+    def _iterparse_items(
+        self,
+        reader: "_ChunkReader",
+        max_items: int,
+        cutoff: Optional[datetime]
+    ) -> Optional[List[ParsedRSSItem]]:
+        """
+        使用 iterparse 逐条解析
+
+        Returns:
+            条目列表；根元素不是 RSS/Atom 时返回 None
+        """
+        items: List[ParsedRSSItem] = []
+        stack: List[ET.Element] = []
+        stale_streak = 0
+
+        for event, elem in ET.iterparse(reader, events=("start", "end")):
+            if event == "start":
+                if not stack and _local_name(elem.tag) not in _FEED_ROOTS:
+                    return None
+                stack.append(elem)
+                continue
+
+            stack.pop()
+            if elem.tag not in _ITEM_TAGS:
+                continue
+
+            item, is_stale = self._parse_element(elem, cutoff)
+
+            # 处理完即释放条目元素，避免整棵树常驻内存
+            elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+
+            if is_stale:
+                stale_streak += 1
+                if stale_streak >= STALE_STREAK_LIMIT:
+                    break
+                continue
+
+            stale_streak = 0
+            if item:
+                items.append(item)
+                if 0 < max_items <= len(items):
+                    break
 
         return items
 
+    def _parse_element(
+        self,
+        elem: ET.Element,
+        cutoff: Optional[datetime]
+    ) -> Tuple[Optional[ParsedRSSItem], bool]:
+        """
+        解析单个 XML 条目元素
+
+        Returns:
+            (条目或 None, 是否因过期被跳过)
+        """
+        fields: Dict[str, ET.Element] = {}
+        links: List[ET.Element] = []
+        for child in elem:
+            name = _local_name(child.tag)
+            if name == "link":
+                links.append(child)
+            fields.setdefault(name, child)
+
+        def text_of(name: str) -> str:
+            child = fields.get(name)
+            return "".join(child.itertext()).strip() if child is not None else ""
+
+        # 先判断发布时间，过期条目不再做其余解析
+        date_str = (
+            text_of("pubDate") or text_of("published") or text_of("issued")
+            or text_of("updated") or text_of("date") or text_of("modified")
+        )
+        published_at, published_dt = self._parse_date_string(date_str)
+        if cutoff and published_dt and published_dt < cutoff:
+            return None, True
+
+        title = self._clean_text(text_of("title"))
+        if not title:
+            return None, False
+
+        # 链接：RSS 为文本，Atom 为 href 属性（优先 alternate）
+        url = ""
+        for link in links:
+            href = link.get("href")
+            if href is None:
+                url = (link.text or "").strip()
+            elif link.get("rel", "alternate") == "alternate" or link.get("type", "").startswith("text/html"):
+                url = href
+            if url:
+                break
+        if not url and links:
+            url = links[0].get("href", "") or (links[0].text or "").strip()
+
+        guid_elem = fields.get("guid")
+        guid = text_of("guid") or text_of("id")
+        if not url and guid and guid_elem is not None and guid_elem.get("isPermaLink", "true") != "false":
+            url = guid
+
+        summary = text_of("description") or text_of("summary") or text_of("encoded") or text_of("content")
+        summary = self._truncate_summary(summary)
+
+        author = None
+        author_elem = fields.get("author")
+        if author_elem is not None:
+            name_elem = next((c for c in author_elem if _local_name(c.tag) == "name"), None)
+            author_text = "".join((name_elem if name_elem is not None else author_elem).itertext())
+            author = self._clean_text(author_text) or None
+        if not author:
+            author = self._clean_text(text_of("creator")) or None
+
+        return ParsedRSSItem(
+            title=title,
+            url=url,
+            published_at=published_at,
+            summary=summary,
+            author=author,
+            guid=guid or url,
+        ), False
+
     def _is_json_feed(self, content: str) -> bool:
         """
         检测内容是否为 JSON Feed 格式
@@ -213,8 +459,12 @@ class RSSParser:
 
         return self.parse(response.text, url)
 
-    def _parse_entry(self, entry: Any) -> Optional[ParsedRSSItem]:
-        """解析单个条目"""
+    def _parse_entry(self, entry: Any, cutoff: Optional[datetime] = None) -> Optional[ParsedRSSItem]:
+        """解析单个条目（先判断发布时间，过期条目不再解析摘要）"""
+        published_at, published_dt = self._parse_entry_date(entry)
+        if cutoff and published_dt and published_dt < cutoff:
+            return None
+
         title = self._clean_text(entry.get("title", ""))
         if not title:
             return None
@@ -230,7 +480,6 @@ class RSSParser:
             if not url and links:
                 url = links[0].get("href", "")
 
-        published_at = self._parse_date(entry)
         summary = self._parse_summary(entry)
         author = self._parse_author(entry)
         guid = entry.get("id") or entry.get("guid", {}).get("value") or url
@@ -262,13 +511,22 @@ class RSSParser:
 
     def _parse_date(self, entry: Any) -> Optional[str]:
         """解析发布日期"""
-        # feedparser 会自动解析日期到 published_parsed
+        return self._parse_entry_date(entry)[0]
+
+    def _parse_entry_date(self, entry: Any) -> Tuple[Optional[str], Optional[datetime]]:
+        """
+        解析 feedparser 条目的发布日期
+
+        Returns:
+            (ISO 格式字符串, 带时区的 datetime)；无法解析时均为 None
+        """
+        # feedparser 会自动解析日期到 published_parsed（UTC）
         date_struct = entry.get("published_parsed") or entry.get("updated_parsed")
 
         if date_struct:
             try:
                 dt = datetime(*date_struct[:6])
-                return dt.isoformat()
+                return dt.isoformat(), dt.replace(tzinfo=timezone.utc)
             except (ValueError, TypeError):
                 pass
 
@@ -277,18 +535,47 @@ class RSSParser:
         if date_str:
             try:
                 dt = parsedate_to_datetime(date_str)
-                return dt.isoformat()
+                return dt.isoformat(), self._as_aware(dt)
             except (ValueError, TypeError):
                 pass
 
             # 尝试 ISO 格式
             try:
                 dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                return dt.isoformat()
+                return dt.isoformat(), self._as_aware(dt)
             except (ValueError, TypeError):
                 pass
 
-        return None
+        return None, None
+
+    def _parse_date_string(self, date_str: str) -> Tuple[Optional[str], Optional[datetime]]:
+        """
+        解析流式条目的日期字符串（RFC 822 或 ISO 8601）
+
+        与 feedparser 路径保持一致：输出转换为 UTC 的无时区 ISO 字符串。
+
+        Returns:
+            (ISO 格式字符串, 带时区的 datetime)；无法解析时均为 None
+        """
+        if not date_str:
+            return None, None
+
+        dt = None
+        try:
+            dt = parsedate_to_datetime(date_str)
+        except (ValueError, TypeError, IndexError):
+            try:
+                dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+            except (ValueError, TypeError):
+                return None, None
+
+        aware = self._as_aware(dt)
+        return aware.astimezone(timezone.utc).replace(tzinfo=None).isoformat(), aware
+
+    @staticmethod
+    def _as_aware(dt: datetime) -> datetime:
+        """无时区的时间视为 UTC"""
+        return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
 
     def _parse_summary(self, entry: Any) -> Optional[str]:
         """解析摘要"""
@@ -300,6 +587,10 @@ class RSSParser:
             if content and isinstance(content, list):
                 summary = content[0].get("value", "")
 
+        return self._truncate_summary(summary)
+
+    def _truncate_summary(self, summary: str) -> Optional[str]:
+        """清理并截断摘要"""
         if not summary:
             return None
 
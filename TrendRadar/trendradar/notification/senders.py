@@ -136,6 +136,8 @@ def send_to_feishu(
                 "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
                 "rss_count": getattr(ai_analysis, "rss_count", 0),
                 "ai_mode": getattr(ai_analysis, "ai_mode", ""),
+                "context_tokens": getattr(ai_analysis, "context_tokens", 0),
+                "context_total_tokens": getattr(ai_analysis, "context_total_tokens", 0),
             }
 
     # 预留批次头部空间，避免添加头部后超限
@@ -266,6 +268,8 @@ def send_to_dingtalk(
                 "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
                 "rss_count": getattr(ai_analysis, "rss_count", 0),
                 "ai_mode": getattr(ai_analysis, "ai_mode", ""),
+                "context_tokens": getattr(ai_analysis, "context_tokens", 0),
+                "context_total_tokens": getattr(ai_analysis, "context_total_tokens", 0),
             }
 
     # 预留批次头部空间，避免添加头部后超限
@@ -407,6 +411,8 @@ def send_to_wework(
                 "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
                 "rss_count": getattr(ai_analysis, "rss_count", 0),
                 "ai_mode": getattr(ai_analysis, "ai_mode", ""),
+                "context_tokens": getattr(ai_analysis, "context_tokens", 0),
+                "context_total_tokens": getattr(ai_analysis, "context_total_tokens", 0),
             }
 
     # 获取分批内容，预留批次头部空间
@@ -537,6 +543,8 @@ def send_to_telegram(
                 "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
                 "rss_count": getattr(ai_analysis, "rss_count", 0),
                 "ai_mode": getattr(ai_analysis, "ai_mode", ""),
+                "context_tokens": getattr(ai_analysis, "context_tokens", 0),
+                "context_total_tokens": getattr(ai_analysis, "context_total_tokens", 0),
             }
 
     # 获取分批内容，预留批次头部空间
@@ -847,6 +855,8 @@ def send_to_ntfy(
                 "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
                 "rss_count": getattr(ai_analysis, "rss_count", 0),
                 "ai_mode": getattr(ai_analysis, "ai_mode", ""),
+                "context_tokens": getattr(ai_analysis, "context_tokens", 0),
+                "context_total_tokens": getattr(ai_analysis, "context_total_tokens", 0),
             }
 
     # 获取分批内容，预留批次头部空间
@@ -1034,6 +1044,8 @@ def send_to_bark(
                 "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
                 "rss_count": getattr(ai_analysis, "rss_count", 0),
                 "ai_mode": getattr(ai_analysis, "ai_mode", ""),
+                "context_tokens": getattr(ai_analysis, "context_tokens", 0),
+                "context_total_tokens": getattr(ai_analysis, "context_total_tokens", 0),
             }
 
     # 获取分批内容，预留批次头部空间
@@ -1197,6 +1209,8 @@ def send_to_slack(
                 "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
                 "rss_count": getattr(ai_analysis, "rss_count", 0),
                 "ai_mode": getattr(ai_analysis, "ai_mode", ""),
+                "context_tokens": getattr(ai_analysis, "context_tokens", 0),
+                "context_total_tokens": getattr(ai_analysis, "context_total_tokens", 0),
             }
 
     # 获取分批内容，预留批次头部空间
@@ -1320,6 +1334,8 @@ def send_to_generic_webhook(
                 "max_news_limit": getattr(ai_analysis, "max_news_limit", 0),
                 "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
                 "rss_count": getattr(ai_analysis, "rss_count", 0),
+                "context_tokens": getattr(ai_analysis, "context_tokens", 0),
+                "context_total_tokens": getattr(ai_analysis, "context_total_tokens", 0),
             }
 
     # 获取分批内容
@@ -21,13 +21,20 @@ from trendradar.storage.sqlite_mixin import SQLiteStorageMixin
 from trendradar.storage.local import LocalStorageBackend
 from trendradar.storage.manager import StorageManager, get_storage_manager
 
-# 远程后端可选导入（需要 boto3）
-try:
-    from trendradar.storage.remote import RemoteStorageBackend
-    HAS_REMOTE = True
-except ImportError:
-    RemoteStorageBackend = None
-    HAS_REMOTE = False
+
+def __getattr__(name):
+    """远程后端按需导入（需要 boto3，导入较慢，只使用本地存储时不加载）"""
+    if name not in ("RemoteStorageBackend", "HAS_REMOTE"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        from trendradar.storage.remote import RemoteStorageBackend
+        has_remote = True
+    except ImportError:
+        RemoteStorageBackend = None
+        has_remote = False
+    globals().update(RemoteStorageBackend=RemoteStorageBackend, HAS_REMOTE=has_remote)
+    return globals()[name]
+
 
 __all__ = [
     # 基础类
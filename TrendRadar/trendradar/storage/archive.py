@@ -0,0 +1,370 @@
+# coding=utf-8
+"""
+按月归档存储
+
+已结束的每日数据库（output/{type}/{date}.db）可以压缩归档到月度 SQLite 文件：
+- output/news/archive/2025-12.db
+- output/rss/archive/2025-12.db
+
+每个归档文件的 archived_days 表中一行对应一天：整库 VACUUM 后的页面映像经 zlib
+压缩保存，标题、URL、平台名等重复文本都能被压缩。读取时按需解压到归档目录下的
+.cache/{date}.db，原有的 SQL 查询无需改动即可透明读取（缓存数量有上限，按最近
+使用淘汰；缓存文件只读打开）。需要写入已归档的日期时先用 restore_archived_day
+取回为普通的每日数据库。
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+# 归档目录名（位于 output/{type}/ 下）
+ARCHIVE_DIR_NAME = "archive"
+
+# 解压缓存目录名（位于归档目录下）
+ARCHIVE_CACHE_DIR_NAME = ".cache"
+
+# 解压缓存最多保留的天数（超出后按最近使用淘汰；解压单日只需十几毫秒，
+# 缓存只用于避免热点日期反复解压，不追求覆盖长区间）
+ARCHIVE_CACHE_MAX_FILES = 31
+
+# 缓存租期（秒）：租期内用过的文件不参与淘汰，缓存可以暂时超过上限。
+# 一次长区间查询用到的所有日期都留在缓存中，不会边查边被淘汰后反复解压；
+# 其他线程/进程刚返回的路径也不会在打开前被删除
+ARCHIVE_CACHE_LEASE_SECONDS = 600
+
+# zlib 压缩级别（6 与 9 的压缩率相差不到 1%，速度快约 3 倍）
+ARCHIVE_COMPRESS_LEVEL = 6
+
+# 进程内的缓存命中检查与淘汰互斥（多日并行加载时多个线程同时访问缓存）
+_cache_lock = threading.Lock()
+
+_ARCHIVE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS archived_days (
+    date TEXT PRIMARY KEY,                    -- 日期（YYYY-MM-DD）
+    codec TEXT NOT NULL,                      -- 压缩方式
+    raw_size INTEGER NOT NULL,                -- 原始数据库大小（字节）
+    data BLOB NOT NULL,                       -- 压缩后的数据库映像
+    archived_at TEXT NOT NULL                 -- 归档时间
+)
+"""
+
+
+def get_archive_dir(db_dir: Path) -> Path:
+    """获取归档目录（db_dir 为 output/{type}）"""
+    return Path(db_dir) / ARCHIVE_DIR_NAME
+
+
+def get_archive_path(db_dir: Path, date_str: str) -> Path:
+    """获取日期所属的月度归档文件路径"""
+    return get_archive_dir(db_dir) / f"{date_str[:7]}.db"
+
+
+def archive_day_db(db_file: Path, date_str: str, now_str: str) -> Tuple[int, int]:
+    """
+    把单日数据库压缩写入月度归档，校验成功后删除原文件
+
+    Args:
+        db_file: 每日数据库文件路径（output/{type}/{date}.db）
+        date_str: 日期字符串（YYYY-MM-DD）
+        now_str: 当前时间字符串
+
+    Returns:
+        (原始大小, 压缩后大小)，单位字节
+
+    Raises:
+        sqlite3.Error / OSError / ValueError: 归档失败（原文件保留）
+    """
+    db_file = Path(db_file)
+
+    # 先 VACUUM 整理空闲页，并把 WAL 中的数据写回主文件
+    conn = sqlite3.connect(str(db_file))
+    try:
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+    raw = db_file.read_bytes()
+    compressed = zlib.compress(raw, ARCHIVE_COMPRESS_LEVEL)
+
+    archive_path = get_archive_path(db_file.parent, date_str)
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(str(archive_path))
+    try:
+        conn.execute(_ARCHIVE_SCHEMA)
+        conn.execute("""
+            INSERT OR REPLACE INTO archived_days (date, codec, raw_size, data, archived_at)
+            VALUES (?, 'zlib', ?, ?, ?)
+        """, (date_str, len(raw), compressed, now_str))
+        conn.commit()
+
+        # 读回校验，确认可以完整解压后才删除原文件
+        row = conn.execute(
+            "SELECT data FROM archived_days WHERE date = ?", (date_str,)
+        ).fetchone()
+        if not row or zlib.decompress(row[0]) != raw:
+            raise ValueError(f"归档校验失败: {date_str}")
+    finally:
+        conn.close()
+
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        path = db_file.with_name(db_file.name + suffix)
+        if path.exists():
+            path.unlink()
+
+    return len(raw), len(compressed)
+
+
+def is_archive_cache_path(db_path: Path) -> bool:
+    """判断路径是否为归档解压缓存文件（只能只读打开）"""
+    db_path = Path(db_path)
+    return db_path.parent.name == ARCHIVE_CACHE_DIR_NAME and db_path.parent.parent.name == ARCHIVE_DIR_NAME
+
+
+def list_archived_dates(db_dir: Path) -> List[str]:
+    """
+    列出已归档的日期
+
+    Args:
+        db_dir: 数据库目录（output/{type}）
+
+    Returns:
+        日期字符串列表（YYYY-MM-DD，升序）
+    """
+    archive_dir = get_archive_dir(db_dir)
+    if not archive_dir.exists():
+        return []
+
+    dates = []
+    for archive_path in sorted(archive_dir.glob("*.db")):
+        try:
+            conn = sqlite3.connect(str(archive_path))
+            try:
+                dates.extend(row[0] for row in conn.execute(
+                    "SELECT date FROM archived_days ORDER BY date"
+                ))
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"[归档] 读取归档索引失败 {archive_path.name}: {e}")
+    return dates
+
+
+def extract_archived_day(db_dir: Path, date_str: str) -> Optional[Path]:
+    """
+    获取已归档日期的可读数据库文件（按需解压到缓存目录）
+
+    缓存文件比归档文件新时直接复用；归档被改写后自动重新解压。
+
+    Args:
+        db_dir: 数据库目录（output/{type}）
+        date_str: 日期字符串（YYYY-MM-DD）
+
+    Returns:
+        解压后的数据库路径，该日期未归档时返回 None
+    """
+    archive_path = get_archive_path(db_dir, date_str)
+    if not archive_path.exists():
+        return None
+
+    cache_dir = get_archive_dir(db_dir) / ARCHIVE_CACHE_DIR_NAME
+    cache_path = cache_dir / f"{date_str}.db"
+
+    with _cache_lock:
+        try:
+            if cache_path.stat().st_mtime >= archive_path.stat().st_mtime:
+                # 刷新修改时间，作为最近使用标记（同时续租）
+                os.utime(cache_path)
+                return cache_path
+        except OSError:
+            pass
+
+    data = _read_archived_image(archive_path, date_str)
+    if data is None:
+        return None
+
+    # 先写临时文件再原子替换，避免并发读取到半成品
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    if not _write_atomic(cache_dir, cache_path, data, date_str):
+        return None
+
+    _prune_cache(cache_dir)
+    return cache_path
+
+
+def restore_archived_day(db_dir: Path, date_str: str) -> Optional[Path]:
+    """
+    把已归档的日期取回为普通的每日数据库（用于写入）
+
+    解压缓存只读，写入它的数据会在下次解压时被覆盖；需要写入已归档的日期时先取回，
+    取回后从归档中删除该日，之后由正常的归档流程重新归档。
+
+    Args:
+        db_dir: 数据库目录（output/{type}）
+        date_str: 日期字符串（YYYY-MM-DD）
+
+    Returns:
+        取回后的每日数据库路径，该日期未归档或取回失败时返回 None
+    """
+    db_dir = Path(db_dir)
+    archive_path = get_archive_path(db_dir, date_str)
+    if not archive_path.exists():
+        return None
+
+    data = _read_archived_image(archive_path, date_str)
+    if data is None:
+        return None
+
+    db_path = db_dir / f"{date_str}.db"
+    if not _write_atomic(db_dir, db_path, data, date_str):
+        return None
+
+    # 每日数据库已落盘，再删除归档中的该日（删除失败时两处都有，重新归档会覆盖）
+    try:
+        conn = sqlite3.connect(str(archive_path))
+        try:
+            conn.execute("DELETE FROM archived_days WHERE date = ?", (date_str,))
+            conn.commit()
+            remaining = conn.execute("SELECT COUNT(*) FROM archived_days").fetchone()[0]
+        finally:
+            conn.close()
+        if not remaining:
+            archive_path.unlink()
+    except (sqlite3.Error, OSError) as e:
+        print(f"[归档] 从归档删除已取回的日期失败 ({date_str}): {e}")
+
+    cache_path = get_archive_dir(db_dir) / ARCHIVE_CACHE_DIR_NAME / f"{date_str}.db"
+    with _cache_lock:
+        try:
+            cache_path.unlink()
+        except OSError:
+            pass
+
+    print(f"[归档] 已取回归档数据库: {db_dir.name}/{date_str}.db")
+    return db_path
+
+
+def _read_archived_image(archive_path: Path, date_str: str) -> Optional[bytes]:
+    """读取并解压归档中某一天的数据库映像"""
+    try:
+        conn = sqlite3.connect(f"{archive_path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            row = conn.execute(
+                "SELECT codec, data FROM archived_days WHERE date = ?", (date_str,)
+            ).fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"[归档] 读取归档失败 {archive_path.name}: {e}")
+        return None
+
+    if not row:
+        return None
+
+    codec, data = row
+    if codec != "zlib":
+        print(f"[归档] 不支持的压缩方式: {codec} ({date_str})")
+        return None
+
+    try:
+        return zlib.decompress(data)
+    except zlib.error as e:
+        print(f"[归档] 解压失败 ({date_str}): {e}")
+        return None
+
+
+def _write_atomic(target_dir: Path, target_path: Path, data: bytes, date_str: str) -> bool:
+    """先写临时文件再原子替换目标文件"""
+    fd, tmp_path = tempfile.mkstemp(dir=str(target_dir), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, target_path)
+        return True
+    except OSError as e:
+        print(f"[归档] 写入失败 ({date_str}): {e}")
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        return False
+
+
+def _prune_cache(cache_dir: Path) -> None:
+    """解压缓存超出上限时删除最久未使用且租期已过的文件"""
+    with _cache_lock:
+        try:
+            files = sorted(
+                (p.stat().st_mtime, p) for p in cache_dir.glob("*.db")
+            )
+        except OSError:
+            return
+
+        expire_before = time.time() - ARCHIVE_CACHE_LEASE_SECONDS
+        for mtime, path in files[:max(len(files) - ARCHIVE_CACHE_MAX_FILES, 0)]:
+            if mtime >= expire_before:
+                # 按修改时间升序，之后的文件都在租期内
+                break
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def remove_archived_days(db_dir: Path, cutoff: datetime) -> int:
+    """
+    删除早于截止日期的归档数据（用于数据保留策略）
+
+    整月过期的归档文件直接删除，部分过期的归档删除对应行后 VACUUM。
+
+    Args:
+        db_dir: 数据库目录（output/{type}）
+        cutoff: 截止日期，早于此日期的数据被删除
+
+    Returns:
+        删除的天数
+    """
+    archive_dir = get_archive_dir(db_dir)
+    if not archive_dir.exists():
+        return 0
+
+    cutoff_str = cutoff.strftime("%Y-%m-%d")
+    cache_dir = archive_dir / ARCHIVE_CACHE_DIR_NAME
+    removed = 0
+
+    for archive_path in sorted(archive_dir.glob("*.db")):
+        try:
+            conn = sqlite3.connect(str(archive_path))
+            try:
+                expired = [row[0] for row in conn.execute(
+                    "SELECT date FROM archived_days WHERE date < ?", (cutoff_str,)
+                )]
+                if not expired:
+                    continue
+
+                conn.execute("DELETE FROM archived_days WHERE date < ?", (cutoff_str,))
+                conn.commit()
+                remaining = conn.execute("SELECT COUNT(*) FROM archived_days").fetchone()[0]
+                if remaining:
+                    conn.execute("VACUUM")
+            finally:
+                conn.close()
+
+            if not remaining:
+                archive_path.unlink()
+
+            for date_str in expired:
+                cache_path = cache_dir / f"{date_str}.db"
+                if cache_path.exists():
+                    cache_path.unlink()
+
+            removed += len(expired)
+        except (sqlite3.Error, OSError) as e:
+            print(f"[归档] 清理归档失败 {archive_path.name}: {e}")
+
+    return removed
@@ -13,6 +13,13 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from trendradar.storage.archive import (
+    archive_day_db,
+    extract_archived_day,
+    is_archive_cache_path,
+    remove_archived_days,
+    restore_archived_day,
+)
 from trendradar.storage.base import StorageBackend, NewsItem, NewsData, RSSItem, RSSData
 from trendradar.storage.sqlite_mixin import SQLiteStorageMixin
 from trendradar.utils.time import (
@@ -79,7 +86,12 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
         """格式化时间文件名 (格式: HH-MM)"""
         return format_time_filename(self.timezone)
 
-    def _get_db_path(self, date: Optional[str] = None, db_type: str = "news") -> Path:
+    def _get_db_path(
+        self,
+        date: Optional[str] = None,
+        db_type: str = "news",
+        for_write: bool = False
+    ) -> Path:
         """
         获取 SQLite 数据库路径
 
@@ -87,9 +99,13 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
         - output/news/2025-12-28.db
         - output/rss/2025-12-28.db
 
+        已归档的日期：读取时返回解压后的只读副本（output/{type}/archive/.cache/{date}.db），
+        写入时先把该日取回为每日数据库，避免写入缓存副本后数据丢失
+
         Args:
             date: 日期字符串
             db_type: 数据库类型 ("news" 或 "rss")
+            for_write: 是否用于写入
 
         Returns:
             数据库文件路径
@@ -97,7 +113,18 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
         date_str = self._format_date_folder(date)
         db_dir = self.data_dir / db_type
         db_dir.mkdir(parents=True, exist_ok=True)
-        return db_dir / f"{date_str}.db"
+        db_path = db_dir / f"{date_str}.db"
+
+        if not db_path.exists():
+            if for_write:
+                if restore_archived_day(db_dir, date_str) is not None:
+                    self._close_archive_cache_connections()
+            else:
+                archived_path = extract_archived_day(db_dir, date_str)
+                if archived_path is not None:
+                    return archived_path
+
+        return db_path
 
     def _get_connection(self, date: Optional[str] = None, db_type: str = "news") -> sqlite3.Connection:
         """
@@ -110,23 +137,37 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
         Returns:
             数据库连接
         """
-        db_path = str(self._get_db_path(date, db_type))
+        path = self._get_db_path(date, db_type)
+        db_path = str(path)
 
         if db_path not in self._db_connections:
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row
-            self._init_tables(conn, db_type)
+            if is_archive_cache_path(path):
+                # 归档缓存只读打开：文件已被淘汰时报错而不是新建空库，写入也会被拒绝
+                conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+                conn.row_factory = sqlite3.Row
+            else:
+                conn = sqlite3.connect(db_path)
+                conn.row_factory = sqlite3.Row
+                self._init_tables(conn, db_type)
             self._db_connections[db_path] = conn
 
         return self._db_connections[db_path]
 
+    def _close_archive_cache_connections(self) -> None:
+        """关闭指向归档缓存的连接（日期被取回后改用每日数据库）"""
+        for db_path in [p for p in self._db_connections if is_archive_cache_path(Path(p))]:
+            try:
+                self._db_connections.pop(db_path).close()
+            except sqlite3.Error:
+                pass
+
     # ========================================
     # StorageBackend 接口实现（委托给 mixin）
     # ========================================
 
     def save_news_data(self, data: NewsData) -> bool:
         """保存新闻数据到 SQLite"""
-        db_path = self._get_db_path(data.date)
+        db_path = self._get_db_path(data.date, for_write=True)
         if not db_path.exists():
             # 确保目录存在
             db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -179,6 +220,13 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
             return []
         return self._get_crawl_times_impl(date)
 
+    def get_keyword_trend_log(self, date: Optional[str] = None) -> Optional[Dict]:
+        """获取指定日期的关键词热度状态变化日志"""
+        db_path = self._get_db_path(date)
+        if not db_path.exists():
+            return None
+        return self._get_keyword_trend_log_impl(date)
+
     def has_pushed_today(self, date: Optional[str] = None) -> bool:
         """检查指定日期是否已推送过"""
         return self._has_pushed_today_impl(date)
@@ -203,6 +251,25 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
             print(f"[本地存储] AI 分析记录已保存: {analysis_mode} at {now_str}")
         return success
 
+    def get_ai_analysis_cache(
+        self,
+        fingerprint: Optional[str] = None,
+        base_key: Optional[str] = None,
+        date: Optional[str] = None,
+    ) -> Optional[Dict]:
+        """获取 AI 分析缓存记录（按指纹精确匹配，或按基线取最近一条）"""
+        return self._get_ai_analysis_cache_impl(fingerprint, base_key, date)
+
+    def save_ai_analysis_cache(self, entry: Dict, date: Optional[str] = None) -> bool:
+        """保存 AI 分析缓存记录"""
+        return self._save_ai_analysis_cache_impl(entry, date)
+
+    def record_ai_analysis_cache_hit(
+        self, fingerprint: str, saved_tokens: int = 0, date: Optional[str] = None
+    ) -> bool:
+        """记录 AI 分析缓存命中"""
+        return self._record_ai_analysis_cache_hit_impl(fingerprint, saved_tokens, date)
+
     def reset_push_state(self, date: Optional[str] = None) -> bool:
         """重置推送状态"""
         return self._reset_push_state_impl(date)
@@ -221,6 +288,7 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
 
     def save_rss_data(self, data: RSSData) -> bool:
         """保存 RSS 数据到 SQLite"""
+        self._get_db_path(data.date, db_type="rss", for_write=True)
         success, new_count, updated_count = self._save_rss_data_impl(data, "[本地存储]")
 
         if success:
@@ -365,6 +433,7 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
         新结构清理逻辑：
         - output/news/{date}.db  -> 删除过期的 .db 文件
         - output/rss/{date}.db   -> 删除过期的 .db 文件
+        - output/{type}/archive/ -> 删除归档中过期的日期
         - output/txt/{date}/     -> 删除过期的日期目录
         - output/html/{date}/    -> 删除过期的日期目录
 
@@ -427,6 +496,12 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
                         except Exception as e:
                             print(f"[本地存储] 删除文件失败 {db_file}: {e}")
 
+                # 清理归档中的过期日期
+                archived_removed = remove_archived_days(db_dir, cutoff_date)
+                if archived_removed:
+                    deleted_count += archived_removed
+                    print(f"[本地存储] 清理过期归档: {db_type} {archived_removed} 天")
+
             # 清理快照目录 (txt/, html/)
             for snapshot_type in ["txt", "html"]:
                 snapshot_dir = self.data_dir / snapshot_type
@@ -455,6 +530,64 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
             print(f"[本地存储] 清理过期数据失败: {e}")
             return deleted_count
 
+    def archive_old_data(self, archive_after_days: int) -> int:
+        """
+        把已结束的每日数据库压缩归档到月度归档文件
+
+        - output/news/{date}.db -> output/news/archive/{YYYY-MM}.db
+        - output/rss/{date}.db  -> output/rss/archive/{YYYY-MM}.db
+
+        Args:
+            archive_after_days: 超过 N 天的每日数据库被归档（0 表示不归档）
+
+        Returns:
+            归档的数据库数量
+        """
+        if archive_after_days <= 0:
+            return 0
+
+        now = self._get_configured_time()
+        cutoff_str = (now - timedelta(days=archive_after_days)).strftime("%Y-%m-%d")
+        now_str = now.strftime("%Y-%m-%d %H:%M:%S")
+
+        archived_count = 0
+        raw_total = 0
+        compressed_total = 0
+
+        for db_type in ["news", "rss"]:
+            db_dir = self.data_dir / db_type
+            if not db_dir.exists():
+                continue
+
+            for db_file in sorted(db_dir.glob("*.db")):
+                date_match = re.match(r'(\d{4}-\d{2}-\d{2})\.db$', db_file.name)
+                if not date_match or date_match.group(1) >= cutoff_str:
+                    continue
+
+                # 先关闭数据库连接
+                db_path = str(db_file)
+                if db_path in self._db_connections:
+                    try:
+                        self._db_connections.pop(db_path).close()
+                    except Exception:
+                        pass
+
+                try:
+                    raw_size, compressed_size = archive_day_db(db_file, date_match.group(1), now_str)
+                    archived_count += 1
+                    raw_total += raw_size
+                    compressed_total += compressed_size
+                except Exception as e:
+                    print(f"[本地存储] 归档失败 {db_type}/{db_file.name}: {e}")
+
+        if archived_count > 0:
+            print(
+                f"[本地存储] 共归档 {archived_count} 个数据库："
+                f"{raw_total / 1024 / 1024:.2f} MB -> {compressed_total / 1024 / 1024:.2f} MB"
+            )
+
+        return archived_count
+
     def __del__(self):
         """析构函数，确保关闭连接"""
         self.cleanup()
@@ -6,7 +6,7 @@
 """
 
 import os
-from typing import Optional
+from typing import Dict, Optional
 
 from trendradar.storage.base import StorageBackend, NewsData, RSSData
 from trendradar.utils.time import DEFAULT_TIMEZONE
@@ -36,6 +36,8 @@ class StorageManager:
         remote_config: Optional[dict] = None,
         local_retention_days: int = 0,
         remote_retention_days: int = 0,
+        remote_upload_delay: int = 0,
+        local_archive_after_days: int = 0,
         pull_enabled: bool = False,
         pull_days: int = 0,
         timezone: str = DEFAULT_TIMEZONE,
@@ -51,6 +53,8 @@ class StorageManager:
             remote_config: 远程存储配置（endpoint_url, bucket_name, access_key_id 等）
             local_retention_days: 本地数据保留天数（0 = 无限制）
             remote_retention_days: 远程数据保留天数（0 = 无限制）
+            remote_upload_delay: 远程数据库延迟上传秒数（0 = 每次写入后同步上传）
+            local_archive_after_days: 本地每日数据库超过 N 天后归档为月度压缩文件（0 = 不归档）
             pull_enabled: 是否启用启动时自动拉取
             pull_days: 拉取最近 N 天的数据
             timezone: 时区配置
@@ -62,6 +66,8 @@ class StorageManager:
         self.remote_config = remote_config or {}
         self.local_retention_days = local_retention_days
         self.remote_retention_days = remote_retention_days
+        self.remote_upload_delay = remote_upload_delay
+        self.local_archive_after_days = local_archive_after_days
         self.pull_enabled = pull_enabled
         self.pull_days = pull_days
         self.timezone = timezone
@@ -138,6 +144,7 @@ class StorageManager:
                 enable_txt=self.enable_txt,
                 enable_html=self.enable_html,
                 timezone=self.timezone,
+                upload_delay=self.remote_upload_delay,
             )
         except ImportError as e:
             print(f"[存储管理器] 远程后端导入失败: {e}")
@@ -238,6 +245,10 @@ class StorageManager:
         """保存 HTML 报告"""
         return self.get_backend().save_html_report(html_content, filename, is_summary)
 
+    def get_keyword_trend_log(self, date: Optional[str] = None) -> Optional[Dict]:
+        """获取关键词热度状态变化日志"""
+        return self.get_backend().get_keyword_trend_log(date)
+
     def is_first_crawl_today(self, date: Optional[str] = None) -> bool:
         """检查是否是当天第一次抓取"""
         return self.get_backend().is_first_crawl_today(date)
@@ -262,6 +273,12 @@ class StorageManager:
         if self.local_retention_days > 0:
             total_deleted += self.get_backend().cleanup_old_data(self.local_retention_days)
 
+        # 归档本地已结束的每日数据库（仅本地后端支持）
+        if self.local_archive_after_days > 0:
+            backend = self.get_backend()
+            if hasattr(backend, "archive_old_data"):
+                backend.archive_old_data(self.local_archive_after_days)
+
         # 清理远程数据（如果配置了）
         if self.remote_retention_days > 0 and self._has_remote_config():
             if self._remote_backend is None:
@@ -333,6 +350,54 @@ class StorageManager:
         """
         return self.get_backend().record_ai_analysis(analysis_mode, date)
 
+    def get_ai_analysis_cache(
+        self,
+        fingerprint: Optional[str] = None,
+        base_key: Optional[str] = None,
+        date: Optional[str] = None,
+    ) -> Optional[Dict]:
+        """
+        获取 AI 分析缓存记录
+
+        Args:
+            fingerprint: 输入指纹（精确匹配）
+            base_key: 基线指纹（返回该基线下最近一条记录）
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            缓存记录字典，不存在时返回 None
+        """
+        return self.get_backend().get_ai_analysis_cache(fingerprint, base_key, date)
+
+    def save_ai_analysis_cache(self, entry: Dict, date: Optional[str] = None) -> bool:
+        """
+        保存 AI 分析缓存记录
+
+        Args:
+            entry: 缓存记录字典
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            是否保存成功
+        """
+        return self.get_backend().save_ai_analysis_cache(entry, date)
+
+    def record_ai_analysis_cache_hit(
+        self, fingerprint: str, saved_tokens: int = 0, date: Optional[str] = None
+    ) -> bool:
+        """
+        记录 AI 分析缓存命中及节省的 token 数
+
+        Args:
+            fingerprint: 命中的缓存指纹
+            saved_tokens: 本次节省的估算 token 数
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            是否记录成功
+        """
+        return self.get_backend().record_ai_analysis_cache_hit(fingerprint, saved_tokens, date)
+
 
 def get_storage_manager(
     backend_type: str = "auto",
@@ -342,6 +407,8 @@ def get_storage_manager(
     remote_config: Optional[dict] = None,
     local_retention_days: int = 0,
     remote_retention_days: int = 0,
+    remote_upload_delay: int = 0,
+    local_archive_after_days: int = 0,
     pull_enabled: bool = False,
     pull_days: int = 0,
     timezone: str = DEFAULT_TIMEZONE,
@@ -358,6 +425,8 @@ def get_storage_manager(
         remote_config: 远程存储配置
         local_retention_days: 本地数据保留天数（0 = 无限制）
         remote_retention_days: 远程数据保留天数（0 = 无限制）
+        remote_upload_delay: 远程数据库延迟上传秒数（0 = 同步上传）
+        local_archive_after_days: 本地数据归档天数（0 = 不归档）
         pull_enabled: 是否启用启动时自动拉取
         pull_days: 拉取最近 N 天的数据
         timezone: 时区配置
@@ -377,6 +446,8 @@ def get_storage_manager(
             remote_config=remote_config,
             local_retention_days=local_retention_days,
             remote_retention_days=remote_retention_days,
+            remote_upload_delay=remote_upload_delay,
+            local_archive_after_days=local_archive_after_days,
             pull_enabled=pull_enabled,
             pull_days=pull_days,
             timezone=timezone,
@@ -30,6 +30,8 @@ except ImportError:
 
 from trendradar.storage.base import StorageBackend, NewsItem, NewsData, RSSItem, RSSData
 from trendradar.storage.sqlite_mixin import SQLiteStorageMixin
+from trendradar.storage.sync import RemoteSyncEngine
+from trendradar.storage.upload_queue import WriteBehindUploader
 from trendradar.utils.time import (
     DEFAULT_TIMEZONE,
     get_configured_time,
@@ -62,6 +64,7 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         enable_html: bool = True,
         temp_dir: Optional[str] = None,
         timezone: str = DEFAULT_TIMEZONE,
+        upload_delay: int = 0,
     ):
         """
         初始化远程存储后端
@@ -76,6 +79,8 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
             enable_html: 是否启用 HTML 报告
             temp_dir: 临时目录路径（默认使用系统临时目录）
             timezone: 时区配置
+            upload_delay: 延迟上传秒数（0 = 每次写入后同步上传；
+                大于 0 时写入只标记待上传，由后台线程合并上传，cleanup() 时全部上传）
         """
         if not HAS_BOTO3:
             raise ImportError("远程存储后端需要安装 boto3: pip install boto3")
@@ -119,6 +124,11 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         self._downloaded_files: List[Path] = []
         self._db_connections: Dict[str, sqlite3.Connection] = {}
 
+        # 延迟上传队列（write-behind）
+        self._uploader: Optional[WriteBehindUploader] = None
+        if upload_delay > 0:
+            self._uploader = WriteBehindUploader(self._upload_sqlite, upload_delay)
+
         print(f"[远程存储] 初始化完成，存储桶: {bucket_name}，签名版本: {signature_version}")
 
     @property
@@ -220,12 +230,8 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         # 确保目录存在
         local_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # 先检查文件是否存在
-        if not self._check_object_exists(r2_key):
-            print(f"[远程存储] 文件不存在，将创建新数据库: {r2_key}")
-            return None
-
         try:
+            # 直接 GET，不存在时由 404 / NoSuchKey 判断（省去一次 HEAD 往返）
             # 使用 get_object + iter_chunks 替代 download_file
             # iter_chunks 会自动处理 chunked transfer encoding
             response = self.s3_client.get_object(Bucket=self.bucket_name, Key=r2_key)
@@ -274,8 +280,13 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
             # 读取文件内容为 bytes 后上传
             # 避免传入文件对象时 requests 库使用 chunked transfer encoding
             # 腾讯云 COS 等 S3 兼容服务可能无法正确处理 chunked encoding
-            with open(local_path, 'rb') as f:
-                file_content = f.read()
+            if self._uploader is not None:
+                # 后台上传时主线程可能仍在写入，通过 SQLite 备份接口取一致快照
+                file_content = self._snapshot_sqlite(local_path)
+                local_size = len(file_content)
+            else:
+                with open(local_path, 'rb') as f:
+                    file_content = f.read()
 
             # 使用 put_object 并明确设置 ContentLength，确保不使用 chunked encoding
             self.s3_client.put_object(
@@ -299,6 +310,64 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
             print(f"[远程存储] 上传失败: {e}")
             return False
 
+    def _snapshot_sqlite(self, local_path: Path) -> bytes:
+        """
+        读取数据库的一致快照（使用独立连接的备份接口，不受其他线程写入影响）
+
+        Args:
+            local_path: 本地数据库路径
+
+        Returns:
+            数据库文件内容
+        """
+        snapshot_path = local_path.with_name(local_path.name + ".upload")
+        src = sqlite3.connect(str(local_path))
+        try:
+            dst = sqlite3.connect(str(snapshot_path))
+            try:
+                src.backup(dst)
+            finally:
+                dst.close()
+        finally:
+            src.close()
+
+        try:
+            with open(snapshot_path, 'rb') as f:
+                return f.read()
+        finally:
+            snapshot_path.unlink()
+
+    def _schedule_upload(self, date: Optional[str] = None, db_type: str = "news") -> bool:
+        """
+        上传数据库到远程存储（启用延迟上传时只加入队列）
+
+        Returns:
+            同步模式返回上传结果；延迟上传模式返回 True（失败在 flush 时报告）
+        """
+        if self._uploader is None:
+            return self._upload_sqlite(date, db_type)
+        self._uploader.mark_dirty(date, db_type)
+        return True
+
+    @property
+    def _upload_status(self) -> str:
+        """上传成功日志的措辞（延迟上传模式下只是加入队列）"""
+        return "已加入上传队列" if self._uploader is not None else "已同步到远程存储"
+
+    def flush_uploads(self, timeout: Optional[float] = None) -> bool:
+        """
+        立即上传所有待上传的数据库并等待完成
+
+        Args:
+            timeout: 最长等待秒数（None 表示一直等待）
+
+        Returns:
+            是否全部上传成功
+        """
+        if self._uploader is None:
+            return True
+        return self._uploader.flush(timeout)
+
     def _get_connection(self, date: Optional[str] = None, db_type: str = "news") -> sqlite3.Connection:
         """
         获取数据库连接
@@ -371,8 +440,8 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         print("，".join(log_parts))
 
         # 上传到远程存储
-        if self._upload_sqlite(data.date):
-            print(f"[远程存储] 数据已同步到远程存储")
+        if self._schedule_upload(data.date):
+            print(f"[远程存储] 数据{self._upload_status}")
             return True
         else:
             print(f"[远程存储] 上传远程存储失败")
@@ -394,6 +463,10 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         """检查是否是当天第一次抓取"""
         return self._is_first_crawl_today_impl(date)
 
+    def get_keyword_trend_log(self, date: Optional[str] = None) -> Optional[Dict]:
+        """获取指定日期的关键词热度状态变化日志"""
+        return self._get_keyword_trend_log_impl(date)
+
     def has_pushed_today(self, date: Optional[str] = None) -> bool:
         """检查指定日期是否已推送过"""
         return self._has_pushed_today_impl(date)
@@ -407,8 +480,8 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
             print(f"[远程存储] 推送记录已保存: {report_type} at {now_str}")
 
             # 上传到远程存储 确保记录持久化
-            if self._upload_sqlite(date):
-                print(f"[远程存储] 推送记录已同步到远程存储")
+            if self._schedule_upload(date):
+                print(f"[远程存储] 推送记录{self._upload_status}")
                 return True
             else:
                 print(f"[远程存储] 推送记录同步到远程存储失败")
@@ -429,8 +502,8 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
             print(f"[远程存储] AI 分析记录已保存: {analysis_mode} at {now_str}")
 
             # 上传到远程存储 确保记录持久化
-            if self._upload_sqlite(date):
-                print(f"[远程存储] AI 分析记录已同步到远程存储")
+            if self._schedule_upload(date):
+                print(f"[远程存储] AI 分析记录{self._upload_status}")
                 return True
             else:
                 print(f"[远程存储] AI 分析记录同步到远程存储失败")
@@ -438,6 +511,31 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
 
         return False
 
+    def get_ai_analysis_cache(
+        self,
+        fingerprint: Optional[str] = None,
+        base_key: Optional[str] = None,
+        date: Optional[str] = None,
+    ) -> Optional[Dict]:
+        """获取 AI 分析缓存记录（按指纹精确匹配，或按基线取最近一条）"""
+        return self._get_ai_analysis_cache_impl(fingerprint, base_key, date)
+
+    def save_ai_analysis_cache(self, entry: Dict, date: Optional[str] = None) -> bool:
+        """保存 AI 分析缓存记录"""
+        success = self._save_ai_analysis_cache_impl(entry, date)
+        if success and not self._schedule_upload(date):
+            print(f"[远程存储] AI 分析缓存同步到远程存储失败")
+        return success
+
+    def record_ai_analysis_cache_hit(
+        self, fingerprint: str, saved_tokens: int = 0, date: Optional[str] = None
+    ) -> bool:
+        """记录 AI 分析缓存命中"""
+        success = self._record_ai_analysis_cache_hit_impl(fingerprint, saved_tokens, date)
+        if success and not self._schedule_upload(date):
+            print(f"[远程存储] AI 分析缓存命中记录同步到远程存储失败")
+        return success
+
     def reset_push_state(self, date: Optional[str] = None) -> bool:
         """
         重置推送状态（远程存储版本）
@@ -452,8 +550,8 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
 
         if success:
             # 上传到远程存储
-            if self._upload_sqlite(date):
-                print(f"[远程存储] 推送状态重置已同步到远程存储")
+            if self._schedule_upload(date):
+                print(f"[远程存储] 推送状态重置{self._upload_status}")
                 return True
             else:
                 print(f"[远程存储] 推送状态重置同步到远程存储失败")
@@ -475,8 +573,8 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
 
         if success:
             # 上传到远程存储
-            if self._upload_sqlite(date):
-                print(f"[远程存储] AI 分析状态重置已同步到远程存储")
+            if self._schedule_upload(date):
+                print(f"[远程存储] AI 分析状态重置{self._upload_status}")
                 return True
             else:
                 print(f"[远程存储] AI 分析状态重置同步到远程存储失败")
@@ -512,8 +610,8 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         print("，".join(log_parts))
 
         # 上传到远程存储
-        if self._upload_sqlite(data.date, db_type="rss"):
-            print(f"[远程存储] RSS 数据已同步到远程存储")
+        if self._schedule_upload(data.date, db_type="rss"):
+            print(f"[远程存储] RSS 数据{self._upload_status}")
             return True
         else:
             print(f"[远程存储] RSS 上传远程存储失败")
@@ -613,6 +711,15 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         if sys.meta_path is None:
             return
 
+        # 先把延迟上传队列中的数据库全部上传，再关闭连接、删除临时文件
+        uploader = getattr(self, "_uploader", None)
+        if uploader is not None:
+            pending = uploader.pending_count
+            if pending:
+                print(f"[远程存储] 正在上传 {pending} 个待上传的数据库...")
+            if not uploader.close():
+                print("[远程存储] 部分数据库上传失败，本次运行的数据未完全同步到远程存储")
+
         # 关闭数据库连接
         db_connections = getattr(self, "_db_connections", {})
         for db_path, conn in list(db_connections.items()):
@@ -738,6 +845,9 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         """
         从远程拉取最近 N 天的数据到本地
 
+        由 RemoteSyncEngine 执行：一次 list 比对 ETag / 大小，跳过未变化的文件，
+        其余文件分片并发下载（支持断点续传）。
+
         Args:
             days: 拉取天数
             local_data_dir: 本地数据目录
@@ -748,48 +858,27 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         if days <= 0:
             return 0
 
-        local_dir = Path(local_data_dir)
-        local_dir.mkdir(parents=True, exist_ok=True)
-
-        pulled_count = 0
         now = self._get_configured_time()
+        dates = [(now - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days)]
 
         print(f"[远程存储] 开始拉取最近 {days} 天的数据...")
 
-        for i in range(days):
-            date = now - timedelta(days=i)
-            date_str = date.strftime("%Y-%m-%d")
-
-            # 本地目标路径
-            local_date_dir = local_dir / date_str
-            local_db_path = local_date_dir / "news.db"
-
-            # 如果本地已存在，跳过
-            if local_db_path.exists():
-                print(f"[远程存储] 跳过（本地已存在）: {date_str}")
-                continue
-
-            # 远程对象键
-            remote_key = f"news/{date_str}.db"
-
-            # 检查远程是否存在
-            if not self._check_object_exists(remote_key):
-                print(f"[远程存储] 跳过（远程不存在）: {date_str}")
-                continue
+        try:
+            engine = RemoteSyncEngine(self.s3_client, self.bucket_name, local_data_dir)
+            result = engine.sync(dates)
+        except Exception as e:
+            print(f"[远程存储] 拉取失败: {e}")
+            return 0
 
-            # 下载（使用 get_object + iter_chunks 处理 chunked encoding）
-            try:
-                local_date_dir.mkdir(parents=True, exist_ok=True)
-                response = self.s3_client.get_object(Bucket=self.bucket_name, Key=remote_key)
-                with open(local_db_path, 'wb') as f:
-                    for chunk in response['Body'].iter_chunks(chunk_size=1024*1024):
-                        f.write(chunk)
-                print(f"[远程存储] 已拉取: {remote_key} -> {local_db_path}")
-                pulled_count += 1
-            except Exception as e:
-                print(f"[远程存储] 拉取失败 ({date_str}): {e}")
+        for key in result["skipped"]:
+            print(f"[远程存储] 跳过（本地已存在）: {key}")
 
-        print(f"[远程存储] 拉取完成，共下载 {pulled_count} 个数据库文件")
+        pulled_count = len(result["synced"])
+        print(
+            f"[远程存储] 拉取完成，共下载 {pulled_count} 个数据库文件"
+            f"（{result['bytes']} bytes），未变化 {len(result['unchanged'])} 个，"
+            f"失败 {len(result['failed'])} 个"
+        )
         return pulled_count
 
     def list_remote_dates(self) -> List[str]:
@@ -80,6 +80,28 @@ CREATE TABLE IF NOT EXISTS crawl_source_status (
     FOREIGN KEY (platform_id) REFERENCES platforms(id)
 );
 
+-- ============================================
+-- 平台抓取聚合表
+-- 每次抓取各平台的在榜条数、新增条数、排名与失败标记，
+-- 供 MCP 平台活跃度 / 平台对比分析直接查询（无需读取标题）
+-- ============================================
+CREATE TABLE IF NOT EXISTS crawl_platform_stats (
+    crawl_time TEXT NOT NULL,
+    platform_id TEXT NOT NULL,
+    item_count INTEGER NOT NULL DEFAULT 0,   -- 本次在榜条数
+    new_count INTEGER NOT NULL DEFAULT 0,    -- 本次新增条数（当天首次出现）
+    rank_sum INTEGER NOT NULL DEFAULT 0,     -- 在榜排名之和（求平均排名）
+    best_rank INTEGER NOT NULL DEFAULT 0,    -- 最高排名（未在榜为 0）
+    failed INTEGER NOT NULL DEFAULT 0,       -- 本次抓取是否失败
+    PRIMARY KEY (crawl_time, platform_id)
+) WITHOUT ROWID;
+
+-- 各平台当天去重后的标题数（抓取时按本次涉及的平台刷新）
+CREATE TABLE IF NOT EXISTS platform_title_counts (
+    platform_id TEXT PRIMARY KEY,
+    title_count INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
 -- ============================================
 -- 推送记录表
 -- 用于 push_window once_per_day 功能
@@ -97,6 +119,160 @@ CREATE TABLE IF NOT EXISTS push_records (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- ============================================
+-- AI 分析结果缓存表
+-- 输入指纹相同时直接复用分析结果；最近一条记录同时作为增量重分析的基线
+-- ============================================
+CREATE TABLE IF NOT EXISTS ai_analysis_cache (
+    fingerprint TEXT PRIMARY KEY,        -- 输入指纹（打包后的新闻内容 + 提示词 + 模型）
+    base_key TEXT NOT NULL,              -- 提示词 + 模型 + 分析模式指纹（增量基线匹配）
+    analysis_mode TEXT,
+    result_json TEXT NOT NULL,           -- 分析结果
+    context_json TEXT,                   -- 已分析新闻 {key: [状态签名, 标题]}
+    input_tokens INTEGER DEFAULT 0,      -- 生成该结果时发送的估算 token 数
+    delta_depth INTEGER DEFAULT 0,       -- 连续增量分析次数（0 为全量分析）
+    hits INTEGER DEFAULT 0,              -- 缓存命中次数
+    saved_tokens INTEGER DEFAULT 0,      -- 命中与增量分析累计节省的估算 token 数
+    created_at TEXT NOT NULL,
+    last_hit_at TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_ai_cache_base ON ai_analysis_cache(base_key, created_at);
+
+-- ============================================
+-- 关键词统计表
+-- 抓取时增量维护，供 MCP 分析直接查询（无需重新分词）
+-- 派生表均为 WITHOUT ROWID：主键即存储顺序，不再额外维护一份主键索引
+-- ============================================
+CREATE TABLE IF NOT EXISTS keyword_stats (
+    keyword TEXT PRIMARY KEY,
+    count INTEGER NOT NULL DEFAULT 0,    -- 当天所有标题中的出现次数
+    first_seen TEXT NOT NULL,            -- 首次出现的抓取时间
+    last_seen TEXT NOT NULL              -- 最后出现的抓取时间
+) WITHOUT ROWID;
+
+-- 关键词分平台计数
+CREATE TABLE IF NOT EXISTS keyword_platform_stats (
+    keyword TEXT NOT NULL,
+    platform_id TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (keyword, platform_id)
+) WITHOUT ROWID;
+
+-- 关键词共现计数（keyword1 <= keyword2）
+CREATE TABLE IF NOT EXISTS keyword_cooccurrence (
+    keyword1 TEXT NOT NULL,
+    keyword2 TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (keyword1, keyword2)
+) WITHOUT ROWID;
+
+-- 已计入统计的标题（平台 + 标题），用于增量更新和标题变更回退
+CREATE TABLE IF NOT EXISTS keyword_indexed_titles (
+    platform_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    PRIMARY KEY (platform_id, title)
+) WITHOUT ROWID;
+
+-- 已计入统计的标题包含的关键词，用于按在榜标题刷新 last_seen（无需重新分词）
+CREATE TABLE IF NOT EXISTS keyword_title_keywords (
+    platform_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    PRIMARY KEY (platform_id, title, keyword)
+) WITHOUT ROWID;
+
+-- 统计元信息（提取规则签名不一致时统计不可用）
+CREATE TABLE IF NOT EXISTS keyword_stats_meta (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    extractor_version TEXT NOT NULL,     -- 提取规则签名（规则版本 + 分词词典指纹）
+    updated_at TEXT
+);
+
+-- ============================================
+-- 标题倒排索引与话题时间序列
+-- 抓取时增量维护，供 MCP 话题趋势 / 生命周期分析直接查询
+-- ============================================
+CREATE TABLE IF NOT EXISTS title_docs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    platform_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    UNIQUE (platform_id, title)
+);
+
+-- 标题字符二元组倒排表（小写）
+CREATE TABLE IF NOT EXISTS title_grams (
+    gram TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    PRIMARY KEY (gram, doc_id)
+) WITHOUT ROWID;
+
+-- 预置话题（frequency_words.txt 中的词）当天计数
+CREATE TABLE IF NOT EXISTS topic_stats (
+    topic TEXT PRIMARY KEY,
+    title_count INTEGER NOT NULL DEFAULT 0,   -- 包含该词的（平台, 标题）数
+    first_seen TEXT,                         -- 首次出现的抓取时间
+    last_seen TEXT                           -- 最后在榜的抓取时间
+);
+
+-- 预置话题每个抓取时间点的在榜聚合
+CREATE TABLE IF NOT EXISTS topic_slot_stats (
+    topic TEXT NOT NULL,
+    crawl_time TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,        -- 在榜的（平台, 标题）数
+    rank_sum INTEGER NOT NULL DEFAULT 0,     -- 在榜排名之和（求平均排名）
+    best_rank INTEGER NOT NULL DEFAULT 0,    -- 最高排名
+    PRIMARY KEY (topic, crawl_time)
+) WITHOUT ROWID;
+
+-- 索引元信息（索引规则或预置话题变化时重建）
+CREATE TABLE IF NOT EXISTS title_index_meta (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    index_version TEXT NOT NULL,             -- 索引签名（规则版本 + 话题词指纹）
+    updated_at TEXT
+);
+
+-- ============================================
+-- 关键词热度状态（指数加权滑动统计）
+-- 抓取时增量维护，供 MCP 热点异常检测按任意时间窗口计算基线
+-- ============================================
+CREATE TABLE IF NOT EXISTS keyword_trend_state (
+    keyword TEXT PRIMARY KEY,
+    slot INTEGER NOT NULL,                   -- 在榜条数最后变化的时间点序号（当天从 1 开始）
+    count INTEGER NOT NULL DEFAULT 0,        -- 该时间点起在榜的（平台, 标题）数
+    cum INTEGER NOT NULL DEFAULT 0,          -- 截至该时间点的累计在榜次数
+    m1 REAL NOT NULL DEFAULT 0,              -- 在榜条数的指数加权一阶矩
+    m2 REAL NOT NULL DEFAULT 0,              -- 在榜条数的指数加权二阶矩
+    level REAL NOT NULL DEFAULT 0,           -- Holt 线性趋势模型的水平
+    trend REAL NOT NULL DEFAULT 0            -- Holt 线性趋势模型的趋势（每个时间点）
+) WITHOUT ROWID;
+
+-- 关键词在榜条数变化日志（每次变化记录一行；任意时间点的状态由日志按序重放得到）
+CREATE TABLE IF NOT EXISTS keyword_trend_log (
+    keyword TEXT NOT NULL,
+    slot INTEGER NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (keyword, slot)
+) WITHOUT ROWID;
+
+-- 状态元信息（签名变化或时间点乱序时重放当天数据）
+CREATE TABLE IF NOT EXISTS keyword_trend_meta (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    state_version TEXT NOT NULL,             -- 状态签名（规则版本 + 平滑系数 + 提取规则签名）
+    slot_count INTEGER NOT NULL DEFAULT 0,   -- 已计入的抓取时间点数
+    last_crawl_time TEXT NOT NULL,           -- 最后计入的抓取时间
+    updated_at TEXT
+);
+
+-- ============================================
+-- 派生统计表口径版本
+-- 以分组内第一张表命名，版本低于代码中的版本时整组删除重建
+-- ============================================
+CREATE TABLE IF NOT EXISTS derived_table_versions (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+) WITHOUT ROWID;
+
 -- ============================================
 -- 索引定义
 -- ============================================
@@ -119,3 +295,6 @@ CREATE INDEX IF NOT EXISTS idx_crawl_status_record ON crawl_source_status(crawl_
 
 -- 排名历史索引
 CREATE INDEX IF NOT EXISTS idx_rank_history_news ON rank_history(news_item_id);
+
+-- 排名历史时间索引（每次保存时按抓取时间读取本次在榜标题）
+CREATE INDEX IF NOT EXISTS idx_rank_history_crawl_time ON rank_history(crawl_time);
@@ -5,16 +5,86 @@ SQLite 存储 Mixin
 提供共用的 SQLite 数据库操作逻辑，供 LocalStorageBackend 和 RemoteStorageBackend 复用。
 """
 
+import re
 import sqlite3
 from abc import abstractmethod
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from trendradar.core.anomaly import EMPTY_STATE, get_trend_state_signature, update_state
+from trendradar.core.keywords import (
+    extract_keyword_pairs,
+    extract_keywords,
+    get_extractor_signature,
+)
+from trendradar.core.title_index import (
+    get_title_index_signature,
+    get_topic_words,
+    match_topics,
+    title_grams,
+)
 from trendradar.storage.base import NewsItem, NewsData, RSSItem, RSSData
 from trendradar.utils.url import normalize_url
 
 
+# 抓取时维护的派生统计表分组（含元信息表）及其口径版本：任一表的结构与 schema.sql
+# 不一致，或记录的版本低于当前版本时整组删除重建，元信息缺失时对应的增量维护会按
+# 当天全部数据重新生成。版本记录在 derived_table_versions 表中（以组内第一张表命名，
+# 缺失时按 1 计），统计口径变化而表结构不变时递增版本
+_DERIVED_TABLE_GROUPS = (
+    (2, ("keyword_stats", "keyword_platform_stats", "keyword_cooccurrence",
+         "keyword_indexed_titles", "keyword_title_keywords", "keyword_stats_meta")),
+    (1, ("title_docs", "title_grams", "topic_stats", "topic_slot_stats", "title_index_meta")),
+    (1, ("keyword_trend_state", "keyword_trend_log", "keyword_trend_meta")),
+    (2, ("crawl_platform_stats", "platform_title_counts")),
+)
+
+_CREATE_TABLE_PATTERN = re.compile(r"CREATE TABLE IF NOT EXISTS (\w+) (\(.*?\n\)[^;\n]*);", re.S)
+
+
+def _normalize_table_sql(sql: str) -> str:
+    """去掉注释和多余空白，用于比较建表语句"""
+    return " ".join(re.sub(r"--[^\n]*", "", sql).split())
+
+
+def aggregate_platform_stats(cursor: sqlite3.Cursor, crawl_times: List[str]) -> List[tuple]:
+    """
+    由排名历史与抓取状态计算指定抓取时间点的各平台聚合
+
+    抓取端补齐升级前的抓取时间点、读取端在聚合表缺失时直接计算，两处共用同一口径。
+
+    Args:
+        cursor: 数据库游标
+        crawl_times: 抓取时间列表
+
+    Returns:
+        [(抓取时间, 平台ID, 在榜条数, 新增条数, 排名之和, 最高排名, 是否失败), ...]；
+        抓取失败的平台只有失败标记
+    """
+    if not crawl_times:
+        return []
+    placeholders = ",".join("?" * len(crawl_times))
+    cursor.execute(f"""
+        SELECT r.crawl_time, n.platform_id, COUNT(*),
+               SUM(n.first_crawl_time = r.crawl_time), SUM(r.rank), MIN(r.rank), 0
+        FROM rank_history r
+        JOIN news_items n ON n.id = r.news_item_id
+        WHERE r.rank > 0 AND r.crawl_time IN ({placeholders})
+        GROUP BY r.crawl_time, n.platform_id
+    """, crawl_times)
+    rows = {(row[0], row[1]): tuple(row) for row in cursor.fetchall()}
+    cursor.execute(f"""
+        SELECT c.crawl_time, s.platform_id
+        FROM crawl_source_status s
+        JOIN crawl_records c ON c.id = s.crawl_record_id
+        WHERE s.status = 'failed' AND c.crawl_time IN ({placeholders})
+    """, crawl_times)
+    for crawl_time, platform_id in cursor.fetchall():
+        rows[(crawl_time, platform_id)] = (crawl_time, platform_id, 0, 0, 0, 0, 1)
+    return [rows[key] for key in sorted(rows)]
+
+
 class SQLiteStorageMixin:
     """
     SQLite 存储操作 Mixin
@@ -81,12 +151,51 @@ class SQLiteStorageMixin:
         if schema_path.exists():
             with open(schema_path, "r", encoding="utf-8") as f:
                 schema_sql = f.read()
+            self._drop_outdated_derived_tables(conn, schema_sql)
             conn.executescript(schema_sql)
+            if "derived_table_versions" in schema_sql:
+                conn.executemany("""
+                    INSERT OR REPLACE INTO derived_table_versions (name, version)
+                    VALUES (?, ?)
+                """, [(tables[0], version) for version, tables in _DERIVED_TABLE_GROUPS])
         else:
             raise FileNotFoundError(f"Schema file not found: {schema_path}")
 
         conn.commit()
 
+    def _drop_outdated_derived_tables(self, conn: sqlite3.Connection, schema_sql: str) -> None:
+        """
+        删除结构或口径版本已过时的派生统计表（随后由 schema.sql 按新结构重建）
+
+        Args:
+            conn: 数据库连接
+            schema_sql: schema.sql 内容
+        """
+        expected = {
+            name: _normalize_table_sql(body)
+            for name, body in _CREATE_TABLE_PATTERN.findall(schema_sql)
+        }
+        stored = {
+            name: _normalize_table_sql(sql[sql.index("("):])
+            for name, sql in conn.execute(
+                "SELECT name, sql FROM sqlite_master WHERE type = 'table' AND sql IS NOT NULL"
+            )
+        }
+
+        versions = {}
+        if "derived_table_versions" in stored:
+            versions = dict(conn.execute("SELECT name, version FROM derived_table_versions"))
+
+        for version, group in _DERIVED_TABLE_GROUPS:
+            present = [table for table in group if table in stored and table in expected]
+            if not present:
+                continue
+            if (versions.get(group[0], 1) < version
+                    or any(stored[table] != expected[table] for table in present)):
+                for table in group:
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+                print(f"[存储] 统计表结构或口径已更新，将重新生成: {', '.join(group)}")
+
     # ========================================
     # 新闻数据存储
     # ========================================
@@ -124,9 +233,12 @@ class SQLiteStorageMixin:
             updated_count = 0
             title_changed_count = 0
             success_sources = []
+            # 各平台本次抓取的聚合：[在榜条数, 新增条数, 排名之和, 最高排名]
+            platform_stats: Dict[str, List[int]] = {}
 
             for source_id, news_list in data.items.items():
                 success_sources.append(source_id)
+                stats = platform_stats.setdefault(source_id, [0, 0, 0, 0])
 
                 for item in news_list:
                     try:
@@ -175,6 +287,7 @@ class SQLiteStorageMixin:
                                 """, (item.title, item.rank, item.mobile_url,
                                       data.crawl_time, now_str, existing_id))
                                 updated_count += 1
+                                is_new = False
                             else:
                                 # 不存在，插入新记录（存储标准化后的 URL）
                                 cursor.execute("""
@@ -194,6 +307,7 @@ class SQLiteStorageMixin:
                                     VALUES (?, ?, ?, ?)
                                 """, (new_id, item.rank, data.crawl_time, now_str))
                                 new_count += 1
+                                is_new = True
                         else:
                             # URL 为空的情况，直接插入（不做去重）
                             cursor.execute("""
@@ -213,6 +327,12 @@ class SQLiteStorageMixin:
                                 VALUES (?, ?, ?, ?)
                             """, (new_id, item.rank, data.crawl_time, now_str))
                             new_count += 1
+                            is_new = True
+
+                        stats[0] += 1
+                        stats[1] += is_new
+                        stats[2] += item.rank
+                        stats[3] = min(stats[3], item.rank) if stats[3] else item.rank
 
                     except sqlite3.Error as e:
                         print(f"{log_prefix} 保存新闻条目失败 [{item.title[:30]}...]: {e}")
@@ -302,6 +422,20 @@ class SQLiteStorageMixin:
                         VALUES (?, ?, 'failed')
                     """, (crawl_record_id, failed_id))
 
+            # 记录各平台本次抓取的聚合
+            self._update_platform_stats(
+                cursor, data.crawl_time, platform_stats, data.failed_ids, log_prefix
+            )
+
+            # 增量更新关键词统计表
+            self._update_keyword_stats(cursor, data.crawl_time, now_str, log_prefix)
+
+            # 增量更新标题倒排索引与话题统计
+            self._update_title_index(cursor, data.crawl_time, now_str, log_prefix)
+
+            # 增量更新关键词热度状态
+            self._update_keyword_trend(cursor, data.crawl_time, now_str, log_prefix)
+
             conn.commit()
 
             return True, new_count, updated_count, title_changed_count, off_list_count
@@ -310,6 +444,482 @@ class SQLiteStorageMixin:
             print(f"{log_prefix} 保存失败: {e}")
             return False, 0, 0, 0, 0
 
+    def _update_platform_stats(
+        self,
+        cursor: sqlite3.Cursor,
+        crawl_time: str,
+        platform_stats: Dict[str, List[int]],
+        failed_ids: List[str],
+        log_prefix: str = "[存储]"
+    ) -> None:
+        """
+        写入本次抓取的各平台聚合（在榜条数、新增条数、排名、是否失败）及当天去重后的标题数
+
+        升级前已有的抓取时间点按排名历史补齐，之后每次只写入本次抓取；标题数只刷新
+        本次涉及的平台。
+        失败时回滚到保存点，不影响新闻数据本身的保存。
+
+        Args:
+            cursor: 数据库游标（与新闻数据处于同一事务）
+            crawl_time: 本次抓取时间（HH:MM）
+            platform_stats: {平台ID: [在榜条数, 新增条数, 排名之和, 最高排名]}
+            failed_ids: 本次抓取失败的平台ID
+            log_prefix: 日志前缀
+        """
+        cursor.execute("SAVEPOINT platform_stats")
+        try:
+            # 补齐尚未聚合的历史抓取时间点（仅升级后首次保存时发生）
+            cursor.execute("""
+                SELECT crawl_time FROM crawl_records
+                WHERE crawl_time != ? AND crawl_time NOT IN (
+                    SELECT DISTINCT crawl_time FROM crawl_platform_stats
+                )
+            """, (crawl_time,))
+            missing = [row[0] for row in cursor.fetchall()]
+            cursor.executemany("""
+                INSERT OR REPLACE INTO crawl_platform_stats
+                (crawl_time, platform_id, item_count, new_count, rank_sum, best_rank, failed)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, aggregate_platform_stats(cursor, missing))
+
+            # 同一时间点重复保存时以最后一次为准
+            cursor.execute("DELETE FROM crawl_platform_stats WHERE crawl_time = ?", (crawl_time,))
+            rows = [
+                (crawl_time, platform_id, *stats, 0)
+                for platform_id, stats in platform_stats.items()
+            ]
+            rows.extend(
+                (crawl_time, failed_id, 0, 0, 0, 0, 1)
+                for failed_id in failed_ids if failed_id not in platform_stats
+            )
+            cursor.executemany("""
+                INSERT INTO crawl_platform_stats
+                (crawl_time, platform_id, item_count, new_count, rank_sum, best_rank, failed)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+
+            # 刷新本次涉及的平台（及尚未统计的平台）当天去重后的标题数
+            placeholders = ",".join("?" * len(platform_stats))
+            cursor.execute(f"""
+                INSERT OR REPLACE INTO platform_title_counts (platform_id, title_count)
+                SELECT platform_id, COUNT(DISTINCT title) FROM news_items
+                WHERE platform_id IN ({placeholders})
+                   OR platform_id NOT IN (SELECT platform_id FROM platform_title_counts)
+                GROUP BY platform_id
+            """, list(platform_stats))
+
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT platform_stats")
+            print(f"{log_prefix} 平台聚合更新失败: {e}")
+
+        finally:
+            cursor.execute("RELEASE SAVEPOINT platform_stats")
+
+    def _update_keyword_stats(
+        self,
+        cursor: sqlite3.Cursor,
+        crawl_time: str,
+        now_str: str,
+        log_prefix: str = "[存储]"
+    ) -> None:
+        """
+        增量更新当天的关键词统计表
+
+        只对尚未计入统计的（平台, 标题）分词并累加，同时记录每个标题的关键词；
+        标题变更导致不再存在的旧标题会被扣除。本次抓取仍在榜的已有标题按记录的
+        关键词在 SQL 中刷新 last_seen，无需重新分词。
+        失败时回滚到保存点，不影响新闻数据本身的保存。
+
+        Args:
+            cursor: 数据库游标（与新闻数据处于同一事务）
+            crawl_time: 本次抓取时间（HH:MM）
+            now_str: 当前时间字符串
+            log_prefix: 日志前缀
+        """
+        cursor.execute("SAVEPOINT keyword_stats")
+        try:
+            # 提取规则或分词词典变化后旧统计作废，全部重建
+            signature = get_extractor_signature()
+            cursor.execute("SELECT extractor_version FROM keyword_stats_meta WHERE id = 1")
+            meta = cursor.fetchone()
+            if meta and meta[0] != signature:
+                for table in ("keyword_stats", "keyword_platform_stats", "keyword_cooccurrence",
+                              "keyword_indexed_titles", "keyword_title_keywords"):
+                    cursor.execute(f"DELETE FROM {table}")
+
+            # 新出现的标题（首次保存时也会覆盖升级前已有的数据）
+            cursor.execute("""
+                SELECT n.platform_id, n.title,
+                       MIN(n.first_crawl_time), MAX(n.last_crawl_time)
+                FROM news_items n
+                LEFT JOIN keyword_indexed_titles k
+                    ON k.platform_id = n.platform_id AND k.title = n.title
+                WHERE k.title IS NULL
+                GROUP BY n.platform_id, n.title
+            """)
+            added = cursor.fetchall()
+
+            # 已不存在的标题（标题变更）
+            cursor.execute("""
+                SELECT k.platform_id, k.title FROM keyword_indexed_titles k
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM news_items n
+                    WHERE n.platform_id = k.platform_id AND n.title = k.title
+                )
+            """)
+            removed = cursor.fetchall()
+
+            keyword_delta: Dict[str, int] = {}
+            platform_delta: Dict[tuple, int] = {}
+            pair_delta: Dict[tuple, int] = {}
+            first_seen: Dict[str, str] = {}
+            last_seen: Dict[str, str] = {}
+            title_keyword_rows = []
+
+            def apply(platform_id: str, title: str, sign: int) -> List[str]:
+                keywords = extract_keywords(title)
+                for kw in keywords:
+                    keyword_delta[kw] = keyword_delta.get(kw, 0) + sign
+                    key = (kw, platform_id)
+                    platform_delta[key] = platform_delta.get(key, 0) + sign
+                for pair in extract_keyword_pairs(title):
+                    pair_delta[pair] = pair_delta.get(pair, 0) + sign
+                return keywords
+
+            for platform_id, title, first_time, last_time in added:
+                keywords = apply(platform_id, title, 1)
+                title_keyword_rows.extend((platform_id, title, kw) for kw in set(keywords))
+                for kw in keywords:
+                    if kw not in first_seen or first_time < first_seen[kw]:
+                        first_seen[kw] = first_time
+                    if kw not in last_seen or last_time > last_seen[kw]:
+                        last_seen[kw] = last_time
+
+            for platform_id, title in removed:
+                apply(platform_id, title, -1)
+
+            if keyword_delta:
+                cursor.executemany("""
+                    INSERT INTO keyword_stats (keyword, count, first_seen, last_seen)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(keyword) DO UPDATE SET
+                        count = count + excluded.count,
+                        first_seen = MIN(first_seen, excluded.first_seen),
+                        last_seen = MAX(last_seen, excluded.last_seen)
+                """, [
+                    (kw, delta, first_seen.get(kw, crawl_time), last_seen.get(kw, ""))
+                    for kw, delta in keyword_delta.items()
+                ])
+                cursor.executemany("""
+                    INSERT INTO keyword_platform_stats (keyword, platform_id, count)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT(keyword, platform_id) DO UPDATE SET
+                        count = count + excluded.count
+                """, [(kw, pid, delta) for (kw, pid), delta in platform_delta.items()])
+                cursor.executemany("""
+                    INSERT INTO keyword_cooccurrence (keyword1, keyword2, count)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT(keyword1, keyword2) DO UPDATE SET
+                        count = count + excluded.count
+                """, [(kw1, kw2, delta) for (kw1, kw2), delta in pair_delta.items()])
+
+            if removed:
+                cursor.executemany("""
+                    DELETE FROM keyword_indexed_titles WHERE platform_id = ? AND title = ?
+                """, removed)
+                cursor.executemany("""
+                    DELETE FROM keyword_title_keywords WHERE platform_id = ? AND title = ?
+                """, removed)
+                cursor.execute("DELETE FROM keyword_stats WHERE count <= 0")
+                cursor.execute("DELETE FROM keyword_platform_stats WHERE count <= 0")
+                cursor.execute("DELETE FROM keyword_cooccurrence WHERE count <= 0")
+
+            if added:
+                cursor.executemany("""
+                    INSERT INTO keyword_indexed_titles (platform_id, title) VALUES (?, ?)
+                """, [(row[0], row[1]) for row in added])
+                cursor.executemany("""
+                    INSERT OR IGNORE INTO keyword_title_keywords (platform_id, title, keyword)
+                    VALUES (?, ?, ?)
+                """, title_keyword_rows)
+
+            # 本次仍在榜的已有标题：按记录的关键词刷新 last_seen
+            cursor.execute("""
+                UPDATE keyword_stats SET last_seen = MAX(last_seen, ?)
+                WHERE keyword IN (
+                    SELECT t.keyword FROM news_items n
+                    JOIN keyword_title_keywords t
+                        ON t.platform_id = n.platform_id AND t.title = n.title
+                    WHERE n.last_crawl_time = ? AND n.first_crawl_time != ?
+                )
+            """, (crawl_time, crawl_time, crawl_time))
+
+            cursor.execute("""
+                INSERT OR REPLACE INTO keyword_stats_meta (id, extractor_version, updated_at)
+                VALUES (1, ?, ?)
+            """, (signature, now_str))
+
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT keyword_stats")
+            print(f"{log_prefix} 关键词统计更新失败: {e}")
+
+        finally:
+            cursor.execute("RELEASE SAVEPOINT keyword_stats")
+
+    def _update_title_index(
+        self,
+        cursor: sqlite3.Cursor,
+        crawl_time: str,
+        now_str: str,
+        log_prefix: str = "[存储]"
+    ) -> None:
+        """
+        增量维护当天的标题倒排索引与预置话题统计
+
+        新出现的（平台, 标题）写入二元组倒排表并累加包含的话题计数，标题变更导致
+        不再存在的旧标题从索引中移除；本次抓取的在榜排名按话题聚合写入时间点统计。
+        索引签名（规则版本或预置话题词）变化时全部重建。
+        失败时回滚到保存点，不影响新闻数据本身的保存。
+
+        Args:
+            cursor: 数据库游标（与新闻数据处于同一事务）
+            crawl_time: 本次抓取时间（HH:MM）
+            now_str: 当前时间字符串
+            log_prefix: 日志前缀
+        """
+        cursor.execute("SAVEPOINT title_index")
+        try:
+            signature = get_title_index_signature()
+            topics = get_topic_words()
+            cursor.execute("SELECT index_version FROM title_index_meta WHERE id = 1")
+            meta = cursor.fetchone()
+            rebuild = not meta or meta[0] != signature
+            if rebuild:
+                for table in ("title_docs", "title_grams", "topic_stats", "topic_slot_stats"):
+                    cursor.execute(f"DELETE FROM {table}")
+
+            # 新出现的标题（按首次入库顺序编号，与读取端的标题顺序一致）
+            cursor.execute("""
+                SELECT n.platform_id, n.title, MIN(n.first_crawl_time)
+                FROM news_items n
+                LEFT JOIN title_docs d
+                    ON d.platform_id = n.platform_id AND d.title = n.title
+                WHERE d.id IS NULL
+                GROUP BY n.platform_id, n.title
+                ORDER BY MIN(n.id)
+            """)
+            added = cursor.fetchall()
+
+            # 已不存在的标题（标题变更）
+            cursor.execute("""
+                SELECT d.id, d.title FROM title_docs d
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM news_items n
+                    WHERE n.platform_id = d.platform_id AND n.title = d.title
+                )
+            """)
+            removed = cursor.fetchall()
+
+            topic_delta: Dict[str, int] = {}
+            first_seen: Dict[str, str] = {}
+
+            for _, title in removed:
+                for topic in match_topics(title, topics):
+                    topic_delta[topic] = topic_delta.get(topic, 0) - 1
+            if removed:
+                doc_ids = [(row[0],) for row in removed]
+                cursor.executemany("DELETE FROM title_grams WHERE doc_id = ?", doc_ids)
+                cursor.executemany("DELETE FROM title_docs WHERE id = ?", doc_ids)
+
+            gram_rows = []
+            for platform_id, title, first_time in added:
+                cursor.execute("""
+                    INSERT INTO title_docs (platform_id, title) VALUES (?, ?)
+                """, (platform_id, title))
+                doc_id = cursor.lastrowid
+                gram_rows.extend((gram, doc_id) for gram in title_grams(title))
+                for topic in match_topics(title, topics):
+                    topic_delta[topic] = topic_delta.get(topic, 0) + 1
+                    if topic not in first_seen or first_time < first_seen[topic]:
+                        first_seen[topic] = first_time
+            if gram_rows:
+                cursor.executemany("""
+                    INSERT OR IGNORE INTO title_grams (gram, doc_id) VALUES (?, ?)
+                """, gram_rows)
+
+            if topic_delta:
+                cursor.executemany("""
+                    INSERT INTO topic_stats (topic, title_count, first_seen, last_seen)
+                    VALUES (?, ?, ?, NULL)
+                    ON CONFLICT(topic) DO UPDATE SET
+                        title_count = title_count + excluded.title_count,
+                        first_seen = MIN(COALESCE(first_seen, excluded.first_seen),
+                                         COALESCE(excluded.first_seen, first_seen))
+                """, [
+                    (topic, delta, first_seen.get(topic))
+                    for topic, delta in topic_delta.items()
+                ])
+                cursor.execute("DELETE FROM topic_stats WHERE title_count <= 0")
+
+            # 在榜排名按话题聚合（重建时覆盖当天全部抓取时间点）
+            query = """
+                SELECT r.crawl_time, n.platform_id, n.title, r.rank
+                FROM rank_history r
+                JOIN news_items n ON n.id = r.news_item_id
+                WHERE r.rank > 0
+            """
+            if rebuild:
+                cursor.execute(query)
+            else:
+                cursor.execute(query + " AND r.crawl_time = ?", (crawl_time,))
+
+            title_topics: Dict[tuple, List[str]] = {}
+            slot_ranks: Dict[tuple, Dict[tuple, int]] = {}
+            for slot_time, platform_id, title, rank in cursor.fetchall():
+                key = (platform_id, title)
+                matched = title_topics.get(key)
+                if matched is None:
+                    matched = title_topics[key] = match_topics(title, topics)
+                for topic in matched:
+                    ranks = slot_ranks.setdefault((topic, slot_time), {})
+                    if key not in ranks or rank < ranks[key]:
+                        ranks[key] = rank
+
+            if slot_ranks:
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO topic_slot_stats
+                    (topic, crawl_time, count, rank_sum, best_rank)
+                    VALUES (?, ?, ?, ?, ?)
+                """, [
+                    (topic, slot_time, len(ranks), sum(ranks.values()), min(ranks.values()))
+                    for (topic, slot_time), ranks in slot_ranks.items()
+                ])
+                last_seen: Dict[str, str] = {}
+                for topic, slot_time in slot_ranks:
+                    if slot_time > last_seen.get(topic, ""):
+                        last_seen[topic] = slot_time
+                cursor.executemany("""
+                    UPDATE topic_stats SET last_seen = MAX(COALESCE(last_seen, ''), ?)
+                    WHERE topic = ?
+                """, [(slot_time, topic) for topic, slot_time in last_seen.items()])
+
+            cursor.execute("""
+                INSERT OR REPLACE INTO title_index_meta (id, index_version, updated_at)
+                VALUES (1, ?, ?)
+            """, (signature, now_str))
+
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT title_index")
+            print(f"{log_prefix} 标题索引更新失败: {e}")
+
+        finally:
+            cursor.execute("RELEASE SAVEPOINT title_index")
+
+    def _update_keyword_trend(
+        self,
+        cursor: sqlite3.Cursor,
+        crawl_time: str,
+        now_str: str,
+        log_prefix: str = "[存储]"
+    ) -> None:
+        """
+        增量维护当天的关键词热度状态
+
+        本次抓取的在榜（平台, 标题）与上一时间点比较，只对上榜 / 下榜的标题分词，
+        得到在榜条数发生变化的关键词并更新其状态、追加变化日志；条数不变的关键词
+        不写入（读取端按闭式推进）。首次维护、状态签名变化或同一时间点重复保存时，
+        按当天全部抓取时间点重放。失败时回滚到保存点，不影响新闻数据本身的保存。
+
+        Args:
+            cursor: 数据库游标（与新闻数据处于同一事务）
+            crawl_time: 本次抓取时间（HH:MM）
+            now_str: 当前时间字符串
+            log_prefix: 日志前缀
+        """
+        cursor.execute("SAVEPOINT keyword_trend")
+        try:
+            signature = get_trend_state_signature()
+            cursor.execute("""
+                SELECT state_version, slot_count, last_crawl_time
+                FROM keyword_trend_meta WHERE id = 1
+            """)
+            meta = cursor.fetchone()
+            replay = not meta or meta[0] != signature or crawl_time <= meta[2]
+            if replay:
+                for table in ("keyword_trend_state", "keyword_trend_log"):
+                    cursor.execute(f"DELETE FROM {table}")
+                cursor.execute("SELECT crawl_time FROM crawl_records ORDER BY crawl_time")
+                slot_times = [row[0] for row in cursor.fetchall()]
+                slot = 0
+            else:
+                slot_times = [crawl_time]
+                slot = meta[1]
+
+            def on_list_titles(slot_time: str) -> set:
+                cursor.execute("""
+                    SELECT DISTINCT n.platform_id, n.title
+                    FROM rank_history r
+                    JOIN news_items n ON n.id = r.news_item_id
+                    WHERE r.crawl_time = ? AND r.rank > 0
+                """, (slot_time,))
+                return set(cursor.fetchall())
+
+            prev_titles = set() if replay else on_list_titles(meta[2])
+            states: Dict[str, tuple] = {}
+            log_rows = []
+            for slot_time in slot_times:
+                slot += 1
+                titles = on_list_titles(slot_time)
+                delta: Dict[str, int] = {}
+                for key in prev_titles - titles:
+                    for kw in extract_keywords(key[1]):
+                        delta[kw] = delta.get(kw, 0) - 1
+                for key in titles - prev_titles:
+                    for kw in extract_keywords(key[1]):
+                        delta[kw] = delta.get(kw, 0) + 1
+                prev_titles = titles
+
+                changed = [kw for kw, d in delta.items() if d]
+                missing = [kw for kw in changed if kw not in states]
+                if not replay and missing:
+                    placeholders = ",".join("?" * len(missing))
+                    cursor.execute(f"""
+                        SELECT keyword, slot, count, cum, m1, m2, level, trend
+                        FROM keyword_trend_state
+                        WHERE keyword IN ({placeholders})
+                    """, missing)
+                    for row in cursor.fetchall():
+                        states[row[0]] = tuple(row[1:])
+
+                for kw in changed:
+                    state = states.get(kw, EMPTY_STATE)
+                    state = states[kw] = update_state(state, slot, state[1] + delta[kw])
+                    log_rows.append((kw, slot, state[1]))
+
+            if log_rows:
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO keyword_trend_log (keyword, slot, count)
+                    VALUES (?, ?, ?)
+                """, log_rows)
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO keyword_trend_state
+                    (keyword, slot, count, cum, m1, m2, level, trend)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, [(kw,) + state for kw, state in states.items()])
+
+            cursor.execute("""
+                INSERT OR REPLACE INTO keyword_trend_meta
+                (id, state_version, slot_count, last_crawl_time, updated_at)
+                VALUES (1, ?, ?, ?, ?)
+            """, (signature, slot, slot_times[-1] if slot_times else crawl_time, now_str))
+
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT keyword_trend")
+            print(f"{log_prefix} 关键词热度状态更新失败: {e}")
+
+        finally:
+            cursor.execute("RELEASE SAVEPOINT keyword_trend")
+
     def _get_today_all_data_impl(self, date: Optional[str] = None) -> Optional[NewsData]:
         """
         获取指定日期的所有新闻数据（合并后）
@@ -688,6 +1298,33 @@ class SQLiteStorageMixin:
             print(f"[存储] 获取抓取时间列表失败: {e}")
             return []
 
+    def _get_keyword_trend_log_impl(self, date: Optional[str] = None) -> Optional[Dict]:
+        """
+        获取指定日期的关键词热度状态变化日志
+
+        Args:
+            date: 日期字符串，默认为今天
+
+        Returns:
+            {"slot_count": 时间点数, "rows": [(关键词, 时间点序号, 在榜条数), ...]}；
+            状态不可用（未生成或规则签名不一致）时返回 None
+        """
+        try:
+            conn = self._get_connection(date)
+            cursor = conn.cursor()
+
+            cursor.execute("SELECT state_version, slot_count FROM keyword_trend_meta WHERE id = 1")
+            meta = cursor.fetchone()
+            if not meta or meta[0] != get_trend_state_signature():
+                return None
+
+            cursor.execute("SELECT keyword, slot, count FROM keyword_trend_log")
+            return {"slot_count": meta[1], "rows": [tuple(row) for row in cursor.fetchall()]}
+
+        except Exception as e:
+            print(f"[存储] 获取关键词热度日志失败: {e}")
+            return None
+
     # ========================================
     # 推送记录
     # ========================================
@@ -926,10 +1563,317 @@ class SQLiteStorageMixin:
             print(f"[存储] 获取推送状态失败: {e}")
             return {}
 
+    # ========================================
+    # AI 分析缓存
+    # ========================================
+
+    _AI_CACHE_COLUMNS = (
+        "fingerprint", "base_key", "analysis_mode", "result_json", "context_json",
+        "input_tokens", "delta_depth", "hits", "saved_tokens", "created_at", "last_hit_at",
+    )
+
+    def _get_ai_analysis_cache_impl(
+        self,
+        fingerprint: Optional[str] = None,
+        base_key: Optional[str] = None,
+        date: Optional[str] = None,
+    ) -> Optional[Dict]:
+        """
+        获取 AI 分析缓存记录
+
+        Args:
+            fingerprint: 输入指纹（精确匹配）
+            base_key: 基线指纹（返回该基线下最近一条记录，用于增量分析）
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            缓存记录字典，不存在时返回 None
+        """
+        try:
+            conn = self._get_connection(date)
+            cursor = conn.cursor()
+            columns = ", ".join(self._AI_CACHE_COLUMNS)
+
+            if fingerprint:
+                cursor.execute(
+                    f"SELECT {columns} FROM ai_analysis_cache WHERE fingerprint = ?",
+                    (fingerprint,),
+                )
+            elif base_key:
+                cursor.execute(
+                    f"""
+                    SELECT {columns} FROM ai_analysis_cache
+                    WHERE base_key = ?
+                    ORDER BY created_at DESC, rowid DESC
+                    LIMIT 1
+                    """,
+                    (base_key,),
+                )
+            else:
+                return None
+
+            row = cursor.fetchone()
+            if row:
+                return dict(zip(self._AI_CACHE_COLUMNS, row))
+            return None
+
+        except Exception as e:
+            print(f"[存储] 读取 AI 分析缓存失败: {e}")
+            return None
+
+    def _save_ai_analysis_cache_impl(self, entry: Dict, date: Optional[str] = None) -> bool:
+        """
+        保存 AI 分析缓存记录
+
+        Args:
+            entry: 缓存记录（fingerprint, base_key, analysis_mode, result_json,
+                   context_json, input_tokens, delta_depth, saved_tokens）
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            是否保存成功
+        """
+        try:
+            conn = self._get_connection(date)
+            cursor = conn.cursor()
+
+            now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
+
+            cursor.execute("""
+                INSERT INTO ai_analysis_cache
+                    (fingerprint, base_key, analysis_mode, result_json, context_json,
+                     input_tokens, delta_depth, saved_tokens, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(fingerprint) DO UPDATE SET
+                    result_json = excluded.result_json,
+                    context_json = excluded.context_json,
+                    input_tokens = excluded.input_tokens,
+                    delta_depth = excluded.delta_depth,
+                    saved_tokens = saved_tokens + excluded.saved_tokens,
+                    created_at = excluded.created_at
+            """, (
+                entry["fingerprint"],
+                entry["base_key"],
+                entry.get("analysis_mode", ""),
+                entry["result_json"],
+                entry.get("context_json", ""),
+                entry.get("input_tokens", 0),
+                entry.get("delta_depth", 0),
+                entry.get("saved_tokens", 0),
+                now_str,
+            ))
+
+            conn.commit()
+            return True
+
+        except Exception as e:
+            print(f"[存储] 保存 AI 分析缓存失败: {e}")
+            return False
+
+    def _record_ai_analysis_cache_hit_impl(
+        self,
+        fingerprint: str,
+        saved_tokens: int = 0,
+        date: Optional[str] = None,
+    ) -> bool:
+        """
+        记录 AI 分析缓存命中
+
+        Args:
+            fingerprint: 命中的缓存指纹
+            saved_tokens: 本次节省的估算 token 数
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            是否记录成功
+        """
+        try:
+            conn = self._get_connection(date)
+            cursor = conn.cursor()
+
+            now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
+
+            cursor.execute("""
+                UPDATE ai_analysis_cache
+                SET hits = hits + 1,
+                    saved_tokens = saved_tokens + ?,
+                    last_hit_at = ?
+                WHERE fingerprint = ?
+            """, (saved_tokens, now_str, fingerprint))
+
+            conn.commit()
+            return cursor.rowcount > 0
+
+        except Exception as e:
+            print(f"[存储] 记录 AI 分析缓存命中失败: {e}")
+            return False
+
     # ========================================
     # RSS 数据存储
     # ========================================
 
+    def _upsert_rss_items_batch(
+        self,
+        cursor: sqlite3.Cursor,
+        data: RSSData,
+        now_str: str
+    ) -> tuple[int, int]:
+        """
+        批量 upsert RSS 条目（在保存点内执行，失败时回滚并抛出异常）
+
+        所有条目按原顺序通过一次 executemany 写入：有 URL 的条目按
+        ON CONFLICT(url, feed_id) 更新；空 URL 的条目只保留每个源的第一条
+        （冲突时跳过，与逐条路径一致）。
+        新增数量通过自增主键的前后差值计算，同一批次内重复出现的 URL
+        第二次起计为更新，与逐条保存的计数口径相同。
+
+        Args:
+            cursor: 数据库游标
+            data: RSS 数据
+            now_str: 当前时间字符串
+
+        Returns:
+            (new_count, updated_count)
+        """
+        rows = []
+        url_item_count = 0
+        for feed_id, rss_list in data.items.items():
+            for item in rss_list:
+                if item.url:
+                    url_item_count += 1
+                rows.append((item.title, feed_id, item.url or "", item.published_at,
+                             item.summary, item.author, data.crawl_time,
+                             data.crawl_time, now_str, now_str))
+
+        cursor.execute("SAVEPOINT rss_items_batch")
+        try:
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM rss_items")
+            max_id_before = cursor.fetchone()[0]
+
+            cursor.executemany("""
+                INSERT INTO rss_items
+                (title, feed_id, url, published_at, summary, author,
+                 first_crawl_time, last_crawl_time, crawl_count,
+                 created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+                ON CONFLICT(url, feed_id) DO UPDATE SET
+                    title = excluded.title,
+                    published_at = excluded.published_at,
+                    summary = excluded.summary,
+                    author = excluded.author,
+                    last_crawl_time = excluded.last_crawl_time,
+                    crawl_count = crawl_count + 1,
+                    updated_at = excluded.updated_at
+                WHERE excluded.url != ''
+            """, rows)
+
+            cursor.execute("""
+                SELECT COUNT(*), COALESCE(SUM(url != ''), 0)
+                FROM rss_items WHERE id > ?
+            """, (max_id_before,))
+            new_count, new_url_count = cursor.fetchone()
+
+        except Exception:
+            cursor.execute("ROLLBACK TO SAVEPOINT rss_items_batch")
+            raise
+
+        finally:
+            cursor.execute("RELEASE SAVEPOINT rss_items_batch")
+
+        return new_count, url_item_count - new_url_count
+
+    def _upsert_rss_items_rowwise(
+        self,
+        cursor: sqlite3.Cursor,
+        data: RSSData,
+        now_str: str,
+        log_prefix: str = "[存储]"
+    ) -> tuple[int, int]:
+        """
+        逐条保存 RSS 条目（批量路径失败时的兜底，单条失败不影响其他条目）
+
+        Args:
+            cursor: 数据库游标
+            data: RSS 数据
+            now_str: 当前时间字符串
+            log_prefix: 日志前缀
+
+        Returns:
+            (new_count, updated_count)
+        """
+        # 统计计数器
+        new_count = 0
+        updated_count = 0
+
+        for feed_id, rss_list in data.items.items():
+            for item in rss_list:
+                try:
+                    # 检查是否已存在（通过 URL + feed_id）
+                    if item.url:
+                        cursor.execute("""
+                            SELECT id, title FROM rss_items
+                            WHERE url = ? AND feed_id = ?
+                        """, (item.url, feed_id))
+                        existing = cursor.fetchone()
+
+                        if existing:
+                            # 已存在，更新记录
+                            existing_id = existing[0]
+                            cursor.execute("""
+                                UPDATE rss_items SET
+                                    title = ?,
+                                    published_at = ?,
+                                    summary = ?,
+                                    author = ?,
+                                    last_crawl_time = ?,
+                                    crawl_count = crawl_count + 1,
+                                    updated_at = ?
+                                WHERE id = ?
+                            """, (item.title, item.published_at, item.summary,
+                                  item.author, data.crawl_time, now_str, existing_id))
+                            updated_count += 1
+                        else:
+                            # 不存在，插入新记录（使用 ON CONFLICT 兜底处理并发/竞争场景）
+                            cursor.execute("""
+                                INSERT INTO rss_items
+                                (title, feed_id, url, published_at, summary, author,
+                                 first_crawl_time, last_crawl_time, crawl_count,
+                                 created_at, updated_at)
+                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+                                ON CONFLICT(url, feed_id) DO UPDATE SET
+                                    title = excluded.title,
+                                    published_at = excluded.published_at,
+                                    summary = excluded.summary,
+                                    author = excluded.author,
+                                    last_crawl_time = excluded.last_crawl_time,
+                                    crawl_count = crawl_count + 1,
+                                    updated_at = excluded.updated_at
+                            """, (item.title, feed_id, item.url, item.published_at,
+                                  item.summary, item.author, data.crawl_time,
+                                  data.crawl_time, now_str, now_str))
+                            new_count += 1
+                    else:
+                        # URL 为空，用 try-except 处理重复
+                        try:
+                            cursor.execute("""
+                                INSERT INTO rss_items
+                                (title, feed_id, url, published_at, summary, author,
+                                 first_crawl_time, last_crawl_time, crawl_count,
+                                 created_at, updated_at)
+                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+                            """, (item.title, feed_id, "", item.published_at,
+                                  item.summary, item.author, data.crawl_time,
+                                  data.crawl_time, now_str, now_str))
+                            new_count += 1
+                        except sqlite3.IntegrityError:
+                            # 重复的空 URL 条目，忽略
+                            pass
+
+                except sqlite3.Error as e:
+                    print(f"{log_prefix} 保存 RSS 条目失败 [{item.title[:30]}...]: {e}")
+
+        return new_count, updated_count
+
     def _save_rss_data_impl(self, data: RSSData, log_prefix: str = "[存储]") -> tuple[bool, int, int]:
         """
         保存 RSS 数据到 SQLite（以 URL 为唯一标识）
@@ -948,85 +1892,22 @@ class SQLiteStorageMixin:
             now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
 
             # 同步 RSS 源信息到 rss_feeds 表
-            for feed_id, feed_name in data.id_to_name.items():
-                cursor.execute("""
-                    INSERT INTO rss_feeds (id, name, updated_at)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(id) DO UPDATE SET
-                        name = excluded.name,
-                        updated_at = excluded.updated_at
-                """, (feed_id, feed_name, now_str))
-
-            # 统计计数器
-            new_count = 0
-            updated_count = 0
-
-            for feed_id, rss_list in data.items.items():
-                for item in rss_list:
-                    try:
-                        # 检查是否已存在（通过 URL + feed_id）
-                        if item.url:
-                            cursor.execute("""
-                                SELECT id, title FROM rss_items
-                                WHERE url = ? AND feed_id = ?
-                            """, (item.url, feed_id))
-                            existing = cursor.fetchone()
-
-                            if existing:
-                                # 已存在，更新记录
-                                existing_id = existing[0]
-                                cursor.execute("""
-                                    UPDATE rss_items SET
-                                        title = ?,
-                                        published_at = ?,
-                                        summary = ?,
-                                        author = ?,
-                                        last_crawl_time = ?,
-                                        crawl_count = crawl_count + 1,
-                                        updated_at = ?
-                                    WHERE id = ?
-                                """, (item.title, item.published_at, item.summary,
-                                      item.author, data.crawl_time, now_str, existing_id))
-                                updated_count += 1
-                            else:
-                                # 不存在，插入新记录（使用 ON CONFLICT 兜底处理并发/竞争场景）
-                                cursor.execute("""
-                                    INSERT INTO rss_items
-                                    (title, feed_id, url, published_at, summary, author,
-                                     first_crawl_time, last_crawl_time, crawl_count,
-                                     created_at, updated_at)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                                    ON CONFLICT(url, feed_id) DO UPDATE SET
-                                        title = excluded.title,
-                                        published_at = excluded.published_at,
-                                        summary = excluded.summary,
-                                        author = excluded.author,
-                                        last_crawl_time = excluded.last_crawl_time,
-                                        crawl_count = crawl_count + 1,
-                                        updated_at = excluded.updated_at
-                                """, (item.title, feed_id, item.url, item.published_at,
-                                      item.summary, item.author, data.crawl_time,
-                                      data.crawl_time, now_str, now_str))
-                                new_count += 1
-                        else:
-                            # URL 为空，用 try-except 处理重复
-                            try:
-                                cursor.execute("""
-                                    INSERT INTO rss_items
-                                    (title, feed_id, url, published_at, summary, author,
-                                     first_crawl_time, last_crawl_time, crawl_count,
-                                     created_at, updated_at)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                                """, (item.title, feed_id, "", item.published_at,
-                                      item.summary, item.author, data.crawl_time,
-                                      data.crawl_time, now_str, now_str))
-                                new_count += 1
-                            except sqlite3.IntegrityError:
-                                # 重复的空 URL 条目，忽略
-                                pass
-
-                    except sqlite3.Error as e:
-                        print(f"{log_prefix} 保存 RSS 条目失败 [{item.title[:30]}...]: {e}")
+            cursor.executemany("""
+                INSERT INTO rss_feeds (id, name, updated_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    name = excluded.name,
+                    updated_at = excluded.updated_at
+            """, [(feed_id, feed_name, now_str) for feed_id, feed_name in data.id_to_name.items()])
+
+            # 批量 upsert；个别条目不合法导致批量失败时回退到逐条保存
+            try:
+                new_count, updated_count = self._upsert_rss_items_batch(cursor, data, now_str)
+            except sqlite3.Error as e:
+                print(f"{log_prefix} RSS 批量保存失败，改为逐条保存: {e}")
+                new_count, updated_count = self._upsert_rss_items_rowwise(
+                    cursor, data, now_str, log_prefix
+                )
 
             total_items = new_count + updated_count
 
@@ -1045,26 +1926,20 @@ class SQLiteStorageMixin:
             if record_row:
                 crawl_record_id = record_row[0]
 
-                # 记录成功的源
-                for feed_id in data.items.keys():
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO rss_crawl_status
-                        (crawl_record_id, feed_id, status)
-                        VALUES (?, ?, 'success')
-                    """, (crawl_record_id, feed_id))
-
-                # 记录失败的源
-                for failed_id in data.failed_ids:
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO rss_feeds (id, name, updated_at)
-                        VALUES (?, ?, ?)
-                    """, (failed_id, failed_id, now_str))
-
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO rss_crawl_status
-                        (crawl_record_id, feed_id, status)
-                        VALUES (?, ?, 'failed')
-                    """, (crawl_record_id, failed_id))
+                # 记录失败的源（失败源可能不在配置映射中，先补齐 rss_feeds）
+                cursor.executemany("""
+                    INSERT OR IGNORE INTO rss_feeds (id, name, updated_at)
+                    VALUES (?, ?, ?)
+                """, [(failed_id, failed_id, now_str) for failed_id in data.failed_ids])
+
+                # 记录各源抓取状态（成功在前、失败在后，同一源以失败为准）
+                status_rows = [(crawl_record_id, feed_id, "success") for feed_id in data.items.keys()]
+                status_rows += [(crawl_record_id, failed_id, "failed") for failed_id in data.failed_ids]
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO rss_crawl_status
+                    (crawl_record_id, feed_id, status)
+                    VALUES (?, ?, ?)
+                """, status_rows)
 
             conn.commit()
 
@@ -0,0 +1,377 @@
+# coding=utf-8
+"""
+远程存储同步引擎
+
+把远程存储（S3 兼容协议）中的每日数据库拉取到本地 output/{type}/{date}.db：
+- 每种数据库类型只 list 一次，用返回的 ETag / 大小与本地清单比对，未变化的文件直接跳过
+- 需要下载的文件拆成固定大小的分片，所有分片在同一个线程池中并发执行 Range GET
+- 下载先写入 {date}.db.part，已完成的分片记录在 {date}.db.part.json 中，
+  中断后再次同步只补齐缺失分片（对象 ETag 变化时自动重新下载）
+- 全部分片完成并校验大小后原子替换目标文件，再更新清单
+
+本地清单保存在 output/.remote_sync.json，记录每个文件拉取时的远程 ETag / 大小
+以及落盘后的本地大小 / 修改时间，用于区分"远程有更新"和"本地已被修改"。
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+# 本地同步清单文件名（位于本地数据目录下）
+SYNC_MANIFEST_NAME = ".remote_sync.json"
+
+# 并发下载线程数（所有文件的分片共用）
+SYNC_MAX_WORKERS = 8
+
+# 分片大小：小于该大小的文件整体一次 GET，更大的文件按分片并发下载
+SYNC_PART_SIZE = 8 * 1024 * 1024
+
+# 每次从响应流读取的块大小
+SYNC_CHUNK_SIZE = 1024 * 1024
+
+_DB_KEY_PATTERN = re.compile(r'^(news|rss)/(\d{4}-\d{2}-\d{2})\.db$')
+
+
+class _Transfer:
+    """单个文件的下载状态（分片完成情况持久化到 .part.json）"""
+
+    def __init__(self, key: str, dest: Path, etag: str, size: int):
+        self.key = key
+        self.dest = dest
+        self.etag = etag
+        self.size = size
+        self.part_path = dest.with_name(dest.name + ".part")
+        self.state_path = dest.with_name(dest.name + ".part.json")
+        self.part_count = max((size + SYNC_PART_SIZE - 1) // SYNC_PART_SIZE, 1)
+        self.done = set()
+        self.lock = threading.Lock()
+
+    def prepare(self) -> None:
+        """加载可续传的分片记录并预分配临时文件"""
+        self.dest.parent.mkdir(parents=True, exist_ok=True)
+
+        state = None
+        if self.part_path.exists() and self.state_path.exists():
+            try:
+                with open(self.state_path, "r", encoding="utf-8") as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                state = None
+
+        # 只有同一版本对象、同一分片方式的记录才能续传
+        if (
+            state
+            and state.get("etag") == self.etag
+            and state.get("size") == self.size
+            and state.get("part_size") == SYNC_PART_SIZE
+            and self.part_path.stat().st_size == self.size
+        ):
+            self.done = {i for i in state.get("done", []) if 0 <= i < self.part_count}
+        else:
+            self.done = set()
+            with open(self.part_path, "wb") as f:
+                f.truncate(self.size)
+            self._save_state()
+
+    def pending_parts(self) -> List[int]:
+        return [i for i in range(self.part_count) if i not in self.done]
+
+    def part_range(self, index: int):
+        start = index * SYNC_PART_SIZE
+        end = min(start + SYNC_PART_SIZE, self.size) - 1
+        return start, end
+
+    def mark_done(self, index: int) -> None:
+        with self.lock:
+            self.done.add(index)
+            self._save_state()
+
+    @property
+    def complete(self) -> bool:
+        return len(self.done) >= self.part_count
+
+    def finalize(self) -> None:
+        """校验大小后原子替换目标文件，并清除续传记录"""
+        actual = self.part_path.stat().st_size
+        if actual != self.size:
+            raise ValueError(f"文件大小不一致: {self.key} ({actual} != {self.size})")
+
+        # 目标文件被替换，旧的 WAL / SHM 不再对应，需要一起删除
+        for suffix in ("-wal", "-shm", "-journal"):
+            stale = self.dest.with_name(self.dest.name + suffix)
+            if stale.exists():
+                stale.unlink()
+
+        os.replace(self.part_path, self.dest)
+        if self.state_path.exists():
+            self.state_path.unlink()
+
+    def _save_state(self) -> None:
+        _write_json_atomic(self.state_path, {
+            "key": self.key,
+            "etag": self.etag,
+            "size": self.size,
+            "part_size": SYNC_PART_SIZE,
+            "done": sorted(self.done),
+        })
+
+
+class RemoteSyncEngine:
+    """
+    远程 → 本地的每日数据库同步引擎
+
+    Examples:
+        >>> engine = RemoteSyncEngine(s3_client, "my-bucket", "output")
+        >>> result = engine.sync(["2025-12-30", "2025-12-29"])
+        >>> result["synced"]
+        ['news/2025-12-30.db', 'rss/2025-12-30.db']
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket_name: str,
+        local_dir: str,
+        max_workers: int = SYNC_MAX_WORKERS,
+    ):
+        """
+        Args:
+            s3_client: boto3 S3 客户端（客户端对象可在线程间共享）
+            bucket_name: 存储桶名称
+            local_dir: 本地数据目录（如 output）
+            max_workers: 并发下载线程数
+        """
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.local_dir = Path(local_dir)
+        self.max_workers = max(int(max_workers), 1)
+        self.manifest_path = self.local_dir / SYNC_MANIFEST_NAME
+
+    # ========================================
+    # 远程列表与本地清单
+    # ========================================
+
+    def list_remote_objects(self, db_type: str = "news") -> Dict[str, Dict]:
+        """
+        列出远程某类数据库的全部对象（一次分页 list，不逐个 HEAD）
+
+        Args:
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            {date: {"key": ..., "etag": ..., "size": ...}}
+        """
+        objects = {}
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=f"{db_type}/"):
+            for obj in page.get("Contents", []):
+                match = _DB_KEY_PATTERN.match(obj["Key"])
+                if match and match.group(1) == db_type:
+                    objects[match.group(2)] = {
+                        "key": obj["Key"],
+                        "etag": obj.get("ETag", ""),
+                        "size": int(obj.get("Size", 0)),
+                    }
+        return objects
+
+    def load_manifest(self) -> Dict[str, Dict]:
+        """读取本地同步清单（不存在或损坏时返回空字典）"""
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError) as e:
+            print(f"[远程同步] 同步清单损坏，将重新建立: {e}")
+            return {}
+
+    def save_manifest(self, manifest: Dict[str, Dict]) -> None:
+        """原子写入本地同步清单"""
+        self.local_dir.mkdir(parents=True, exist_ok=True)
+        _write_json_atomic(self.manifest_path, manifest)
+
+    # ========================================
+    # 同步
+    # ========================================
+
+    def sync(
+        self,
+        dates: Iterable[str],
+        db_types: Iterable[str] = ("news", "rss"),
+    ) -> Dict[str, List]:
+        """
+        同步指定日期的数据库到本地
+
+        判定规则（以对象键为单位）：
+        - 远程不存在 → missing
+        - 本地不存在 → 下载
+        - 本地存在且清单记录与远程 ETag / 大小一致 → unchanged
+        - 本地存在、远程已更新、本地自上次拉取后未被修改 → 下载覆盖
+        - 本地存在但没有拉取记录或已被本地修改 → skipped（保留本地数据）
+
+        Args:
+            dates: 日期列表（YYYY-MM-DD）
+            db_types: 数据库类型
+
+        Returns:
+            {
+                "synced": [对象键, ...],
+                "unchanged": [...],
+                "skipped": [...],
+                "missing": [...],
+                "failed": [{"key": ..., "error": ...}, ...],
+                "bytes": 下载字节数,
+            }
+        """
+        dates = list(dict.fromkeys(dates))
+        result = {"synced": [], "unchanged": [], "skipped": [], "missing": [], "failed": [], "bytes": 0}
+        if not dates:
+            return result
+
+        manifest = self.load_manifest()
+        transfers: List[_Transfer] = []
+
+        for db_type in db_types:
+            remote_objects = self.list_remote_objects(db_type)
+            for date_str in dates:
+                key = f"{db_type}/{date_str}.db"
+                remote = remote_objects.get(date_str)
+                if remote is None:
+                    result["missing"].append(key)
+                    continue
+
+                dest = self.local_dir / db_type / f"{date_str}.db"
+                action = self._plan(dest, remote, manifest.get(key))
+                if action == "download":
+                    transfers.append(_Transfer(key, dest, remote["etag"], remote["size"]))
+                else:
+                    result[action].append(key)
+
+        if transfers:
+            self._run_transfers(transfers, manifest, result)
+            self.save_manifest(manifest)
+
+        return result
+
+    def _plan(self, dest: Path, remote: Dict, record: Optional[Dict]) -> str:
+        """判定单个文件的同步动作：download / unchanged / skipped"""
+        if not dest.exists():
+            return "download"
+
+        if not record:
+            return "skipped"
+
+        try:
+            stat = dest.stat()
+        except OSError:
+            return "download"
+
+        local_untouched = (
+            record.get("local_size") == stat.st_size
+            and record.get("local_mtime") == int(stat.st_mtime)
+        )
+        if record.get("etag") == remote["etag"] and record.get("size") == remote["size"]:
+            return "unchanged" if local_untouched else "skipped"
+        return "download" if local_untouched else "skipped"
+
+    def _run_transfers(self, transfers: List[_Transfer], manifest: Dict, result: Dict) -> None:
+        """所有文件的分片共用一个线程池并发下载，完成后逐个落盘"""
+        failed_keys = {}
+        tasks = []
+        for transfer in transfers:
+            try:
+                transfer.prepare()
+            except OSError as e:
+                failed_keys[transfer.key] = str(e)
+                continue
+            if transfer.size == 0:
+                continue
+            resumed = len(transfer.done)
+            if resumed:
+                print(f"[远程同步] 续传 {transfer.key}: 已完成 {resumed}/{transfer.part_count} 个分片")
+            tasks.extend((transfer, index) for index in transfer.pending_parts())
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, max(len(tasks), 1))) as executor:
+            futures = {
+                executor.submit(self._download_part, transfer, index): transfer
+                for transfer, index in tasks
+            }
+            for future in as_completed(futures):
+                transfer = futures[future]
+                try:
+                    result["bytes"] += future.result()
+                except Exception as e:
+                    failed_keys.setdefault(transfer.key, str(e))
+
+        for transfer in transfers:
+            if transfer.key in failed_keys or (transfer.size and not transfer.complete):
+                error = failed_keys.get(transfer.key, "分片未完成")
+                result["failed"].append({"key": transfer.key, "error": error})
+                print(f"[远程同步] 下载失败 ({transfer.key}): {error}")
+                continue
+            try:
+                transfer.finalize()
+            except (OSError, ValueError) as e:
+                result["failed"].append({"key": transfer.key, "error": str(e)})
+                print(f"[远程同步] 落盘失败 ({transfer.key}): {e}")
+                continue
+
+            stat = transfer.dest.stat()
+            manifest[transfer.key] = {
+                "etag": transfer.etag,
+                "size": transfer.size,
+                "local_size": stat.st_size,
+                "local_mtime": int(stat.st_mtime),
+            }
+            result["synced"].append(transfer.key)
+            print(f"[远程同步] 已拉取: {transfer.key} ({transfer.size} bytes)")
+
+    def _download_part(self, transfer: _Transfer, index: int) -> int:
+        """
+        下载单个分片并写入临时文件对应偏移
+
+        请求带 If-Match，下载期间对象被改写时服务端返回 412，
+        本次失败、续传记录保留，下次同步时因 ETag 不同而整体重新下载。
+        """
+        start, end = transfer.part_range(index)
+        kwargs = {"Bucket": self.bucket_name, "Key": transfer.key}
+        if transfer.part_count > 1:
+            kwargs["Range"] = f"bytes={start}-{end}"
+        if transfer.etag:
+            kwargs["IfMatch"] = transfer.etag
+
+        response = self.s3_client.get_object(**kwargs)
+        written = 0
+        # iter_chunks 会自动处理 chunked transfer encoding（腾讯云 COS 等）
+        with open(transfer.part_path, "r+b") as f:
+            f.seek(start)
+            for chunk in response["Body"].iter_chunks(chunk_size=SYNC_CHUNK_SIZE):
+                f.write(chunk)
+                written += len(chunk)
+
+        expected = end - start + 1
+        if written != expected:
+            raise ValueError(f"分片 {index} 大小不一致 ({written} != {expected})")
+
+        transfer.mark_done(index)
+        return written
+
+
+def _write_json_atomic(path: Path, data: Dict) -> None:
+    """先写临时文件再原子替换，避免中断时留下半个 JSON"""
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
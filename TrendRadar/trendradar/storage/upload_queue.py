@@ -0,0 +1,163 @@
+# coding=utf-8
+"""
+远程存储延迟上传队列（write-behind）
+
+远程后端每次写入（保存新闻、保存 RSS、记录推送、记录 AI 分析等）后不再立即上传
+整个 SQLite 文件，而是把 (date, db_type) 标记为脏：
+- 同一文件在延迟窗口内的多次写入合并为一次上传
+- 后台线程在文件首次变脏后最多等待 delay 秒上传，抓取 / 推送流程不再等待对象存储
+- flush() 立即上传全部待上传文件并等待完成，cleanup() 时调用，保证运行结束前落到远程
+
+所有上传都在同一个后台线程中串行执行，同一文件不会被并发上传。
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+UploadKey = Tuple[Optional[str], str]
+
+
+class WriteBehindUploader:
+    """
+    按 (date, db_type) 合并的后台上传队列
+
+    Examples:
+        >>> uploader = WriteBehindUploader(backend._upload_sqlite, delay=30)
+        >>> uploader.mark_dirty("2025-12-30", "news")
+        >>> uploader.mark_dirty("2025-12-30", "news")   # 合并，只上传一次
+        >>> uploader.flush()
+        True
+    """
+
+    def __init__(self, upload_func: Callable[[Optional[str], str], bool], delay: float):
+        """
+        Args:
+            upload_func: 上传函数 upload_func(date, db_type) -> 是否成功
+            delay: 文件首次变脏后最多延迟多少秒上传
+        """
+        self.upload_func = upload_func
+        self.delay = max(float(delay), 0.0)
+
+        self._cond = threading.Condition()
+        self._pending: Dict[UploadKey, float] = {}  # key -> 截止上传时间
+        self._in_flight: Optional[UploadKey] = None
+        self._flush_requested = False
+        self._flush_failed: List[UploadKey] = []
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def pending_count(self) -> int:
+        """待上传文件数（不含正在上传的文件）"""
+        with self._cond:
+            return len(self._pending)
+
+    def mark_dirty(self, date: Optional[str], db_type: str = "news") -> None:
+        """
+        标记文件已修改，等待合并上传
+
+        已在队列中的文件保持原有截止时间，保证最长延迟不超过 delay。
+        """
+        key = (date, db_type)
+        with self._cond:
+            if key not in self._pending:
+                self._pending[key] = time.monotonic() + self.delay
+            self._ensure_thread()
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        立即上传全部待上传文件并等待完成
+
+        Args:
+            timeout: 最长等待秒数（None 表示一直等待）
+
+        Returns:
+            是否全部上传成功
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            if not self._pending and self._in_flight is None:
+                return True
+
+            self._flush_requested = True
+            self._flush_failed = []
+            self._ensure_thread()
+            self._cond.notify_all()
+
+            while self._pending or self._in_flight is not None:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    print(f"[上传队列] 等待上传超时，仍有 {len(self._pending)} 个文件未上传")
+                    self._flush_requested = False
+                    return False
+                self._cond.wait(remaining)
+
+            self._flush_requested = False
+            failed = self._flush_failed
+            self._flush_failed = []
+
+        for date, db_type in failed:
+            print(f"[上传队列] 上传失败: {db_type}/{date}")
+        return not failed
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """上传全部待上传文件后停止后台线程"""
+        success = self.flush(timeout)
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        return success
+
+    def _ensure_thread(self) -> None:
+        """按需启动后台线程（调用方持有锁）"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._run, name="trendradar-uploader", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                key = None
+                while key is None:
+                    if self._stopped and not self._pending:
+                        return
+                    if self._pending:
+                        key, due = min(self._pending.items(), key=lambda item: item[1])
+                        wait = due - time.monotonic()
+                        if wait > 0 and not self._flush_requested:
+                            key = None
+                            self._cond.wait(wait)
+                            continue
+                    else:
+                        self._cond.wait()
+
+                # 取出后再上传：上传期间的新写入会重新入队，不会丢失
+                del self._pending[key]
+                self._in_flight = key
+                flushing = self._flush_requested
+
+            try:
+                success = self.upload_func(*key)
+            except Exception as e:
+                print(f"[上传队列] 上传异常 ({key[1]}/{key[0]}): {e}")
+                success = False
+
+            with self._cond:
+                self._in_flight = None
+                if not success:
+                    if flushing or self._flush_requested:
+                        # flush 期间失败不再重试，交由调用方处理
+                        self._flush_failed.append(key)
+                    elif key not in self._pending:
+                        # 后台上传失败：延迟后重试（最迟在 flush 时再试一次）
+                        self._pending[key] = time.monotonic() + self.delay
+                self._cond.notify_all()
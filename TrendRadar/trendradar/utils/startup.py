@@ -0,0 +1,204 @@
+# coding=utf-8
+"""
+启动耗时基准
+
+定时抓取（supercronic 每次触发）和 MCP stdio 客户端每次连接都会启动新进程，
+导入耗时直接计入每次运行。本模块用 python -X importtime 在独立进程中导入入口
+模块，统计导入耗时并检查可选子系统是否被提前加载：
+- 耗时预算：入口模块导入耗时（多次运行取中位数）不得超过预算
+- 延迟加载：AI（litellm）、远程存储（boto3）等可选子系统以及 MCP 工具模块
+  只在首次使用时导入，出现在启动导入列表中即视为回退（与机器快慢无关）
+"""
+
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+# 入口模块 -> 导入耗时预算（毫秒）和启动时不应导入的模块
+STARTUP_TARGETS = {
+    "trendradar.__main__": {
+        "budget_ms": 600,
+        "lazy": ("litellm", "boto3", "botocore"),
+    },
+    # 预算包含 fastmcp 自身的导入耗时
+    "mcp_server.server": {
+        "budget_ms": 1500,
+        "lazy": (
+            "litellm",
+            "boto3",
+            "botocore",
+            "trendradar.context",
+            "mcp_server.tools.analytics",
+            "mcp_server.tools.article_reader",
+        ),
+    },
+}
+
+# 默认运行次数
+DEFAULT_RUNS = 3
+
+# 报告中列出的最慢导入数
+TOP_IMPORTS = 5
+
+# 项目根目录（trendradar 和 mcp_server 包所在目录）
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _run_importtime(code: str, cwd: Path) -> Tuple[int, str]:
+    """在独立进程中以 -X importtime 执行代码，返回 (退出码, stderr)"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=str(cwd),
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    return proc.returncode, proc.stderr
+
+
+def parse_importtime(output: str) -> List[Tuple[str, int, int, int]]:
+    """
+    解析 -X importtime 输出
+
+    Returns:
+        [(模块名, 嵌套深度, 自身耗时微秒, 累计耗时微秒), ...]（按输出顺序）
+    """
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0])
+            cumulative_us = int(parts[1])
+        except ValueError:
+            # 表头行
+            continue
+        raw_name = parts[2].rstrip()
+        name = raw_name.lstrip()
+        depth = (len(raw_name) - len(name) - 1) // 2
+        entries.append((name, depth, self_us, cumulative_us))
+    return entries
+
+
+def measure_import(
+    module: str,
+    runs: int = DEFAULT_RUNS,
+    cwd: Optional[Path] = None,
+    baseline: Optional[Set[str]] = None,
+) -> Dict:
+    """
+    测量导入入口模块的耗时
+
+    Args:
+        module: 模块名
+        runs: 运行次数（取中位数）
+        cwd: 运行目录，默认为项目根目录
+        baseline: 解释器启动时已导入的模块（不计入耗时）
+
+    Returns:
+        {
+            "ok": 是否导入成功,
+            "error": 失败时的最后一行错误信息,
+            "total_ms": 导入耗时中位数（毫秒）,
+            "runs_ms": 每次的导入耗时,
+            "modules": 导入的模块集合,
+            "top": [(模块名, 累计耗时毫秒), ...]（最慢的直接依赖）
+        }
+    """
+    cwd = cwd or PROJECT_ROOT
+    if baseline is None:
+        baseline = interpreter_baseline(cwd)
+
+    totals = []
+    entries: List[Tuple[str, int, int, int]] = []
+    for _ in range(max(runs, 1)):
+        returncode, output = _run_importtime(f"import {module}", cwd)
+        if returncode != 0:
+            lines = [line for line in output.splitlines() if line and not line.startswith("import time:")]
+            return {
+                "ok": False,
+                "error": lines[-1] if lines else f"退出码 {returncode}",
+                "total_ms": None,
+                "runs_ms": totals,
+                "modules": set(),
+                "top": [],
+            }
+        entries = [entry for entry in parse_importtime(output) if entry[0] not in baseline]
+        totals.append(sum(cumulative for _, depth, _, cumulative in entries if depth == 0) / 1000)
+
+    top = sorted(
+        ((name, cumulative / 1000) for name, depth, _, cumulative in entries
+         if depth <= 1 and name != module),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:TOP_IMPORTS]
+    return {
+        "ok": True,
+        "error": None,
+        "total_ms": round(statistics.median(totals), 1),
+        "runs_ms": [round(total, 1) for total in totals],
+        "modules": {name for name, _, _, _ in entries},
+        "top": [(name, round(ms, 1)) for name, ms in top],
+    }
+
+
+def interpreter_baseline(cwd: Optional[Path] = None) -> Set[str]:
+    """解释器启动时（未导入任何项目模块）已导入的模块"""
+    _, output = _run_importtime("pass", cwd or PROJECT_ROOT)
+    return {name for name, _, _, _ in parse_importtime(output)}
+
+
+def find_eager_imports(modules: Set[str], lazy: Iterable[str]) -> List[str]:
+    """返回 lazy 中在启动时就被导入的模块（含其子模块）"""
+    return [
+        name for name in lazy
+        if any(module == name or module.startswith(name + ".") for module in modules)
+    ]
+
+
+def run_startup_benchmark(
+    runs: int = DEFAULT_RUNS,
+    targets: Optional[Dict[str, Dict]] = None,
+    cwd: Optional[Path] = None,
+) -> Dict:
+    """
+    对各入口模块运行启动耗时基准
+
+    Args:
+        runs: 每个入口模块的运行次数
+        targets: 入口模块配置，默认 STARTUP_TARGETS
+        cwd: 运行目录，默认为项目根目录
+
+    Returns:
+        {
+            "passed": 是否全部通过,
+            "targets": {模块名: measure_import 结果 + "budget_ms", "eager", "passed"}
+        }
+    """
+    targets = targets or STARTUP_TARGETS
+    cwd = cwd or PROJECT_ROOT
+    baseline = interpreter_baseline(cwd)
+
+    results = {}
+    for module, spec in targets.items():
+        result = measure_import(module, runs, cwd, baseline)
+        result["budget_ms"] = spec["budget_ms"]
+        result["eager"] = find_eager_imports(result["modules"], spec.get("lazy", ()))
+        result["passed"] = (
+            result["ok"]
+            and result["total_ms"] <= spec["budget_ms"]
+            and not result["eager"]
+        )
+        results[module] = result
+
+    return {
+        "passed": all(result["passed"] for result in results.values()),
+        "targets": results,
+    }